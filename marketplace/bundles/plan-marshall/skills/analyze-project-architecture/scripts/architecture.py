@@ -7,6 +7,15 @@ Entry point for all architecture operations. Dispatches to command modules.
 import argparse
 import sys
 
+# Read-only client commands the executor may replay from its result cache
+EXECUTOR_CACHE_POLICY = {
+    'info': {'reads': ['{--project-dir}/{plan_dir_name}/project-architecture/*'], 'defaults': {'--project-dir': '.'}},
+    'modules': {'reads': ['{--project-dir}/{plan_dir_name}/project-architecture/*'], 'defaults': {'--project-dir': '.'}},
+    'graph': {'reads': ['{--project-dir}/{plan_dir_name}/project-architecture/*'], 'defaults': {'--project-dir': '.'}},
+    'module': {'reads': ['{--project-dir}/{plan_dir_name}/project-architecture/*'], 'defaults': {'--project-dir': '.'}},
+    'commands': {'reads': ['{--project-dir}/{plan_dir_name}/project-architecture/*'], 'defaults': {'--project-dir': '.'}},
+}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -7,7 +7,22 @@ Usage:
         python3 manage-log.py {type} {plan_id} {level} "{message}"
 
     Read:
-        python3 manage-log.py read --plan-id {plan_id} --type {work|script} [--limit N] [--phase PHASE]
+        python3 manage-log.py read --plan-id {plan_id} --type {work|script} [--limit N] [--phase PHASE] [--tail N]
+        python3 manage-log.py read --type script --tail N
+
+    Query (filter + aggregate, text and JSONL logs):
+        python3 manage-log.py query [--type {script|work}] [--plan-id ID] [--since S] [--until U]
+                                    [--level L] [--notation N] [--exit-code N] [--min-duration SEC]
+                                    [--group-by FIELD] [--limit N]
+
+    Show full script output stored in the blob store:
+        python3 manage-log.py show-output {ref}
+
+    Convert text logs to JSONL:
+        python3 manage-log.py convert [--plan-id {plan_id}]
+
+    Import profile summary:
+        python3 manage-log.py profile-summary [--plan-id {plan_id}] [--notation N] [--limit N]
 
 Arguments (write):
     type      - Log type: 'script' or 'work'
@@ -16,10 +31,36 @@ Arguments (write):
     message   - Log message
 
 Arguments (read):
-    --plan-id - Plan identifier (required)
+    --plan-id - Plan identifier (required, except with --type script --tail:
+                without it the tail comes from today's global script log)
     --type    - Log type: 'script' or 'work' (required)
     --limit   - Max entries to return (optional, default: all)
     --phase   - Filter by phase (optional, work logs only)
+    --tail    - Last N entries, read backwards from the end of the log (optional,
+                takes precedence over --limit and --phase)
+
+Arguments (query):
+    --type         - Log type: 'script' (default) or 'work'
+    --plan-id      - Only entries of this plan
+    --since        - Start of time range: 30m, 24h, 7d, 2w or ISO date/timestamp
+    --until        - End of time range (same forms as --since)
+    --level        - Only entries of this level (INFO, WARN, ERROR)
+    --notation     - Only executions of this script notation
+    --exit-code    - Only executions with this exit code
+    --min-duration - Only executions taking at least this many seconds
+    --group-by     - Aggregate per notation, subcommand, level, category, plan_id, exit_code or phase
+    --limit        - Also list the last N matching entries (default: 0)
+
+Arguments (show-output):
+    ref - stdout_ref/stderr_ref of a log entry (full sha256 or a unique prefix of 8+ chars)
+
+Arguments (convert):
+    --plan-id - Only convert this plan's logs (optional, default: all global and plan logs)
+
+Arguments (profile-summary):
+    --plan-id  - Read this plan's script log (optional, default: all global script logs)
+    --notation - Only aggregate profiles of this notation (optional)
+    --limit    - Max module rows (optional, default: 20)
 
 Examples:
     # Write operations
@@ -30,16 +71,39 @@ Examples:
     python3 manage-log.py read --plan-id my-plan --type work
     python3 manage-log.py read --plan-id my-plan --type work --limit 5
     python3 manage-log.py read --plan-id my-plan --type work --phase init
+    python3 manage-log.py read --plan-id my-plan --type script --tail 3
+    python3 manage-log.py read --type script --tail 20
+
+    # Slow executions of one script in the last day, per subcommand
+    python3 manage-log.py query --since 24h --notation pm-workflow:manage-tasks:manage-tasks \
+        --min-duration 1 --group-by subcommand
+
+    # Full stderr of a failed execution (stderr_ref field of its log entry)
+    python3 manage-log.py show-output 3f2a9c41
+
+    # Migrate existing text logs after setting LOG_FORMAT=jsonl
+    python3 manage-log.py convert
+
+    # Aggregate --profile-startup runs
+    python3 manage-log.py profile-summary --notation pm-workflow:manage-tasks
 """
 
 import sys
+from collections import deque
 from pathlib import Path
 
 # Direct imports from same directory (local imports)
-from plan_logging import log_entry, read_work_log, list_recent_work, get_log_path
+from plan_logging import (
+    convert_logs, get_read_log_path, iter_log_lines, list_recent_work, log_entry, parse_since, query_log,
+    read_output, read_work_log, summarize_import_profiles, tail_log
+)
+
+# Cross-skill import (PYTHONPATH set by executor)
+from toon_parser import serialize_toon  # type: ignore[import-not-found]
 
 VALID_TYPES = ('script', 'work')
 VALID_LEVELS = ('INFO', 'WARN', 'ERROR')
+PROFILE_SUMMARY_LIMIT = 20
 
 
 def format_toon_output(result: dict) -> str:
@@ -105,7 +169,8 @@ def parse_read_args(args: list) -> dict:
         'plan_id': None,
         'log_type': None,
         'limit': None,
-        'phase': None
+        'phase': None,
+        'tail': None
     }
 
     i = 0
@@ -136,6 +201,12 @@ def parse_read_args(args: list) -> dict:
         elif arg.startswith('--phase='):
             result['phase'] = arg.split('=', 1)[1]
             i += 1
+        elif arg == '--tail' and i + 1 < len(args):
+            result['tail'] = int(args[i + 1])
+            i += 2
+        elif arg.startswith('--tail='):
+            result['tail'] = int(arg.split('=', 1)[1])
+            i += 1
         else:
             i += 1
 
@@ -147,16 +218,17 @@ def handle_read(args: list) -> None:
     parsed = parse_read_args(args)
 
     # Validate required args
-    if not parsed['plan_id']:
+    if not parsed['log_type']:
         print("status: error", file=sys.stderr)
         print("error: missing_argument", file=sys.stderr)
-        print("message: --plan-id is required", file=sys.stderr)
+        print("message: --type is required (work or script)", file=sys.stderr)
         sys.exit(1)
 
-    if not parsed['log_type']:
+    # Without a plan, only the tail of the global script log can be read
+    if not parsed['plan_id'] and not (parsed['log_type'] == 'script' and parsed['tail'] is not None):
         print("status: error", file=sys.stderr)
         print("error: missing_argument", file=sys.stderr)
-        print("message: --type is required (work or script)", file=sys.stderr)
+        print("message: --plan-id is required (optional only with --type script --tail)", file=sys.stderr)
         sys.exit(1)
 
     if parsed['log_type'] not in VALID_TYPES:
@@ -165,8 +237,11 @@ def handle_read(args: list) -> None:
         print(f"message: type must be one of {VALID_TYPES}", file=sys.stderr)
         sys.exit(1)
 
+    # Tail reads only the end of the log (both types)
+    if parsed['tail'] is not None:
+        result = tail_log(parsed['plan_id'], parsed['log_type'], parsed['tail'])
     # Currently only work logs support full parsing
-    if parsed['log_type'] == 'work':
+    elif parsed['log_type'] == 'work':
         if parsed['limit']:
             result = list_recent_work(parsed['plan_id'], limit=parsed['limit'])
         else:
@@ -174,31 +249,18 @@ def handle_read(args: list) -> None:
 
         result['log_type'] = 'work'
     else:
-        # Script logs - read raw file content for now
-        log_file = get_log_path(parsed['plan_id'], 'script')
-        if log_file.exists():
-            content = log_file.read_text(encoding='utf-8')
-            lines = content.strip().split('\n') if content.strip() else []
-
-            # Apply limit if specified
-            if parsed['limit'] and lines:
-                lines = lines[-parsed['limit']:]
-
-            result = {
-                'status': 'success',
-                'plan_id': parsed['plan_id'],
-                'log_type': 'script',
-                'total_entries': len(lines),
-                'raw_content': '\n'.join(lines)
-            }
-        else:
-            result = {
-                'status': 'success',
-                'plan_id': parsed['plan_id'],
-                'log_type': 'script',
-                'total_entries': 0,
-                'raw_content': ''
-            }
+        # Script logs - raw lines, streamed across rotated (gzip) segments
+        log_file = get_read_log_path(parsed['plan_id'], 'script')
+        lines = deque(maxlen=parsed['limit'] or None)
+        lines.extend(line for line in iter_log_lines(log_file) if line.strip())
+
+        result = {
+            'status': 'success',
+            'plan_id': parsed['plan_id'],
+            'log_type': 'script',
+            'total_entries': len(lines),
+            'raw_content': '\n'.join(lines)
+        }
 
     # Output
     if result.get('status') == 'error':
@@ -208,6 +270,120 @@ def handle_read(args: list) -> None:
         print(format_toon_output(result))
 
 
+def format_profile_summary(summary: dict, limit: int) -> str:
+    """Format aggregated import profiles as TOON."""
+    notations = summary['notations']
+    modules = summary['modules'][:limit]
+    lines = [
+        "status: success",
+        f"profiles: {summary['profiles']}",
+        "",
+        f"notations[{len(notations)}]{{notation,runs,avg_ms,max_ms}}:",
+    ]
+    lines.extend(f"  {r['notation']},{r['runs']},{r['avg_ms']},{r['max_ms']}" for r in notations)
+    lines.append("")
+    lines.append(f"modules[{len(modules)}]{{module,runs,avg_ms,max_ms}}:")
+    lines.extend(f"  {r['module']},{r['runs']},{r['avg_ms']},{r['max_ms']}" for r in modules)
+    return '\n'.join(lines)
+
+
+def handle_profile_summary(args: list) -> None:
+    """Handle profile-summary subcommand."""
+    parsed = parse_read_args(args)
+    notation = None
+    for i, arg in enumerate(args):
+        if arg == '--notation' and i + 1 < len(args):
+            notation = args[i + 1]
+        elif arg.startswith('--notation='):
+            notation = arg.split('=', 1)[1]
+
+    summary = summarize_import_profiles(plan_id=parsed['plan_id'], notation=notation)
+    print(format_profile_summary(summary, parsed['limit'] or PROFILE_SUMMARY_LIMIT))
+
+
+def parse_options(args: list, names: tuple) -> dict:
+    """Parse --name value / --name=value options (unknown arguments are ignored)."""
+    result = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        name, _, value = arg[2:].partition('=') if arg.startswith('--') else ('', '', '')
+        if name in names and value:
+            result[name] = value
+            i += 1
+        elif name in names and i + 1 < len(args):
+            result[name] = args[i + 1]
+            i += 2
+        else:
+            i += 1
+    return result
+
+
+def fail(error: str, message: str) -> None:
+    """Print an error result to stderr and exit 1."""
+    print(serialize_toon({'status': 'error', 'error': error, 'message': message}), file=sys.stderr)
+    sys.exit(1)
+
+
+QUERY_OPTIONS = (
+    'type', 'plan-id', 'since', 'until', 'level', 'notation', 'exit-code', 'min-duration', 'group-by', 'limit'
+)
+
+
+def handle_query(args: list) -> None:
+    """Handle query subcommand."""
+    options = parse_options(args, QUERY_OPTIONS)
+    try:
+        since = parse_since(options['since']) if 'since' in options else None
+        until = parse_since(options['until']) if 'until' in options else None
+        exit_code = int(options['exit-code']) if 'exit-code' in options else None
+        min_duration = float(options['min-duration']) if 'min-duration' in options else None
+        limit = int(options.get('limit', 0))
+    except ValueError as e:
+        fail('invalid_argument', str(e))
+
+    result = query_log(
+        log_type=options.get('type', 'script'),
+        plan_id=options.get('plan-id'),
+        since=since,
+        until=until,
+        level=options['level'].upper() if 'level' in options else None,
+        notation=options.get('notation'),
+        exit_code=exit_code,
+        min_duration=min_duration,
+        group_by=options.get('group-by'),
+        limit=limit,
+    )
+    if result['status'] == 'error':
+        fail(result['error'], result['message'])
+    print(serialize_toon(result))
+
+
+def handle_show_output(args: list) -> None:
+    """Handle show-output subcommand (prints the stored output as is)."""
+    if len(args) != 1:
+        fail('missing_argument', 'usage: show-output {ref}')
+    try:
+        content = read_output(args[0])
+    except FileNotFoundError as e:
+        fail('not_found', str(e))
+    except ValueError as e:
+        fail('invalid_reference', str(e))
+    sys.stdout.write(content)
+
+
+def handle_convert(args: list) -> None:
+    """Handle convert subcommand."""
+    options = parse_options(args, ('plan-id',))
+    converted = convert_logs(options.get('plan-id'))
+    print(serialize_toon({
+        'status': 'success',
+        'files': len(converted),
+        'entries': sum(item['entries'] for item in converted),
+        'converted': converted,
+    }))
+
+
 def handle_write(args: list) -> None:
     """Handle write operation (positional args)."""
     if len(args) != 4:
@@ -237,12 +413,24 @@ def handle_write(args: list) -> None:
 def main():
     if len(sys.argv) < 2:
         print(f"Usage: {sys.argv[0]} read --plan-id {{id}} --type {{work|script}}", file=sys.stderr)
+        print(f"       {sys.argv[0]} query [--type {{script|work}}] [--since S] [--group-by FIELD] ...", file=sys.stderr)
+        print(f"       {sys.argv[0]} show-output {{ref}}", file=sys.stderr)
+        print(f"       {sys.argv[0]} convert [--plan-id {{id}}]", file=sys.stderr)
+        print(f"       {sys.argv[0]} profile-summary [--plan-id {{id}}] [--notation N] [--limit N]", file=sys.stderr)
         print(f"       {sys.argv[0]} {{type}} {{plan_id}} {{level}} \"{{message}}\"", file=sys.stderr)
         sys.exit(1)
 
     # Check if first arg is 'read' subcommand
     if sys.argv[1] == 'read':
         handle_read(sys.argv[2:])
+    elif sys.argv[1] == 'query':
+        handle_query(sys.argv[2:])
+    elif sys.argv[1] == 'show-output':
+        handle_show_output(sys.argv[2:])
+    elif sys.argv[1] == 'convert':
+        handle_convert(sys.argv[2:])
+    elif sys.argv[1] == 'profile-summary':
+        handle_profile_summary(sys.argv[2:])
     else:
         # Legacy positional write
         handle_write(sys.argv[1:])
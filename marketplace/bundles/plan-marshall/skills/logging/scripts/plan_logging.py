@@ -10,20 +10,50 @@ Configuration via environment variables:
 - PLAN_BASE_DIR: Base directory for .plan structure (default: .plan)
 - LOG_MAX_OUTPUT: Max chars to capture from stdout/stderr (default: 2000)
 - LOG_RETENTION_DAYS: Days to keep global logs (default: 7)
+- LOG_FLUSH_BYTES: Buffered writer flush threshold in chars (default: 65536)
+- LOG_FLUSH_INTERVAL: Buffered writer max delay in seconds (default: 1.0)
+- LOG_FORMAT: 'text' (default) or 'jsonl' for JSON Lines logs (*.jsonl)
+- LOG_OUTPUT_BLOBS: Executions whose full stdout/stderr go to the blob store
+  (.plan/logs/blobs): 'errors' (default), 'all' or 'off'
+- LOG_ROTATE_BYTES: Size at which a global script log is rotated into a
+  gzip-compressed segment (default: 10 MiB, 0 disables)
+
+All log appends go through write_log_entry(): each entry is appended in one
+write under an fcntl advisory lock, or buffered by a LogWriter while
+start_buffered_logging() is active (batch execution).
+
+With LOG_FORMAT=jsonl every entry is one JSON object per line, and script
+executions carry structured fields (notation, subcommand, duration,
+exit_code, plan_id). Readers accept both formats; query_log() filters and
+aggregates either in one streaming pass, and convert_log_to_jsonl()
+migrates existing text logs.
+
+Script execution stats are appended to .plan/logs/script-stats.jsonl
+(one compact JSON record per call) and aggregated on demand.
 """
 
+# gzip, hashlib and shutil are imported lazily by the rotation, tail and output store functions
+import io
+import json
 import os
 import re
 import time
+from collections import deque
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows: appends stay unlocked
+    fcntl = None  # type: ignore[assignment]
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
 LOG_ENABLED = True
+LOG_FORMATS = ('text', 'jsonl')
 
 def get_plan_base_dir() -> Path:
     """Get base directory for plan structure."""
@@ -37,6 +67,28 @@ def get_retention_days() -> int:
     """Get days to keep global logs."""
     return int(os.environ.get('LOG_RETENTION_DAYS', '7'))
 
+def get_flush_bytes() -> int:
+    """Get buffered writer flush threshold (chars across all files)."""
+    return int(os.environ.get('LOG_FLUSH_BYTES', '65536'))
+
+def get_flush_interval() -> float:
+    """Get max seconds a buffered entry waits before it is flushed."""
+    return float(os.environ.get('LOG_FLUSH_INTERVAL', '1.0'))
+
+def get_rotate_bytes() -> int:
+    """Get size at which a global script log is rotated (0 disables rotation)."""
+    return int(os.environ.get('LOG_ROTATE_BYTES', str(10 * 1024 * 1024)))
+
+def get_output_blobs_mode() -> str:
+    """Get which executions store full output as blobs ('errors', 'all' or 'off')."""
+    value = os.environ.get('LOG_OUTPUT_BLOBS', 'errors').lower()
+    return value if value in BLOB_MODES else 'errors'
+
+def get_log_format() -> str:
+    """Get log file format for new entries ('text' or 'jsonl')."""
+    value = os.environ.get('LOG_FORMAT', 'text').lower()
+    return value if value in LOG_FORMATS else 'text'
+
 def get_global_log_dir() -> Path:
     """Get global log directory."""
     return get_plan_base_dir() / 'logs'
@@ -78,6 +130,42 @@ def format_log_entry(
 
     return '\n'.join(lines) + '\n'
 
+# Leading [CATEGORY] of a message, split off like HEADER_PATTERN does for text entries
+CATEGORY_PATTERN = re.compile(r'^\[(\w+)\] (.+)$', re.DOTALL)
+
+def format_log_record(
+    level: str,
+    message: str,
+    **fields
+) -> str:
+    """
+    Format a log entry as one JSON line (JSONL backend).
+
+    The record has the keys a parsed text entry has (timestamp, level,
+    category, message) plus the fields, with their types kept.
+
+    Args:
+        level: Log level (INFO, WARN, ERROR)
+        message: Primary message (a leading [CATEGORY] becomes the category)
+        **fields: Additional fields (None and '' are omitted)
+
+    Returns:
+        JSON object string with trailing newline
+    """
+    record = {'timestamp': format_timestamp(), 'level': level}
+    match = CATEGORY_PATTERN.match(message)
+    if match:
+        record['category'], message = match.group(1), match.group(2)
+    record['message'] = message
+    record.update((key, value) for key, value in fields.items() if value is not None and value != '')
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def _format_entry(log_file: Path, level: str, message: str, **fields) -> str:
+    """Format an entry in the format of the log file it goes to."""
+    if log_file.suffix == JSONL_SUFFIX:
+        return format_log_record(level, message, **fields)
+    return format_log_entry(level, message, **fields)
+
 def extract_plan_id(args: list) -> Optional[str]:
     """Extract --plan-id value from argument list."""
     for i, arg in enumerate(args):
@@ -95,6 +183,12 @@ def validate_plan_id(plan_id: str) -> bool:
 # PATH RESOLUTION
 # =============================================================================
 
+LOG_SUFFIX = '.log'
+JSONL_SUFFIX = '.jsonl'
+
+def _log_basename(log_type: str) -> str:
+    return 'work' if log_type.lower() == 'work' else 'script-execution'
+
 def get_log_path(plan_id: Optional[str], log_type: str = 'script') -> Path:
     """
     Get path to log file.
@@ -104,24 +198,394 @@ def get_log_path(plan_id: Optional[str], log_type: str = 'script') -> Path:
         log_type: 'script' or 'work'
 
     Returns:
-        Path to log file (script-execution.log or work.log)
+        Path to log file (script-execution.log or work.log, .jsonl with
+        LOG_FORMAT=jsonl)
     """
-    log_type = log_type.lower()
-    filename = 'work.log' if log_type == 'work' else 'script-execution.log'
+    basename = _log_basename(log_type)
+    suffix = JSONL_SUFFIX if get_log_format() == 'jsonl' else LOG_SUFFIX
 
     if plan_id:
         plan_dir = get_plans_dir() / plan_id
         if plan_dir.exists():
-            return plan_dir / filename
+            return plan_dir / f'{basename}{suffix}'
 
     # Global fallback for both script and work logs
     global_log_dir = get_global_log_dir()
     global_log_dir.mkdir(parents=True, exist_ok=True)
 
-    if log_type == 'work':
-        return global_log_dir / f'work-{date.today()}.log'
+    return global_log_dir / f'{basename}-{date.today()}{suffix}'
+
+def get_read_log_path(plan_id: Optional[str], log_type: str = 'script') -> Path:
+    """
+    Get path to the log file readers use.
+
+    Like get_log_path(), but with LOG_FORMAT=jsonl a log not yet written as
+    JSONL is read from its text file (the first JSONL append converts it).
+    """
+    log_file = get_log_path(plan_id, log_type)
+    if log_file.suffix == JSONL_SUFFIX and not log_segments(log_file):
+        text_log = log_file.with_suffix(LOG_SUFFIX)
+        if log_segments(text_log):
+            return text_log
+    return log_file
+
+def list_global_logs(log_type: str = 'script') -> list:
+    """
+    Get daily global logs of a type in both formats, oldest first (text before JSONL).
+
+    Returns the active file path of each day, also when only rotated
+    segments exist; read them with log_segments() or iter_log_lines().
+    """
+    basename = _log_basename(log_type)
+    global_log_dir = get_global_log_dir()
+    logs = set()
+    for path in global_log_dir.glob(f'{basename}-*'):
+        match = GLOBAL_LOG_PATTERN.match(path.name)
+        if match and match.group('stem')[:-len('-YYYY-MM-DD')] == basename:
+            logs.add(global_log_dir / f"{match.group('stem')}{match.group('suffix')}")
+    return sorted(logs, key=lambda path: (path.stem, path.suffix != LOG_SUFFIX))
+
+def list_plan_logs(log_type: str = 'script') -> list:
+    """Get (plan_id, path) of every plan-scoped log of a type in both formats (text before JSONL)."""
+    basename = _log_basename(log_type)
+    return sorted(
+        ((path.parent.name, path) for suffix in (LOG_SUFFIX, JSONL_SUFFIX)
+         for path in get_plans_dir().glob(f'*/{basename}{suffix}')),
+        key=lambda item: (item[0], item[1].suffix != LOG_SUFFIX)
+    )
+
+# =============================================================================
+# LOG ROTATION
+# =============================================================================
+
+# Daily global log name, optionally a rotated segment, optionally compressed:
+#   script-execution-2025-12-08.log        active file
+#   script-execution-2025-12-08.3.log      rotated segment (being compressed)
+#   script-execution-2025-12-08.3.log.gz   compressed segment
+GZIP_SUFFIX = '.gz'
+GLOBAL_LOG_PATTERN = re.compile(
+    r'^(?P<stem>[a-z-]+-\d{4}-\d{2}-\d{2})(?:\.(?P<segment>\d+))?(?P<suffix>\.log|\.jsonl)(?:\.gz)?$'
+)
+
+def _segment_number(path: Path) -> int:
+    match = GLOBAL_LOG_PATTERN.match(path.name)
+    return int(match.group('segment')) if match and match.group('segment') else 0
+
+def _rotated_segments(log_file: Path) -> list:
+    """Rotated segments of a log, oldest first (the plain file while it is being compressed)."""
+    segments = {}
+    for pattern in (f'{log_file.stem}.*{log_file.suffix}', f'{log_file.stem}.*{log_file.suffix}{GZIP_SUFFIX}'):
+        for path in log_file.parent.glob(pattern):
+            number = _segment_number(path)
+            if number and (number not in segments or path.suffix != GZIP_SUFFIX):
+                segments[number] = path
+    return [segments[number] for number in sorted(segments)]
+
+def log_segments(log_file: Path) -> list:
+    """
+    Get the existing files holding a log's entries, oldest first.
+
+    Returns:
+        Rotated segments (plain or gzip) followed by the active file
+    """
+    segments = _rotated_segments(log_file)
+    if log_file.exists():
+        segments.append(log_file)
+    return segments
+
+def _open_log(path: Path, binary: bool = False):
+    """
+    Open a plain or gzip-compressed log file for reading.
+
+    A plain segment compressed after it was listed is read from its .gz.
+    """
+    mode, kwargs = ('rb', {}) if binary else ('rt', {'encoding': 'utf-8', 'errors': 'replace'})
+    if path.suffix != GZIP_SUFFIX:
+        try:
+            return open(path, mode, **kwargs)
+        except FileNotFoundError:
+            if not _segment_number(path):
+                raise
+            path = path.with_name(path.name + GZIP_SUFFIX)
+    import gzip
+    return gzip.open(path, mode, **kwargs)
+
+def iter_log_lines(log_file: Path):
+    """Stream the lines of a log across its rotated segments (without newlines)."""
+    _flush_pending(log_file)
+    for path in log_segments(log_file):
+        try:
+            with _open_log(path) as f:
+                for line in f:
+                    yield line.rstrip('\n')
+        except FileNotFoundError:
+            continue  # Deleted by retention meanwhile
+
+def _replaced(f, log_file: Path) -> bool:
+    """Check whether the path no longer names the open file (rotated away)."""
+    try:
+        return os.stat(log_file).st_ino != os.fstat(f.fileno()).st_ino
+    except FileNotFoundError:
+        return True
+
+def _temp_token() -> str:
+    """Process and thread unique temp file token."""
+    import threading
+    return f'{os.getpid()}.{threading.get_ident()}'
+
+def rotate_log(log_file: Path, max_bytes: Optional[int] = None) -> Optional[Path]:
+    """
+    Rotate a log that has reached max_bytes and compress the segment.
+
+    The active file is renamed to the next segment number under the log
+    lock; writers that opened it before notice the rename and reopen the
+    path (see _append_locked). The segment is gzip-compressed in a
+    daemon thread; a compression cut short by interpreter exit leaves the
+    segment plain for cleanup_old_script_logs() to compress.
+
+    Args:
+        log_file: Active log file
+        max_bytes: Size limit (default from LOG_ROTATE_BYTES, 0 disables)
+
+    Returns:
+        Path of the rotated segment, None if the log was not rotated
+    """
+    if max_bytes is None:
+        max_bytes = get_rotate_bytes()
+    if max_bytes <= 0:
+        return None
+    try:
+        if log_file.stat().st_size < max_bytes:
+            return None
+        with open(log_file, 'rb') as log:
+            if fcntl is not None:
+                fcntl.flock(log.fileno(), fcntl.LOCK_EX)
+            # Another process may have rotated it while we waited for the lock
+            if _replaced(log, log_file) or os.fstat(log.fileno()).st_size < max_bytes:
+                return None
+            existing = _rotated_segments(log_file)
+            number = _segment_number(existing[-1]) + 1 if existing else 1
+            segment = log_file.with_name(f'{log_file.stem}.{number}{log_file.suffix}')
+            os.rename(log_file, segment)
+    except FileNotFoundError:
+        return None
+
+    import threading
+    threading.Thread(target=compress_segments, args=(log_file,), name='log-compress', daemon=True).start()
+    return segment
+
+def compress_segment(segment: Path) -> Path:
+    """
+    Gzip a rotated segment, keeping its mtime for retention.
 
-    return global_log_dir / f'script-execution-{date.today()}.log'
+    Returns:
+        Path of the compressed segment
+    """
+    import gzip
+    import shutil
+    target = segment.with_name(segment.name + GZIP_SUFFIX)
+    # Per-process temp file: rotating processes may compress the same segment
+    temp_file = target.with_name(f'{target.name}.{_temp_token()}.tmp')
+    stat = segment.stat()
+    try:
+        with open(segment, 'rb') as source, gzip.open(temp_file, 'wb') as compressed:
+            shutil.copyfileobj(source, compressed)
+        os.utime(temp_file, (stat.st_atime, stat.st_mtime))
+        os.replace(temp_file, target)
+    finally:
+        temp_file.unlink(missing_ok=True)
+    segment.unlink(missing_ok=True)
+    return target
+
+def compress_segments(log_file: Path) -> int:
+    """
+    Compress every rotated segment of a log that is still plain.
+
+    Picks up segments left plain by an interrupted background compression.
+
+    Returns:
+        Count of compressed segments
+    """
+    compressed = 0
+    for segment in _rotated_segments(log_file):
+        if segment.suffix != GZIP_SUFFIX:
+            try:
+                compress_segment(segment)
+                compressed += 1
+            except OSError:
+                pass  # Another process compressed it first
+    return compressed
+
+# =============================================================================
+# LOG WRITER
+# =============================================================================
+
+def _rotates(log_file: Path) -> bool:
+    """Only the daily global script logs rotate (plan logs and work logs do not)."""
+    return (log_file.name.startswith(_log_basename('script') + '-')
+            and log_file.parent == get_global_log_dir())
+
+def _convert_text_log(log_file: Path) -> None:
+    """Convert the text log a new JSONL log replaces, under the text log's lock."""
+    text_log = log_file.with_suffix(LOG_SUFFIX)
+    try:
+        f = open(text_log, encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            if _replaced(f, text_log):
+                return  # Converted by another writer while we waited
+        if not log_file.exists():
+            plan_id = log_file.parent.name if log_file.parent.parent == get_plans_dir() else None
+            convert_log_to_jsonl(text_log, plan_id)
+
+def _append_locked(log_file: Path, text: str) -> None:
+    """
+    Append text to log_file under an exclusive advisory lock.
+
+    A full global script log is rotated first. The first append to a JSONL
+    log converts the text log it replaces, so history stays in one file.
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    if log_file.suffix == JSONL_SUFFIX and not log_file.exists():
+        _convert_text_log(log_file)
+    if _rotates(log_file):
+        rotate_log(log_file)
+    while True:
+        with open(log_file, 'a', encoding='utf-8') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                if _replaced(f, log_file):
+                    continue  # Rotated while waiting for the lock: append to the new file
+            f.write(text)
+            f.flush()
+            return  # Closing the file releases the lock
+
+class LogWriter:
+    """
+    Buffer log entries per file and append them in batches.
+
+    A flush appends all buffered entries of a file in one locked write, so
+    concurrent writers (parallel agents, batch threads) never interleave
+    partial entries and a burst costs one open/close per file. Buffers are
+    flushed when they reach max_bytes, when the oldest buffered entry is
+    max_delay seconds old (timer thread) and at interpreter exit.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, max_delay: Optional[float] = None):
+        # Imported lazily: only batch execution buffers, plain scripts skip the cost
+        import atexit
+        import threading
+        self.max_bytes = get_flush_bytes() if max_bytes is None else max_bytes
+        self.max_delay = get_flush_interval() if max_delay is None else max_delay
+        self._buffers: dict = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._timer = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def write(self, log_file: Path, entry: str) -> None:
+        """Buffer one complete entry for log_file."""
+        with self._lock:
+            if self._closed:
+                _append_locked(log_file, entry)
+                return
+            self._buffers.setdefault(log_file, []).append(entry)
+            self._size += len(entry)
+            if self._size >= self.max_bytes:
+                self._flush_locked()
+            elif self._timer is None:
+                import threading
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self, log_file: Optional[Path] = None) -> None:
+        """Write buffered entries of log_file (default: all files)."""
+        with self._lock:
+            self._flush_locked(log_file)
+
+    def close(self) -> None:
+        """Flush everything; later writes are appended immediately."""
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+        import atexit
+        atexit.unregister(self.close)
+
+    def _flush_locked(self, log_file: Optional[Path] = None) -> None:
+        if log_file is None:
+            pending, self._buffers, self._size = self._buffers, {}, 0
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        elif log_file in self._buffers:
+            entries = self._buffers.pop(log_file)
+            self._size -= sum(len(entry) for entry in entries)
+            pending = {log_file: entries}
+        else:
+            return
+
+        for path, entries in pending.items():
+            try:
+                _append_locked(path, ''.join(entries))
+            except Exception:
+                pass  # Silent failure for logging
+
+_log_writer: Optional[LogWriter] = None
+
+def start_buffered_logging(max_bytes: Optional[int] = None, max_delay: Optional[float] = None) -> LogWriter:
+    """
+    Route log appends through a shared LogWriter until stop_buffered_logging().
+
+    Args:
+        max_bytes: Flush threshold (default from LOG_FLUSH_BYTES)
+        max_delay: Max seconds before a buffered entry is written (default from LOG_FLUSH_INTERVAL)
+
+    Returns:
+        The active writer (an already active writer is reused)
+    """
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = LogWriter(max_bytes, max_delay)
+    return _log_writer
+
+def stop_buffered_logging() -> None:
+    """Flush and detach the shared LogWriter; appends become synchronous again."""
+    global _log_writer
+    writer, _log_writer = _log_writer, None
+    if writer is not None:
+        writer.close()
+
+def write_log_entry(log_file: Path, entry: str, sync: bool = False) -> None:
+    """
+    Append one complete entry to log_file.
+
+    Without an active LogWriter (single calls) the entry is appended
+    immediately under the file lock.
+
+    Args:
+        log_file: Target log file
+        entry: Formatted entry, including the trailing newline
+        sync: Write now, after any entries still buffered for log_file
+    """
+    writer = _log_writer
+    if writer is None:
+        _append_locked(log_file, entry)
+    elif sync:
+        writer.flush(log_file)
+        _append_locked(log_file, entry)
+    else:
+        writer.write(log_file, entry)
+
+def _flush_pending(log_file: Path) -> None:
+    """Make entries still buffered for log_file visible to readers."""
+    writer = _log_writer
+    if writer is not None:
+        writer.flush(log_file)
 
 # =============================================================================
 # UNIFIED LOG ENTRY (SIMPLIFIED API)
@@ -148,12 +612,7 @@ def log_entry(log_type: str, plan_id: str, level: str, message: str) -> None:
 
     try:
         log_file = get_log_path(plan_id, log_type_lower)
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-
-        entry = format_log_entry(level, message)
-
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(entry)
+        write_log_entry(log_file, _format_entry(log_file, level, message))
 
     except Exception:
         pass  # Silent failure for logging
@@ -169,7 +628,8 @@ def log_script_execution(
     exit_code: int,
     duration: float,
     stdout: str = '',
-    stderr: str = ''
+    stderr: str = '',
+    cached: bool = False
 ) -> None:
     """
     Log script execution to script-execution.log.
@@ -180,8 +640,9 @@ def log_script_execution(
         args: Full argument list
         exit_code: Process exit code
         duration: Execution time in seconds
-        stdout: Captured stdout
-        stderr: Captured stderr
+        stdout: Captured stdout (stored in full as a blob per LOG_OUTPUT_BLOBS)
+        stderr: Captured stderr (stored in full as a blob per LOG_OUTPUT_BLOBS)
+        cached: Result was replayed from the executor's result cache
     """
     if not LOG_ENABLED:
         return
@@ -191,28 +652,49 @@ def log_script_execution(
         log_file = get_log_path(plan_id, 'script')
 
         message = f"{notation} {subcommand} ({duration:.2f}s)"
+        if cached:
+            message += " [cache hit]"
 
-        if exit_code == 0:
-            entry = format_log_entry('INFO', message)
-        else:
+        level = 'INFO' if exit_code == 0 else 'ERROR'
+        details = {}
+        if exit_code != 0:
             max_output = get_max_output()
-            entry = format_log_entry(
-                'ERROR', message,
-                exit_code=exit_code,
-                args=' '.join(args),
-                stdout=stdout[:max_output].replace('\n', ' ')[:500] if stdout else None,
-                stderr=stderr[:max_output].replace('\n', ' ')[:500] if stderr else None
+            details = {
+                'exit_code': exit_code,
+                'args': ' '.join(args),
+                'stdout': stdout[:max_output].replace('\n', ' ')[:500] if stdout else None,
+                'stderr': stderr[:max_output].replace('\n', ' ')[:500] if stderr else None,
+            }
+        # Full output goes to the blob store, the entry only references it
+        details.update(_output_refs(stdout, stderr, exit_code != 0))
+
+        if log_file.suffix == JSONL_SUFFIX:
+            # Structured fields: queries never need to parse the message
+            details['exit_code'] = exit_code
+            entry = format_log_record(
+                level, message,
+                notation=notation,
+                subcommand=subcommand,
+                duration=round(duration, 3),
+                plan_id=plan_id,
+                cached=True if cached else None,
+                **details
             )
+        else:
+            entry = format_log_entry(level, message, **details)
 
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(entry)
+        write_log_entry(log_file, entry)
 
     except Exception:
         pass  # Silent failure for logging
 
+# Age after which a compression temp file is considered abandoned
+STALE_TEMP_SECONDS = 3600
+
 def cleanup_old_script_logs(max_age_days: Optional[int] = None) -> int:
     """
-    Delete global script logs older than max_age_days.
+    Delete global script logs older than max_age_days, then the output
+    blobs no remaining log references.
 
     Args:
         max_age_days: Days to keep (default from LOG_RETENTION_DAYS)
@@ -230,16 +712,488 @@ def cleanup_old_script_logs(max_age_days: Optional[int] = None) -> int:
     if not global_log_dir.exists():
         return 0
 
-    for log_file in global_log_dir.glob('script-execution-*.log'):
+    for log_file in list_global_logs('script'):
+        for path in log_segments(log_file):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except Exception:
+                pass
+        # Temp files of compressions cut short by interpreter exit
+        for temp_file in log_file.parent.glob(f'{log_file.stem}.*{GZIP_SUFFIX}.*.tmp'):
+            try:
+                if temp_file.stat().st_mtime < time.time() - STALE_TEMP_SECONDS:
+                    temp_file.unlink()
+            except OSError:
+                pass
         try:
-            if log_file.stat().st_mtime < cutoff:
-                log_file.unlink()
-                deleted += 1
+            compress_segments(log_file)
         except Exception:
             pass
 
+    try:
+        gc_output_blobs()
+    except Exception:
+        pass
+
+    try:
+        compact_script_stats(max_age_days)
+    except Exception:
+        pass
+
     return deleted
 
+# =============================================================================
+# OUTPUT BLOBS
+# =============================================================================
+
+# Full script output, content-addressed: .plan/logs/blobs/ab/abcdef....gz
+# (sha256 of the UTF-8 output, gzip-compressed). Log entries reference blobs
+# with stdout_ref/stderr_ref fields; identical outputs are stored once.
+BLOB_DIR_NAME = 'blobs'
+BLOB_MODES = ('errors', 'all', 'off')
+BLOB_REF_PATTERN = re.compile(r'(?:stdout|stderr)_ref"?:\s*"?([0-9a-f]{64})')
+BLOB_REF_MIN_LENGTH = 8
+# Blobs written or reused this recently survive GC: their entry may still be buffered
+BLOB_GC_GRACE_SECONDS = 3600
+
+def get_blob_dir() -> Path:
+    """Get output blob store directory."""
+    return get_global_log_dir() / BLOB_DIR_NAME
+
+def _blob_path(digest: str) -> Path:
+    return get_blob_dir() / digest[:2] / f'{digest}{GZIP_SUFFIX}'
+
+def store_output(text: str) -> str:
+    """
+    Store full script output in the blob store (deduplicated).
+
+    Args:
+        text: Output to store
+
+    Returns:
+        sha256 hex digest referencing the blob
+    """
+    import gzip
+    import hashlib
+    data = text.encode('utf-8', errors='replace')
+    digest = hashlib.sha256(data).hexdigest()
+    blob = _blob_path(digest)
+    if blob.exists():
+        os.utime(blob)  # Reused: restart the GC grace period
+        return digest
+
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = blob.with_name(f'{blob.name}.{_temp_token()}.tmp')
+    try:
+        with gzip.open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, blob)
+    finally:
+        temp_file.unlink(missing_ok=True)
+    return digest
+
+def _output_refs(stdout: str, stderr: str, failed: bool) -> dict:
+    """Store outputs per LOG_OUTPUT_BLOBS and get their stdout_ref/stderr_ref fields."""
+    mode = get_output_blobs_mode()
+    if mode == 'off' or (mode == 'errors' and not failed):
+        return {}
+    refs = {}
+    for stream, text in (('stdout', stdout), ('stderr', stderr)):
+        if text:
+            try:
+                refs[f'{stream}_ref'] = store_output(text)
+            except OSError:
+                pass  # The entry is still logged, with the truncated output only
+    return refs
+
+def resolve_output_ref(ref: str) -> Path:
+    """
+    Find the blob of a full or abbreviated (at least 8 hex chars) reference.
+
+    Raises:
+        ValueError: If the reference is malformed or ambiguous
+        FileNotFoundError: If no blob matches
+    """
+    ref = ref.strip().lower()
+    if not re.fullmatch(rf'[0-9a-f]{{{BLOB_REF_MIN_LENGTH},64}}', ref):
+        raise ValueError(f"Invalid output reference: {ref} (expected {BLOB_REF_MIN_LENGTH}-64 hex chars)")
+    matches = sorted((get_blob_dir() / ref[:2]).glob(f'{ref}*{GZIP_SUFFIX}'))
+    if not matches:
+        raise FileNotFoundError(f"No stored output for {ref}")
+    if len(matches) > 1:
+        raise ValueError(f"Ambiguous output reference: {ref} ({len(matches)} matches)")
+    return matches[0]
+
+def read_output(ref: str) -> str:
+    """Read the full output stored under a (possibly abbreviated) reference."""
+    import gzip
+    with gzip.open(resolve_output_ref(ref), 'rt', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+def _referenced_outputs() -> set:
+    """Collect the blob digests referenced by any script log (global, plan and archived plan)."""
+    archived = [
+        path for path in sorted((get_plan_base_dir() / 'archived-plans').glob('*/script-execution.*'))
+        if path.suffix in (LOG_SUFFIX, JSONL_SUFFIX)
+    ]
+    logs = list_global_logs('script') + [path for _, path in list_plan_logs('script')] + archived
+    referenced = set()
+    for log_file in logs:
+        for line in iter_log_lines(log_file):
+            if '_ref' in line:
+                referenced.update(BLOB_REF_PATTERN.findall(line))
+    return referenced
+
+def gc_output_blobs(dry_run: bool = False) -> tuple:
+    """
+    Delete output blobs that no log references anymore.
+
+    Blobs written or reused within BLOB_GC_GRACE_SECONDS are kept, as are
+    blobs referenced from archived plans. Leftover temp files are removed.
+
+    Args:
+        dry_run: Only count what would be deleted
+
+    Returns:
+        Tuple of (deleted blob count, bytes freed)
+    """
+    blob_dir = get_blob_dir()
+    if not blob_dir.exists():
+        return 0, 0
+
+    referenced = _referenced_outputs()
+    cutoff = time.time() - BLOB_GC_GRACE_SECONDS
+    deleted = freed = 0
+    for path in [*blob_dir.glob(f'??/*{GZIP_SUFFIX}'), *blob_dir.glob('??/*.tmp')]:
+        if path.name.endswith(GZIP_SUFFIX) and path.name[:-len(GZIP_SUFFIX)] in referenced:
+            continue
+        try:
+            stat = path.stat()
+            if stat.st_mtime >= cutoff:
+                continue
+            if not dry_run:
+                path.unlink()
+        except OSError:
+            continue
+        if path.name.endswith(GZIP_SUFFIX):
+            deleted += 1
+            freed += stat.st_size
+    return deleted, freed
+
+# =============================================================================
+# SCRIPT EXECUTION STATS
+# =============================================================================
+
+STATS_FILENAME = 'script-stats.jsonl'
+SINCE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+def get_stats_path() -> Path:
+    """Get path to the append-only script stats sidecar."""
+    return get_global_log_dir() / STATS_FILENAME
+
+def record_script_stats(
+    notation: str,
+    subcommand: str,
+    exit_code: int,
+    duration: float,
+    timestamp: Optional[float] = None
+) -> None:
+    """
+    Append one execution record to the stats sidecar.
+
+    Records are single JSON lines with short keys (t, n, s, e, d) so that
+    appends stay small and atomic.
+
+    Args:
+        notation: Script notation (bundle:skill:script)
+        subcommand: Script subcommand
+        exit_code: Process exit code
+        duration: Execution time in seconds
+        timestamp: Epoch seconds (default: now)
+    """
+    if not LOG_ENABLED:
+        return
+
+    try:
+        record = {
+            't': round(time.time() if timestamp is None else timestamp, 3),
+            'n': notation,
+            's': subcommand,
+            'e': exit_code,
+            'd': round(duration, 4),
+        }
+        write_log_entry(get_stats_path(), json.dumps(record, separators=(',', ':')) + '\n')
+
+    except Exception:
+        pass  # Silent failure for logging
+
+def parse_since(value: str) -> float:
+    """
+    Parse a --since value into epoch seconds.
+
+    Accepts relative durations (30m, 24h, 7d, 2w) and ISO dates or
+    timestamps (2025-12-08, 2025-12-08T10:30:00Z).
+
+    Raises:
+        ValueError: If the value matches neither form
+    """
+    match = re.match(r'^(\d+)([smhdw])$', value.strip())
+    if match:
+        return time.time() - int(match.group(1)) * SINCE_UNITS[match.group(2)]
+
+    parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def read_script_stats(since: Optional[float] = None) -> list:
+    """
+    Read execution records from the stats sidecar.
+
+    Args:
+        since: Only include records at or after this epoch time
+
+    Returns:
+        List of record dicts (malformed lines are skipped)
+    """
+    stats_file = get_stats_path()
+    _flush_pending(stats_file)
+    if not stats_file.exists():
+        return []
+
+    records = []
+    with open(stats_file, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if since is not None and record.get('t', 0) < since:
+                continue
+            records.append(record)
+    return records
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(int(-(-pct * len(sorted_values) // 100)), 1)
+    return sorted_values[rank - 1]
+
+def summarize_script_stats(since: Optional[float] = None) -> list:
+    """
+    Aggregate execution records per notation and subcommand.
+
+    Args:
+        since: Only include records at or after this epoch time
+
+    Returns:
+        List of dicts with notation, subcommand, count, errors, error_rate,
+        p50, p95, p99, max and total (durations in seconds)
+    """
+    groups: dict = {}
+    for record in read_script_stats(since):
+        key = (record.get('n', ''), record.get('s', ''))
+        group = groups.setdefault(key, {'durations': [], 'errors': 0})
+        group['durations'].append(float(record.get('d', 0.0)))
+        if record.get('e', 0) != 0:
+            group['errors'] += 1
+
+    summary = []
+    for (notation, subcommand), group in groups.items():
+        durations = sorted(group['durations'])
+        count = len(durations)
+        summary.append({
+            'notation': notation,
+            'subcommand': subcommand,
+            'count': count,
+            'errors': group['errors'],
+            'error_rate': round(group['errors'] / count, 3),
+            'p50': _percentile(durations, 50),
+            'p95': _percentile(durations, 95),
+            'p99': _percentile(durations, 99),
+            'max': durations[-1],
+            'total': round(sum(durations), 4),
+        })
+    return summary
+
+def compact_script_stats(max_age_days: Optional[int] = None) -> int:
+    """
+    Drop stats records older than max_age_days (atomic rewrite).
+
+    The read and the replace happen under the lock record_script_stats()
+    appends under; appenders that waited for it notice the replaced file and
+    append to the new one (see _append_locked), so no record is lost.
+
+    Args:
+        max_age_days: Days to keep (default from LOG_RETENTION_DAYS)
+
+    Returns:
+        Count of dropped records
+    """
+    if max_age_days is None:
+        max_age_days = get_retention_days()
+
+    stats_file = get_stats_path()
+    _flush_pending(stats_file)
+    cutoff = time.time() - (max_age_days * 86400)
+    while True:
+        try:
+            f = open(stats_file, encoding='utf-8')
+        except FileNotFoundError:
+            return 0
+        with f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                if _replaced(f, stats_file):
+                    continue  # Rewritten by another compactor while waiting for the lock
+            kept = []
+            dropped = 0
+            for line in f:
+                try:
+                    if json.loads(line).get('t', 0) < cutoff:
+                        dropped += 1
+                        continue
+                except ValueError:
+                    dropped += 1
+                    continue
+                kept.append(line)
+
+            if dropped:
+                # Per-process temp file: compactors may run concurrently
+                temp_file = stats_file.with_name(f'{stats_file.name}.{_temp_token()}.tmp')
+                try:
+                    temp_file.write_text(''.join(kept), encoding='utf-8')
+                    os.replace(temp_file, stats_file)
+                finally:
+                    temp_file.unlink(missing_ok=True)
+            return dropped  # Closing the file releases the lock
+
+# =============================================================================
+# IMPORT-TIME PROFILING
+# =============================================================================
+
+PROFILE_TOP_MODULES = 20
+
+# Lines written by `python -X importtime`:
+#   import time: self [us] | cumulative | imported package
+#   import time:       412 |       1630 |   encodings.aliases
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$')
+IMPORT_TIME_HEADER = 'import time: self [us] | cumulative | imported package'
+IMPORT_ENTRY_PATTERN = re.compile(r'([^\s=,]+)=([\d.]+)ms')
+
+def parse_import_time(stderr: str) -> tuple:
+    """
+    Split `-X importtime` output from the rest of stderr.
+
+    Args:
+        stderr: Captured stderr of a script run with -X importtime
+
+    Returns:
+        Tuple of (modules, remaining_stderr). Each module is a dict with
+        module, self_us, cumulative_us and depth (0 = imported directly).
+    """
+    modules = []
+    remaining = []
+    for line in stderr.splitlines(keepends=True):
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            modules.append({
+                'module': match.group(4),
+                'self_us': int(match.group(1)),
+                'cumulative_us': int(match.group(2)),
+                'depth': len(match.group(3)) // 2,
+            })
+        elif line.rstrip('\n') != IMPORT_TIME_HEADER:
+            remaining.append(line)
+    return modules, ''.join(remaining)
+
+def log_import_profile(
+    notation: str,
+    subcommand: str,
+    args: list,
+    modules: list,
+    limit: int = PROFILE_TOP_MODULES
+) -> None:
+    """
+    Log an import profile entry to script-execution.log.
+
+    The entry records the total import time (sum of top-level cumulative
+    times) and the `limit` most expensive modules by cumulative time.
+
+    Args:
+        notation: Script notation (bundle:skill:script)
+        subcommand: Script subcommand
+        args: Full argument list (used for plan routing)
+        modules: Parsed modules from parse_import_time()
+        limit: Number of modules to record
+    """
+    if not LOG_ENABLED:
+        return
+
+    try:
+        log_file = get_log_path(extract_plan_id(args), 'script')
+        total_ms = sum(m['cumulative_us'] for m in modules if m['depth'] == 0) / 1000
+        top = sorted(modules, key=lambda m: -m['cumulative_us'])[:limit]
+
+        entry = _format_entry(
+            log_file, 'INFO', f"[PROFILE] {notation} {subcommand} (imports {total_ms:.1f}ms)",
+            notation=notation,
+            total_ms=f"{total_ms:.1f}",
+            modules=len(modules),
+            imports=', '.join(f"{m['module']}={m['cumulative_us'] / 1000:.1f}ms" for m in top)
+        )
+
+        write_log_entry(log_file, entry)
+
+    except Exception:
+        pass  # Silent failure for logging
+
+def summarize_import_profiles(plan_id: Optional[str] = None, notation: Optional[str] = None) -> dict:
+    """
+    Aggregate [PROFILE] entries across runs.
+
+    Args:
+        plan_id: Read this plan's script log (default: all global script logs)
+        notation: Only include profiles of this notation
+
+    Returns:
+        Dict with profiles (run count), notations (runs, avg/max total ms)
+        and modules (runs, avg/max cumulative ms), both sorted by average
+        cost descending
+    """
+    if plan_id:
+        log_files = [get_read_log_path(plan_id, 'script')]
+    else:
+        log_files = list_global_logs('script')
+
+    by_notation: dict = {}
+    by_module: dict = {}
+    profiles = 0
+    for log_file in log_files:
+        for entry in iter_log_entries(log_file):
+            if entry.get('category') != 'PROFILE' or 'notation' not in entry:
+                continue
+            if notation and entry['notation'] != notation:
+                continue
+            profiles += 1
+            by_notation.setdefault(entry['notation'], []).append(float(entry.get('total_ms', 0)))
+            for module_name, cost in IMPORT_ENTRY_PATTERN.findall(entry.get('imports', '')):
+                by_module.setdefault(module_name, []).append(float(cost))
+
+    def rows(groups: dict, key: str) -> list:
+        result = [
+            {key: name, 'runs': len(values), 'avg_ms': round(sum(values) / len(values), 1), 'max_ms': max(values)}
+            for name, values in groups.items()
+        ]
+        return sorted(result, key=lambda r: (-r['avg_ms'], r[key]))
+
+    return {
+        'profiles': profiles,
+        'notations': rows(by_notation, 'notation'),
+        'modules': rows(by_module, 'module'),
+    }
+
 # =============================================================================
 # WORK LOGGING
 # =============================================================================
@@ -285,19 +1239,18 @@ def log_work(
 
     try:
         log_file = get_log_path(plan_id, 'work')
-        log_file.parent.mkdir(parents=True, exist_ok=True)
 
         level = 'ERROR' if category == 'ERROR' else 'INFO'
         # Include category in message for work logs (DECISION, ARTIFACT, etc.)
         formatted_message = f"[{category}] {message}"
-        entry = format_log_entry(
-            level, formatted_message,
+        entry = _format_entry(
+            log_file, level, formatted_message,
             phase=phase,
             detail=detail
         )
 
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(entry)
+        # Synchronous: the entry count below must include this entry
+        write_log_entry(log_file, entry, sync=True)
 
         # Count entries
         total_entries = _count_entries(log_file)
@@ -344,7 +1297,7 @@ def read_work_log(plan_id: str, phase: Optional[str] = None) -> dict:
         }
 
     try:
-        log_file = get_log_path(plan_id, 'work')
+        log_file = get_read_log_path(plan_id, 'work')
 
         if not log_file.exists():
             return {
@@ -354,11 +1307,12 @@ def read_work_log(plan_id: str, phase: Optional[str] = None) -> dict:
                 'entries': []
             }
 
-        entries = _parse_log_file(log_file)
-
-        # Filter by phase if specified
         if phase:
-            entries = [e for e in entries if e.get('phase') == phase]
+            # Seek to the entries of this phase only
+            rows = [row for row in _load_index(log_file) if row[3] == phase]
+            entries = _read_indexed_entries(log_file, rows)
+        else:
+            entries = _parse_log_file(log_file)
 
         return {
             'status': 'success',
@@ -386,13 +1340,21 @@ def list_recent_work(plan_id: str, limit: int = 10) -> dict:
     Returns:
         Result dict with entries
     """
-    result = read_work_log(plan_id)
-
-    if result['status'] != 'success':
-        return result
+    if not validate_plan_id(plan_id):
+        return read_work_log(plan_id)
 
-    total = result['total_entries']
-    entries = result['entries'][-limit:]  # Get most recent
+    try:
+        log_file = get_read_log_path(plan_id, 'work')
+        rows = _load_index(log_file) if log_file.exists() else []
+        total = len(rows)
+        entries = _read_indexed_entries(log_file, rows[-limit:]) if rows else []  # Get most recent
+    except Exception as e:
+        return {
+            'status': 'error',
+            'plan_id': plan_id,
+            'error': 'read_failed',
+            'message': str(e)
+        }
 
     return {
         'status': 'success',
@@ -416,16 +1378,52 @@ HEADER_PATTERN = re.compile(
 FIELD_PATTERN = re.compile(r'^  (\w+): (.+)$', re.MULTILINE)
 
 def _parse_log_file(log_file: Path) -> list:
-    """Parse log file into list of entry dicts."""
-    entries = []
+    """Parse log file (and its rotated segments) into list of entry dicts."""
+    return list(iter_log_entries(log_file))
+
+def _parse_log_text(content: str, jsonl: bool = False) -> list:
+    """Parse log text (whole file or a slice of entries) into entry dicts."""
+    return list(_iter_entries(content.split('\n'), jsonl))
+
+def _is_jsonl_log(log_file: Path) -> bool:
+    """Whether a log holds JSONL records; decided by its name, never by line content."""
+    return log_file.suffix == JSONL_SUFFIX
+
+def _parse_record(line: str) -> Optional[dict]:
+    """Parse a JSONL record into an entry dict (None if malformed)."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    record.setdefault('category', None)
+    return record
+
+def _iter_entries(lines, jsonl: bool = False):
+    """
+    Parse log lines into entry dicts, one entry at a time.
+
+    A JSONL log holds one record per line. A text log holds entries of a
+    header line plus indented fields; other lines (e.g. unindented lines of
+    a multi-line message) belong to the current entry, even when they start
+    with '{'.
+    """
+    if jsonl:
+        for line in lines:
+            if line.strip():
+                record = _parse_record(line)
+                if record is not None:
+                    yield record
+        return
+
     current = None
 
-    content = log_file.read_text(encoding='utf-8')
-    for line in content.split('\n'):
+    for line in lines:
         header_match = HEADER_PATTERN.match(line)
         if header_match:
             if current:
-                entries.append(current)
+                yield current
             current = {
                 'timestamp': header_match.group(1),
                 'level': header_match.group(2),
@@ -438,16 +1436,518 @@ def _parse_log_file(log_file: Path) -> list:
                 current[field_match.group(1)] = field_match.group(2)
 
     if current:
-        entries.append(current)
+        yield current
 
-    return entries
+def iter_log_entries(log_file: Path):
+    """Stream the entries of a text or JSONL log (and its rotated segments) without reading it whole."""
+    return _iter_entries(iter_log_lines(log_file), _is_jsonl_log(log_file))
 
 def _count_entries(log_file: Path) -> int:
-    """Count entries in log file."""
+    """Count entries in log file (from its sidecar index)."""
+    _flush_pending(log_file)
     if not log_file.exists():
         return 0
-    content = log_file.read_text(encoding='utf-8')
-    return len(HEADER_PATTERN.findall(content))
+    return _sync_index(log_file)
+
+# =============================================================================
+# LOG INDEX
+# =============================================================================
+
+# Sidecar next to the log (work.log -> work.log.idx), one line per entry:
+#   byte offset <TAB> byte length <TAB> level <TAB> phase
+# Entry numbers are line numbers. Entries appended without updating the
+# index (buffered writer, log_entry, other processes) are indexed on the next
+# read by scanning only the unindexed tail.
+INDEX_SUFFIX = '.idx'
+PHASE_FIELD_PREFIX = b'  phase: '
+
+def _index_path(log_file: Path) -> Path:
+    """Get path to the sidecar index of a log file."""
+    return log_file.with_name(log_file.name + INDEX_SUFFIX)
+
+def _scan_entries(data: bytes, base: int, jsonl: bool = False) -> list:
+    """
+    Locate entries in raw log bytes.
+
+    Args:
+        data: Log content starting at an entry boundary
+        base: File offset of data
+        jsonl: Data is JSONL (one record per line) rather than text entries
+
+    Returns:
+        List of (offset, length, level, phase) tuples
+    """
+    rows = []
+    current = None
+    position = 0
+    for line in data.splitlines(keepends=True):
+        if jsonl:
+            record = _parse_record(line.decode('utf-8', errors='replace')) if line.strip() else None
+            if record is not None:
+                if current:
+                    current[1] = base + position - current[0]
+                    rows.append(tuple(current))
+                current = [base + position, 0, str(record.get('level') or ''), str(record.get('phase') or '')]
+        elif line.startswith(b'['):
+            match = HEADER_PATTERN.match(line.rstrip(b'\r\n').decode('utf-8', errors='replace'))
+            if match:
+                if current:
+                    current[1] = base + position - current[0]
+                    rows.append(tuple(current))
+                current = [base + position, 0, match.group(2), '']
+        elif current and line.startswith(PHASE_FIELD_PREFIX):
+            current[3] = line[len(PHASE_FIELD_PREFIX):].strip().decode('utf-8', errors='replace')
+        position += len(line)
+    if current:
+        current[1] = base + position - current[0]
+        rows.append(tuple(current))
+    return rows
+
+def _format_index_rows(rows: list) -> str:
+    return ''.join(f"{offset}\t{length}\t{level}\t{phase}\n" for offset, length, level, phase in rows)
+
+def _read_index_rows(index_file: Path) -> list:
+    """Read all index rows."""
+    rows = []
+    with open(index_file, encoding='utf-8') as f:
+        for line in f:
+            offset, length, level, phase = line.rstrip('\n').split('\t', 3)
+            rows.append((int(offset), int(length), level, phase))
+    return rows
+
+def _index_extent(index_file: Path) -> Optional[tuple]:
+    """(entry count, end offset of the last entry) of an index; None if missing or malformed."""
+    try:
+        data = index_file.read_bytes()
+        if not data:
+            return 0, 0
+        if not data.endswith(b'\n'):
+            return None
+        last = data[data.rfind(b'\n', 0, -1) + 1:].split(b'\t', 2)
+        return data.count(b'\n'), int(last[0]) + int(last[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _sync_index(log_file: Path) -> int:
+    """
+    Bring the sidecar index of a log file up to date.
+
+    Unindexed entries at the end of the log are scanned and appended to the
+    index. A missing, malformed or inconsistent index (log truncated or
+    rewritten) is rebuilt from a full scan. Runs under the log file lock, so
+    writers cannot append in between.
+
+    Returns:
+        Number of entries in the log
+    """
+    _flush_pending(log_file)
+    index_file = _index_path(log_file)
+    jsonl = _is_jsonl_log(log_file)
+    with open(log_file, 'rb') as log:
+        if fcntl is not None:
+            fcntl.flock(log.fileno(), fcntl.LOCK_EX)
+        size = os.fstat(log.fileno()).st_size
+        extent = _index_extent(index_file)
+
+        if extent is not None and extent[1] <= size:
+            count, covered = extent
+            log.seek(covered)
+            tail = log.read()
+            if not tail:
+                return count
+            if tail.startswith(b'{' if jsonl else b'['):
+                new_rows = _scan_entries(tail, covered, jsonl)
+                if new_rows and new_rows[0][0] == covered:
+                    with open(index_file, 'a', encoding='utf-8') as f:
+                        f.write(_format_index_rows(new_rows))
+                    return count + len(new_rows)
+
+        # Rebuild from a full scan
+        log.seek(0)
+        rows = _scan_entries(log.read(), 0, jsonl)
+        temp_file = index_file.with_name(index_file.name + '.tmp')
+        temp_file.write_text(_format_index_rows(rows), encoding='utf-8')
+        os.replace(temp_file, index_file)
+        return len(rows)
+
+def _load_index(log_file: Path) -> list:
+    """
+    Load the up-to-date sidecar index of a log file.
+
+    Returns:
+        List of (offset, length, level, phase) tuples, one per entry
+    """
+    _sync_index(log_file)
+    return _read_index_rows(_index_path(log_file))
+
+def _read_indexed_entries(log_file: Path, rows: list) -> list:
+    """Parse the entries at the given index rows (seeking to each one)."""
+    entries = []
+    jsonl = _is_jsonl_log(log_file)
+    with open(log_file, 'rb') as log:
+        for offset, length, _level, _phase in rows:
+            log.seek(offset)
+            entries.extend(_parse_log_text(log.read(length).decode('utf-8', errors='replace'), jsonl))
+    return entries
+
+# =============================================================================
+# TAIL READER
+# =============================================================================
+
+TAIL_BLOCK_SIZE = 8192
+
+def read_log_tail(log_file: Path, count: int, block_size: int = TAIL_BLOCK_SIZE) -> str:
+    """
+    Read the last entries of a log file by scanning it backwards.
+
+    Blocks of block_size bytes are read from the end of the file until count
+    entry headers (HEADER_PATTERN, or records of a .jsonl log) have been
+    found, so the bytes read depend on the size of the returned entries, not
+    on the size of the log. Rotated segments are read, newest first, only
+    when the active file has fewer entries; a compressed segment is
+    decompressed whole (it is at most LOG_ROTATE_BYTES).
+
+    Args:
+        log_file: Log file to read
+        count: Number of entries to return
+        block_size: Bytes read per step
+
+    Returns:
+        Log text of the last count entries (whole log if it has fewer)
+    """
+    import gzip
+    _flush_pending(log_file)
+    jsonl = _is_jsonl_log(log_file)
+    parts = []
+    for path in reversed(log_segments(log_file)):
+        if count <= 0:
+            break
+        try:
+            with _open_log(path, binary=True) as f:
+                # gzip streams cannot seek from the end
+                found, data = _scan_tail(io.BytesIO(f.read()) if isinstance(f, gzip.GzipFile) else f,
+                                         count, block_size, jsonl)
+        except FileNotFoundError:
+            continue  # Deleted by retention meanwhile
+        parts.append(data)
+        count -= found
+
+    return b''.join(reversed(parts)).decode('utf-8', errors='replace')
+
+def _scan_tail(log, count: int, block_size: int, jsonl: bool = False) -> tuple:
+    """
+    Scan a seekable binary file backwards for its last count entries.
+
+    In a JSONL log every line starting with '{' is an entry; in a text log
+    only lines matching HEADER_PATTERN are.
+
+    Returns:
+        Tuple of (entries found, bytes from the oldest found entry to the end)
+    """
+    position = log.seek(0, os.SEEK_END)
+    data = b''
+    boundary = 0  # Start of the oldest line checked so far, as index into data
+    found = 0
+    while True:
+        # Check complete lines ending at boundary, newest first
+        while found < count and boundary > 0:
+            newline = data.rfind(b'\n', 0, boundary - 1)
+            if newline < 0 and position > 0:
+                break  # Line starts in an earlier block
+            start = newline + 1
+            if jsonl:
+                if data.startswith(b'{', start):
+                    found += 1
+            elif data.startswith(b'[', start):
+                line = data[start:boundary].rstrip(b'\r\n').decode('utf-8', errors='replace')
+                if HEADER_PATTERN.match(line):
+                    found += 1
+            boundary = start
+        if found >= count or position == 0:
+            break
+        read = min(block_size, position)
+        position -= read
+        log.seek(position)
+        data = log.read(read) + data
+        boundary += read
+    return found, data[boundary:]
+
+def tail_log(plan_id: Optional[str], log_type: str, count: int) -> dict:
+    """
+    Get the last entries of a script or work log.
+
+    Args:
+        plan_id: Plan identifier (None for today's global log)
+        log_type: 'script' or 'work'
+        count: Number of entries to return
+
+    Returns:
+        Result dict with parsed entries (work) or raw entry text (script)
+    """
+    if plan_id is not None and not validate_plan_id(plan_id):
+        return {
+            'status': 'error',
+            'plan_id': plan_id,
+            'error': 'invalid_plan_id',
+            'message': f"Invalid plan_id format: {plan_id}"
+        }
+
+    try:
+        log_file = get_read_log_path(plan_id, log_type)
+        content = read_log_tail(log_file, count)
+        entries = _parse_log_text(content, _is_jsonl_log(log_file))
+    except Exception as e:
+        return {
+            'status': 'error',
+            'plan_id': plan_id,
+            'error': 'read_failed',
+            'message': str(e)
+        }
+
+    result = {'status': 'success'}
+    if plan_id is not None:
+        result['plan_id'] = plan_id
+    result['log_type'] = log_type
+    result['showing'] = len(entries)
+    if log_type == 'work':
+        result['entries'] = entries
+    else:
+        result['raw_content'] = content.rstrip('\n')
+    return result
+
+# =============================================================================
+# LOG QUERY
+# =============================================================================
+
+# Script execution message: "{notation} {subcommand} ({duration}s)" [+ " [cache hit]"]
+SCRIPT_MESSAGE_PATTERN = re.compile(r'^(\S+) (.*?) ?\((\d+(?:\.\d+)?)s\)( \[cache hit\])?$')
+LOG_FILE_DATE_PATTERN = re.compile(r'-(\d{4}-\d{2}-\d{2})\.\w+$')
+QUERY_GROUP_KEYS = ('notation', 'subcommand', 'level', 'category', 'plan_id', 'exit_code', 'phase')
+QUERY_COLUMNS = {
+    'script': ('timestamp', 'level', 'plan_id', 'notation', 'subcommand', 'exit_code', 'duration', 'message'),
+    'work': ('timestamp', 'level', 'plan_id', 'category', 'phase', 'message'),
+}
+
+def _structure_entry(entry: dict, plan_id: Optional[str], script: bool) -> dict:
+    """
+    Fill the structured fields of a parsed entry in place.
+
+    JSONL script records already carry notation, subcommand, duration and
+    exit_code. For text script entries they are derived from the message
+    and the exit_code field. plan_id falls back to the plan of the log file,
+    then to the --plan-id in the logged args.
+    """
+    if script and 'duration' not in entry and entry.get('category') is None:
+        match = SCRIPT_MESSAGE_PATTERN.match(entry.get('message') or '')
+        if match:
+            entry['notation'] = match.group(1)
+            entry['subcommand'] = match.group(2)
+            entry['duration'] = float(match.group(3))
+            if match.group(4):
+                entry['cached'] = True
+            try:
+                entry['exit_code'] = int(entry.get('exit_code', 0))
+            except ValueError:
+                pass
+    if not entry.get('plan_id'):
+        entry['plan_id'] = plan_id or extract_plan_id(str(entry.get('args', '')).split())
+    return entry
+
+def _to_iso(epoch: Optional[float]) -> Optional[str]:
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _query_sources(log_type: str, plan_id: Optional[str], since: Optional[str], until: Optional[str]) -> list:
+    """
+    Get (plan_id, path) of the logs a query reads.
+
+    Daily global logs outside the time range are skipped by their file
+    date (with a day of slack for local vs UTC dates).
+    """
+    sources = []
+    for log_file in list_global_logs(log_type):
+        match = LOG_FILE_DATE_PATTERN.search(log_file.name)
+        if match:
+            day = date.fromisoformat(match.group(1))
+            if since and (day - date.fromisoformat(since[:10])).days < -1:
+                continue
+            if until and (day - date.fromisoformat(until[:10])).days > 1:
+                continue
+        sources.append((None, log_file))
+    sources.extend((plan, path) for plan, path in list_plan_logs(log_type) if plan_id in (None, plan))
+    return sources
+
+def _aggregate(count: int, errors: int, durations: list) -> dict:
+    """Count, errors and duration total, percentiles and max (None without durations)."""
+    stats = {'count': count, 'errors': errors, 'total': 0.0, 'p50': None, 'p95': None, 'p99': None, 'max': None}
+    if durations:
+        durations.sort()
+        stats.update({
+            'total': round(sum(durations), 4),
+            'p50': _percentile(durations, 50),
+            'p95': _percentile(durations, 95),
+            'p99': _percentile(durations, 99),
+            'max': durations[-1],
+        })
+    return stats
+
+def query_log(
+    log_type: str = 'script',
+    plan_id: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    level: Optional[str] = None,
+    notation: Optional[str] = None,
+    exit_code: Optional[int] = None,
+    min_duration: Optional[float] = None,
+    group_by: Optional[str] = None,
+    limit: int = 0
+) -> dict:
+    """
+    Filter and aggregate log entries in one streaming pass.
+
+    Reads the global daily logs and the plan-scoped logs of a type, text and
+    JSONL alike, one entry at a time. Only durations and the last `limit`
+    matching entries are kept in memory.
+
+    Args:
+        log_type: 'script' or 'work'
+        plan_id: Only entries of this plan
+        since: Only entries at or after this epoch time
+        until: Only entries at or before this epoch time
+        level: Only entries of this level
+        notation: Only script executions of this notation
+        exit_code: Only script executions with this exit code
+        min_duration: Only script executions taking at least this many seconds
+        group_by: Aggregate per value of this field (QUERY_GROUP_KEYS)
+        limit: Number of matching entries to return (in log order)
+
+    Returns:
+        Result dict with files, count, errors, duration stats (total, p50,
+        p95, p99, max), groups (with group_by) and entries (with limit)
+    """
+    if log_type not in VALID_TYPES:
+        return {'status': 'error', 'error': 'invalid_type', 'message': f"type must be one of {VALID_TYPES}"}
+    if group_by and group_by not in QUERY_GROUP_KEYS:
+        return {
+            'status': 'error',
+            'error': 'invalid_group_by',
+            'message': f"group_by must be one of {', '.join(QUERY_GROUP_KEYS)}"
+        }
+
+    since_iso, until_iso = _to_iso(since), _to_iso(until)
+    sources = _query_sources(log_type, plan_id, since_iso, until_iso)
+    script = log_type == 'script'
+    count = errors = 0
+    durations: list = []
+    groups: dict = {}
+    recent: deque = deque(maxlen=max(limit, 0))
+
+    for source_plan, log_file in sources:
+        for entry in iter_log_entries(log_file):
+            timestamp = entry.get('timestamp') or ''
+            if (since_iso and timestamp < since_iso) or (until_iso and timestamp > until_iso):
+                continue
+            if level and entry.get('level') != level:
+                continue
+            _structure_entry(entry, source_plan, script)
+            if plan_id and entry['plan_id'] != plan_id:
+                continue
+            if notation and entry.get('notation') != notation:
+                continue
+            if exit_code is not None and entry.get('exit_code') != exit_code:
+                continue
+            duration = entry.get('duration')
+            if min_duration is not None and (duration is None or duration < min_duration):
+                continue
+
+            failed = entry.get('level') == 'ERROR'
+            count += 1
+            errors += failed
+            if duration is not None:
+                durations.append(duration)
+            if group_by:
+                group = groups.setdefault(entry.get(group_by), [0, 0, []])
+                group[0] += 1
+                group[1] += failed
+                if duration is not None:
+                    group[2].append(duration)
+            recent.append(entry)
+
+    result = {'status': 'success', 'log_type': log_type, 'files': len(sources)}
+    result.update(_aggregate(count, errors, durations))
+    if group_by:
+        rows = [{group_by: key, **_aggregate(*values)} for key, values in groups.items()]
+        result['groups'] = sorted(rows, key=lambda row: (-row['count'], str(row[group_by])))
+    if limit > 0:
+        columns = QUERY_COLUMNS[log_type]
+        result['entries'] = [{column: entry.get(column) for column in columns} for entry in recent]
+    return result
+
+def _entry_to_record(entry: dict) -> str:
+    """Serialize a parsed entry as a JSONL record."""
+    record = {key: value for key, value in entry.items() if value is not None}
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def convert_log_to_jsonl(log_file: Path, plan_id: Optional[str] = None) -> int:
+    """
+    Convert a text log to JSONL (name.log -> name.jsonl).
+
+    Script entries gain the structured fields of JSONL records. Records
+    already in the target (written after switching LOG_FORMAT) follow the
+    converted entries. The text log and the indexes of both files are
+    removed.
+
+    Args:
+        log_file: Text log to convert
+        plan_id: Plan the log belongs to (None for global logs)
+
+    Returns:
+        Number of converted entries
+    """
+    target = log_file.with_suffix(JSONL_SUFFIX)
+    script = not log_file.name.startswith('work')
+    temp_file = target.with_name(f'{target.name}.{_temp_token()}.tmp')
+    count = 0
+    with open(temp_file, 'w', encoding='utf-8') as out:
+        for entry in iter_log_entries(log_file):
+            if script:
+                _structure_entry(entry, plan_id, script)
+            out.write(_entry_to_record(entry))
+            count += 1
+        if target.exists():
+            _flush_pending(target)
+            import shutil
+            with open(target, encoding='utf-8') as existing:
+                shutil.copyfileobj(existing, out)
+    os.replace(temp_file, target)
+
+    for stale in (*log_segments(log_file), _index_path(log_file), _index_path(target)):
+        stale.unlink(missing_ok=True)
+    return count
+
+def convert_logs(plan_id: Optional[str] = None) -> list:
+    """
+    Convert text logs to JSONL.
+
+    Args:
+        plan_id: Only this plan's logs (default: all global and plan logs)
+
+    Returns:
+        List of dicts with file and entries (converted entry count)
+    """
+    targets = []
+    for log_type in VALID_TYPES:
+        if plan_id is None:
+            targets.extend((None, path) for path in list_global_logs(log_type))
+        targets.extend((plan, path) for plan, path in list_plan_logs(log_type) if plan_id in (None, plan))
+
+    converted = []
+    for plan, path in targets:
+        if path.suffix == LOG_SUFFIX:
+            converted.append({'file': str(path), 'entries': convert_log_to_jsonl(path, plan)})
+    return converted
 
 # =============================================================================
 # MODULE SELF-TEST
@@ -464,8 +1964,21 @@ if __name__ == '__main__':
     print("- format_log_entry(level, category, message, **fields) -> str")
     print("- extract_plan_id(args) -> str | None")
     print("- get_log_path(plan_id, log_type) -> Path")
+    print("- get_read_log_path(plan_id, log_type) -> Path")
     print("- log_script_execution(...)")
+    print("- write_log_entry(log_file, entry, sync) / LogWriter")
+    print("- start_buffered_logging(max_bytes, max_delay) / stop_buffered_logging()")
     print("- cleanup_old_script_logs(max_age_days) -> int")
+    print("- store_output(text) -> str / read_output(ref) -> str / gc_output_blobs(dry_run)")
+    print("- record_script_stats(notation, subcommand, exit_code, duration)")
+    print("- summarize_script_stats(since) -> list")
+    print("- parse_import_time(stderr) -> (modules, stderr)")
+    print("- log_import_profile(notation, subcommand, args, modules)")
+    print("- summarize_import_profiles(plan_id, notation) -> dict")
     print("- log_work(plan_id, category, message, phase, detail) -> dict")
     print("- read_work_log(plan_id, phase) -> dict")
     print("- list_recent_work(plan_id, limit) -> dict")
+    print("- read_log_tail(log_file, count) -> str")
+    print("- tail_log(plan_id, log_type, count) -> dict")
+    print("- query_log(log_type, plan_id, since, until, level, ...) -> dict")
+    print("- convert_logs(plan_id) -> list")
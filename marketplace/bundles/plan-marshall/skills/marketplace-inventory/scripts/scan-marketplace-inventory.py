@@ -40,6 +40,19 @@ MARKETPLACE_BUNDLES_PATH = "marketplace/bundles"
 CLAUDE_DIR = ".claude"
 PLUGIN_CACHE_SUBPATH = "plugins/cache/plan-marshall"
 
+# The executor may replay scans from its result cache while no bundle file changed
+# (global/project scopes read arbitrary .claude trees and are never cached)
+EXECUTOR_CACHE_POLICY = {
+    '*': {
+        'reads': [
+            'marketplace/bundles/**',
+            '../marketplace/bundles/**',
+            '{home}/.claude/plugins/cache/plan-marshall/**',
+        ],
+        'bypass': ['global', 'project', '--scope=global', '--scope=project'],
+    },
+}
+
 
 def safe_relative_path(path: Path) -> str:
     """Return path relative to cwd if possible, otherwise absolute path."""
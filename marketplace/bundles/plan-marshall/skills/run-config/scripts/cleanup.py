@@ -41,12 +41,21 @@ from dataclasses import dataclass
 from pathlib import Path
 
 # Direct import - PYTHONPATH set by executor
+from plan_logging import gc_output_blobs  # type: ignore[import-not-found]
 from toon_parser import serialize_toon  # type: ignore[import-not-found]
 
 # Configuration
 PLAN_BASE_DIR = Path(os.environ.get('PLAN_BASE_DIR', '.plan'))
 MARSHAL_JSON = PLAN_BASE_DIR / 'marshal.json'
 
+# Text logs, daily JSONL logs (LOG_FORMAT=jsonl) and rotated gzip segments; not script-stats.jsonl
+LOG_PATTERNS = ('*.log', 'script-execution-*.jsonl', 'work-*.jsonl', '*.log.gz', '*.jsonl.gz')
+
+
+def list_log_files(logs_dir: Path) -> list[Path]:
+    """Get the log files in .plan/logs that are subject to retention."""
+    return sorted(path for pattern in LOG_PATTERNS for path in logs_dir.glob(pattern))
+
 
 @dataclass
 class CleanupStats:
@@ -157,6 +166,9 @@ def clean_logs(max_age_days: int, dry_run: bool = False) -> tuple[int, int]:
     """
     Clean old log files from .plan/logs.
 
+    Output blobs (.plan/logs/blobs) that no remaining log references are
+    deleted with the logs and counted with them.
+
     Returns:
         (files_deleted, bytes_freed)
     """
@@ -167,10 +179,16 @@ def clean_logs(max_age_days: int, dry_run: bool = False) -> tuple[int, int]:
     deleted = 0
     total_bytes = 0
 
-    for log_file in logs_dir.glob('*.log'):
+    for log_file in list_log_files(logs_dir):
         if get_file_age_days(log_file) > max_age_days:
             try:
                 size = log_file.stat().st_size
+                # Sidecar entry index (work.log -> work.log.idx) goes with its log
+                index_file = log_file.with_name(log_file.name + '.idx')
+                if index_file.exists():
+                    size += index_file.stat().st_size
+                    if not dry_run:
+                        index_file.unlink()
                 if not dry_run:
                     log_file.unlink()
                 deleted += 1
@@ -178,7 +196,9 @@ def clean_logs(max_age_days: int, dry_run: bool = False) -> tuple[int, int]:
             except OSError:
                 pass
 
-    return deleted, total_bytes
+    # In a dry run the old logs still exist, so their blobs are not counted
+    blobs_deleted, blobs_bytes = gc_output_blobs(dry_run)
+    return deleted + blobs_deleted, total_bytes + blobs_bytes
 
 
 def clean_archived_plans(max_age_days: int, dry_run: bool = False) -> tuple[int, int]:
@@ -292,7 +312,7 @@ def get_status() -> dict:
     logs_old = 0
     logs_old_bytes = 0
     if logs_dir.exists():
-        for f in logs_dir.glob('*.log'):
+        for f in list_log_files(logs_dir):
             logs_total += 1
             if get_file_age_days(f) > retention['logs_days']:
                 logs_old += 1
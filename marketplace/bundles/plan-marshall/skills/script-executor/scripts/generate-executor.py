@@ -7,6 +7,7 @@ Usage:
     python3 generate-executor.py verify
     python3 generate-executor.py drift [--marketplace]
     python3 generate-executor.py paths
+    python3 generate-executor.py precompile [--check] [--timings]
     python3 generate-executor.py cleanup [--max-age-days N]
 
 Subcommands:
@@ -14,19 +15,29 @@ Subcommands:
     verify      Verify existing executor is valid
     drift       Compare executor mappings with current marketplace state
     paths       Verify all mapped paths exist
+    precompile  Compile all script directories into the executor's pycache prefix
     cleanup     Clean up old global logs
 
+Incremental Regeneration:
+    generate, verify and drift compare a stat-only fingerprint of the bundles
+    (stored in marshall-state.toon) and skip discovery/validation subprocesses
+    when nothing changed. Use generate --force to rebuild unconditionally.
+
 Context Detection:
     By default, operates in plugin-cache context (~/.claude/plugins/cache/plan-marshall/).
     Use --marketplace flag for marketplace development context (marketplace/bundles/).
 """
 
 import argparse
+import ast
 import hashlib
+import importlib.util
 import json
 import os
+import py_compile
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -41,6 +52,8 @@ PLAN_DIR = Path(PLAN_DIR_NAME)
 EXECUTOR_PATH = PLAN_DIR / 'execute-script.py'
 STATE_PATH = PLAN_DIR / 'marshall-state.toon'
 LOGS_DIR = PLAN_DIR / 'logs'
+# Dedicated bytecode cache (pycache prefix) used by the executor when present
+PYCACHE_DIR = PLAN_DIR / 'pycache'
 
 # Path constants
 MARKETPLACE_BUNDLES_PATH = "marketplace/bundles"
@@ -50,6 +63,34 @@ PLUGIN_CACHE_SUBPATH = "plugins/cache/plan-marshall"
 # Script-relative paths (resolved at runtime)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 
+# Notation prefixes eligible for in-process execution inside the executor
+IN_PROCESS_CANDIDATES = (
+    'pm-workflow:manage-',
+    'plan-marshall:logging:',
+)
+
+# Stdlib modules that make in-process execution unsafe: child processes and
+# threads write to the real fds (bypassing output capture), signal/atexit
+# handlers outlive the script
+IN_PROCESS_BLOCKED_MODULES = frozenset([
+    'asyncio',
+    'atexit',
+    'concurrent',
+    'ctypes',
+    'multiprocessing',
+    'signal',
+    'subprocess',
+    'threading',
+])
+
+# Marketplace modules reviewed to use blocked modules safely in-process (module
+# stem -> allowed imports). plan_logging only starts log-file threads (buffered
+# writer timer, segment compression) and registers a flush at exit; neither
+# touches stdout/stderr.
+IN_PROCESS_ALLOWED_IMPORTS = {
+    'plan_logging': frozenset(['atexit', 'threading']),
+}
+
 
 # ============================================================================
 # PATH RESOLUTION (follows scan-marketplace-inventory.py pattern)
@@ -251,6 +292,97 @@ def generate_mappings_code(mappings: dict[str, str]) -> str:
     return '\n'.join(lines)
 
 
+# ============================================================================
+# NOTATION INDEX
+# ============================================================================
+
+def notation_match_rank(notation: str, fragment: str) -> int:
+    """
+    Rank how a partial notation matches a full notation (lower is better).
+
+    Must stay identical to notation_match_rank() in execute-script.py.template.
+
+    0: fragment is a leading run of whole segments (e.g. 'pm-workflow')
+    1: fragment is a run of whole segments elsewhere (e.g. 'manage-files')
+    2: notation starts with fragment
+    3: a segment starts with fragment
+    4: plain substring
+    """
+    bounded = f':{notation}:'
+    if bounded.startswith(f':{fragment}:'):
+        return 0
+    if f':{fragment}:' in bounded:
+        return 1
+    if notation.startswith(fragment):
+        return 2
+    if f':{fragment}' in bounded:
+        return 3
+    return 4
+
+
+def _notation_trigrams(text: str) -> set[str]:
+    """Character trigrams of a (lowercased) notation fragment."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_prefix_index(mappings: dict[str, str]) -> dict[str, str]:
+    """
+    Map every run of whole notation segments to the notation it resolves to.
+
+    For 'pm-workflow:manage-files:manage-files' this covers 'pm-workflow',
+    'pm-workflow:manage-files', 'manage-files', 'manage-files:manage-files', ...
+    Ambiguous segment runs resolve to the best (rank, notation) - the same
+    order the executor uses for arbitrary substrings.
+
+    Returns:
+        dict mapping lowercase segment run to full notation (full notations excluded)
+    """
+    index: dict[str, tuple[int, str]] = {}
+    for notation in sorted(mappings):
+        key = notation.lower()
+        segments = key.split(':')
+        for start in range(len(segments)):
+            for end in range(start + 1, len(segments) + 1):
+                alias = ':'.join(segments[start:end])
+                if alias == key:
+                    continue
+                candidate = (notation_match_rank(key, alias), notation)
+                if alias not in index or candidate < index[alias]:
+                    index[alias] = candidate
+    return {alias: notation for alias, (_, notation) in sorted(index.items())}
+
+
+def build_trigram_index(mappings: dict[str, str]) -> dict[str, list[int]]:
+    """
+    Map each trigram to the positions (in sorted notation order) containing it.
+
+    Returns:
+        dict mapping trigram to sorted list of positions into sorted(mappings)
+    """
+    index: dict[str, list[int]] = {}
+    for position, notation in enumerate(sorted(mappings)):
+        for trigram in sorted(_notation_trigrams(notation.lower())):
+            index.setdefault(trigram, []).append(position)
+    return dict(sorted(index.items()))
+
+
+def generate_index_code(mappings: dict[str, str]) -> tuple[str, str]:
+    """
+    Generate string literals embedding the prefix and trigram indexes as compact JSON.
+
+    String literals keep executor startup cheap; the executor only parses
+    them on non-exact lookups.
+
+    Returns:
+        Tuple of (prefix_index_literal, trigram_index_literal)
+    """
+    compact = {'separators': (',', ':'), 'sort_keys': True}
+    return (
+        repr(json.dumps(build_prefix_index(mappings), **compact)),
+        repr(json.dumps(build_trigram_index(mappings), **compact)),
+    )
+
+
 def generate_executor(mappings: dict[str, str], base_path: Path, dry_run: bool = False) -> bool:
     """
     Generate execute-script.py with embedded mappings.
@@ -272,6 +404,11 @@ def generate_executor(mappings: dict[str, str], base_path: Path, dry_run: bool =
 
     template = executor_template.read_text()
     mappings_code = generate_mappings_code(mappings)
+    in_process_code = generate_in_process_code(find_in_process_scripts(mappings))
+    prefix_index_code, trigram_index_code = generate_index_code(mappings)
+    cache_policies = find_cache_policies(mappings)
+    cache_policy_code = generate_cache_policy_code(cache_policies)
+    cache_sources_code = generate_cache_sources_code(find_cache_sources(mappings, cache_policies))
 
     # logging module location (unified logging skill)
     logging_scripts_dir = get_logging_scripts_dir(base_path)
@@ -279,6 +416,11 @@ def generate_executor(mappings: dict[str, str], base_path: Path, dry_run: bool =
 
     content = template.replace('{{SCRIPT_MAPPINGS}}', mappings_code)
     content = content.replace('{{LOGGING_DIR}}', logging_dir)
+    content = content.replace('{{IN_PROCESS_SCRIPTS}}', in_process_code)
+    content = content.replace('{{NOTATION_PREFIXES}}', prefix_index_code)
+    content = content.replace('{{NOTATION_TRIGRAMS}}', trigram_index_code)
+    content = content.replace('{{CACHE_POLICIES}}', cache_policy_code)
+    content = content.replace('{{CACHE_SOURCES}}', cache_sources_code)
     content = content.replace('{{PLAN_DIR_NAME}}', PLAN_DIR_NAME)
 
     if dry_run:
@@ -287,24 +429,430 @@ def generate_executor(mappings: dict[str, str], base_path: Path, dry_run: bool =
         print("... (truncated)")
         return True
 
+    # Re-render only: keep the file (and its mtime) when content is identical
+    if EXECUTOR_PATH.exists() and EXECUTOR_PATH.read_text() == content:
+        return True
+
     PLAN_DIR.mkdir(parents=True, exist_ok=True)
     EXECUTOR_PATH.write_text(content)
     return True
 
 
+def _imported_modules(script_path: Path) -> set[str] | None:
+    """
+    Collect top-level names of all absolute imports in a script.
+
+    Imports anywhere in the file count (function-level imports included).
+
+    Returns:
+        Set of module names, or None if the file cannot be parsed
+    """
+    try:
+        tree = ast.parse(script_path.read_text(encoding='utf-8'), filename=str(script_path))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                return None
+            if node.module:
+                modules.add(node.module.split('.')[0])
+    return modules
+
+
+def is_in_process_safe(script_path: Path, local_modules: dict[str, Path],
+                       _seen: dict[Path, bool] | None = None) -> bool:
+    """
+    Statically decide whether a script can run inside the executor's interpreter.
+
+    A script is safe when every import is either a stdlib module not listed in
+    IN_PROCESS_BLOCKED_MODULES (unless IN_PROCESS_ALLOWED_IMPORTS allows it for
+    that module), or a marketplace module (from any scripts directory) that is
+    itself safe.
+
+    Args:
+        script_path: Script to check
+        local_modules: Module name to path for all marketplace script modules
+        _seen: Memo shared across recursive checks
+
+    Returns:
+        True if the script only depends on safe modules
+    """
+    seen = {} if _seen is None else _seen
+    if script_path in seen:
+        return seen[script_path]
+    seen[script_path] = True  # import cycles between safe modules stay safe
+
+    modules = _imported_modules(script_path)
+    if modules is None:
+        safe = False
+    else:
+        safe = True
+        allowed = IN_PROCESS_ALLOWED_IMPORTS.get(script_path.stem, frozenset())
+        for name in sorted(modules):
+            if name in local_modules:
+                safe = is_in_process_safe(local_modules[name], local_modules, seen)
+            else:
+                safe = name in sys.stdlib_module_names and (
+                    name not in IN_PROCESS_BLOCKED_MODULES or name in allowed)
+            if not safe:
+                break
+
+    seen[script_path] = safe
+    return safe
+
+
+def find_local_modules(mappings: dict[str, str]) -> dict[str, Path]:
+    """Module name to path for every module in the mapped scripts directories (first directory wins)."""
+    local_modules = {}
+    for script_dir in sorted({Path(p).parent for p in mappings.values()}):
+        if script_dir.is_dir():
+            for module_file in script_dir.glob('*.py'):
+                local_modules.setdefault(module_file.stem, module_file)
+    return local_modules
+
+
+def find_in_process_scripts(mappings: dict[str, str]) -> list[str]:
+    """
+    Determine notations the executor may run in-process.
+
+    Only notations matching IN_PROCESS_CANDIDATES are considered; each is
+    checked with is_in_process_safe().
+
+    Returns:
+        Sorted list of safe notations
+    """
+    local_modules = find_local_modules(mappings)
+    seen: dict[Path, bool] = {}
+    safe = []
+    for notation, path in sorted(mappings.items()):
+        if not notation.startswith(IN_PROCESS_CANDIDATES):
+            continue
+        if Path(path).is_file() and is_in_process_safe(Path(path), local_modules, seen):
+            safe.append(notation)
+    return safe
+
+
+def generate_in_process_code(notations: list[str]) -> str:
+    """Generate Python code for the in-process notation set entries."""
+    return '\n'.join(f"    '{notation}'," for notation in sorted(notations))
+
+
+# ============================================================================
+# RESULT CACHE POLICIES
+# ============================================================================
+
+# Module-level literal a script uses to declare cacheable read-only subcommands:
+#   EXECUTOR_CACHE_POLICY = {'list': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']}}
+CACHE_POLICY_NAME = 'EXECUTOR_CACHE_POLICY'
+CACHE_POLICY_FIELDS = {'reads': list, 'max_age': int, 'defaults': dict, 'bypass': list}
+
+
+def validate_cache_policy(policy) -> str | None:
+    """
+    Validate a declared cache policy.
+
+    Returns:
+        Error message, or None when the policy is valid
+    """
+    if not isinstance(policy, dict) or not policy:
+        return "must be a non-empty dict of subcommand -> rule"
+    for subcommand, rule in policy.items():
+        if not isinstance(subcommand, str) or not isinstance(rule, dict):
+            return f"rule for {subcommand!r} must be a dict"
+        for field, value in rule.items():
+            if field not in CACHE_POLICY_FIELDS:
+                return f"unknown field {field!r} in rule for {subcommand!r}"
+            if not isinstance(value, CACHE_POLICY_FIELDS[field]):
+                return f"field {field!r} in rule for {subcommand!r} must be {CACHE_POLICY_FIELDS[field].__name__}"
+        if not rule.get('reads') or not all(isinstance(p, str) for p in rule['reads']):
+            return f"rule for {subcommand!r} needs a non-empty 'reads' list of glob patterns"
+        if rule.get('max_age', 1) <= 0:
+            return f"max_age for {subcommand!r} must be positive"
+    return None
+
+
+def read_cache_policy(script_path: Path) -> dict | None:
+    """
+    Statically read a script's EXECUTOR_CACHE_POLICY declaration.
+
+    Returns:
+        The policy dict, or None when the script declares none (or it is invalid)
+    """
+    try:
+        tree = ast.parse(script_path.read_text(encoding='utf-8'))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == CACHE_POLICY_NAME):
+            try:
+                policy = ast.literal_eval(node.value)
+            except ValueError:
+                print(f"Warning: {script_path}: {CACHE_POLICY_NAME} is not a literal", file=sys.stderr)
+                return None
+            error = validate_cache_policy(policy)
+            if error:
+                print(f"Warning: {script_path}: {CACHE_POLICY_NAME} {error}", file=sys.stderr)
+                return None
+            return policy
+    return None
+
+
+def find_cache_policies(mappings: dict[str, str]) -> dict[str, dict]:
+    """Collect declared cache policies for all mapped scripts (notation -> policy)."""
+    policies = {}
+    for notation, path in sorted(mappings.items()):
+        policy = read_cache_policy(Path(path))
+        if policy:
+            policies[notation] = policy
+    return policies
+
+
+def generate_cache_policy_code(policies: dict[str, dict]) -> str:
+    """Generate the Python literal for the executor's CACHE_POLICIES (JSON of str/int/list/dict)."""
+    return json.dumps(policies, indent=4, sort_keys=True)
+
+
+def find_imported_sources(script_path: Path, local_modules: dict[str, Path]) -> list[str]:
+    """
+    Marketplace modules a script imports from other directories, directly or
+    through other marketplace modules.
+
+    Modules in the script's own directory are left out: the executor already
+    fingerprints that directory.
+
+    Returns:
+        Sorted module paths
+    """
+    found: set[Path] = set()
+    pending = [script_path]
+    while pending:
+        for name in sorted(_imported_modules(pending.pop()) or ()):
+            module_path = local_modules.get(name)
+            if module_path and module_path != script_path and module_path not in found:
+                found.add(module_path)
+                pending.append(module_path)
+    return sorted(str(path) for path in found if path.parent != script_path.parent)
+
+
+def find_cache_sources(mappings: dict[str, str], policies: dict[str, dict]) -> dict[str, list[str]]:
+    """Imported marketplace modules of every script with a cache policy (notation -> paths)."""
+    local_modules = find_local_modules(mappings)
+    return {notation: find_imported_sources(Path(mappings[notation]), local_modules)
+            for notation in sorted(policies)}
+
+
+def generate_cache_sources_code(sources: dict[str, list[str]]) -> str:
+    """Generate the Python literal for the executor's CACHE_SOURCES."""
+    return json.dumps(sources, indent=4, sort_keys=True)
+
+
 def compute_checksum(mappings: dict[str, str]) -> str:
     """Compute checksum of mappings for change detection."""
     content = json.dumps(mappings, sort_keys=True)
     return hashlib.md5(content.encode()).hexdigest()[:8]
 
 
-def update_state(script_count: int, checksum: str, logs_cleaned: int) -> None:
-    """Update marshall-state.toon with generation metadata."""
-    timestamp = datetime.now().isoformat()
-    content = f"""status\tgenerated\tscript_count\tchecksum\tlogs_cleaned
-success\t{timestamp}\t{script_count}\t{checksum}\t{logs_cleaned}
-"""
-    STATE_PATH.write_text(content)
+# Header of the legacy single-row state format (replaced by key/value lines)
+_LEGACY_STATE_HEADER = 'status\tgenerated\tscript_count\tchecksum\tlogs_cleaned'
+
+
+def read_state() -> dict[str, str]:
+    """
+    Read marshall-state.toon as key/value pairs.
+
+    Shares the file with bootstrap-plugin.py (plugin_root, detected_at), so the
+    format is one tab-separated key/value pair per line. A legacy header/row
+    block from older generators is ignored.
+    """
+    if not STATE_PATH.exists():
+        return {}
+
+    state = {}
+    lines = STATE_PATH.read_text().splitlines()
+    skip_next = False
+    for line in lines:
+        if skip_next:
+            skip_next = False
+            continue
+        if line == _LEGACY_STATE_HEADER:
+            skip_next = True
+            continue
+        if '\t' in line:
+            key, value = line.split('\t', 1)
+            state[key.strip()] = value.strip()
+    return state
+
+
+def write_state(state: dict[str, str]) -> None:
+    """Write marshall-state.toon as key/value lines."""
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f"{key}\t{value}" for key, value in state.items()]
+    STATE_PATH.write_text("\n".join(lines) + "\n")
+
+
+def update_state(script_count: int, checksum: str, logs_cleaned: int,
+                 fingerprint: dict[str, object] | None = None) -> None:
+    """
+    Update marshall-state.toon with generation metadata.
+
+    Existing keys (e.g., plugin_root from bootstrap-plugin.py) are preserved.
+
+    Args:
+        script_count: Number of mapped scripts
+        checksum: Mappings checksum
+        logs_cleaned: Number of deleted logs
+        fingerprint: Result of compute_fingerprint() to store for incremental runs
+    """
+    state = read_state()
+    for key in [k for k in state if k.startswith('bundle_fingerprint.')]:
+        del state[key]
+
+    state.update({
+        'status': 'success',
+        'generated': datetime.now().isoformat(),
+        'script_count': str(script_count),
+        'checksum': checksum,
+        'logs_cleaned': str(logs_cleaned),
+    })
+    if fingerprint:
+        state['executor_fingerprint'] = str(fingerprint['combined'])
+        state['executor_base_path'] = str(fingerprint['base_path'])
+        state['executor_stat'] = executor_stat()
+        for bundle, bundle_fingerprint in sorted(fingerprint['bundles'].items()):
+            state[f'bundle_fingerprint.{bundle}'] = bundle_fingerprint
+    write_state(state)
+
+
+# ============================================================================
+# FINGERPRINTS (incremental regeneration)
+# ============================================================================
+
+def _stat_token(path: Path) -> str | None:
+    """mtime_ns:size of a path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _bundle_roots(bundle_dir: Path) -> list[Path]:
+    """Bundle content roots: the bundle itself or its versioned subdirectories (plugin-cache)."""
+    roots = [bundle_dir]
+    with os.scandir(bundle_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and entry.name[:1].isdigit() and entry.name.count('.') == 2:
+                roots.append(Path(entry.path))
+    return sorted(roots)
+
+
+def compute_bundle_fingerprint(bundle_dir: Path) -> str | None:
+    """
+    Fingerprint the script layout of one bundle without reading any file.
+
+    Covers the mtimes of skills/, every skill directory and every scripts/
+    directory (catching added/removed/renamed scripts) plus path, mtime and
+    size of each file in scripts/ (catching edits that affect in-process
+    safety). Only stat calls are used.
+
+    Returns:
+        Short hash, or None if the bundle has no skills directory
+    """
+    entries = []
+    for root in _bundle_roots(bundle_dir):
+        skills_dir = root / 'skills'
+        skills_token = _stat_token(skills_dir)
+        if skills_token is None:
+            continue
+        entries.append(f"{skills_dir.relative_to(bundle_dir)}\t{skills_token}")
+        with os.scandir(skills_dir) as skills:
+            skill_paths = sorted(Path(e.path) for e in skills if e.is_dir())
+        for skill_dir in skill_paths:
+            entries.append(f"{skill_dir.relative_to(bundle_dir)}\t{_stat_token(skill_dir)}")
+            scripts_dir = skill_dir / 'scripts'
+            scripts_token = _stat_token(scripts_dir)
+            if scripts_token is None:
+                continue
+            entries.append(f"{scripts_dir.relative_to(bundle_dir)}\t{scripts_token}")
+            with os.scandir(scripts_dir) as scripts:
+                for entry in sorted(scripts, key=lambda e: e.name):
+                    if entry.is_file():
+                        st = entry.stat()
+                        entries.append(f"{entry.name}\t{st.st_mtime_ns}:{st.st_size}")
+
+    if not entries:
+        return None
+    return hashlib.md5('\n'.join(entries).encode()).hexdigest()[:12]
+
+
+def compute_fingerprint(base_path: Path) -> dict[str, object]:
+    """
+    Fingerprint everything the generated executor depends on.
+
+    Per-bundle script layout fingerprints, plus the template, logging module,
+    this generator and PLAN_DIR_NAME. Equal fingerprints mean regeneration
+    would produce the same executor.
+
+    Returns:
+        dict with 'bundles' (name -> hash), 'combined' (hash) and 'base_path'
+    """
+    bundles = {}
+    for bundle_dir in sorted(p for p in base_path.iterdir() if p.is_dir()):
+        bundle_fingerprint = compute_bundle_fingerprint(bundle_dir)
+        if bundle_fingerprint:
+            bundles[bundle_dir.name] = bundle_fingerprint
+
+    inputs = {
+        'bundles': bundles,
+        'template': _stat_token(get_templates_dir(base_path) / 'execute-script.py.template'),
+        'logging': _stat_token(get_logging_scripts_dir(base_path) / 'plan_logging.py'),
+        'generator': _stat_token(Path(__file__)),
+        'plan_dir_name': PLAN_DIR_NAME,
+    }
+    combined = hashlib.md5(json.dumps(inputs, sort_keys=True).encode()).hexdigest()[:16]
+    return {'bundles': bundles, 'combined': combined, 'base_path': str(base_path.resolve())}
+
+
+def executor_stat() -> str:
+    """mtime_ns:size of the generated executor ('' if missing)."""
+    return _stat_token(EXECUTOR_PATH) or ''
+
+
+def is_executor_current(state: dict[str, str], fingerprint: dict[str, object]) -> bool:
+    """
+    Check whether the executor was generated from the current bundle state.
+
+    True when the stored fingerprint matches and the executor file is the one
+    written by that generation (not edited or deleted since).
+    """
+    return (
+        bool(state.get('executor_fingerprint'))
+        and state.get('executor_fingerprint') == fingerprint['combined']
+        and state.get('executor_base_path') == fingerprint['base_path']
+        and state.get('executor_stat') == executor_stat()
+    )
+
+
+def changed_bundles(state: dict[str, str], fingerprint: dict[str, object]) -> list[str]:
+    """Bundles whose fingerprint differs from the stored one (added, removed or modified)."""
+    stored = {k.split('.', 1)[1]: v for k, v in state.items() if k.startswith('bundle_fingerprint.')}
+    current = fingerprint['bundles']
+    return sorted(name for name in set(stored) | set(current) if stored.get(name) != current.get(name))
+
+
+def _stored_base_path() -> Path | None:
+    """Base path recorded by the last generation, if it still exists."""
+    stored = read_state().get('executor_base_path')
+    if stored and Path(stored).is_dir():
+        return Path(stored)
+    return None
 
 
 def cleanup_old_logs(max_age_days: int = 7) -> int:
@@ -322,7 +870,8 @@ def cleanup_old_logs(max_age_days: int = 7) -> int:
     if not LOGS_DIR.exists():
         return 0
 
-    for log_file in LOGS_DIR.glob('script-execution-*.log'):
+    for log_file in [*LOGS_DIR.glob('script-execution-*.log'), *LOGS_DIR.glob('script-execution-*.jsonl'),
+                     *LOGS_DIR.glob('script-execution-*.gz')]:
         try:
             if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
@@ -333,6 +882,173 @@ def cleanup_old_logs(max_age_days: int = 7) -> int:
     return deleted
 
 
+# ============================================================================
+# BYTECODE PRECOMPILATION
+# ============================================================================
+
+# Snippet measuring script startup cost in a fresh interpreter: imports of all
+# dependencies plus compiling the script itself (never cached as __main__).
+# Prints one time in ms per script path argument.
+_IMPORT_TIMING_CODE = """
+import ast, importlib, sys, time
+for path in sys.argv[1:]:
+    start = time.perf_counter()
+    tree = ast.parse(open(path, 'rb').read(), filename=path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(a.name.split('.')[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module.split('.')[0])
+    for name in dict.fromkeys(names):
+        try:
+            importlib.import_module(name)
+        except BaseException:
+            pass
+    compile(tree, path, 'exec')
+    print(f'{(time.perf_counter() - start) * 1000:.1f}', flush=True)
+"""
+
+
+def get_script_dirs(mappings: dict[str, str]) -> list[Path]:
+    """Unique script directories of the mappings (the generated _PYTHONPATH)."""
+    return sorted({Path(p).parent for p in mappings.values() if Path(p).parent.is_dir()})
+
+
+def _pyc_path(source: Path, prefix: Path) -> Path:
+    """Location of the bytecode for source under a pycache prefix."""
+    original = sys.pycache_prefix
+    sys.pycache_prefix = str(prefix.resolve())
+    try:
+        return Path(importlib.util.cache_from_source(str(source.resolve())))
+    finally:
+        sys.pycache_prefix = original
+
+
+def _is_pyc_fresh(source: Path, pyc: Path) -> bool:
+    """Check magic number and source mtime/size recorded in a timestamp-based pyc header."""
+    try:
+        with open(pyc, 'rb') as f:
+            header = f.read(16)
+        st = source.stat()
+    except OSError:
+        return False
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+    mtime = int.from_bytes(header[8:12], 'little')
+    size = int.from_bytes(header[12:16], 'little')
+    return mtime == (int(st.st_mtime) & 0xFFFFFFFF) and size == (st.st_size & 0xFFFFFFFF)
+
+
+def precompile_script_dirs(script_dirs: list[Path], prefix: Path,
+                           check_only: bool = False) -> dict[str, object]:
+    """
+    Compile every .py file of the script directories into a pycache prefix and verify it.
+
+    Args:
+        script_dirs: Directories on the executor's PYTHONPATH
+        prefix: Pycache prefix directory (PYTHONPYCACHEPREFIX)
+        check_only: Only verify existing bytecode, compile nothing
+
+    Returns:
+        dict with 'compiled', 'verified', 'stale' (list of paths) and 'failed' (list of (path, error))
+    """
+    compiled = 0
+    failed = []
+    sources = [f for d in script_dirs for f in sorted(d.glob('*.py'))]
+
+    if not check_only:
+        prefix.mkdir(parents=True, exist_ok=True)
+        for source in sources:
+            try:
+                py_compile.compile(str(source), cfile=str(_pyc_path(source, prefix)), doraise=True)
+                compiled += 1
+            except (py_compile.PyCompileError, OSError) as e:
+                failed.append((str(source), str(e).strip().splitlines()[-1] if str(e).strip() else type(e).__name__))
+
+    failed_paths = {path for path, _ in failed}
+    stale = [str(source) for source in sources
+             if str(source) not in failed_paths and not _is_pyc_fresh(source, _pyc_path(source, prefix))]
+
+    return {
+        'compiled': compiled,
+        'verified': len(sources) - len(stale) - len(failed),
+        'stale': stale,
+        'failed': failed,
+    }
+
+
+def _run_import_timing(script_paths: list[str], script_dirs: list[Path], prefix: Path) -> list[float | None]:
+    """Import the dependencies of scripts in one fresh interpreter using a pycache prefix."""
+    env = os.environ.copy()
+    env['PYTHONPATH'] = ':'.join(str(d) for d in script_dirs)
+    env['PYTHONPYCACHEPREFIX'] = str(prefix.resolve())
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    try:
+        result = subprocess.run(
+            [sys.executable, '-c', _IMPORT_TIMING_CODE] + script_paths,
+            capture_output=True,
+            text=True,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            timeout=300
+        )
+    except subprocess.TimeoutExpired:
+        return [None] * len(script_paths)
+
+    timings: list[float | None] = []
+    for line in result.stdout.splitlines():
+        try:
+            timings.append(float(line))
+        except ValueError:
+            timings.append(None)
+    return (timings + [None] * len(script_paths))[:len(script_paths)]
+
+
+def warm_pycache(mappings: dict[str, str], prefix: Path) -> None:
+    """
+    Import every script's dependencies once with the prefix active.
+
+    With a pycache prefix active, stdlib modules are cached under the prefix
+    too; warming fills those entries so the first real call finds everything.
+    This runs every mapped script's imports, so only `precompile` calls it.
+    """
+    script_paths = sorted({p for p in mappings.values() if p.endswith('.py') and Path(p).is_file()})
+    if script_paths:
+        _run_import_timing(script_paths, get_script_dirs(mappings), prefix)
+
+
+def measure_import_time(script_path: str, script_dirs: list[Path], prefix: Path) -> float | None:
+    """
+    Measure a script's startup cost (dependency imports + compile) in a fresh interpreter.
+
+    Returns:
+        Milliseconds, or None if the measurement failed
+    """
+    return _run_import_timing([script_path], script_dirs, prefix)[0]
+
+
+def measure_script_timings(mappings: dict[str, str], prefix: Path) -> list[tuple[str, float | None, float | None]]:
+    """
+    Report cold (empty bytecode cache) vs warm (precompiled prefix) start cost per script.
+
+    Returns:
+        List of (notation, cold_ms, warm_ms), slowest cold start first
+    """
+    script_dirs = get_script_dirs(mappings)
+    timings = []
+    with tempfile.TemporaryDirectory(prefix='pycache-cold-') as cold_dir:
+        for notation, path in sorted(mappings.items()):
+            if not path.endswith('.py') or not Path(path).is_file():
+                continue
+            # Fresh empty prefix per script: everything (stdlib included) is compiled
+            cold_prefix = Path(cold_dir) / str(len(timings))
+            cold = measure_import_time(path, script_dirs, cold_prefix)
+            warm = measure_import_time(path, script_dirs, prefix)
+            timings.append((notation, cold, warm))
+    return sorted(timings, key=lambda t: -(t[1] or 0))
+
+
 # ============================================================================
 # VERIFICATION
 # ============================================================================
@@ -352,7 +1068,9 @@ def verify_executor(base_path: Path | None = None) -> tuple[bool, int]:
         print(f"Error: Executor not found: {EXECUTOR_PATH}", file=sys.stderr)
         return False, 0
 
-    # Resolve base_path if not provided
+    # Resolve base_path if not provided (prefer the one the executor was generated from)
+    if base_path is None:
+        base_path = _stored_base_path()
     if base_path is None:
         try:
             base_path = get_base_path(use_marketplace=False)
@@ -367,6 +1085,14 @@ def verify_executor(base_path: Path | None = None) -> tuple[bool, int]:
         print(f"Error: Logging module not found: {logging_module}", file=sys.stderr)
         return False, 0
 
+    # Fast path: executor and bundles unchanged since a successful generation
+    state = read_state()
+    if state.get('script_count', '').isdigit() and is_executor_current(state, compute_fingerprint(base_path)):
+        script_count = int(state['script_count'])
+        print(f"Executor valid: {script_count} scripts mapped (fingerprint unchanged)")
+        print("Logging module valid")
+        return True, script_count
+
     # Try to import and validate using importlib.util for hyphenated filename
     try:
         executor_path = f'{PLAN_DIR_NAME}/execute-script.py'
@@ -478,6 +1204,19 @@ def cmd_generate(args):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Incremental: skip discovery when nothing changed since the last generation
+    fingerprint = compute_fingerprint(base_path)
+    state = read_state()
+    if not args.force and not args.dry_run and is_executor_current(state, fingerprint):
+        print("Executor up to date (bundle fingerprint unchanged)")
+        print("\nstatus\tscripts_discovered\texecutor_generated\tlogs_cleaned")
+        print(f"success\t{state.get('script_count', 0)}\t{EXECUTOR_PATH}\t0")
+        return
+
+    changed = changed_bundles(state, fingerprint)
+    if state.get('executor_fingerprint') and changed:
+        print(f"Changed bundles: {', '.join(changed)}")
+
     # Discover scripts
     print("Discovering scripts...")
     try:
@@ -488,10 +1227,16 @@ def cmd_generate(args):
 
     print(f"Found {len(mappings)} scripts")
 
+    in_process = find_in_process_scripts(mappings)
+    print(f"In-process safe: {len(in_process)}")
+
     if args.dry_run:
         print("\n=== Script Mappings ===")
         for notation, path in sorted(mappings.items()):
             print(f"  {notation} -> {path}")
+        print("\n=== In-Process Scripts ===")
+        for notation in in_process:
+            print(f"  {notation}")
         print()
 
     # Generate executor (uses logging skill from plan-marshall/logging)
@@ -510,7 +1255,15 @@ def cmd_generate(args):
 
     # Update state
     checksum = compute_checksum(mappings)
-    update_state(len(mappings), checksum, logs_cleaned)
+    update_state(len(mappings), checksum, logs_cleaned, fingerprint)
+
+    # Precompile helper modules so the first call after an update skips compilation.
+    # compileall runs no module code; warming stdlib imports is left to `precompile`.
+    precompiled = precompile_script_dirs(get_script_dirs(mappings), PYCACHE_DIR)
+    print(f"Precompiled {precompiled['compiled']} modules into {PYCACHE_DIR} "
+          f"(run 'precompile' to also warm stdlib imports)")
+    for path, error in precompiled['failed']:
+        print(f"Warning: could not compile {path}: {error}", file=sys.stderr)
 
     # Output summary in TOON format
     print("\nstatus\tscripts_discovered\texecutor_generated\tlogs_cleaned")
@@ -532,9 +1285,7 @@ def cmd_verify(args):
 
 def cmd_drift(args):
     """Compare executor mappings with current bundles state."""
-    executor_mappings = get_executor_mappings()
-
-    if not executor_mappings:
+    if not EXECUTOR_PATH.exists():
         print("Error: Could not read executor mappings", file=sys.stderr)
         sys.exit(1)
 
@@ -547,6 +1298,25 @@ def cmd_drift(args):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Fast path: unchanged fingerprint means no drift (no subprocess needed)
+    state = read_state()
+    fingerprint = compute_fingerprint(base_path)
+    if is_executor_current(state, fingerprint):
+        print(f"Executor scripts: {state.get('script_count', 0)} (fingerprint unchanged)")
+        print(f"\nstatus\tadded\tremoved\tchanged")
+        print(f"ok\t0\t0\t0")
+        sys.exit(0)
+
+    changed = changed_bundles(state, fingerprint)
+    if state.get('executor_fingerprint') and changed:
+        print(f"Changed bundles: {', '.join(changed)}")
+
+    executor_mappings = get_executor_mappings()
+
+    if not executor_mappings:
+        print("Error: Could not read executor mappings", file=sys.stderr)
+        sys.exit(1)
+
     # Get current bundles state using discover_scripts()
     try:
         current_mappings = discover_scripts(base_path)
@@ -623,6 +1393,36 @@ def cmd_paths(args):
         sys.exit(0)
 
 
+def cmd_precompile(args):
+    """Precompile script directories into the pycache prefix and report start costs."""
+    mappings = get_executor_mappings()
+
+    if not mappings:
+        print("Error: Could not read executor mappings", file=sys.stderr)
+        sys.exit(1)
+
+    result = precompile_script_dirs(get_script_dirs(mappings), PYCACHE_DIR, check_only=args.check)
+    if not args.check:
+        warm_pycache(mappings, PYCACHE_DIR)
+
+    for path in result['stale']:
+        print(f"  stale: {path}")
+    for path, error in result['failed']:
+        print(f"  failed: {path}: {error}")
+
+    if args.timings:
+        print("\nnotation\tcold_ms\twarm_ms")
+        for notation, cold, warm in measure_script_timings(mappings, PYCACHE_DIR):
+            cold_text = f"{cold:.1f}" if cold is not None else '-'
+            warm_text = f"{warm:.1f}" if warm is not None else '-'
+            print(f"{notation}\t{cold_text}\t{warm_text}")
+
+    status = 'ok' if not result['stale'] and not result['failed'] else 'error'
+    print("\nstatus\tcompiled\tverified\tstale\tfailed\tpycache")
+    print(f"{status}\t{result['compiled']}\t{result['verified']}\t{len(result['stale'])}\t{len(result['failed'])}\t{PYCACHE_DIR}")
+    sys.exit(0 if status == 'ok' else 1)
+
+
 def cmd_cleanup(args):
     """Clean up old global logs."""
     deleted = cleanup_old_logs(max_age_days=args.max_age_days)
@@ -642,7 +1442,8 @@ def main():
 
     # generate subcommand
     gen_parser = subparsers.add_parser('generate', help='Generate executor with script mappings')
-    gen_parser.add_argument('--force', action='store_true', help='Force regeneration')
+    gen_parser.add_argument('--force', action='store_true',
+                           help='Force regeneration even if the bundle fingerprint is unchanged')
     gen_parser.add_argument('--dry-run', action='store_true', help='Show what would be generated')
     gen_parser.add_argument('--marketplace', action='store_true',
                            help='Use marketplace context (development mode) instead of plugin-cache')
@@ -662,6 +1463,13 @@ def main():
     paths_parser = subparsers.add_parser('paths', help='Verify all mapped paths exist')
     paths_parser.set_defaults(func=cmd_paths)
 
+    # precompile subcommand
+    precompile_parser = subparsers.add_parser('precompile', help='Precompile script directories into the pycache prefix')
+    precompile_parser.add_argument('--check', action='store_true', help='Only verify existing bytecode')
+    precompile_parser.add_argument('--timings', action='store_true',
+                                   help='Report cold vs warm start time per script')
+    precompile_parser.set_defaults(func=cmd_precompile)
+
     # cleanup subcommand
     cleanup_parser = subparsers.add_parser('cleanup', help='Clean up old global logs')
     cleanup_parser.add_argument('--max-age-days', type=int, default=7, help='Max age in days (default: 7)')
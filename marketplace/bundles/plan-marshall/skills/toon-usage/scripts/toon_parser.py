@@ -11,16 +11,30 @@ Supports:
 - Uniform arrays with headers (items[N]{field1,field2}:)
 - Comments (#)
 - Multi-line values (|)
+- Streaming events for large documents (iter_toon)
+- Incremental writing to text streams (ToonWriter)
+- Compact columnar uniform arrays (parse_toon(..., tables=True) -> ToonTable)
+- Cached file loading keyed by (inode, size, mtime_ns) (load_cached, save_toon)
 
 Stdlib-only - no external dependencies.
 
 Usage:
     from toon_parser import parse_toon, serialize_toon, ToonParseError
+    from toon_parser import iter_toon, ToonEvent, ToonWriter, ToonTable
+    from toon_parser import load_cached, save_toon
 """
 
+import os
 import re
-from dataclasses import dataclass
-from typing import Any
+import shutil
+import tempfile
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import sub
+from typing import IO, Any, TextIO
 
 
 class ToonParseError(Exception):
@@ -34,83 +48,291 @@ class ToonParseError(Exception):
 
 @dataclass
 class ParseContext:
-    """Internal parsing context."""
+    """Internal parsing context.
+
+    The tokenizer fills three lists parallel to lines in a single pass:
+    indents (leading whitespace), contents (stripped line) and skips (blank
+    or comment line). Parsers work on these; only multi-line values read the
+    raw lines.
+    """
     lines: list[str]
+    indents: list[int] = field(default_factory=list)
+    contents: list[str] = field(default_factory=list)
+    skips: list[bool] = field(default_factory=list)
     index: int = 0
     base_indent: int = 0
+    tables: bool = False
 
 
-def _get_indent(line: str) -> int:
-    """Get the indentation level of a line (count of leading spaces)."""
-    return len(line) - len(line.lstrip())
+class ToonRow(Mapping):
+    """Read-only dict-like view of one ToonTable row."""
 
+    __slots__ = ('_index', '_values')
 
-def _parse_value(value_str: str) -> Any:
-    """Parse a TOON value string into Python type."""
-    value_str = value_str.strip()
+    def __init__(self, index: dict[str, int], values: tuple[Any, ...]):
+        self._index = index
+        self._values = values
 
-    # Empty
-    if not value_str:
-        return ''
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
 
-    # Null
-    if value_str == 'null':
-        return None
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class ToonTable(Sequence):
+    """Uniform array stored as one shared header and a tuple per row.
+
+    Returned by parse_toon(content, tables=True) instead of a list of dicts,
+    which repeats every field name in every row. Indexing and iteration
+    yield ToonRow views created on demand, so read-only callers written for
+    the list-of-dicts form keep working; to_list() converts for callers that
+    need real dicts.
+    """
+
+    __slots__ = ('fields', 'rows', '_index')
+
+    def __init__(self, fields: Iterable[str], rows: list[tuple[Any, ...]]):
+        self.fields = tuple(fields)
+        self.rows = rows
+        self._index = {name: position for position, name in enumerate(self.fields)}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ToonTable(self.fields, self.rows[index])
+        return ToonRow(self._index, self.rows[index])
+
+    def __iter__(self) -> Iterator[ToonRow]:
+        index = self._index
+        return (ToonRow(index, values) for values in self.rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ToonTable):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ToonTable(fields={list(self.fields)!r}, rows={len(self.rows)})"
+
+    def column(self, name: str) -> list[Any]:
+        """All values of one field, in row order."""
+        position = self._index[name]
+        return [values[position] for values in self.rows]
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Convert to the list-of-dicts form returned by default."""
+        factory = _row_factory(self.fields)
+        return [factory(*values) for values in self.rows]
+
+
+# Precompiled patterns (content is always stripped, so no anchors for whitespace)
+_UNIFORM_ARRAY_HEADER = re.compile(r'([\w_-]+)\[(\d+)\]\{([^}]+)\}:\s*$')
+_SIMPLE_ARRAY_HEADER = re.compile(r'([\w_-]+)\[(\d+)\]:\s*$')
+_KEY_VALUE_LINE = re.compile(r'[a-zA-Z_]\w*\s*:')
+# int | float | percentage (group 1: fraction, group 2: percent sign)
+_NUMBER = re.compile(r'-?\d+(\.\d+)?|\d+(%)')
+
+# Whole-column patterns (values joined with newlines)
+_INT_COLUMN = re.compile(r'-?\d+(?:\n-?\d+)*')
+_FLOAT_COLUMN = re.compile(r'-?\d+\.\d+(?:\n-?\d+\.\d+)*')
+_BOOL_COLUMN = re.compile(r'(?:true|false)(?:\n(?:true|false))*')
+# Any empty, constant, numeric or quoted value in a newline-framed column
+# (literal-led, so searching only tries positions at line starts)
+_SPECIAL_VALUE = re.compile(r'\n(?:null|true|false|-?\d+(?:\.\d+)?|\d+%)?\n|\n"')
+
+# Placeholder for commas inside quotes while splitting a block of rows
+_QUOTED_COMMA = '\x1f'
+
+_CONSTANTS = {'': '', 'null': None, 'true': True, 'false': False}
+_NOT_CONSTANT = object()
 
-    # Boolean
-    if value_str == 'true':
-        return True
-    if value_str == 'false':
-        return False
 
-    # Number (int or float)
-    if re.match(r'^-?\d+$', value_str):
-        return int(value_str)
-    if re.match(r'^-?\d+\.\d+$', value_str):
-        return float(value_str)
+def _tokenize(ctx: ParseContext) -> None:
+    """Tokenize all lines once into the context's indents, contents and skips."""
+    stripped = [line.lstrip() for line in ctx.lines]
+    ctx.indents = list(map(sub, map(len, ctx.lines), map(len, stripped)))
+    ctx.contents = list(map(str.rstrip, stripped))
+    ctx.skips = [not content or content[0] == '#' for content in ctx.contents]
 
-    # Percentage (convert to int)
-    if re.match(r'^\d+%$', value_str):
-        return int(value_str[:-1])
+
+def _parse_value(value_str: str) -> Any:
+    """Parse a TOON value string into Python type."""
+    value_str = value_str.strip()
+
+    # Empty, null, boolean
+    constant = _CONSTANTS.get(value_str, _NOT_CONSTANT)
+    if constant is not _NOT_CONSTANT:
+        return constant
+
+    # Number (int, float, or percentage converted to int)
+    first = value_str[0]
+    if first == '-' or first.isdecimal():
+        match = _NUMBER.fullmatch(value_str)
+        if match:
+            if match.group(2):
+                return int(value_str[:-1])
+            if match.group(1):
+                return float(value_str)
+            return int(value_str)
 
     # String (possibly quoted)
-    if value_str.startswith('"') and value_str.endswith('"'):
+    if first == '"' and value_str.endswith('"'):
         return value_str[1:-1]
 
     return value_str
 
 
+def _split_csv_row(row: str) -> list[str]:
+    """Split a CSV-style row on commas outside double quotes (quotes are dropped)."""
+    if '"' not in row:
+        return row.split(',')
+
+    # Even segments lie outside quotes, odd segments inside
+    values = []
+    current = []
+    for position, segment in enumerate(row.split('"')):
+        if position % 2:
+            current.append(segment)
+            continue
+        pieces = segment.split(',')
+        current.append(pieces[0])
+        for piece in pieces[1:]:
+            values.append(''.join(current))
+            current = [piece]
+    values.append(''.join(current))
+    return values
+
+
 def _parse_csv_row(row: str, fields: list[str]) -> dict[str, Any]:
     """Parse a CSV-style row into a dictionary using field headers."""
-    result = {}
+    values = _split_csv_row(row)
 
-    # Handle quoted values with commas
-    values = []
-    current = ''
-    in_quotes = False
-
-    for char in row:
-        if char == '"':
-            in_quotes = not in_quotes
-        elif char == ',' and not in_quotes:
-            values.append(current.strip())
-            current = ''
-        else:
-            current += char
+    # Map values to fields (missing values are None, extra values are ignored)
+    if len(values) >= len(fields):
+        return dict(zip(fields, map(_parse_value, values)))
+    parsed = list(map(_parse_value, values))
+    parsed.extend([None] * (len(fields) - len(values)))
+    return dict(zip(fields, parsed))
 
-    values.append(current.strip())
 
-    # Map values to fields
-    for i, field in enumerate(fields):
-        if i < len(values):
-            result[field] = _parse_value(values[i])
-        else:
-            result[field] = None
+def _row_values(row: str, width: int) -> tuple[Any, ...]:
+    """Parse one uniform array row into a tuple with exactly width values."""
+    values = _split_csv_row(row)[:width]
+    parsed = tuple(map(_parse_value, values))
+    if len(parsed) < width:
+        parsed += (None,) * (width - len(parsed))
+    return parsed
 
-    return result
+
+def _mask_quoted_commas(block: str) -> str | None:
+    """Drop quotes from a block of rows, masking commas inside quotes.
+
+    Returns None when the block cannot be handled at once: a row with
+    unbalanced quotes, or the mask character already present.
+    """
+    if '"' not in block:
+        return block
+    if _QUOTED_COMMA in block:
+        return None
+
+    segments = block.split('"')
+    quoted = segments[1::2]
+    quoted_text = '\n'.join(quoted)
+    # A quoted segment spanning a row boundary means a row has unbalanced quotes
+    if quoted_text.count('\n') != len(quoted) - 1:
+        return None
+    segments[1::2] = quoted_text.replace(',', _QUOTED_COMMA).split('\n')
+    return ''.join(segments)
+
+
+def _parse_column(values: list[str]) -> list[Any]:
+    """Convert one column of raw CSV values, typing the whole column at once.
+
+    Columns that are entirely ints, floats, booleans or plain strings are
+    recognized with a single regex over the joined column, and repetitive
+    columns parse each distinct value once; anything else is converted value
+    by value.
+    """
+    joined = '\n'.join(values)
+    if _QUOTED_COMMA in joined:
+        joined = joined.replace(_QUOTED_COMMA, ',')
+        values = joined.split('\n')
+    # str.strip returns the same object when there is nothing to strip
+    stripped = list(map(str.strip, values))
+    if stripped != values:
+        values = stripped
+        joined = '\n'.join(values)
+
+    if _INT_COLUMN.fullmatch(joined):
+        return list(map(int, values))
+    if _FLOAT_COLUMN.fullmatch(joined):
+        return list(map(float, values))
+    if _BOOL_COLUMN.fullmatch(joined):
+        return list(map('true'.__eq__, values))
+
+    # Repetitive columns (types, severities, rules) convert each distinct value once
+    distinct = set(values)
+    if len(distinct) * 4 <= len(values):
+        parsed = {value: _parse_value(value) for value in distinct}
+        return list(map(parsed.__getitem__, values))
+    if not _SPECIAL_VALUE.search(f'\n{joined}\n'):
+        return values
+    return list(map(_parse_value, values))
+
+
+@lru_cache(maxsize=64)
+def _row_factory(fields: tuple[str, ...]) -> Callable[..., dict[str, Any]]:
+    """Build a function taking one value per field and returning the row dict.
+
+    Like collections.namedtuple, the function is generated source: a dict
+    display with constant keys is much cheaper per row than dict(zip(...)).
+    Field names are embedded with repr(), so any header text is a safe literal.
+    """
+    params = [f'v{position}' for position in range(len(fields))]
+    items = ', '.join(f'{name!r}: {param}' for name, param in zip(fields, params))
+    return eval(f"lambda {', '.join(params)}: {{{items}}}", {})
 
 
-def _parse_uniform_array(ctx: ParseContext, count: int, fields: list[str], min_indent: int) -> list[dict]:
+def _parse_rows(rows: list[str], fields: list[str], tables: bool = False) -> list[dict] | ToonTable:
+    """Parse collected uniform array rows into dictionaries (or a ToonTable).
+
+    Rows are split in one pass over the joined block and typed column by
+    column. Blocks where some row does not have exactly one value per field
+    (missing values become None, extra values are dropped) are parsed row by
+    row instead.
+    """
+    width = len(fields)
+    block = '\n'.join(rows)
+    masked = _mask_quoted_commas(block)
+    if masked is not None:
+        masked_rows = masked.split('\n') if masked is not block else rows
+        if set(map(str.count, masked_rows, repeat(','))) != {width - 1}:
+            masked = None
+    if masked is None:
+        if tables:
+            return ToonTable(fields, [_row_values(row, width) for row in rows])
+        return [_parse_csv_row(row, fields) for row in rows]
+
+    flat = masked.replace('\n', ',').split(',')
+    columns = [_parse_column(flat[offset::width]) for offset in range(width)]
+    if tables:
+        return ToonTable(fields, list(zip(*columns)))
+    return list(map(_row_factory(tuple(fields)), *columns))
+
+
+def _parse_uniform_array(ctx: ParseContext, count: int, fields: list[str],
+                         min_indent: int) -> list[dict] | ToonTable:
     """Parse uniform array rows.
 
     Args:
@@ -119,40 +341,45 @@ def _parse_uniform_array(ctx: ParseContext, count: int, fields: list[str], min_i
         fields: Field names for CSV parsing
         min_indent: Minimum indentation for array rows (rows must be >= this)
     """
-    result = []
-
-    while ctx.index < len(ctx.lines) and len(result) < count:
-        line = ctx.lines[ctx.index]
-
-        # Skip empty lines
-        if not line.strip():
-            ctx.index += 1
+    start = ctx.index
+    end = min(start + count, len(ctx.contents))
+    rows = ctx.contents[start:end]
+
+    # Fast path: the next count lines are all rows (no blank, comment,
+    # outdented or key: value line in between)
+    if (
+        rows
+        and not any(ctx.skips[start:end])
+        and min(ctx.indents[start:end]) >= min_indent
+        and not any(map(_KEY_VALUE_LINE.match, rows))
+    ):
+        ctx.index = end
+        return _parse_rows(rows, fields, ctx.tables)
+
+    rows = []
+    index = start
+    while index < len(ctx.contents) and len(rows) < count:
+        # Skip empty lines and comments
+        if ctx.skips[index]:
+            index += 1
             continue
 
-        # Skip comments
-        if line.strip().startswith('#'):
-            ctx.index += 1
-            continue
-
-        indent = _get_indent(line)
-        content = line.strip()
-
         # Check if we've exited the array (less indentation than required)
-        if indent < min_indent and content:
+        if ctx.indents[index] < min_indent:
             break
 
-        # Parse the row if it's at the right indentation
-        if indent >= min_indent and content and not content.startswith('#'):
-            # Check if this looks like a new key-value pair (word followed by colon at start)
-            # Skip this check if the line looks like CSV data (starts with alphanumeric or quote)
-            if re.match(r'^[a-zA-Z_][\w_]*\s*:', content) and not re.match(r'^[a-zA-Z_][\w_]*,', content):
-                # This is a new key-value pair, stop parsing array
-                break
-            result.append(_parse_csv_row(content, fields))
+        # A new key-value pair (word followed by colon at start) ends the array
+        content = ctx.contents[index]
+        if ':' in content and _KEY_VALUE_LINE.match(content):
+            break
 
-        ctx.index += 1
+        rows.append(content)
+        index += 1
 
-    return result
+    ctx.index = index
+    if not rows:
+        return ToonTable(fields, []) if ctx.tables else []
+    return _parse_rows(rows, fields, ctx.tables)
 
 
 def _parse_simple_array(ctx: ParseContext, min_indent: int) -> list[Any]:
@@ -164,35 +391,24 @@ def _parse_simple_array(ctx: ParseContext, min_indent: int) -> list[Any]:
     """
     result = []
 
-    while ctx.index < len(ctx.lines):
-        line = ctx.lines[ctx.index]
-
-        # Skip empty lines
-        if not line.strip():
+    while ctx.index < len(ctx.contents):
+        # Skip empty lines and comments
+        if ctx.skips[ctx.index]:
             ctx.index += 1
             continue
 
-        # Skip comments
-        if line.strip().startswith('#'):
-            ctx.index += 1
-            continue
-
-        indent = _get_indent(line)
-        content = line.strip()
-
         # Check if we've exited the array (less indentation)
-        if indent < min_indent and content:
+        if ctx.indents[ctx.index] < min_indent:
             break
 
         # Check for list item marker
+        content = ctx.contents[ctx.index]
         if content.startswith('- '):
             result.append(_parse_value(content[2:]))
-            ctx.index += 1
-        elif indent >= min_indent and not content.startswith('-'):
+        elif not content.startswith('-'):
             # Non-list-item at same or greater indent = end of array
             break
-        else:
-            ctx.index += 1
+        ctx.index += 1
 
     return result
 
@@ -200,129 +416,99 @@ def _parse_simple_array(ctx: ParseContext, min_indent: int) -> list[Any]:
 def _parse_multiline_value(ctx: ParseContext, base_indent: int) -> str:
     """Parse a multi-line string value (indicated by |)."""
     lines = []
+    cut = base_indent + 2
 
-    while ctx.index < len(ctx.lines):
-        line = ctx.lines[ctx.index]
-        indent = _get_indent(line)
+    while ctx.index < len(ctx.contents):
+        content = ctx.contents[ctx.index]
 
         # Empty line within multi-line is preserved
-        if not line.strip():
+        if not content:
             lines.append('')
             ctx.index += 1
             continue
 
         # Check if we're still in the multi-line value
-        if indent <= base_indent and line.strip():
+        if ctx.indents[ctx.index] <= base_indent:
             break
 
-        lines.append(line[base_indent + 2:] if len(line) > base_indent + 2 else line.strip())
+        line = ctx.lines[ctx.index]
+        lines.append(line[cut:] if len(line) > cut else content)
         ctx.index += 1
 
     return '\n'.join(lines).strip()
 
 
+def _has_nested_content(ctx: ParseContext, indent: int) -> bool:
+    """Check whether the next non-empty, non-comment line is indented deeper."""
+    for index in range(ctx.index, len(ctx.contents)):
+        if not ctx.skips[index]:
+            return ctx.indents[index] > indent
+    return False
+
+
 def _parse_object(ctx: ParseContext, base_indent: int) -> dict[str, Any]:
     """Parse a TOON object at the given indentation level."""
     result = {}
 
-    while ctx.index < len(ctx.lines):
-        line = ctx.lines[ctx.index]
-
-        # Skip empty lines
-        if not line.strip():
-            ctx.index += 1
-            continue
-
-        # Skip comments
-        if line.strip().startswith('#'):
+    while ctx.index < len(ctx.contents):
+        # Skip empty lines and comments
+        if ctx.skips[ctx.index]:
             ctx.index += 1
             continue
 
-        indent = _get_indent(line)
-        content = line.strip()
-
         # Check if we've exited this indentation level
+        indent = ctx.indents[ctx.index]
         if indent < base_indent:
             break
 
-        # Check if this is at our level
-        if indent > base_indent:
+        # Lines deeper than our level (or without key: value) are skipped
+        content = ctx.contents[ctx.index]
+        if indent > base_indent or ':' not in content:
             ctx.index += 1
             continue
 
-        # Parse key: value
-        if ':' in content:
-            # Check for uniform array pattern: key[N]{fields}:
-            # Note: Key can contain hyphens (e.g., oauth-sheriff-core[1]{...}:)
-            array_match = re.match(r'^([\w_-]+)\[(\d+)\]\{([^}]+)\}:\s*$', content)
+        if '[' in content:
+            # Uniform array: key[N]{fields}: (key can contain hyphens)
+            array_match = _UNIFORM_ARRAY_HEADER.match(content)
             if array_match:
-                key = array_match.group(1)
                 count = int(array_match.group(2))
                 fields = [f.strip() for f in array_match.group(3).split(',')]
                 ctx.index += 1
-                # Array items should be at current indent level (for top-level) or indented
-                min_array_indent = 0 if indent == 0 else indent
-                result[key] = _parse_uniform_array(ctx, count, fields, min_array_indent)
+                result[array_match.group(1)] = _parse_uniform_array(ctx, count, fields, indent)
                 continue
 
-            # Check for simple array pattern: key[N]:
-            # Note: Key can contain hyphens (e.g., oauth-sheriff-core[1]:)
-            simple_array_match = re.match(r'^([\w_-]+)\[(\d+)\]:\s*$', content)
+            # Simple array: key[N]:
+            simple_array_match = _SIMPLE_ARRAY_HEADER.match(content)
             if simple_array_match:
-                key = simple_array_match.group(1)
                 ctx.index += 1
-                # Array items should be at current indent level (for top-level) or indented
-                min_array_indent = 0 if indent == 0 else indent
-                result[key] = _parse_simple_array(ctx, min_array_indent)
+                result[simple_array_match.group(1)] = _parse_simple_array(ctx, indent)
                 continue
 
-            # Regular key: value
-            colon_pos = content.index(':')
-            key = content[:colon_pos].strip()
-            value_part = content[colon_pos + 1:].strip()
+        # Regular key: value
+        key, _, value_part = content.partition(':')
+        key = key.strip()
+        value_part = value_part.strip()
 
-            ctx.index += 1
+        ctx.index += 1
 
-            # Check for multi-line value
-            if value_part == '|':
-                result[key] = _parse_multiline_value(ctx, indent)
-            # Check for nested object (no value after colon)
-            elif not value_part:
-                # Peek ahead to see if there's actually nested content
-                has_nested_content = False
-                peek_idx = ctx.index
-                while peek_idx < len(ctx.lines):
-                    peek_line = ctx.lines[peek_idx]
-                    if not peek_line.strip():
-                        peek_idx += 1
-                        continue
-                    if peek_line.strip().startswith('#'):
-                        peek_idx += 1
-                        continue
-                    # Check if next non-empty line is indented more than current
-                    peek_indent = _get_indent(peek_line)
-                    if peek_indent > indent:
-                        has_nested_content = True
-                    break
-
-                if has_nested_content:
-                    result[key] = _parse_object(ctx, indent + 2)
-                else:
-                    result[key] = ''
-            else:
-                result[key] = _parse_value(value_part)
+        if value_part == '|':
+            result[key] = _parse_multiline_value(ctx, indent)
+        elif not value_part:
+            # Nested object only when the next content line is indented deeper
+            result[key] = _parse_object(ctx, indent + 2) if _has_nested_content(ctx, indent) else ''
         else:
-            # Unknown line format, skip
-            ctx.index += 1
+            result[key] = _parse_value(value_part)
 
     return result
 
 
-def parse_toon(content: str) -> dict[str, Any]:
+def parse_toon(content: str, tables: bool = False) -> dict[str, Any]:
     """Parse TOON content into a Python dictionary.
 
     Args:
         content: TOON formatted string
+        tables: Return uniform arrays as compact ToonTable objects instead
+            of lists of dicts (for large findings or module tables)
 
     Returns:
         Parsed dictionary
@@ -341,8 +527,8 @@ def parse_toon(content: str) -> dict[str, Any]:
         >>> parse_toon(toon)
         {'name': 'Alice', 'age': 30, 'roles': [{'id': 1, 'name': 'admin'}, {'id': 2, 'name': 'user'}]}
     """
-    lines = content.split('\n')
-    ctx = ParseContext(lines=lines)
+    ctx = ParseContext(lines=content.split('\n'), tables=tables)
+    _tokenize(ctx)
 
     try:
         return _parse_object(ctx, 0)
@@ -354,6 +540,200 @@ def parse_toon(content: str) -> dict[str, Any]:
         ) from e
 
 
+@dataclass(frozen=True)
+class ToonEvent:
+    """Event yielded by iter_toon().
+
+    Attributes:
+        kind: 'key', 'begin_object', 'end_object', 'begin_array', 'row', 'item'
+            or 'end_array'.
+        path: Keys from the document root down to the key, object or array.
+        value: Parsed scalar for 'key' and 'item', tuple with one value per
+            field for 'row' (missing values are None), None otherwise.
+        fields: Field names on 'begin_array' of a uniform array (None for
+            simple '- item' arrays and all other events).
+        count: Declared length [N] on 'begin_array', None otherwise.
+    """
+    kind: str
+    path: tuple[str, ...]
+    value: Any = None
+    fields: tuple[str, ...] | None = None
+    count: int | None = None
+
+
+class _LineReader:
+    """Lazy line source with lookahead for iter_toon().
+
+    Tokens are (indent, content, skip, raw) like ParseContext, computed as
+    lines are read. Only lines that have been peeked but not consumed are
+    buffered (a run of blank or comment lines at most).
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._buffer: deque[tuple[int, str, bool, str]] = deque()
+        self.line_number = 0
+
+    def peek(self, offset: int = 0) -> tuple[int, str, bool, str] | None:
+        """Return the token offset lines ahead without consuming it."""
+        while len(self._buffer) <= offset:
+            line = next(self._lines, None)
+            if line is None:
+                return None
+            if line.endswith('\n'):
+                line = line[:-1]
+            stripped = line.lstrip()
+            content = stripped.rstrip()
+            self._buffer.append((len(line) - len(stripped), content, not content or content[0] == '#', line))
+        return self._buffer[offset]
+
+    def advance(self) -> None:
+        """Consume the next token."""
+        self._buffer.popleft()
+        self.line_number += 1
+
+    def has_nested_content(self, indent: int) -> bool:
+        """Check whether the next non-empty, non-comment line is indented deeper."""
+        offset = 0
+        while (token := self.peek(offset)) is not None:
+            if not token[2]:
+                return token[0] > indent
+            offset += 1
+        return False
+
+
+def _iter_uniform_rows(reader: _LineReader, count: int, width: int, min_indent: int,
+                       path: tuple[str, ...]) -> Iterator[ToonEvent]:
+    """Yield 'row' events; same termination rules as _parse_uniform_array."""
+    emitted = 0
+    while emitted < count and (token := reader.peek()) is not None:
+        indent, content, skip, _ = token
+        if skip:
+            reader.advance()
+            continue
+        if indent < min_indent:
+            break
+        if ':' in content and _KEY_VALUE_LINE.match(content):
+            break
+        reader.advance()
+        yield ToonEvent('row', path, _row_values(content, width))
+        emitted += 1
+
+
+def _iter_simple_items(reader: _LineReader, min_indent: int, path: tuple[str, ...]) -> Iterator[ToonEvent]:
+    """Yield 'item' events; same termination rules as _parse_simple_array."""
+    while (token := reader.peek()) is not None:
+        indent, content, skip, _ = token
+        if skip:
+            reader.advance()
+            continue
+        if indent < min_indent:
+            break
+        if content.startswith('- '):
+            yield ToonEvent('item', path, _parse_value(content[2:]))
+        elif not content.startswith('-'):
+            break
+        reader.advance()
+
+
+def _read_multiline_value(reader: _LineReader, base_indent: int) -> str:
+    """Read a multi-line string value; same rules as _parse_multiline_value."""
+    lines = []
+    cut = base_indent + 2
+    while (token := reader.peek()) is not None:
+        indent, content, _, line = token
+        if content and indent <= base_indent:
+            break
+        lines.append(line[cut:] if content and len(line) > cut else content)
+        reader.advance()
+    return '\n'.join(lines).strip()
+
+
+def _iter_object(reader: _LineReader, base_indent: int, path: tuple[str, ...]) -> Iterator[ToonEvent]:
+    """Yield events for an object at the given indentation; mirrors _parse_object."""
+    while (token := reader.peek()) is not None:
+        indent, content, skip, _ = token
+        if skip:
+            reader.advance()
+            continue
+        if indent < base_indent:
+            return
+        if indent > base_indent or ':' not in content:
+            reader.advance()
+            continue
+
+        if '[' in content:
+            array_match = _UNIFORM_ARRAY_HEADER.match(content)
+            if array_match:
+                reader.advance()
+                key_path = path + (array_match.group(1),)
+                fields = tuple(f.strip() for f in array_match.group(3).split(','))
+                yield ToonEvent('begin_array', key_path, fields=fields, count=int(array_match.group(2)))
+                yield from _iter_uniform_rows(reader, int(array_match.group(2)), len(fields), indent, key_path)
+                yield ToonEvent('end_array', key_path)
+                continue
+
+            simple_array_match = _SIMPLE_ARRAY_HEADER.match(content)
+            if simple_array_match:
+                reader.advance()
+                key_path = path + (simple_array_match.group(1),)
+                yield ToonEvent('begin_array', key_path, count=int(simple_array_match.group(2)))
+                yield from _iter_simple_items(reader, indent, key_path)
+                yield ToonEvent('end_array', key_path)
+                continue
+
+        key, _, value_part = content.partition(':')
+        key_path = path + (key.strip(),)
+        value_part = value_part.strip()
+        reader.advance()
+
+        if value_part == '|':
+            yield ToonEvent('key', key_path, _read_multiline_value(reader, indent))
+        elif not value_part:
+            if reader.has_nested_content(indent):
+                yield ToonEvent('begin_object', key_path)
+                yield from _iter_object(reader, indent + 2, key_path)
+                yield ToonEvent('end_object', key_path)
+            else:
+                yield ToonEvent('key', key_path, '')
+        else:
+            yield ToonEvent('key', key_path, _parse_value(value_part))
+
+
+def iter_toon(source: str | Iterable[str]) -> Iterator[ToonEvent]:
+    """Lazily yield parse events for TOON content.
+
+    Reads one line at a time from a file object (or any iterable of lines,
+    or a string), so consumers such as filters and counters can process
+    large uniform arrays in constant memory. The events describe exactly the
+    data parse_toon() would return: a uniform array row maps to
+    dict(zip(event.fields, row.value)) of its 'begin_array' event.
+
+    Args:
+        source: Open text file, iterable of lines, or TOON string
+
+    Yields:
+        ToonEvent in document order
+
+    Raises:
+        ToonParseError: If parsing fails
+
+    Example:
+        >>> with open('findings.toon') as f:
+        ...     errors = sum(1 for e in iter_toon(f) if e.kind == 'row' and e.value[2] == 'ERROR')
+    """
+    reader = _LineReader(source.split('\n') if isinstance(source, str) else source)
+    try:
+        yield from _iter_object(reader, 0, ())
+    except Exception as e:
+        token = reader.peek()
+        raise ToonParseError(
+            str(e),
+            line_number=reader.line_number + 1,
+            line_content=token[3] if token else ''
+        ) from e
+
+
 def _serialize_value(value: Any, indent: int = 0) -> str:
     """Serialize a Python value to TOON format.
 
@@ -364,17 +744,18 @@ def _serialize_value(value: Any, indent: int = 0) -> str:
     Returns:
         TOON formatted string (may be multi-line for complex types)
     """
+    # Strings first: they are by far the most common value
+    if isinstance(value, str):
+        # Quote if contains special characters
+        if ',' in value or ':' in value or '\n' in value:
+            return f'"{value}"'
+        return value
     if value is None:
         return 'null'
     if isinstance(value, bool):
         return 'true' if value else 'false'
     if isinstance(value, (int, float)):
         return str(value)
-    if isinstance(value, str):
-        # Quote if contains special characters
-        if ',' in value or ':' in value or '\n' in value:
-            return f'"{value}"'
-        return value
     if isinstance(value, dict):
         # Serialize dict as inline or nested based on complexity
         return str(value)  # Fallback - dicts should be handled by serialize_toon
@@ -384,6 +765,14 @@ def _serialize_value(value: Any, indent: int = 0) -> str:
     return str(value)
 
 
+def _serialize_entry(prefix: str, key: str, value: Any) -> str:
+    """Serialize a scalar key-value pair; multi-line strings become | blocks."""
+    if isinstance(value, str) and '\n' in value:
+        block = '\n'.join(f"{prefix}  {line}" if line else '' for line in value.split('\n'))
+        return f"{prefix}{key}: |\n{block}"
+    return f"{prefix}{key}: {_serialize_value(value)}"
+
+
 def _is_uniform_array(arr: list) -> tuple[bool, list[str]]:
     """Check if array is uniform (all dicts with compatible keys).
 
@@ -403,15 +792,7 @@ def _is_uniform_array(arr: list) -> tuple[bool, list[str]]:
         return False, []
 
     # Collect union of all keys across all items (preserves order from first occurrence)
-    all_keys = []
-    seen_keys = set()
-    for item in arr:
-        for key in item.keys():
-            if key not in seen_keys:
-                all_keys.append(key)
-                seen_keys.add(key)
-
-    return True, all_keys
+    return True, list(dict.fromkeys(chain.from_iterable(arr)))
 
 
 def serialize_toon(data: dict[str, Any], indent: int = 0) -> str:
@@ -430,30 +811,305 @@ def serialize_toon(data: dict[str, Any], indent: int = 0) -> str:
         name: Alice
         active: true
     """
-    lines = []
-    prefix = '  ' * indent
+    lines: list[str] = []
+    _serialize_lines(data, '  ' * indent, lines)
+    return '\n'.join(lines)
+
 
+def _serialize_lines(data: dict[str, Any], prefix: str, lines: list[str]) -> None:
+    """Append the TOON lines of data to lines (nested dicts share the list, joined once)."""
     for key, value in data.items():
         if isinstance(value, dict):
             lines.append(f"{prefix}{key}:")
-            lines.append(serialize_toon(value, indent + 1))
+            if value:
+                _serialize_lines(value, prefix + '  ', lines)
+            else:
+                lines.append('')
         elif isinstance(value, list):
             is_uniform, fields = _is_uniform_array(value)
             if is_uniform and fields:
                 # Uniform array with headers
                 lines.append(f"{prefix}{key}[{len(value)}]{{{','.join(fields)}}}:")
                 for item in value:
-                    row_values = [_serialize_value(item.get(f, '')) for f in fields]
+                    row_values = map(_serialize_value, map(item.get, fields, repeat('')))
                     lines.append(f"{prefix}  {','.join(row_values)}")
             else:
                 # Simple array
                 lines.append(f"{prefix}{key}[{len(value)}]:")
                 for item in value:
                     lines.append(f"{prefix}  - {_serialize_value(item)}")
+        elif type(value) is ToonTable:
+            # Exact type check: isinstance() on the Sequence ABC is much slower
+            lines.append(f"{prefix}{key}[{len(value)}]{{{','.join(value.fields)}}}:")
+            for values in value.rows:
+                lines.append(f"{prefix}  {','.join(map(_serialize_value, values))}")
+        elif isinstance(value, str) and '\n' in value:
+            lines.append(_serialize_entry(prefix, key, value))
         else:
             lines.append(f"{prefix}{key}: {_serialize_value(value)}")
 
-    return '\n'.join(lines)
+
+# Header room reserved for an array count patched in after the items
+_COUNT_WIDTH = 10
+# Spooled array items stay in memory up to this size, then move to disk
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def _appends(stream: TextIO) -> bool:
+    """Check if writes to stream always go to the end (O_APPEND)."""
+    try:
+        import fcntl
+        return bool(fcntl.fcntl(stream.fileno(), fcntl.F_GETFL) & os.O_APPEND)
+    except (ImportError, AttributeError, OSError, ValueError):
+        return 'a' in getattr(stream, 'mode', '')
+
+
+class ToonWriter:
+    """Incremental TOON writer for text streams.
+
+    Writes the same format as serialize_toon line by line, so large results
+    never have to be built as one string. Arrays accept any iterable and rows
+    are written as they are produced. When the length is not known up front,
+    the [N] count is resolved after the items:
+
+    - Seekable streams: the header reserves room for the count and is
+      rewritten in place once the items are written
+    - Other streams (pipes, terminals): items are spooled to a temporary file
+      (in memory up to 1 MiB, then on disk) while counting, then copied
+      after the header
+
+    Example:
+        >>> writer = ToonWriter(sys.stdout)
+        >>> writer.write('status', 'success')
+        >>> writer.write_table('issues', iter_issues(), ['file', 'line', 'message'])
+    """
+
+    def __init__(self, stream: TextIO, indent: int = 0):
+        self.stream = stream
+        self.indent = indent
+        self._patchable: bool | None = None
+
+    def write(self, key: str, value: Any) -> None:
+        """Write one key with a scalar, dict or list value."""
+        if isinstance(value, dict):
+            self.begin_object(key)
+            self.write_all(value)
+            self.end_object()
+        elif isinstance(value, list):
+            is_uniform, fields = _is_uniform_array(value)
+            if is_uniform and fields:
+                self.write_table(key, value, fields)
+            else:
+                self.write_items(key, value)
+        elif type(value) is ToonTable:
+            self.write_table(key, value, list(value.fields))
+        else:
+            self.stream.write(_serialize_entry('  ' * self.indent, key, value) + '\n')
+
+    def write_all(self, data: dict[str, Any]) -> None:
+        """Write every key of a dictionary (like serialize_toon)."""
+        for key, value in data.items():
+            self.write(key, value)
+
+    def begin_object(self, key: str) -> None:
+        """Start a nested object; following writes are indented under key."""
+        self.stream.write(f"{'  ' * self.indent}{key}:\n")
+        self.indent += 1
+
+    def end_object(self) -> None:
+        """Close the innermost object opened with begin_object."""
+        if self.indent == 0:
+            raise ValueError("end_object() without matching begin_object()")
+        self.indent -= 1
+
+    def write_table(self, key: str, rows: Iterable[dict], fields: list[str] | None = None) -> int:
+        """Write a uniform array from a list or an iterator of dicts.
+
+        Args:
+            key: Array name
+            rows: Row dicts; missing fields are written as empty values
+            fields: Column names. Defaults to the union of keys for a list,
+                or the keys of the first row for an iterator.
+
+        Returns:
+            Number of rows written
+        """
+        if fields is None:
+            if isinstance(rows, list):
+                fields = _is_uniform_array(rows)[1]
+            else:
+                rows = iter(rows)
+                first = next(rows, None)
+                if first is None:
+                    return self.write_items(key, [])
+                fields = list(first)
+                rows = chain([first], rows)
+        if not fields:
+            return self.write_items(key, rows)
+        prefix = '  ' * (self.indent + 1)
+
+        def format_row(row: dict) -> str:
+            return f"{prefix}{','.join([_serialize_value(row.get(f, '')) for f in fields])}\n"
+
+        return self._write_array(key, f"{{{','.join(fields)}}}", rows, format_row)
+
+    def write_items(self, key: str, items: Iterable[Any]) -> int:
+        """Write a simple array from a list or an iterator of scalars.
+
+        Returns:
+            Number of items written
+        """
+        prefix = '  ' * (self.indent + 1)
+
+        def format_item(item: Any) -> str:
+            return f"{prefix}- {_serialize_value(item)}\n"
+
+        return self._write_array(key, '', items, format_item)
+
+    def _write_array(self, key: str, spec: str, items: Iterable, format_item: Callable[[Any], str]) -> int:
+        """Write an array header and its items, resolving [N] as needed."""
+        prefix = '  ' * self.indent
+        if isinstance(items, Sized):
+            self.stream.write(f"{prefix}{key}[{len(items)}]{spec}:\n")
+            self.stream.writelines(map(format_item, items))
+            return len(items)
+
+        if self._can_patch():
+            placeholder = f"{prefix}{key}[0]{spec}:" + ' ' * (_COUNT_WIDTH - 1)
+            start = self.stream.tell()
+            self.stream.write(placeholder + '\n')
+            count = self._write_counted(self.stream, items, format_item)
+            end = self.stream.tell()
+            self.stream.seek(start)
+            self.stream.write(f"{prefix}{key}[{count}]{spec}:".ljust(len(placeholder)))
+            self.stream.seek(end)
+            return count
+
+        with tempfile.SpooledTemporaryFile(_SPOOL_MAX_SIZE, mode='w+', encoding='utf-8') as spool:
+            count = self._write_counted(spool, items, format_item)
+            self.stream.write(f"{prefix}{key}[{count}]{spec}:\n")
+            spool.seek(0)
+            shutil.copyfileobj(spool, self.stream)
+        return count
+
+    @staticmethod
+    def _write_counted(stream: IO[str], items: Iterable, format_item: Callable[[Any], str]) -> int:
+        count = 0
+        for item in items:
+            stream.write(format_item(item))
+            count += 1
+        return count
+
+    def _can_patch(self) -> bool:
+        """Check once if the header can be rewritten in place after the items."""
+        if self._patchable is None:
+            try:
+                self._patchable = self.stream.seekable() and not _appends(self.stream)
+            except (AttributeError, OSError, ValueError):
+                self._patchable = False
+        return self._patchable
+
+
+# Parsed files kept by load_cached, least recently used evicted first
+_LOAD_CACHE_SIZE = 128
+_load_cache: OrderedDict[tuple[str, Callable], tuple[tuple[int, int, int], Any]] = OrderedDict()
+
+
+def _file_signature(path: str) -> tuple[int, int, int]:
+    """Identity of the current file content: (inode, size, mtime_ns)."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy the dicts and lists of a parsed document; scalars are shared."""
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def _remember(key: tuple[str, Callable], signature: tuple[int, int, int], data: Any) -> None:
+    _load_cache[key] = (signature, data)
+    _load_cache.move_to_end(key)
+    while len(_load_cache) > _LOAD_CACHE_SIZE:
+        _load_cache.popitem(last=False)
+
+
+def load_cached(path: str | os.PathLike, parser: Callable[[str], Any] = parse_toon, copy: bool = True) -> Any:
+    """Parse a TOON file, reusing the last result while the file is unchanged.
+
+    Results are cached per process keyed by (inode, size, mtime_ns), so a
+    repeated load of an unchanged file costs a stat() instead of a parse.
+    Files replaced atomically (save_toon, atomic_write_file) always get a new
+    inode and are re-parsed.
+
+    Args:
+        path: File to load
+        parser: Function parsing the file content (default: parse_toon)
+        copy: Return a copy the caller may modify. With copy=False the
+            cached object itself is returned and must not be modified.
+
+    Returns:
+        Parsed content
+
+    Raises:
+        OSError: If the file cannot be read (e.g. FileNotFoundError)
+        ToonParseError: If parsing fails
+    """
+    path = os.path.abspath(path)
+    key = (path, parser)
+    signature = _file_signature(path)
+    entry = _load_cache.get(key)
+    if entry is not None and entry[0] == signature:
+        _load_cache.move_to_end(key)
+        data = entry[1]
+    else:
+        with open(path, encoding='utf-8') as f:
+            data = parser(f.read())
+        _remember(key, signature, data)
+    return _copy_value(data) if copy else data
+
+
+def save_toon(path: str | os.PathLike, data: Any, header: str = '',
+              formatter: Callable[[Any], str] = serialize_toon,
+              parser: Callable[[str], Any] = parse_toon) -> None:
+    """Write a TOON file atomically and refresh its load_cached entry.
+
+    Args:
+        path: Target file (parent directories are created)
+        data: Document to write
+        header: Text written before the document (e.g. a comment line)
+        formatter: Function producing the document text (default: serialize_toon)
+        parser: Parser whose cache entry is refreshed (as passed to load_cached)
+
+    Raises:
+        OSError: If write or rename fails
+    """
+    path = os.path.abspath(path)
+    content = header + formatter(data)
+    if content and not content.endswith('\n'):
+        content += '\n'
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1], prefix='.tmp_', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    _remember((path, parser), _file_signature(path), parser(content))
+
+
+def clear_load_cache() -> None:
+    """Drop all load_cached entries."""
+    _load_cache.clear()
 
 
 if __name__ == '__main__':
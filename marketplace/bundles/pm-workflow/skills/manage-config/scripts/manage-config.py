@@ -17,12 +17,21 @@ Note: workflow_skills are resolved from marshal.json via plan-marshall-config re
 import argparse
 import re
 import sys
+from pathlib import Path
 
-from file_ops import atomic_write_file, base_path  # type: ignore[import-not-found]
-from toon_parser import parse_toon, serialize_toon  # type: ignore[import-not-found]
+from file_ops import base_path  # type: ignore[import-not-found]
+from toon_parser import serialize_toon, load_cached, save_toon  # type: ignore[import-not-found]
 from _config_core import is_initialized, load_config  # type: ignore[import-not-found]
 from plan_logging import log_entry  # type: ignore[import-not-found]
 
+# Read-only subcommands the executor may replay from its result cache
+EXECUTOR_CACHE_POLICY = {
+    'read': {'reads': ['{plan_dir}/plans/{--plan-id}/config.toon', '{plan_dir}/marshal.json']},
+    'get': {'reads': ['{plan_dir}/plans/{--plan-id}/config.toon', '{plan_dir}/marshal.json']},
+    'get-multi': {'reads': ['{plan_dir}/plans/{--plan-id}/config.toon', '{plan_dir}/marshal.json']},
+    'get-domains': {'reads': ['{plan_dir}/plans/{--plan-id}/config.toon', '{plan_dir}/marshal.json']},
+}
+
 # Schema validation - enum fields
 SCHEMA = {
     'commit_strategy': ['per_task', 'per_plan', 'none'],
@@ -88,15 +97,12 @@ def read_config(plan_id: str) -> dict:
     path = get_config_path(plan_id)
     if not path.exists():
         return {}
-    return parse_toon(path.read_text(encoding='utf-8'))
+    return load_cached(path)
 
 
 def write_config(plan_id: str, config: dict):
     """Write config.toon for a plan."""
-    path = get_config_path(plan_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    content = "# Plan Configuration\n\n" + serialize_toon(config)
-    atomic_write_file(path, content)
+    save_toon(get_config_path(plan_id), config, header="# Plan Configuration\n\n")
 
 
 def validate_field(field: str, value: str) -> tuple[bool, list]:
@@ -23,7 +23,7 @@ import sys
 from pathlib import Path
 
 from file_ops import atomic_write_file, base_path  # type: ignore[import-not-found]
-from toon_parser import parse_toon, serialize_toon  # type: ignore[import-not-found]
+from toon_parser import serialize_toon, load_cached  # type: ignore[import-not-found]
 from plan_logging import log_entry  # type: ignore[import-not-found]
 
 
@@ -217,7 +217,7 @@ def cmd_create_or_reference(args):
         status_path = plan_dir / 'status.toon'
         if status_path.exists():
             try:
-                status = parse_toon(status_path.read_text(encoding='utf-8'))
+                status = load_cached(status_path)
                 result['current_phase'] = status.get('current_phase', 'unknown')
             except (ValueError, KeyError, OSError):
                 # Parse error or read error - just note file exists
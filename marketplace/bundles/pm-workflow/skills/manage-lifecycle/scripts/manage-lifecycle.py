@@ -19,10 +19,16 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from file_ops import atomic_write_file, base_path  # type: ignore[import-not-found]
-from toon_parser import parse_toon, serialize_toon  # type: ignore[import-not-found]
+from file_ops import base_path  # type: ignore[import-not-found]
+from toon_parser import serialize_toon, load_cached, save_toon  # type: ignore[import-not-found]
 from plan_logging import log_entry  # type: ignore[import-not-found]
 
+# Read-only subcommands the executor may replay from its result cache
+EXECUTOR_CACHE_POLICY = {
+    'read': {'reads': ['{plan_dir}/plans/{--plan-id}/status.toon']},
+    'progress': {'reads': ['{plan_dir}/plans/{--plan-id}/status.toon']},
+}
+
 # Phase routing maps phase names to skills (for route command)
 PHASE_ROUTING = {
     'init': ('plan-init', 'Initialize plan structure'),
@@ -63,15 +69,14 @@ def read_status(plan_id: str) -> dict:
     path = get_status_path(plan_id)
     if not path.exists():
         return {}
-    return parse_toon(path.read_text(encoding='utf-8'))
+    return load_cached(path)
 
 
 def write_status(plan_id: str, status: dict):
     """Write status.toon for a plan."""
     path = get_status_path(plan_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
     status['updated'] = now_iso()
-    atomic_write_file(path, serialize_toon(status))
+    save_toon(path, status)
 
 
 def output_toon(data: dict):
@@ -322,7 +327,7 @@ def cmd_list(args):
             continue
 
         try:
-            status = parse_toon(status_file.read_text(encoding='utf-8'))
+            status = load_cached(status_file)
             current_phase = status.get('current_phase', 'unknown')
 
             # Apply filter if provided
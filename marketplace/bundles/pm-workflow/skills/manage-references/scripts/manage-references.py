@@ -15,9 +15,10 @@ Usage:
 import argparse
 import re
 import sys
+from pathlib import Path
 
-from file_ops import atomic_write_file, base_path  # type: ignore[import-not-found]
-from toon_parser import parse_toon, serialize_toon  # type: ignore[import-not-found]
+from file_ops import base_path  # type: ignore[import-not-found]
+from toon_parser import serialize_toon, load_cached, save_toon  # type: ignore[import-not-found]
 
 
 def validate_plan_id(plan_id: str) -> bool:
@@ -35,15 +36,12 @@ def read_references(plan_id: str) -> dict:
     path = get_references_path(plan_id)
     if not path.exists():
         return {}
-    return parse_toon(path.read_text(encoding='utf-8'))
+    return load_cached(path)
 
 
 def write_references(plan_id: str, refs: dict):
     """Write references.toon for a plan."""
-    path = get_references_path(plan_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    content = "# Plan References\n\n" + serialize_toon(refs)
-    atomic_write_file(path, content)
+    save_toon(get_references_path(plan_id), refs, header="# Plan References\n\n")
 
 
 def output_toon(data: dict):
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Batch command handler for manage-tasks.py.
+
+Contains: batch subcommand.
+
+Creates and updates many tasks in one transaction. The document on stdin is
+either TOON (entries separated by '---' lines) or JSONL (one JSON object per
+line). An entry with a number updates that task, any other entry creates a
+task. Every entry is validated before the first file is written, numbers are
+allocated once, and all task files and the index are written all or nothing.
+"""
+
+import json
+import sys
+
+from plan_logging import log_entry  # type: ignore[import-not-found]
+
+from _manage_tasks_shared import (
+    now_iso, get_tasks_dir, parse_task_file, parse_depends_on, parse_stdin_task,
+    default_task_definition, validate_task_definition, build_task,
+    normalize_task_changes, apply_task_changes,
+    task_transaction, commit_tasks, next_task_number,
+    output_toon, output_error
+)
+from _task_graph import build_graph, dependency_number, find_cycle_through, format_cycle
+
+BATCH_SEPARATOR = '---'
+BATCH_FORMATS = ['auto', 'toon', 'jsonl']
+
+
+# =============================================================================
+# Document parsing
+# =============================================================================
+
+def split_batch_document(content: str, fmt: str = 'auto') -> list:
+    """Split a batch document into raw entries.
+
+    Returns:
+        TOON blocks (str) or decoded JSON values, in document order
+
+    Raises:
+        ValueError: If a JSONL line is not valid JSON
+    """
+    if fmt == 'auto':
+        first = next((line for line in content.split('\n') if line.strip()), '')
+        fmt = 'jsonl' if first.lstrip().startswith('{') else 'toon'
+
+    if fmt == 'jsonl':
+        entries = []
+        for line_number, line in enumerate(content.split('\n'), 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: invalid JSON ({e.msg})") from None
+        return entries
+
+    blocks, current = [], []
+    for line in content.split('\n'):
+        if line.strip() == BATCH_SEPARATOR:
+            blocks.append('\n'.join(current))
+            current = []
+        else:
+            current.append(line)
+    blocks.append('\n'.join(current))
+    return [block for block in blocks if block.strip()]
+
+
+def _parse_update_block(block: str) -> dict:
+    """Parse a TOON update entry: 'number: N' plus one 'key: value' line per field."""
+    changes = {}
+    for line in block.split('\n'):
+        if not line.strip() or line.startswith('#'):
+            continue
+        key, sep, value = line.partition(':')
+        if not sep or line.startswith(' '):
+            raise ValueError(f"Invalid update line: {line.strip()}")
+        changes[key.strip()] = value.strip()
+    return changes
+
+
+def _definition_from_json(data: dict) -> dict:
+    """Merge a JSON task definition into the defaults and validate it."""
+    result = default_task_definition()
+    for key, value in data.items():
+        if key not in result:
+            raise ValueError(f"Unknown field: {key}")
+        if key in ('delegation', 'verification'):
+            if not isinstance(value, dict):
+                raise ValueError(f"Field {key} must be an object")
+            result[key].update(value)
+        elif key == 'depends_on':
+            refs = value if isinstance(value, list) else [value]
+            result[key] = [dep for ref in refs for dep in parse_depends_on(str(ref))]
+        elif key in ('steps', 'skills', 'deliverables') and not isinstance(value, list):
+            raise ValueError(f"Field {key} must be a list")
+        else:
+            result[key] = value
+    return validate_task_definition(result)
+
+
+def parse_batch_entry(raw) -> tuple:
+    """Parse and validate one raw entry.
+
+    Returns:
+        ('add', definition) or ('update', number, changes)
+
+    Raises:
+        ValueError: If the entry is invalid
+    """
+    if isinstance(raw, dict):
+        if 'number' not in raw:
+            return 'add', _definition_from_json(raw)
+        changes = dict(raw)
+    elif isinstance(raw, str):
+        if not any(line.startswith('number:') for line in raw.split('\n')):
+            return 'add', parse_stdin_task(raw)
+        changes = _parse_update_block(raw)
+    else:
+        raise ValueError("Entry must be a JSON object")
+
+    try:
+        number = int(changes.pop('number'))
+    except (TypeError, ValueError):
+        raise ValueError("Update number must be an integer") from None
+    if not changes:
+        raise ValueError(f"Update of TASK-{number} changes nothing")
+    return 'update', number, normalize_task_changes(changes)
+
+
+# =============================================================================
+# Command
+# =============================================================================
+
+def cmd_batch(args) -> int:
+    """Handle 'batch' subcommand.
+
+    Reads a multi-task document from stdin and applies it in one
+    transaction: either every entry is written or none.
+    """
+    content = sys.stdin.read()
+    if not content.strip():
+        output_error("No task definitions provided on stdin")
+        return 1
+
+    try:
+        raw_entries = split_batch_document(content, args.format)
+    except ValueError as e:
+        output_error(str(e))
+        return 1
+    if not raw_entries:
+        output_error("No task definitions provided on stdin")
+        return 1
+
+    errors = []
+    operations = []
+    for index, raw in enumerate(raw_entries, 1):
+        try:
+            operations.append((index, parse_batch_entry(raw)))
+        except ValueError as e:
+            errors.append(f"Entry {index}: {e}")
+
+    task_dir = get_tasks_dir(args.plan_id)
+    with task_transaction(task_dir) as entries:
+        by_number = {entry['number']: entry for entry in entries}
+        number = next_task_number(entries)
+        now = now_iso()
+
+        # Build every task before anything is written
+        writes, results, seen, relinked = [], [], set(), set()
+        for index, operation in operations:
+            if operation[0] == 'add':
+                parsed = operation[1]
+                filename = f"TASK-{number:03d}-{parsed['type']}.toon"
+                task = build_task(number, parsed, now)
+                relinked.add(number)
+                number += 1
+            else:
+                _, target, changes = operation
+                if target not in by_number:
+                    errors.append(f"Entry {index}: Task TASK-{target} not found")
+                    continue
+                if target in seen:
+                    errors.append(f"Entry {index}: TASK-{target} is updated twice")
+                    continue
+                filename = by_number[target]['file']
+                task = parse_task_file((task_dir / filename).read_text(encoding='utf-8'))
+                if 'depends_on' in changes and changes['depends_on'] != task['depends_on']:
+                    relinked.add(target)
+                task = apply_task_changes(task, changes)
+            seen.add(task['number'])
+            writes.append((index, task_dir / filename, task))
+            results.append({'action': operation[0], 'number': task['number'], 'title': task['title'], 'file': filename})
+
+        # Dependencies must name existing or batch tasks, and changed
+        # dependencies must not close a cycle (cycles elsewhere are left alone)
+        known = set(by_number) | seen
+        for index, _, task in writes:
+            for dep in task['depends_on']:
+                if dependency_number(dep) not in known:
+                    errors.append(f"Entry {index}: depends_on target {dep} does not exist")
+        final = {n: entry for n, entry in by_number.items() if n not in seen}
+        final.update({task['number']: task for _, _, task in writes})
+        graph = build_graph(list(final.values()))
+        cycles = set()
+        for index, _, task in writes:
+            cycle = find_cycle_through(graph, task['number']) if task['number'] in relinked else None
+            if cycle and frozenset(cycle) not in cycles:
+                cycles.add(frozenset(cycle))
+                errors.append(f"Entry {index}: Dependency cycle: {format_cycle(cycle)}")
+
+        if errors:
+            output_error(f"Batch rejected, no task written: {'; '.join(errors)}")
+            return 1
+
+        total = len(commit_tasks(task_dir, entries, [(path, task) for _, path, task in writes]))
+
+    for result in results:
+        if result['action'] == 'add':
+            log_entry('work', args.plan_id, 'INFO',
+                      f"[MANAGE-TASKS] Added TASK-{result['number']:03d} (batch): {result['title'][:50]}")
+
+    output_toon({
+        'status': 'success',
+        'plan_id': args.plan_id,
+        'total_tasks': total,
+        'created_count': sum(1 for r in results if r['action'] == 'add'),
+        'updated_count': sum(1 for r in results if r['action'] == 'update'),
+        'batch_table': results
+    })
+    return 0
@@ -7,16 +7,16 @@ Contains: add, update, remove subcommands.
 
 import sys
 
-from file_ops import atomic_write_file  # type: ignore[import-not-found]
 from plan_logging import log_entry  # type: ignore[import-not-found]
 
 from _manage_tasks_shared import (
-    now_iso, parse_depends_on,
-    get_tasks_dir, parse_task_file, format_task_file,
-    find_task_file, get_next_number,
+    now_iso, get_tasks_dir, parse_task_file, build_task,
+    task_transaction, commit_tasks, delete_task,
+    find_task_file, next_task_number,
     parse_stdin_task, output_toon, output_error,
-    validate_profile, validate_skills
+    normalize_task_changes, apply_task_changes
 )
+from _task_graph import check_dependencies
 
 
 def cmd_add(args) -> int:
@@ -37,50 +37,21 @@ def cmd_add(args) -> int:
         return 1
 
     task_dir = get_tasks_dir(args.plan_id)
-
-    number = get_next_number(task_dir)
-
-    # Use type for filename (TASK-SEQ-TYPE format per target architecture)
     task_type = parsed['type']
-    filename = f"TASK-{number:03d}-{task_type}.toon"
-    filepath = task_dir / filename
-
-    steps = []
-    for i, step_title in enumerate(parsed['steps'], 1):
-        steps.append({
-            'number': i,
-            'title': step_title,
-            'status': 'pending'
-        })
-
-    now = now_iso()
-    task = {
-        'number': number,
-        'title': parsed['title'],
-        'status': 'pending',
-        'phase': parsed['phase'],
-        'domain': parsed['domain'],
-        'profile': parsed['profile'],
-        'type': parsed['type'],
-        'skills': parsed['skills'],
-        'origin': parsed['origin'],
-        'priority': parsed.get('priority'),
-        'finding': parsed.get('finding'),
-        'created': now,
-        'updated': now,
-        'deliverables': parsed['deliverables'],
-        'depends_on': parsed['depends_on'],
-        'description': parsed['description'],
-        'delegation': parsed['delegation'],
-        'verification': parsed['verification'],
-        'steps': steps,
-        'current_step': 1
-    }
 
-    content = format_task_file(task)
-    atomic_write_file(filepath, content)
+    with task_transaction(task_dir) as entries:
+        number = next_task_number(entries)
+
+        try:
+            check_dependencies(entries, number, parsed['depends_on'])
+        except ValueError as e:
+            output_error(str(e))
+            return 1
 
-    total = len(list(task_dir.glob("TASK-*.toon")))
+        # Use type for filename (TASK-SEQ-TYPE format per target architecture)
+        filename = f"TASK-{number:03d}-{task_type}.toon"
+        task = build_task(number, parsed, now_iso())
+        total = len(commit_tasks(task_dir, entries, [(task_dir / filename, task)]))
 
     log_entry('work', args.plan_id, 'INFO', f'[MANAGE-TASKS] Added TASK-{number:03d} ({task_type}): {parsed["title"][:50]}')
 
@@ -101,7 +72,7 @@ def cmd_add(args) -> int:
             'phase': parsed['phase'],
             'origin': parsed['origin'],
             'status': 'pending',
-            'step_count': len(steps)
+            'step_count': len(task['steps'])
         }
     })
     return 0
@@ -116,62 +87,37 @@ def cmd_update(args) -> int:
         output_error(f"Task TASK-{args.number} not found")
         return 1
 
-    content = filepath.read_text(encoding='utf-8')
-    task = parse_task_file(content)
-
-    if args.title:
-        task['title'] = args.title
-    if args.description:
-        task['description'] = args.description
+    changes = {
+        'title': args.title,
+        'description': args.description,
+        'status': args.status,
+        'domain': getattr(args, 'domain', None),
+        'profile': getattr(args, 'profile', None),
+        'skills': getattr(args, 'skills', None),
+        'deliverables': getattr(args, 'deliverables', None),
+    }
+    changes = {key: value for key, value in changes.items() if value}
     if args.depends_on is not None:
-        depends_on = []
-        for dep in args.depends_on:
-            if dep.lower() != 'none':
-                depends_on.extend(parse_depends_on(dep))
-        task['depends_on'] = depends_on
-    if args.status:
-        if args.status not in ('pending', 'in_progress', 'done', 'blocked'):
-            output_error(f"Invalid status: {args.status}. Must be pending, in_progress, done, or blocked")
-            return 1
-        task['status'] = args.status
-
-    # Handle new fields
-    if getattr(args, 'domain', None):
-        task['domain'] = args.domain
-    if getattr(args, 'profile', None):
-        try:
-            task['profile'] = validate_profile(args.profile)
-        except ValueError as e:
-            output_error(str(e))
-            return 1
-    if getattr(args, 'skills', None):
-        try:
-            # Skills can be comma-separated or a list
-            if isinstance(args.skills, str):
-                skills_list = [s.strip() for s in args.skills.split(',') if s.strip()]
-            else:
-                skills_list = args.skills
-            task['skills'] = validate_skills(skills_list)
-        except ValueError as e:
-            output_error(str(e))
-            return 1
-    if getattr(args, 'deliverables', None):
-        try:
-            # Deliverables can be comma-separated or a list
-            if isinstance(args.deliverables, str):
-                deliverables_list = [int(d.strip()) for d in args.deliverables.split(',') if d.strip()]
-            else:
-                deliverables_list = [int(d) for d in args.deliverables]
-            task['deliverables'] = deliverables_list
-        except ValueError:
-            output_error("Deliverables must be comma-separated integers")
-            return 1
+        changes['depends_on'] = args.depends_on
+    try:
+        changes = normalize_task_changes(changes)
+    except ValueError as e:
+        output_error(str(e))
+        return 1
 
-    task['updated'] = now_iso()
+    with task_transaction(task_dir) as entries:
+        task = parse_task_file(filepath.read_text(encoding='utf-8'))
+        # Only a dependency change can close a cycle through this task
+        if 'depends_on' in changes and changes['depends_on'] != task['depends_on']:
+            try:
+                check_dependencies(entries, task['number'], changes['depends_on'])
+            except ValueError as e:
+                output_error(str(e))
+                return 1
+        task = apply_task_changes(task, changes)
 
-    # Filename uses TASK-SEQ-TYPE format - doesn't change when title changes
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+        # Filename uses TASK-SEQ-TYPE format - doesn't change when title changes
+        commit_tasks(task_dir, entries, [(filepath, task)])
 
     output_toon({
         'status': 'success',
@@ -203,9 +149,7 @@ def cmd_remove(args) -> int:
     task = parse_task_file(content)
     filename = filepath.name
 
-    filepath.unlink()
-
-    total = len(list(task_dir.glob("TASK-*.toon")))
+    total = len(delete_task(task_dir, filepath))
 
     log_entry('work', args.plan_id, 'INFO', f'[MANAGE-TASKS] Removed TASK-{task["number"]:03d}: {task["title"][:50]}')
 
@@ -2,76 +2,80 @@
 """
 Query command handlers for manage-tasks.py.
 
-Contains: list, get, next, tasks-by-domain, tasks-by-profile, next-tasks subcommands.
+Contains: list, get, next, tasks-by-domain, tasks-by-profile, next-tasks, schedule subcommands.
+
+All commands except get read the task index (tasks/index.toon); next parses
+only the task file it returns. next, next-tasks and schedule order tasks
+with the dependency graph in _task_graph.py.
 """
 
 from _manage_tasks_shared import (
-    get_tasks_dir, parse_task_file, find_task_file, get_all_tasks,
-    calculate_progress, format_list_value, get_deliverable_context,
+    get_tasks_dir, load_task_file, find_task_file, get_task_index,
+    format_progress, get_deliverable_context,
     output_toon, output_error
 )
+from _task_graph import schedule
 
 
 def cmd_list(args) -> int:
     """Handle 'list' subcommand."""
     task_dir = get_tasks_dir(args.plan_id)
-    all_tasks = get_all_tasks(task_dir)
+    all_tasks = get_task_index(task_dir)
 
     # Build set of done task numbers for dependency checking
-    done_tasks = {f"TASK-{t['number']}" for _, t in all_tasks if t.get('status') == 'done'}
+    done_tasks = {f"TASK-{t['number']}" for t in all_tasks if t['status'] == 'done'}
 
     # Filter by phase if specified
     if args.phase:
         all_tasks = [
-            (p, t) for p, t in all_tasks
-            if t.get('phase', 'execute') == args.phase
+            t for t in all_tasks
+            if t['phase'] == args.phase
         ]
 
     # Filter by deliverable if specified
     if args.deliverable:
         all_tasks = [
-            (p, t) for p, t in all_tasks
-            if args.deliverable in t.get('deliverables', [])
+            t for t in all_tasks
+            if args.deliverable in t['deliverables']
         ]
 
     # Filter by ready (dependencies satisfied) if specified
     if args.ready:
         all_tasks = [
-            (p, t) for p, t in all_tasks
-            if all(dep in done_tasks for dep in t.get('depends_on', []))
+            t for t in all_tasks
+            if all(dep in done_tasks for dep in t['depends_on'])
         ]
 
     # Get filtered list for status filtering
     filtered_tasks = all_tasks
     if args.status and args.status != 'all':
-        filtered_tasks = [(p, t) for p, t in all_tasks if t.get('status') == args.status]
+        filtered_tasks = [t for t in all_tasks if t['status'] == args.status]
 
     # Compute counts from filtered list
-    pending = sum(1 for _, t in all_tasks if t.get('status') == 'pending')
-    in_progress = sum(1 for _, t in all_tasks if t.get('status') == 'in_progress')
-    done_count = sum(1 for _, t in all_tasks if t.get('status') == 'done')
-    blocked = sum(1 for _, t in all_tasks if t.get('status') == 'blocked')
+    pending = sum(1 for t in all_tasks if t['status'] == 'pending')
+    in_progress = sum(1 for t in all_tasks if t['status'] == 'in_progress')
+    done_count = sum(1 for t in all_tasks if t['status'] == 'done')
+    blocked = sum(1 for t in all_tasks if t['status'] == 'blocked')
 
     # Compute counts by phase
     by_phase = {}
-    for _, t in all_tasks:
-        phase = t.get('phase', 'execute')
+    for t in all_tasks:
+        phase = t['phase']
         by_phase[phase] = by_phase.get(phase, 0) + 1
 
     # Build table data
     table = []
-    for path, task in filtered_tasks:
-        completed, total = calculate_progress(task)
-        deliverables = task.get('deliverables', [])
+    for task in filtered_tasks:
+        deliverables = task['deliverables']
         table.append({
             'number': task['number'],
             'title': task['title'],
-            'domain': task.get('domain'),
-            'profile': task.get('profile'),
-            'phase': task.get('phase', 'execute'),
+            'domain': task['domain'],
+            'profile': task['profile'],
+            'phase': task['phase'],
             'deliverables': deliverables,
             'status': task['status'],
-            'progress': f"{completed}/{total}"
+            'progress': format_progress(task)
         })
 
     result = {
@@ -105,8 +109,7 @@ def cmd_get(args) -> int:
         output_error(f"Task TASK-{args.number} not found")
         return 1
 
-    content = filepath.read_text(encoding='utf-8')
-    task = parse_task_file(content)
+    task = load_task_file(filepath)
 
     output_toon({
         'status': 'success',
@@ -138,56 +141,40 @@ def cmd_get(args) -> int:
 def cmd_next(args) -> int:
     """Handle 'next' subcommand."""
     task_dir = get_tasks_dir(args.plan_id)
-    all_tasks = get_all_tasks(task_dir)
-
-    # Build set of done task numbers for dependency checking
-    done_tasks = {f"TASK-{t['number']}" for _, t in all_tasks if t.get('status') == 'done'}
+    all_tasks = get_task_index(task_dir)
 
     # Filter by phase if specified
     filtered_tasks = all_tasks
     if args.phase:
         filtered_tasks = [
-            (p, t) for p, t in all_tasks
-            if t.get('phase', 'execute') == args.phase
+            t for t in all_tasks
+            if t['phase'] == args.phase
         ]
+    by_number = {t['number']: t for t in filtered_tasks}
 
     total_tasks = len(filtered_tasks)
-    completed_tasks = sum(1 for _, t in filtered_tasks if t.get('status') == 'done')
-    in_progress_count = sum(1 for _, t in filtered_tasks if t.get('status') == 'in_progress')
-
-    # Helper to check if dependencies are satisfied
-    def deps_satisfied(task):
-        if getattr(args, 'ignore_deps', False):
-            return True
-        deps = task.get('depends_on', [])
-        return all(dep in done_tasks for dep in deps)
-
-    # Find first in_progress or pending task with satisfied dependencies
-    next_task = None
-    blocked_tasks = []
-
-    # First, look for in_progress tasks
-    for path, task in filtered_tasks:
-        if task.get('status') == 'in_progress':
-            next_task = task
-            break
-
-    # If no in_progress, find first pending with satisfied deps
+    completed_tasks = sum(1 for t in filtered_tasks if t['status'] == 'done')
+    in_progress_count = sum(1 for t in filtered_tasks if t['status'] == 'in_progress')
+
+    # In-progress tasks come first, then the ready task with the longest
+    # remaining path (critical path first)
+    next_task = next((t for t in filtered_tasks if t['status'] == 'in_progress'), None)
+    if not next_task and getattr(args, 'ignore_deps', False):
+        next_task = next((t for t in filtered_tasks if t['status'] == 'pending'), None)
+
     if not next_task:
-        for path, task in filtered_tasks:
-            if task.get('status') == 'pending':
-                if deps_satisfied(task):
-                    next_task = task
-                    break
-                else:
-                    waiting_for = [dep for dep in task.get('depends_on', []) if dep not in done_tasks]
-                    blocked_tasks.append({
-                        'number': task['number'],
-                        'title': task['title'],
-                        'waiting_for': ', '.join(waiting_for)
-                    })
+        plan = schedule(all_tasks)
+        next_task = next((by_number[n] for n in plan['ready'] if n in by_number), None)
 
     if not next_task:
+        blocked_tasks = [
+            {
+                'number': number,
+                'title': by_number[number]['title'],
+                'waiting_for': ', '.join(waiting_for)
+            }
+            for number, waiting_for in plan['blocked'].items() if number in by_number
+        ]
         if blocked_tasks:
             output_toon({
                 'status': 'success',
@@ -215,6 +202,9 @@ def cmd_next(args) -> int:
             })
         return 0
 
+    # Only the selected task file is parsed
+    next_task = load_task_file(task_dir / next_task['file'])
+
     # Find next pending step in this task
     steps = next_task.get('steps', [])
     next_step = None
@@ -284,33 +274,32 @@ def cmd_tasks_by_domain(args) -> int:
     Returns tasks filtered by domain.
     """
     task_dir = get_tasks_dir(args.plan_id)
-    all_tasks = get_all_tasks(task_dir)
+    all_tasks = get_task_index(task_dir)
 
     # Filter by domain
     domain = args.domain
     filtered_tasks = [
-        (p, t) for p, t in all_tasks
-        if t.get('domain') == domain
+        t for t in all_tasks
+        if t['domain'] == domain
     ]
 
     # Build table data
     table = []
-    for path, task in filtered_tasks:
-        completed, total = calculate_progress(task)
+    for task in filtered_tasks:
         table.append({
             'number': task['number'],
             'title': task['title'],
-            'domain': task.get('domain'),
-            'profile': task.get('profile'),
+            'domain': task['domain'],
+            'profile': task['profile'],
             'status': task['status'],
-            'progress': f"{completed}/{total}"
+            'progress': format_progress(task)
         })
 
     # Compute counts
-    pending = sum(1 for _, t in filtered_tasks if t.get('status') == 'pending')
-    in_progress = sum(1 for _, t in filtered_tasks if t.get('status') == 'in_progress')
-    done_count = sum(1 for _, t in filtered_tasks if t.get('status') == 'done')
-    blocked = sum(1 for _, t in filtered_tasks if t.get('status') == 'blocked')
+    pending = sum(1 for t in filtered_tasks if t['status'] == 'pending')
+    in_progress = sum(1 for t in filtered_tasks if t['status'] == 'in_progress')
+    done_count = sum(1 for t in filtered_tasks if t['status'] == 'done')
+    blocked = sum(1 for t in filtered_tasks if t['status'] == 'blocked')
 
     output_toon({
         'status': 'success',
@@ -334,33 +323,32 @@ def cmd_tasks_by_profile(args) -> int:
     Returns tasks filtered by profile.
     """
     task_dir = get_tasks_dir(args.plan_id)
-    all_tasks = get_all_tasks(task_dir)
+    all_tasks = get_task_index(task_dir)
 
     # Filter by profile
     profile = args.profile
     filtered_tasks = [
-        (p, t) for p, t in all_tasks
-        if t.get('profile') == profile
+        t for t in all_tasks
+        if t['profile'] == profile
     ]
 
     # Build table data
     table = []
-    for path, task in filtered_tasks:
-        completed, total = calculate_progress(task)
+    for task in filtered_tasks:
         table.append({
             'number': task['number'],
             'title': task['title'],
-            'domain': task.get('domain'),
-            'profile': task.get('profile'),
+            'domain': task['domain'],
+            'profile': task['profile'],
             'status': task['status'],
-            'progress': f"{completed}/{total}"
+            'progress': format_progress(task)
         })
 
     # Compute counts
-    pending = sum(1 for _, t in filtered_tasks if t.get('status') == 'pending')
-    in_progress = sum(1 for _, t in filtered_tasks if t.get('status') == 'in_progress')
-    done_count = sum(1 for _, t in filtered_tasks if t.get('status') == 'done')
-    blocked = sum(1 for _, t in filtered_tasks if t.get('status') == 'blocked')
+    pending = sum(1 for t in filtered_tasks if t['status'] == 'pending')
+    in_progress = sum(1 for t in filtered_tasks if t['status'] == 'in_progress')
+    done_count = sum(1 for t in filtered_tasks if t['status'] == 'done')
+    blocked = sum(1 for t in filtered_tasks if t['status'] == 'blocked')
 
     output_toon({
         'status': 'success',
@@ -382,57 +370,43 @@ def cmd_next_tasks(args) -> int:
     """Handle 'next-tasks' subcommand.
 
     Returns all tasks that are ready for parallel execution
-    (all depends_on tasks are completed).
+    (all depends_on tasks are completed), longest remaining path first.
     """
     task_dir = get_tasks_dir(args.plan_id)
-    all_tasks = get_all_tasks(task_dir)
-
-    # Build set of done task numbers for dependency checking
-    done_tasks = {f"TASK-{t['number']}" for _, t in all_tasks if t.get('status') == 'done'}
+    all_tasks = get_task_index(task_dir)
+    plan = schedule(all_tasks)
+    by_number = {t['number']: t for t in all_tasks}
 
-    # Find all pending tasks with satisfied dependencies
+    # Pending tasks with satisfied dependencies, critical path first
     ready_tasks = []
-    blocked_tasks = []
-
-    for path, task in all_tasks:
-        if task.get('status') != 'pending':
-            continue
-
-        deps = task.get('depends_on', [])
-        unmet_deps = [dep for dep in deps if dep not in done_tasks]
+    for number in plan['ready']:
+        task = by_number[number]
+        ready_tasks.append({
+            'number': task['number'],
+            'title': task['title'],
+            'domain': task['domain'],
+            'profile': task['profile'],
+            'skills': task['skills'],
+            'deliverables': task['deliverables'],
+            'progress': format_progress(task)
+        })
 
-        if not unmet_deps:
-            # All dependencies satisfied - ready for execution
-            completed, total = calculate_progress(task)
-            ready_tasks.append({
-                'number': task['number'],
-                'title': task['title'],
-                'domain': task.get('domain'),
-                'profile': task.get('profile'),
-                'skills': task.get('skills', []),
-                'deliverables': task.get('deliverables', []),
-                'progress': f"{completed}/{total}"
-            })
-        else:
-            # Has unmet dependencies
-            blocked_tasks.append({
-                'number': task['number'],
-                'title': task['title'],
-                'waiting_for': unmet_deps
-            })
+    blocked_tasks = [
+        {'number': number, 'title': by_number[number]['title'], 'waiting_for': waiting_for}
+        for number, waiting_for in plan['blocked'].items()
+    ]
 
     # Also include in_progress tasks
     in_progress_tasks = []
-    for path, task in all_tasks:
-        if task.get('status') == 'in_progress':
-            completed, total = calculate_progress(task)
+    for task in all_tasks:
+        if task['status'] == 'in_progress':
             in_progress_tasks.append({
                 'number': task['number'],
                 'title': task['title'],
-                'domain': task.get('domain'),
-                'profile': task.get('profile'),
-                'skills': task.get('skills', []),
-                'progress': f"{completed}/{total}"
+                'domain': task['domain'],
+                'profile': task['profile'],
+                'skills': task['skills'],
+                'progress': format_progress(task)
             })
 
     output_toon({
@@ -446,3 +420,45 @@ def cmd_next_tasks(args) -> int:
         'blocked_tasks': blocked_tasks
     })
     return 0
+
+
+def cmd_schedule(args) -> int:
+    """Handle 'schedule' subcommand.
+
+    Returns the remaining tasks in dependency waves (tasks of one wave can
+    run in parallel), the topological order and the critical path.
+    """
+    task_dir = get_tasks_dir(args.plan_id)
+    all_tasks = get_task_index(task_dir)
+    plan = schedule(all_tasks)
+    by_number = {t['number']: t for t in all_tasks}
+
+    waves_table = []
+    for wave, numbers in enumerate(plan['waves']):
+        for number in sorted(numbers, key=lambda n: (-plan['priority'][n], n)):
+            task = by_number[number]
+            waves_table.append({
+                'wave': wave,
+                'number': number,
+                'title': task['title'],
+                'status': task['status'],
+                'progress': format_progress(task),
+                'path_steps': plan['priority'][number]
+            })
+
+    output_toon({
+        'status': 'success',
+        'plan_id': args.plan_id,
+        'total_tasks': len(all_tasks),
+        'wave_count': len(plan['waves']),
+        'critical_path_steps': plan['critical_path_steps'],
+        'critical_path': [f"TASK-{n}" for n in plan['critical_path']],
+        'order': [f"TASK-{n}" for n in plan['order']],
+        'cyclic': [f"TASK-{n}" for n in plan['cyclic']],
+        'waves_table': waves_table,
+        'unresolved_tasks': [
+            {'number': number, 'title': by_number[number]['title'], 'missing': missing}
+            for number, missing in plan['unresolved'].items()
+        ]
+    })
+    return 0
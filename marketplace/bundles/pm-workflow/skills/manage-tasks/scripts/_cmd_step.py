@@ -7,11 +7,10 @@ Contains: step-start, step-done, step-skip, add-step, remove-step subcommands.
 
 import sys
 
-from file_ops import atomic_write_file  # type: ignore[import-not-found]
 from plan_logging import log_entry  # type: ignore[import-not-found]
 
 from _manage_tasks_shared import (
-    now_iso, get_tasks_dir, parse_task_file, format_task_file,
+    now_iso, get_tasks_dir, parse_task_file, write_task,
     find_task_file, output_toon, output_error
 )
 
@@ -44,8 +43,7 @@ def cmd_step_start(args) -> int:
     task['current_step'] = args.step
     task['updated'] = now_iso()
 
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+    write_task(task_dir, filepath, task)
 
     output_toon({
         'status': 'success',
@@ -103,8 +101,7 @@ def cmd_step_done(args) -> int:
     elif next_step:
         task['current_step'] = next_step
 
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+    write_task(task_dir, filepath, task)
 
     if all_done:
         log_entry('work', args.plan_id, 'INFO', f'[MANAGE-TASKS] Completed TASK-{args.task:03d}')
@@ -171,8 +168,7 @@ def cmd_step_skip(args) -> int:
     elif next_step:
         task['current_step'] = next_step
 
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+    write_task(task_dir, filepath, task)
 
     result = {
         'status': 'success',
@@ -230,8 +226,7 @@ def cmd_add_step(args) -> int:
     task['steps'] = steps
     task['updated'] = now_iso()
 
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+    write_task(task_dir, filepath, task)
 
     output_toon({
         'status': 'success',
@@ -284,8 +279,7 @@ def cmd_remove_step(args) -> int:
     if task.get('current_step', 1) > len(steps):
         task['current_step'] = len(steps)
 
-    new_content = format_task_file(task)
-    atomic_write_file(filepath, new_content)
+    write_task(task_dir, filepath, task)
 
     output_toon({
         'status': 'success',
@@ -5,17 +5,27 @@ Shared utilities for manage-tasks.py modular implementation.
 Contains:
 - TOON parsing/formatting utilities
 - Task file operations
+- Task index (tasks/index.toon)
 - Validation functions
 - Output formatting
 """
 
+import os
 import re
 import sys
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Tuple, Any
 
+try:
+    import fcntl
+except ImportError:  # Windows: index updates stay unlocked
+    fcntl = None  # type: ignore[assignment]
+
 from file_ops import atomic_write_file, base_path  # type: ignore[import-not-found]
+from toon_parser import load_cached, save_toon  # type: ignore[import-not-found]
 
 
 # =============================================================================
@@ -26,6 +36,7 @@ from file_ops import atomic_write_file, base_path  # type: ignore[import-not-fou
 VALID_PHASES = ['init', 'outline', 'plan', 'execute', 'finalize']
 # Profiles are arbitrary strings - defined in marshal.json per-domain, not hardcoded
 VALID_ORIGINS = ['plan', 'fix']
+VALID_STATUSES = ['pending', 'in_progress', 'done', 'blocked']
 # Task types per target architecture
 VALID_TYPES = ['IMPL', 'FIX', 'SONAR', 'PR', 'LINT', 'SEC', 'DOC']
 VALID_FILE_EXTENSIONS = [
@@ -546,32 +557,24 @@ def find_task_file(task_dir: Path, number: int) -> Optional[Path]:
 
 def get_next_number(task_dir: Path) -> int:
     """Get next available task number."""
-    if not task_dir.exists():
-        return 1
+    return next_task_number(get_task_index(task_dir))
+
 
+def next_task_number(entries: list) -> int:
+    """Get next available task number from index entries (by file name)."""
     max_num = 0
-    for f in task_dir.glob("TASK-*.toon"):
+    for entry in entries:
         try:
-            num = int(f.name[5:8])
-            max_num = max(max_num, num)
-        except (ValueError, IndexError):
+            max_num = max(max_num, int(entry['file'][5:8]))
+        except ValueError:
             pass
 
     return max_num + 1
 
 
-def get_all_tasks(task_dir: Path) -> list:
-    """Get all tasks sorted by number."""
-    if not task_dir.exists():
-        return []
-
-    tasks = []
-    for f in sorted(task_dir.glob("TASK-*.toon")):
-        content = f.read_text(encoding='utf-8')
-        task = parse_task_file(content)
-        tasks.append((f, task))
-
-    return sorted(tasks, key=lambda x: x[1].get('number', 0))
+def load_task_file(path: Path) -> dict:
+    """Read and parse a task file, reusing the parse while it is unchanged."""
+    return load_cached(path, parse_task_file)
 
 
 def calculate_progress(task: dict) -> Tuple[int, int]:
@@ -581,13 +584,262 @@ def calculate_progress(task: dict) -> Tuple[int, int]:
     return completed, len(steps)
 
 
+# =============================================================================
+# Task index
+# =============================================================================
+
+INDEX_FILENAME = 'index.toon'
+INDEX_HEADER = '# Task index (derived from TASK-*.toon, rebuilt when stale)\n'
+# title comes last so it may contain commas
+INDEX_FIELDS = [
+    'number', 'status', 'phase', 'domain', 'profile', 'type', 'origin', 'deliverables',
+    'depends_on', 'skills', 'steps_done', 'steps_total', 'mtime', 'file', 'title'
+]
+INDEX_INT_FIELDS = ('number', 'steps_done', 'steps_total', 'mtime')
+INDEX_LIST_FIELDS = ('deliverables', 'depends_on', 'skills')
+# Staged files of a multi-file commit (temp name, target name per line)
+BATCH_JOURNAL = '.batch-journal'
+
+
+def format_index_file(entries: list) -> str:
+    """Format index entries as a TOON uniform array (list values space-separated)."""
+    lines = [f"tasks[{len(entries)}]{{{','.join(INDEX_FIELDS)}}}:"]
+    for entry in entries:
+        values = []
+        for field in INDEX_FIELDS:
+            value = entry[field]
+            values.append(' '.join(str(v) for v in value) if field in INDEX_LIST_FIELDS else str(value))
+        lines.append(','.join(values))
+    return '\n'.join(lines)
+
+
+def parse_index_file(content: str) -> list:
+    """Parse index file content; raises ValueError if it is not a current index."""
+    lines = [line for line in content.split('\n') if line and not line.startswith('#')]
+    if not lines or lines[0] != f"tasks[{len(lines) - 1}]{{{','.join(INDEX_FIELDS)}}}:":
+        raise ValueError("Unexpected task index header")
+
+    entries = []
+    for line in lines[1:]:
+        values = line.split(',', len(INDEX_FIELDS) - 1)
+        if len(values) != len(INDEX_FIELDS):
+            raise ValueError(f"Malformed task index line: {line}")
+        entry = dict(zip(INDEX_FIELDS, values))
+        for field in INDEX_INT_FIELDS:
+            entry[field] = int(entry[field])
+        for field in INDEX_LIST_FIELDS:
+            entry[field] = entry[field].split()
+        entry['deliverables'] = [int(d) for d in entry['deliverables']]
+        entries.append(entry)
+    return entries
+
+
+def _index_entry(filepath: Path, task: dict) -> dict:
+    """Build the index entry of a parsed task file."""
+    completed, total = calculate_progress(task)
+    return {
+        'number': task.get('number', 0),
+        'status': task.get('status', 'pending'),
+        'phase': task.get('phase', 'execute'),
+        'domain': task.get('domain') or '',
+        'profile': task.get('profile') or '',
+        'type': task.get('type', 'IMPL'),
+        'origin': task.get('origin', 'plan'),
+        'deliverables': task.get('deliverables', []),
+        'depends_on': task.get('depends_on', []),
+        'skills': task.get('skills', []),
+        'steps_done': completed,
+        'steps_total': total,
+        'mtime': filepath.stat().st_mtime_ns,
+        'file': filepath.name,
+        'title': task.get('title', ''),
+    }
+
+
+def _task_file_mtimes(task_dir: Path) -> dict:
+    """Map each TASK-*.toon file name to its mtime in nanoseconds."""
+    with os.scandir(task_dir) as entries:
+        return {
+            entry.name: entry.stat().st_mtime_ns
+            for entry in entries
+            if entry.name.startswith('TASK-') and entry.name.endswith('.toon')
+        }
+
+
+@contextmanager
+def _index_lock(task_dir: Path):
+    """Hold an exclusive lock on the tasks directory (serializes index updates).
+
+    A multi-file commit interrupted after staging is completed first.
+    Without fcntl (Windows) updates are not serialized.
+    """
+    if fcntl is None:
+        _recover_commit(task_dir)
+        yield
+        return
+    fd = os.open(task_dir, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        _recover_commit(task_dir)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _recover_commit(task_dir: Path) -> None:
+    """Move the remaining staged files of an interrupted commit into place."""
+    journal = task_dir / BATCH_JOURNAL
+    if not journal.exists():
+        return
+    for line in journal.read_text(encoding='utf-8').splitlines():
+        temp_name, _, target_name = line.partition('\t')
+        if temp_name and (task_dir / temp_name).exists():
+            os.replace(task_dir / temp_name, task_dir / target_name)
+    journal.unlink()
+
+
+def _load_index(task_dir: Path) -> Optional[list]:
+    """Load the index, or None if it is missing, malformed or stale.
+
+    The index is stale when its file names and mtimes differ from the task
+    files on disk, e.g. after a task file was edited or copied by hand.
+    """
+    try:
+        entries = load_cached(task_dir / INDEX_FILENAME, parse_index_file)
+    except (OSError, ValueError):
+        return None
+    if {entry['file']: entry['mtime'] for entry in entries} != _task_file_mtimes(task_dir):
+        return None
+    return entries
+
+
+def _build_index(task_dir: Path) -> list:
+    """Build index entries by parsing every task file."""
+    entries = [_index_entry(path, load_task_file(path)) for path in task_dir.glob("TASK-*.toon")]
+    return sorted(entries, key=lambda entry: entry['number'])
+
+
+def _save_index(task_dir: Path, entries: list) -> None:
+    save_toon(task_dir / INDEX_FILENAME, entries, header=INDEX_HEADER,
+              formatter=format_index_file, parser=parse_index_file)
+
+
+def get_task_index(task_dir: Path) -> list:
+    """Get index entries of all tasks sorted by number.
+
+    Reads only tasks/index.toon and stats the task files. A stale index is
+    rebuilt from the task files and saved.
+    """
+    if not task_dir.exists():
+        return []
+
+    entries = _load_index(task_dir)
+    if entries is None:
+        with _index_lock(task_dir):
+            # Another process may have rebuilt it while we waited
+            entries = _load_index(task_dir)
+            if entries is None:
+                entries = _build_index(task_dir)
+                _save_index(task_dir, entries)
+    return entries
+
+
+@contextmanager
+def task_transaction(task_dir: Path):
+    """Lock the tasks directory and yield the current index entries.
+
+    Writes inside the transaction go through commit_tasks(), so number
+    allocation, validation against the index and the writes cannot
+    interleave with other processes.
+    """
+    task_dir.mkdir(parents=True, exist_ok=True)
+    with _index_lock(task_dir):
+        entries = _load_index(task_dir)
+        if entries is None:
+            entries = _build_index(task_dir)
+        yield entries
+
+
+def commit_tasks(task_dir: Path, entries: list, tasks: list) -> list:
+    """Write task files all or nothing and update the index.
+
+    Must be called within task_transaction(). All files are staged as temp
+    files first; nothing is replaced if staging fails. For several files a
+    journal lists the staged files before the first one is moved into
+    place, so a commit interrupted by a crash is completed by the next
+    locked operation.
+
+    Args:
+        task_dir: Tasks directory
+        entries: Index entries yielded by task_transaction()
+        tasks: (filepath, task) pairs to write
+
+    Returns:
+        Updated index entries
+    """
+    staged = []
+    journal = task_dir / BATCH_JOURNAL
+    try:
+        for filepath, task in tasks:
+            content = format_task_file(task) + '\n'
+            fd, temp_path = tempfile.mkstemp(suffix='.toon', prefix='.tmp_', dir=task_dir)
+            staged.append((Path(temp_path), filepath, content))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+        if len(staged) > 1:
+            atomic_write_file(journal, '\n'.join(f"{temp.name}\t{filepath.name}" for temp, filepath, _ in staged))
+    except BaseException:
+        for temp, _, _ in staged:
+            temp.unlink(missing_ok=True)
+        raise
+
+    for temp, filepath, _ in staged:
+        os.replace(temp, filepath)
+
+    written = {filepath.name for _, filepath, _ in staged}
+    entries = [entry for entry in entries if entry['file'] not in written]
+    entries.extend(_index_entry(filepath, parse_task_file(content)) for _, filepath, content in staged)
+    entries.sort(key=lambda entry: entry['number'])
+    _save_index(task_dir, entries)
+    journal.unlink(missing_ok=True)
+    return entries
+
+
+def write_task(task_dir: Path, filepath: Path, task: dict) -> list:
+    """Write a task file and update its index entry.
+
+    Returns:
+        Updated index entries
+    """
+    with task_transaction(task_dir) as entries:
+        return commit_tasks(task_dir, entries, [(filepath, task)])
+
+
+def delete_task(task_dir: Path, filepath: Path) -> list:
+    """Delete a task file and its index entry.
+
+    Returns:
+        Updated index entries
+    """
+    with task_transaction(task_dir) as entries:
+        filepath.unlink()
+        entries = [entry for entry in entries if entry['file'] != filepath.name]
+        _save_index(task_dir, entries)
+    return entries
+
+
+def format_progress(entry: dict) -> str:
+    """Format step progress of an index entry (done/total)."""
+    return f"{entry['steps_done']}/{entry['steps_total']}"
+
+
 # =============================================================================
 # Stdin parsing
 # =============================================================================
 
-def parse_stdin_task(stdin_content: str) -> dict:
-    """Parse task definition from stdin TOON format."""
-    result = {
+def default_task_definition() -> dict:
+    """Task definition with every optional field at its default."""
+    return {
         'title': '',
         'deliverables': [],
         'domain': '',
@@ -614,6 +866,11 @@ def parse_stdin_task(stdin_content: str) -> dict:
         }
     }
 
+
+def parse_stdin_task(stdin_content: str) -> dict:
+    """Parse task definition from stdin TOON format."""
+    result = default_task_definition()
+
     lines = stdin_content.split('\n')
     i = 0
 
@@ -739,6 +996,15 @@ def parse_stdin_task(stdin_content: str) -> dict:
         else:
             i += 1
 
+    return validate_task_definition(result)
+
+
+def validate_task_definition(result: dict) -> dict:
+    """Validate a parsed task definition (stdin, batch TOON or JSONL).
+
+    Raises:
+        ValueError: If a required field is missing or a value is invalid
+    """
     # Copy domain to delegation block
     if result['domain']:
         result['delegation']['domain'] = result['domain']
@@ -773,6 +1039,86 @@ def parse_stdin_task(stdin_content: str) -> dict:
     return result
 
 
+def build_task(number: int, parsed: dict, now: str) -> dict:
+    """Build a new pending task from a validated task definition."""
+    steps = []
+    for i, step_title in enumerate(parsed['steps'], 1):
+        steps.append({
+            'number': i,
+            'title': step_title,
+            'status': 'pending'
+        })
+
+    return {
+        'number': number,
+        'title': parsed['title'],
+        'status': 'pending',
+        'phase': parsed['phase'],
+        'domain': parsed['domain'],
+        'profile': parsed['profile'],
+        'type': parsed['type'],
+        'skills': parsed['skills'],
+        'origin': parsed['origin'],
+        'priority': parsed.get('priority'),
+        'finding': parsed.get('finding'),
+        'created': now,
+        'updated': now,
+        'deliverables': parsed['deliverables'],
+        'depends_on': parsed['depends_on'],
+        'description': parsed['description'],
+        'delegation': parsed['delegation'],
+        'verification': parsed['verification'],
+        'steps': steps,
+        'current_step': 1
+    }
+
+
+# Fields an update may change
+UPDATE_FIELDS = ['title', 'description', 'depends_on', 'status', 'domain', 'profile', 'skills', 'deliverables']
+
+
+def normalize_task_changes(changes: dict) -> dict:
+    """Validate update values given as CLI strings or lists.
+
+    Raises:
+        ValueError: If a field is unknown or a value is invalid
+    """
+    result = {}
+    for key, value in changes.items():
+        if key not in UPDATE_FIELDS:
+            raise ValueError(f"Unknown update field: {key}. Must be one of: {', '.join(UPDATE_FIELDS)}")
+        if key == 'depends_on':
+            refs = value if isinstance(value, list) else [value]
+            value = [dep for ref in refs for dep in parse_depends_on(str(ref))]
+        elif key == 'status' and value not in VALID_STATUSES:
+            raise ValueError(f"Invalid status: {value}. Must be pending, in_progress, done, or blocked")
+        elif key == 'profile':
+            value = validate_profile(value)
+        elif key == 'skills':
+            # Skills can be comma-separated or a list
+            if isinstance(value, str):
+                value = [s.strip() for s in value.split(',') if s.strip()]
+            value = validate_skills(value)
+        elif key == 'deliverables':
+            # Deliverables can be comma-separated or a list
+            try:
+                if isinstance(value, str):
+                    value = [int(d.strip()) for d in value.strip('[]').split(',') if d.strip()]
+                else:
+                    value = [int(d) for d in value]
+            except ValueError:
+                raise ValueError("Deliverables must be comma-separated integers") from None
+        result[key] = value
+    return result
+
+
+def apply_task_changes(task: dict, changes: dict) -> dict:
+    """Apply normalized changes to a parsed task and set its updated time."""
+    task.update(changes)
+    task['updated'] = now_iso()
+    return task
+
+
 # =============================================================================
 # Output formatting
 # =============================================================================
@@ -790,7 +1136,8 @@ def output_toon(data: dict) -> None:
 
     # Top-level simple fields
     for key in ['status', 'plan_id', 'file', 'renamed', 'total_tasks', 'task_number', 'step', 'phase_filter',
-                'domain_filter', 'profile_filter', 'ready_count', 'in_progress_count', 'blocked_count']:
+                'domain_filter', 'profile_filter', 'ready_count', 'in_progress_count', 'blocked_count',
+                'wave_count', 'critical_path_steps', 'created_count', 'updated_count']:
         if key in data:
             lines.append(f"{key}: {data[key]}")
 
@@ -943,6 +1290,34 @@ def output_toon(data: dict) -> None:
         for k, v in ctx.items():
             lines.append(f"  {k}: {v}")
 
+    # Schedule blocks (for schedule command)
+    for key in ['critical_path', 'order']:
+        if key in data:
+            lines.append(f"{key}: {format_list_value(data[key])}")
+    if data.get('cyclic'):
+        lines.append(f"cyclic: {format_list_value(data['cyclic'])}")
+
+    if 'waves_table' in data:
+        waves = data['waves_table']
+        lines.append("")
+        lines.append(f"waves[{len(waves)}]{{wave,number,title,status,progress,path_steps}}:")
+        for w in waves:
+            lines.append(f"{w['wave']},{w['number']},{w['title']},{w['status']},{w['progress']},{w['path_steps']}")
+
+    if 'batch_table' in data:
+        batch = data['batch_table']
+        lines.append("")
+        lines.append(f"batch[{len(batch)}]{{action,number,file,title}}:")
+        for b in batch:
+            lines.append(f"{b['action']},{b['number']},{b['file']},{b['title']}")
+
+    if data.get('unresolved_tasks'):
+        unresolved = data['unresolved_tasks']
+        lines.append("")
+        lines.append(f"unresolved_tasks[{len(unresolved)}]{{number,title,missing}}:")
+        for ut in unresolved:
+            lines.append(f"{ut['number']},{ut['title']},{', '.join(ut['missing'])}")
+
     # Tasks list (tabular)
     if 'tasks_table' in data:
         tasks = data['tasks_table']
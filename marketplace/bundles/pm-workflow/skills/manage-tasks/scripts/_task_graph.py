@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Task dependency graph for manage-tasks.py.
+
+Works on task index entries (see get_task_index). Contains:
+- Graph building from depends_on references
+- Cycle detection (used by add, update and batch for the tasks they change)
+- Topological order, ready waves and critical path (used by next,
+  next-tasks and schedule); tasks in or behind a cycle are never ready
+
+Task weights are the remaining step counts: the critical path is the chain
+of dependent tasks with the most steps left.
+"""
+
+import heapq
+from collections import deque
+from typing import Dict, List, Optional
+
+
+def dependency_number(dep: str) -> Optional[int]:
+    """Task number of a TASK-N reference, None if malformed."""
+    try:
+        return int(dep[5:]) if dep.startswith('TASK-') else None
+    except ValueError:
+        return None
+
+
+def build_graph(entries: list) -> Dict[int, List[int]]:
+    """Map each task number to the numbers of the tasks it depends on."""
+    graph = {}
+    for entry in entries:
+        deps = [dependency_number(dep) for dep in entry.get('depends_on', [])]
+        graph[entry['number']] = list(dict.fromkeys(d for d in deps if d is not None))
+    return graph
+
+
+def find_cycle(graph: Dict[int, List[int]]) -> Optional[List[int]]:
+    """Find a dependency cycle.
+
+    Returns:
+        Task numbers along the cycle, first number repeated at the end,
+        or None if the graph is acyclic. Unknown dependencies are ignored.
+    """
+    visiting, visited = set(), set()
+    for start in sorted(graph):
+        if start in visited:
+            continue
+        path = [start]
+        stack = [iter(graph[start])]
+        visiting.add(start)
+        while stack:
+            dep = next(stack[-1], None)
+            if dep is None:
+                stack.pop()
+                visiting.discard(path[-1])
+                visited.add(path.pop())
+            elif dep in visiting:
+                return path[path.index(dep):] + [dep]
+            elif dep in graph and dep not in visited:
+                path.append(dep)
+                stack.append(iter(graph[dep]))
+                visiting.add(dep)
+    return None
+
+
+def find_cycle_through(graph: Dict[int, List[int]], number: int) -> Optional[List[int]]:
+    """Find the shortest dependency cycle that contains task number.
+
+    Returns:
+        Task numbers along the cycle, starting and ending with number,
+        or None if number is not part of a cycle
+    """
+    parents: Dict[int, int] = {}
+    queue = deque([number])
+    while queue:
+        current = queue.popleft()
+        for dep in graph.get(current, []):
+            if dep == number:
+                path = [current]
+                while path[-1] != number:
+                    path.append(parents[path[-1]])
+                return path[::-1] + [number]
+            if dep in graph and dep not in parents:
+                parents[dep] = current
+                queue.append(dep)
+    return None
+
+
+def format_cycle(cycle: List[int]) -> str:
+    """Format a cycle as 'TASK-1 -> TASK-2 -> TASK-1'."""
+    return ' -> '.join(f"TASK-{number}" for number in cycle)
+
+
+def check_dependencies(entries: list, number: int, depends_on: List[str]) -> None:
+    """Validate the dependencies of a new or updated task.
+
+    Only cycles through this task count: cycles elsewhere in the plan do
+    not block changing it.
+
+    Raises:
+        ValueError: If the task would be part of a dependency cycle
+    """
+    entries = [entry for entry in entries if entry['number'] != number]
+    entries.append({'number': number, 'depends_on': depends_on})
+    cycle = find_cycle_through(build_graph(entries), number)
+    if cycle:
+        raise ValueError(f"Dependency cycle: {format_cycle(cycle)}")
+
+
+def _acyclic_order(graph: Dict[int, List[int]]) -> List[int]:
+    """Order tasks so every task follows its dependencies (ties by number).
+
+    Tasks in or behind a cycle are left out.
+    """
+    dependents: Dict[int, List[int]] = {number: [] for number in graph}
+    waiting = {}
+    for number, deps in graph.items():
+        known = [dep for dep in deps if dep in graph]
+        waiting[number] = len(known)
+        for dep in known:
+            dependents[dep].append(number)
+
+    heap = [number for number, count in waiting.items() if count == 0]
+    heapq.heapify(heap)
+    order = []
+    while heap:
+        number = heapq.heappop(heap)
+        order.append(number)
+        for dependent in dependents[number]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                heapq.heappush(heap, dependent)
+    return order
+
+
+def topological_order(graph: Dict[int, List[int]]) -> List[int]:
+    """Order tasks so every task follows its dependencies (ties by number).
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    order = _acyclic_order(graph)
+    if len(order) < len(graph):
+        raise ValueError(f"Dependency cycle: {format_cycle(find_cycle(graph))}")
+    return order
+
+
+def schedule(entries: list) -> dict:
+    """Schedule the tasks that are not done.
+
+    Args:
+        entries: Task index entries
+
+    Done tasks satisfy their dependents whatever they depend on. Remaining
+    tasks in or behind a dependency cycle are reported as cyclic and stay
+    blocked.
+
+    Returns:
+        Dict with:
+        - order: topological order of all tasks except cyclic ones
+        - cyclic: task numbers in or behind a dependency cycle
+        - waves: remaining task numbers grouped by dependency depth; wave 0
+          can run now, wave N once waves 0..N-1 are done
+        - ready: pending tasks whose dependencies are done, longest
+          remaining path first
+        - blocked: pending task number -> unmet TASK-N references
+        - unresolved: task number -> references to tasks that do not exist
+        - priority: remaining steps on the longest path starting at each task
+        - critical_path: task numbers of the longest remaining path
+        - critical_path_steps: remaining steps on it
+    """
+    graph = build_graph(entries)
+    by_number = {entry['number']: entry for entry in entries}
+    done = {number for number, entry in by_number.items() if entry['status'] == 'done'}
+    order = _acyclic_order({number: [] if number in done else deps for number, deps in graph.items()})
+    cyclic = sorted(set(graph) - set(order))
+
+    # Dependency depth of remaining tasks; missing dependencies propagate
+    level: Dict[int, int] = {}
+    unresolved: Dict[int, List[str]] = {}
+    for number in order:
+        if number in done:
+            continue
+        missing = [dep for dep in graph[number] if dep not in graph]
+        if missing:
+            unresolved[number] = [f"TASK-{dep}" for dep in missing]
+        open_deps = [dep for dep in graph[number] if dep in graph and dep not in done]
+        if any(dep in unresolved for dep in open_deps):
+            unresolved.setdefault(number, [])
+        if number not in unresolved:
+            level[number] = 1 + max((level[dep] for dep in open_deps), default=-1)
+
+    waves: List[List[int]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for number in sorted(level):
+        waves[level[number]].append(number)
+
+    # Longest remaining path from each task, walking dependents backwards
+    dependents: Dict[int, List[int]] = {number: [] for number in level}
+    for number in level:
+        for dep in graph[number]:
+            if dep in level:
+                dependents[dep].append(number)
+    priority: Dict[int, int] = {}
+    for number in reversed(order):
+        if number in level:
+            entry = by_number[number]
+            own = entry['steps_total'] - entry['steps_done']
+            priority[number] = own + max((priority[d] for d in dependents[number]), default=0)
+
+    critical_path: List[int] = []
+    candidates = sorted(waves[0]) if waves else []
+    while candidates:
+        number = max(candidates, key=lambda n: (priority[n], -n))
+        critical_path.append(number)
+        candidates = dependents[number]
+
+    ready, blocked = [], {}
+    for number in sorted(by_number):
+        if by_number[number]['status'] != 'pending':
+            continue
+        if level.get(number) == 0:
+            ready.append(number)
+        else:
+            blocked[number] = [f"TASK-{dep}" for dep in graph[number] if dep not in done]
+    ready.sort(key=lambda n: (-priority[n], n))
+
+    return {
+        'order': order,
+        'cyclic': cyclic,
+        'waves': waves,
+        'ready': ready,
+        'blocked': blocked,
+        'unresolved': unresolved,
+        'priority': priority,
+        'critical_path': critical_path,
+        'critical_path_steps': priority[critical_path[0]] if critical_path else 0,
+    }
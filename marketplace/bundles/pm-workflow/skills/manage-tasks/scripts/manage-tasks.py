@@ -10,12 +10,14 @@ Subcommands:
   add              - Add a new task (reads task definition from stdin)
   update           - Update an existing task
   remove           - Remove a task
+  batch            - Add and update many tasks at once (all or nothing, reads stdin)
   list             - List all tasks (summary)
   get              - Get a single task by number
   next             - Get next pending task/step for execution
   tasks-by-domain  - List tasks filtered by domain
   tasks-by-profile - List tasks filtered by profile
   next-tasks       - Get all tasks ready for parallel execution
+  schedule         - Show dependency waves, topological order and critical path
   step-start       - Mark a step as in_progress
   step-done        - Mark a step as done
   step-skip        - Skip a step
@@ -44,6 +46,25 @@ Add command usage (stdin-based API):
       - grep -l '```json' *.md | wc -l
     criteria: All grep commands return 0
   EOF
+
+Batch command usage (TOON entries separated by '---', or JSONL):
+  python3 manage-task.py batch --plan-id my-plan <<'EOF'
+  title: First Task
+  deliverables: [1]
+  domain: java
+  steps:
+    - Implement
+  ---
+  title: Second Task
+  deliverables: [2]
+  domain: java
+  depends_on: TASK-1
+  steps:
+    - Test
+  ---
+  number: 3
+  status: blocked
+  EOF
 """
 
 import argparse
@@ -51,9 +72,21 @@ import sys
 
 from _manage_tasks_shared import output_error
 from _cmd_crud import cmd_add, cmd_update, cmd_remove
-from _cmd_query import cmd_list, cmd_get, cmd_next, cmd_tasks_by_domain, cmd_tasks_by_profile, cmd_next_tasks
+from _cmd_batch import cmd_batch, BATCH_FORMATS
+from _cmd_query import cmd_list, cmd_get, cmd_next, cmd_tasks_by_domain, cmd_tasks_by_profile, cmd_next_tasks, cmd_schedule
 from _cmd_step import cmd_step_start, cmd_step_done, cmd_step_skip, cmd_add_step, cmd_remove_step
 
+# Read-only subcommands the executor may replay from its result cache
+EXECUTOR_CACHE_POLICY = {
+    'list': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'get': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'next': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'tasks-by-domain': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'tasks-by-profile': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'next-tasks': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+    'schedule': {'reads': ['{plan_dir}/plans/{--plan-id}/tasks/*']},
+}
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Build argument parser with subcommands."""
@@ -128,6 +161,16 @@ def build_parser() -> argparse.ArgumentParser:
     p_next_tasks = subparsers.add_parser('next-tasks', help='Get all tasks ready for parallel execution')
     p_next_tasks.add_argument('--plan-id', required=True, help='Plan identifier')
 
+    # schedule
+    p_schedule = subparsers.add_parser('schedule', help='Show dependency waves and critical path')
+    p_schedule.add_argument('--plan-id', required=True, help='Plan identifier')
+
+    # batch (stdin-based API)
+    p_batch = subparsers.add_parser('batch', help='Add and update many tasks in one transaction (reads stdin)')
+    p_batch.add_argument('--plan-id', required=True, help='Plan identifier')
+    p_batch.add_argument('--format', choices=BATCH_FORMATS, default='auto',
+                         help='Input format (default: auto, JSONL if the first line starts with {)')
+
     # step-start
     p_step_start = subparsers.add_parser('step-start', help='Mark a step as in_progress')
     p_step_start.add_argument('--plan-id', required=True, help='Plan identifier')
@@ -174,6 +217,8 @@ COMMANDS = {
     'tasks-by-domain': cmd_tasks_by_domain,
     'tasks-by-profile': cmd_tasks_by_profile,
     'next-tasks': cmd_next_tasks,
+    'schedule': cmd_schedule,
+    'batch': cmd_batch,
     'step-start': cmd_step_start,
     'step-done': cmd_step_done,
     'step-skip': cmd_step_skip,
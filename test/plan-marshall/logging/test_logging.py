@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Unit tests for logging module."""
 
+import gzip
+import json
 import os
 import re
 import sys
 import tempfile
+import threading
 import time
 from datetime import date
 from pathlib import Path
@@ -243,6 +246,187 @@ def test_cleanup_preserves_recent_logs():
             del os.environ['PLAN_BASE_DIR']
 
 
+# =============================================================================
+# TESTS: script stats
+# =============================================================================
+
+def test_record_script_stats_appends_records():
+    """Each call appends one compact JSON record to the sidecar."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            module.record_script_stats('test:skill:script', 'add', 0, 0.15)
+            module.record_script_stats('test:skill:script', 'add', 1, 0.25)
+
+            records = module.read_script_stats()
+            assert len(records) == 2, f"Expected 2 records, got {records}"
+            assert records[1] == {'t': records[1]['t'], 'n': 'test:skill:script', 's': 'add', 'e': 1, 'd': 0.25}
+            assert module.get_stats_path() == Path(tmp) / 'logs' / 'script-stats.jsonl'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_summarize_script_stats_percentiles_and_errors():
+    """Summary groups by notation and subcommand with nearest-rank percentiles."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            for i in range(1, 101):
+                module.record_script_stats('test:skill:script', 'list', 1 if i % 10 == 0 else 0, i / 100)
+            module.record_script_stats('test:skill:script', 'add', 0, 0.5)
+
+            summary = {(r['notation'], r['subcommand']): r for r in module.summarize_script_stats()}
+            listed = summary[('test:skill:script', 'list')]
+            assert listed['count'] == 100
+            assert listed['p50'] == 0.5 and listed['p95'] == 0.95 and listed['p99'] == 0.99, listed
+            assert listed['max'] == 1.0
+            assert listed['errors'] == 10 and listed['error_rate'] == 0.1, listed
+            assert summary[('test:skill:script', 'add')]['count'] == 1
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_summarize_script_stats_since_filter():
+    """Records before --since are excluded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            module.record_script_stats('old:skill:script', 'run', 0, 1.0, timestamp=time.time() - 3 * 86400)
+            module.record_script_stats('new:skill:script', 'run', 0, 1.0)
+
+            summary = module.summarize_script_stats(since=module.parse_since('1d'))
+            assert [r['notation'] for r in summary] == ['new:skill:script'], summary
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_parse_since_formats():
+    """--since accepts relative durations and ISO dates."""
+    now = time.time()
+    assert abs(module.parse_since('24h') - (now - 86400)) < 5
+    assert abs(module.parse_since('30m') - (now - 1800)) < 5
+    assert module.parse_since('2025-12-08T10:30:00Z') == module.parse_since('2025-12-08T10:30:00+00:00')
+    try:
+        module.parse_since('yesterday')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for invalid --since")
+
+
+def test_cleanup_compacts_script_stats():
+    """Cleanup drops stats records older than the retention period."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            module.record_script_stats('test:skill:script', 'run', 0, 0.1, timestamp=time.time() - 30 * 86400)
+            module.record_script_stats('test:skill:script', 'run', 0, 0.2)
+
+            module.cleanup_old_script_logs(max_age_days=7)
+
+            records = module.read_script_stats()
+            assert [r['d'] for r in records] == [0.2], records
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def _record_stats(plan_base: str, worker: int, count: int) -> None:
+    """Append fresh stats records, each followed by an expired one (forces rewrites)."""
+    os.environ['PLAN_BASE_DIR'] = plan_base
+    for i in range(count):
+        module.record_script_stats('test:skill:script', f'w{worker}-{i}', 0, 0.1)
+        module.record_script_stats('test:skill:script', 'old', 0, 0.1, timestamp=time.time() - 30 * 86400)
+
+
+def _compact_stats(plan_base: str, count: int) -> None:
+    os.environ['PLAN_BASE_DIR'] = plan_base
+    for _ in range(count):
+        module.compact_script_stats(7)
+
+
+def test_compact_script_stats_with_concurrent_appends():
+    """Records appended while another process compacts are never lost."""
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as tmp:
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_record_stats, args=(tmp, w, 150)) for w in range(2)]
+        processes += [context.Process(target=_compact_stats, args=(tmp, 100)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            module.compact_script_stats(7)
+            records = module.read_script_stats()
+            fresh = sorted(r['s'] for r in records)
+            assert fresh == sorted(f'w{w}-{i}' for w in range(2) for i in range(150)), len(fresh)
+            assert not list(module.get_stats_path().parent.glob('*.tmp'))
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+# =============================================================================
+# TESTS: import-time profiling
+# =============================================================================
+
+IMPORT_TIME_STDERR = (
+    "import time: self [us] | cumulative | imported package\n"
+    "import time:       436 |        436 |   _io\n"
+    "import time:       459 |       1483 | _frozen_importlib_external\n"
+    "Traceback: real error output\n"
+    "import time:      1200 |       5000 | json\n"
+)
+
+
+def test_parse_import_time_splits_stderr():
+    """Import timings are parsed with depth; other stderr lines are kept."""
+    modules, remaining = module.parse_import_time(IMPORT_TIME_STDERR)
+
+    assert [m['module'] for m in modules] == ['_io', '_frozen_importlib_external', 'json']
+    assert modules[0]['depth'] == 1 and modules[2]['depth'] == 0
+    assert modules[2]['self_us'] == 1200 and modules[2]['cumulative_us'] == 5000
+    assert remaining == "Traceback: real error output\n", repr(remaining)
+
+
+def test_log_import_profile_writes_entry():
+    """Profile entry records top-level total and the most expensive modules."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        (plan_base / 'plans' / 'test-plan').mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            modules, _ = module.parse_import_time(IMPORT_TIME_STDERR)
+            module.log_import_profile('test:skill:script', 'run', ['--plan-id', 'test-plan'], modules, limit=2)
+
+            content = (plan_base / 'plans' / 'test-plan' / 'script-execution.log').read_text()
+            assert '[PROFILE] test:skill:script run (imports 6.5ms)' in content, content
+            assert '  imports: json=5.0ms, _frozen_importlib_external=1.5ms\n' in content, content
+            assert '_io=' not in content, "Limit not applied"
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_summarize_import_profiles_filters_notation():
+    """Summary only aggregates profiles of the requested notation."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            modules, _ = module.parse_import_time(IMPORT_TIME_STDERR)
+            module.log_import_profile('a:b:one', 'run', [], modules)
+            module.log_import_profile('a:b:two', 'run', [], modules)
+
+            summary = module.summarize_import_profiles(notation='a:b:two')
+            assert summary['profiles'] == 1, summary
+            assert [r['notation'] for r in summary['notations']] == ['a:b:two']
+            assert summary['modules'][0] == {'module': 'json', 'runs': 1, 'avg_ms': 5.0, 'max_ms': 5.0}
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
 # =============================================================================
 # TESTS: log_work
 # =============================================================================
@@ -414,6 +598,703 @@ def test_list_recent_work_with_limit():
             del os.environ['PLAN_BASE_DIR']
 
 
+# =============================================================================
+# TESTS: work log index
+# =============================================================================
+
+def test_log_work_maintains_index():
+    """log_work keeps one index row per entry pointing at its header."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        plan_dir = plan_base / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            for i, phase in enumerate(['init', 'refine', 'init']):
+                result = module.log_work('test-plan', 'PROGRESS', f'Entry {i}', phase, detail=f'détail {i}')
+                assert result['total_entries'] == i + 1
+
+            log_file = plan_dir / 'work.log'
+            rows = module._load_index(log_file)
+            assert [(row[2], row[3]) for row in rows] == [('INFO', 'init'), ('INFO', 'refine'), ('INFO', 'init')]
+            data = log_file.read_bytes()
+            for offset, length, _level, _phase in rows:
+                assert data[offset:offset + 1] == b'[', f"Offset {offset} is not an entry start"
+            assert rows[-1][0] + rows[-1][1] == len(data), "Index should cover the whole log"
+            assert (plan_dir / 'work.log.idx').read_text().count('\n') == 3
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_index_queries_match_full_parse():
+    """Phase filter and recent-N via the index equal filtering a full parse."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        plan_dir = plan_base / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            for i in range(30):
+                module.log_work('test-plan', 'DECISION', f'Entry {i}', ['init', 'execute', 'finalize'][i % 3])
+            # Appended without going through log_work: indexed on the next read
+            module.log_entry('work', 'test-plan', 'WARN', 'external entry')
+
+            log_file = plan_dir / 'work.log'
+            parsed = module._parse_log_file(log_file)
+            filtered = module.read_work_log('test-plan', phase='execute')
+            assert filtered['entries'] == [e for e in parsed if e.get('phase') == 'execute']
+            assert filtered['total_entries'] == 10
+
+            recent = module.list_recent_work('test-plan', limit=4)
+            assert recent['total_entries'] == 31
+            assert recent['entries'] == parsed[-4:]
+            assert recent['entries'][-1]['message'] == 'external entry'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_index_rebuilt_when_stale():
+    """A corrupt index or a rewritten log triggers a full rebuild."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / 'work.log'
+        entries = [module.format_log_entry('INFO', f'[PROGRESS] Entry {i}', phase='init') for i in range(5)]
+        log_file.write_text(''.join(entries))
+        index_file = Path(tmp) / 'work.log.idx'
+
+        assert module._count_entries(log_file) == 5
+        index_file.write_text('not an index')
+        assert module._count_entries(log_file) == 5
+
+        # Log rewritten shorter than the indexed extent
+        log_file.write_text(''.join(entries[:2]))
+        assert module._count_entries(log_file) == 2
+        assert len(module._load_index(log_file)) == 2
+
+        # Log rewritten with unrelated content at the indexed end offset
+        log_file.write_text(''.join(entries[:2]) + 'junk line\n' + entries[2])
+        assert module._count_entries(log_file) == 3
+
+
+# =============================================================================
+# TESTS: tail reader
+# =============================================================================
+
+def test_read_log_tail_matches_full_parse():
+    """Tail of every length equals the end of a full parse, for any block size."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / 'script-execution.log'
+        entries = []
+        for i in range(40):
+            if i % 4 == 0:
+                entries.append(module.format_log_entry(
+                    'ERROR', f'test:skill:script run ({i}.00s)', exit_code=1,
+                    args='--plan-id x', stderr='[not a header] ' + 'x' * (i * 7)))
+            else:
+                entries.append(module.format_log_entry('INFO', f'test:skill:script run ({i}.00s)'))
+        log_file.write_text('preamble line\n' + ''.join(entries))
+        parsed = module._parse_log_file(log_file)
+
+        for block_size in (16, 100, 8192):
+            for count in (1, 3, 17, 40):
+                content = module.read_log_tail(log_file, count, block_size=block_size)
+                assert content == ''.join(entries[-count:]), f"count={count} block_size={block_size}"
+                assert module._parse_log_text(content) == parsed[-count:]
+
+        # More entries requested than present: whole file
+        assert module.read_log_tail(log_file, 100, block_size=64) == log_file.read_text()
+        assert module.read_log_tail(log_file, 0) == ''
+        assert module.read_log_tail(Path(tmp) / 'missing.log', 5) == ''
+
+
+def test_text_log_lines_starting_with_brace_are_not_entries():
+    """In a .log file a line starting with '{' belongs to the current entry; only .jsonl holds records."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = '[2025-01-01T00:00:00Z] [INFO] Dumped config\n{"key": "value",\n "other": 1}\n'
+        second = '[2025-01-01T00:00:01Z] [WARN] Next entry\n'
+        log_file = Path(tmp) / 'work.log'
+        log_file.write_text(first + second)
+
+        assert [e['message'] for e in module._parse_log_file(log_file)] == ['Dumped config', 'Next entry']
+        assert module._count_entries(log_file) == 2
+        assert module.read_log_tail(log_file, 1) == second
+        assert module.read_log_tail(log_file, 2) == first + second
+
+        jsonl_file = Path(tmp) / 'work.jsonl'
+        jsonl_file.write_text('{"level": "INFO", "message": "a"}\n{"level": "WARN", "message": "b"}\n')
+        assert module.read_log_tail(jsonl_file, 1) == '{"level": "WARN", "message": "b"}\n'
+        assert module._count_entries(jsonl_file) == 2
+
+
+def test_read_log_tail_reads_only_the_end():
+    """Tail of a large log reads a few blocks, not the whole file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / 'script-execution.log'
+        entry = module.format_log_entry('INFO', 'test:skill:script run (0.10s)')
+        log_file.write_text(entry * 50000)
+
+        reads = []
+        real_open = open
+
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, size=-1):
+                data = self._f.read(size)
+                reads.append(len(data))
+                return data
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+        module.open = lambda *args, **kwargs: CountingFile(real_open(*args, **kwargs))
+        try:
+            content = module.read_log_tail(log_file, 10)
+        finally:
+            del module.open
+
+        assert content == entry * 10
+        assert sum(reads) <= module.TAIL_BLOCK_SIZE, f"Read {sum(reads)} bytes of {log_file.stat().st_size}"
+
+
+def test_tail_log_work_and_script():
+    """tail_log returns parsed work entries and raw script entries."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        (plan_base / 'plans' / 'test-plan').mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            for i in range(5):
+                module.log_work('test-plan', 'PROGRESS', f'Step {i}', 'execute')
+                module.log_entry('script', 'test-plan', 'INFO', f'test:skill:script run{i} (0.10s)')
+
+            work = module.tail_log('test-plan', 'work', 2)
+            assert work['status'] == 'success'
+            assert work['showing'] == 2
+            assert [e['message'] for e in work['entries']] == ['Step 3', 'Step 4']
+            assert work['entries'][0]['phase'] == 'execute'
+
+            script = module.tail_log('test-plan', 'script', 3)
+            assert script['showing'] == 3
+            assert script['raw_content'].count('\n') == 2
+            assert 'run2' in script['raw_content'] and 'run4' in script['raw_content']
+
+            assert module.tail_log('Invalid_Plan', 'work', 2)['error'] == 'invalid_plan_id'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+# =============================================================================
+# TESTS: JSONL backend and query
+# =============================================================================
+
+def _write_mixed_script_logs(plan_base: Path) -> None:
+    """Script executions in a text global log and a plan log switched to JSONL midway."""
+    (plan_base / 'plans' / 'test-plan').mkdir(parents=True)
+    for i in range(4):
+        module.log_script_execution('a:b:fast', 'run', ['--plan-id', 'other-plan'], 0, 0.1 * (i + 1))
+        module.log_script_execution('a:b:slow', 'build', ['--plan-id', 'test-plan'], i % 2, 1.0 + i, stderr='failed')
+    os.environ['LOG_FORMAT'] = 'jsonl'
+    try:
+        for i in range(4):
+            module.log_script_execution('a:b:slow', 'build', ['--plan-id', 'test-plan'], 0, 5.0 + i, cached=i == 0)
+    finally:
+        del os.environ['LOG_FORMAT']
+
+
+def test_jsonl_backend_round_trip():
+    """LOG_FORMAT=jsonl writes JSON records that every reader understands."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        plan_dir = plan_base / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        os.environ['LOG_FORMAT'] = 'jsonl'
+        try:
+            for i in range(6):
+                result = module.log_work('test-plan', 'DECISION', f'Choice {i}, made', ['init', 'execute'][i % 2])
+                assert result['total_entries'] == i + 1
+            module.log_entry('work', 'test-plan', 'WARN', '[STATUS] (caller) done')
+            module.log_script_execution('a:b:c', 'run', ['--plan-id', 'test-plan'], 2, 0.5, stderr='oops')
+
+            log_file = plan_dir / 'work.jsonl'
+            assert not (plan_dir / 'work.log').exists()
+            records = [json.loads(line) for line in log_file.read_text().splitlines()]
+            assert records[0]['category'] == 'DECISION' and records[0]['message'] == 'Choice 0, made'
+            assert records[-1]['category'] == 'STATUS'
+
+            assert module.read_work_log('test-plan')['total_entries'] == 7
+            execute = module.read_work_log('test-plan', phase='execute')['entries']
+            assert [e['message'] for e in execute] == ['Choice 1, made', 'Choice 3, made', 'Choice 5, made']
+            assert module.list_recent_work('test-plan', limit=2)['entries'][0]['message'] == 'Choice 5, made'
+            assert module.tail_log('test-plan', 'work', 1)['entries'][0]['level'] == 'WARN'
+
+            script = json.loads((plan_dir / 'script-execution.jsonl').read_text())
+            assert script['exit_code'] == 2 and script['duration'] == 0.5
+            assert script['notation'] == 'a:b:c' and script['plan_id'] == 'test-plan'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+            del os.environ['LOG_FORMAT']
+
+
+def test_query_log_filters_and_aggregates():
+    """query_log filters and aggregates text and JSONL entries alike."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            _write_mixed_script_logs(plan_base)
+
+            result = module.query_log(group_by='notation', limit=3)
+            assert result['files'] == 2
+            assert result['count'] == 12 and result['errors'] == 2
+            assert result['max'] == 8.0 and result['p50'] == 2.0
+            groups = {row['notation']: row for row in result['groups']}
+            assert groups['a:b:fast']['count'] == 4 and groups['a:b:fast']['total'] == 1.0
+            assert groups['a:b:slow']['p95'] == 8.0
+            assert [e['duration'] for e in result['entries']] == [6.0, 7.0, 8.0]
+
+            assert module.query_log(plan_id='test-plan')['count'] == 8
+            assert module.query_log(plan_id='other-plan')['count'] == 0  # text INFO entries carry no args
+            assert module.query_log(level='ERROR', notation='a:b:slow')['count'] == 2
+            assert module.query_log(exit_code=1)['count'] == 2
+            assert module.query_log(min_duration=2.0, exit_code=0)['total'] == 29.0
+            assert module.query_log(since=time.time() + 3600)['count'] == 0
+            assert module.query_log(until=time.time() + 3600)['count'] == 12
+            assert module.query_log(group_by='nope')['error'] == 'invalid_group_by'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_convert_logs_to_jsonl():
+    """Converted logs hold the same entries plus structured script fields."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            _write_mixed_script_logs(plan_base)
+            module.log_work('test-plan', 'PROGRESS', 'Text entry', 'init', detail='a: b')
+            plan_dir = plan_base / 'plans' / 'test-plan'
+            work_before = module._parse_log_file(plan_dir / 'work.log')
+            query_before = module.query_log(group_by='notation')
+            assert query_before.pop('files') == 2
+
+            # The plan's text script log was converted by its first JSONL append
+            converted = {Path(item['file']).name: item['entries'] for item in module.convert_logs()}
+            assert converted == {
+                f'script-execution-{date.today()}.log': 4,
+                'work.log': 1,
+            }
+            assert not list(plan_base.rglob('*.log')) and not list(plan_base.rglob('*.idx'))
+
+            assert module._parse_log_file(plan_dir / 'work.jsonl') == work_before
+            query_after = module.query_log(group_by='notation')
+            assert query_after.pop('files') == 2
+            assert query_after == query_before
+
+            records = [json.loads(line) for line in (plan_dir / 'script-execution.jsonl').read_text().splitlines()]
+            assert [r['duration'] for r in records] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+            assert records[1]['exit_code'] == 1 and records[1]['plan_id'] == 'test-plan'
+            assert module.convert_logs() == []
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_jsonl_format_keeps_text_history():
+    """After switching to JSONL, text history is read until the first append converts it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        plan_dir = plan_base / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        try:
+            for i in range(3):
+                module.log_work('test-plan', 'PROGRESS', f'Text entry {i}', 'init')
+            module.log_script_execution('a:b:c', 'run', ['--plan-id', 'test-plan'], 0, 0.5)
+
+            os.environ['LOG_FORMAT'] = 'jsonl'
+            assert module.get_read_log_path('test-plan', 'work') == plan_dir / 'work.log'
+            assert module.read_work_log('test-plan')['total_entries'] == 3
+            assert module.list_recent_work('test-plan', limit=1)['entries'][0]['message'] == 'Text entry 2'
+            assert 'a:b:c run' in module.tail_log('test-plan', 'script', 5)['raw_content']
+            assert not (plan_dir / 'work.jsonl').exists(), "Reads must not convert"
+
+            module.log_work('test-plan', 'PROGRESS', 'JSONL entry', 'execute')
+            assert not (plan_dir / 'work.log').exists(), "First JSONL append converts the text log"
+            assert module.get_read_log_path('test-plan', 'work') == plan_dir / 'work.jsonl'
+            messages = [e['message'] for e in module.read_work_log('test-plan')['entries']]
+            assert messages == ['Text entry 0', 'Text entry 1', 'Text entry 2', 'JSONL entry'], messages
+            assert (plan_dir / 'script-execution.log').exists(), "Unwritten logs stay text"
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+            os.environ.pop('LOG_FORMAT', None)
+
+
+# =============================================================================
+# TESTS: log rotation
+# =============================================================================
+
+def _join_compression():
+    for thread in threading.enumerate():
+        if thread.name == 'log-compress':
+            thread.join(30)
+
+
+def _log_executions(plan_base: str, worker: int, count: int) -> None:
+    """Log script executions in a separate process (global log, rotating)."""
+    os.environ['PLAN_BASE_DIR'] = plan_base
+    for i in range(count):
+        module.log_script_execution('a:b:c', f'w{worker}-{i}', [], 0, 0.01)
+    _join_compression()
+
+
+def test_rotation_compresses_segments_and_reads_across():
+    """Rotated global logs are gzip segments read transparently with the active file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        os.environ['LOG_ROTATE_BYTES'] = '2000'
+        try:
+            for i in range(300):
+                module.log_script_execution('a:b:c', f'run{i}', ['--plan-id', 'gone'], i % 5 == 0, 0.01, stderr='x')
+            _join_compression()
+
+            log_file = module.get_log_path(None, 'script')
+            segments = module.log_segments(log_file)
+            assert len(segments) > 5
+            assert all(path.name.endswith('.log.gz') for path in segments[:-1]), segments
+            assert segments[-1] == log_file
+            assert module.list_global_logs('script') == [log_file]
+
+            entries = module._parse_log_file(log_file)
+            assert [e['message'].split()[1] for e in entries] == [f'run{i}' for i in range(300)]
+            tail = module.read_log_tail(log_file, 120, block_size=512)
+            assert module._parse_log_text(tail) == entries[-120:]
+            assert module.query_log(plan_id='gone')['count'] == 60  # Failed runs log their args
+
+            # Reading never rotates, even a log over the limit
+            os.environ['LOG_ROTATE_BYTES'] = '1'
+            assert module.get_log_path(None, 'script') == log_file
+            module.tail_log(None, 'script', 5)
+            module.read_log_tail(log_file, 5)
+            assert module.log_segments(log_file) == segments
+
+            # Rotation needs the active file to reach the limit
+            assert module.rotate_log(log_file, max_bytes=log_file.stat().st_size + 1) is None
+            assert module.rotate_log(log_file, max_bytes=1).name.endswith('.log')
+            _join_compression()
+            assert not log_file.exists()
+            assert module._parse_log_file(log_file) == entries
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+            del os.environ['LOG_ROTATE_BYTES']
+
+
+def test_compression_thread_does_not_delay_exit():
+    """The compressor runs as a daemon thread and cleanup removes its abandoned temp files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            log_file = module.get_log_path(None, 'script')
+            log_file.write_text('x' * 100)
+            release = threading.Event()
+            compress_segments = module.compress_segments
+            module.compress_segments = lambda path: release.wait(30) and compress_segments(path)
+            try:
+                segment = module.rotate_log(log_file, max_bytes=1)
+                threads = [t for t in threading.enumerate() if t.name == 'log-compress']
+                assert threads and all(t.daemon for t in threads), threads
+            finally:
+                release.set()
+                module.compress_segments = compress_segments
+            _join_compression()
+
+            stale = segment.with_name(segment.name + '.gz.123.456.tmp')
+            stale.write_bytes(b'partial')
+            os.utime(stale, (0, 0))
+            module.cleanup_old_script_logs()
+            assert not stale.exists()
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_rotation_with_concurrent_writers():
+    """Writers that lose the race against a rotation append to the new file."""
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['LOG_ROTATE_BYTES'] = '3000'
+        try:
+            context = multiprocessing.get_context('fork')
+            processes = [context.Process(target=_log_executions, args=(tmp, w, 150)) for w in range(4)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(60)
+                assert process.exitcode == 0, f"Writer process failed: {process.exitcode}"
+
+            os.environ['PLAN_BASE_DIR'] = tmp
+            log_file = module.list_global_logs('script')[0]
+            messages = [e['message'] for e in module._parse_log_file(log_file)]
+            assert len(messages) == 600 and len(set(messages)) == 600, f"Got {len(messages)} entries"
+            assert not list(Path(tmp).rglob('*.tmp'))
+        finally:
+            os.environ.pop('PLAN_BASE_DIR', None)
+            del os.environ['LOG_ROTATE_BYTES']
+
+
+def test_cleanup_handles_segments():
+    """Retention deletes old segments and compresses segments left plain."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            log_dir = Path(tmp) / 'logs'
+            log_dir.mkdir()
+            entry = module.format_log_entry('INFO', 'a:b:c run (0.10s)')
+            old = log_dir / 'script-execution-2020-01-01.1.log.gz'
+            with gzip.open(old, 'wt') as f:
+                f.write(entry)
+            old_time = time.time() - 30 * 86400
+            os.utime(old, (old_time, old_time))
+            plain = log_dir / f'script-execution-{date.today()}.1.log'
+            plain.write_text(entry * 2)
+            (log_dir / f'script-execution-{date.today()}.log').write_text(entry)
+
+            assert module.cleanup_old_script_logs(7) == 1
+            assert not old.exists() and not plain.exists()
+            assert (log_dir / f'script-execution-{date.today()}.1.log.gz').exists()
+            assert len(module._parse_log_file(module.get_log_path(None, 'script'))) == 3
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+# =============================================================================
+# TESTS: output blobs
+# =============================================================================
+
+def _age(path: Path, days: float) -> None:
+    old_time = time.time() - days * 86400
+    os.utime(path, (old_time, old_time))
+
+
+def test_store_output_deduplicates():
+    """Identical outputs are stored once, compressed, and readable by prefix."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            output = 'module: core, status: ok\n' * 2000
+            ref = module.store_output(output)
+            assert module.store_output(output) == ref
+            blobs = list(module.get_blob_dir().rglob('*.gz'))
+            assert blobs == [module.get_blob_dir() / ref[:2] / f'{ref}.gz']
+            assert blobs[0].stat().st_size < len(output) // 20
+
+            assert module.read_output(ref) == output
+            assert module.read_output(ref[:8].upper()) == output
+            for bad_ref in ('abc', 'not-a-hash-at-all'):
+                try:
+                    module.read_output(bad_ref)
+                    assert False, f"Expected ValueError for {bad_ref}"
+                except ValueError:
+                    pass
+            try:
+                module.read_output('0' * 64)
+                assert False, "Expected FileNotFoundError"
+            except FileNotFoundError:
+                pass
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_script_execution_references_output():
+    """Execution entries reference full outputs per LOG_OUTPUT_BLOBS."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        plan_dir = Path(tmp) / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+        args = ['--plan-id', 'test-plan']
+        long_stderr = 'Traceback line\n' * 500
+        try:
+            module.log_script_execution('a:b:c', 'run', args, 1, 0.5, stdout='partial', stderr=long_stderr)
+            module.log_script_execution('a:b:c', 'run', args, 0, 0.5, stdout='inventory')
+            entries = module._parse_log_file(plan_dir / 'script-execution.log')
+            assert len(entries[0]['stderr']) <= 500, "Inline output stays truncated"
+            assert module.read_output(entries[0]['stderr_ref']) == long_stderr
+            assert module.read_output(entries[0]['stdout_ref']) == 'partial'
+            assert 'stdout_ref' not in entries[1], "Successful output is not stored by default"
+
+            os.environ['LOG_OUTPUT_BLOBS'] = 'all'
+            os.environ['LOG_FORMAT'] = 'jsonl'
+            module.log_script_execution('a:b:c', 'run', args, 0, 0.5, stdout='inventory')
+            lines = (plan_dir / 'script-execution.jsonl').read_text().splitlines()
+            assert len(lines) == 3, "Text entries are converted by the first JSONL append"
+            record = json.loads(lines[-1])
+            assert module.read_output(record['stdout_ref']) == 'inventory'
+
+            os.environ['LOG_OUTPUT_BLOBS'] = 'off'
+            module.log_script_execution('a:b:c', 'run', args, 1, 0.5, stderr='fails')
+            record = json.loads((plan_dir / 'script-execution.jsonl').read_text().splitlines()[-1])
+            assert 'stderr_ref' not in record and record['stderr'] == 'fails'
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+            os.environ.pop('LOG_OUTPUT_BLOBS', None)
+            os.environ.pop('LOG_FORMAT', None)
+
+
+def test_gc_output_blobs():
+    """GC keeps referenced and recent blobs and drops the rest."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        archived_dir = Path(tmp) / 'archived-plans' / 'done-plan'
+        archived_dir.mkdir(parents=True)
+        try:
+            module.log_script_execution('a:b:c', 'run', [], 1, 0.1, stderr='global failure')
+            global_log = module.get_log_path(None, 'script')
+            archived_ref = module.store_output('archived failure')
+            (archived_dir / 'script-execution.jsonl').write_text(json.dumps({'stderr_ref': archived_ref}) + '\n')
+            orphan_ref = module.store_output('orphan')
+            recent_ref = module.store_output('recent orphan')
+            blobs = {path.name[:-3]: path for path in module.get_blob_dir().rglob('*.gz')}
+            for ref in (archived_ref, orphan_ref):
+                _age(blobs[ref], 1)
+            global_ref = module._parse_log_file(global_log)[0]['stderr_ref']
+            _age(blobs[global_ref], 1)
+
+            assert module.gc_output_blobs(dry_run=True)[0] == 1
+            assert blobs[orphan_ref].exists()
+            deleted, freed = module.gc_output_blobs()
+            assert deleted == 1 and freed > 0
+            assert not blobs[orphan_ref].exists()
+            assert all(blobs[ref].exists() for ref in (archived_ref, recent_ref, global_ref))
+
+            # Retention removes the log, then the blob it referenced
+            _age(global_log, 30)
+            module.cleanup_old_script_logs(7)
+            assert not blobs[global_ref].exists()
+            assert blobs[archived_ref].exists()
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+# =============================================================================
+# TESTS: LogWriter
+# =============================================================================
+
+def _append_entries(log_file: str, writer_id: int, count: int) -> None:
+    """Append large multi-line entries (run in a separate process)."""
+    for i in range(count):
+        lines = [f"[2025-01-01T00:00:00Z] [INFO] writer {writer_id} entry {i}"]
+        lines.extend(f"  line{n}: {str(writer_id) * 400}" for n in range(20))
+        module.write_log_entry(Path(log_file), '\n'.join(lines) + '\n')
+
+
+def test_log_writer_buffers_until_flush():
+    """Buffered entries are written in order on flush."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / 'logs' / 'script.log'
+        writer = module.LogWriter(max_bytes=1_000_000, max_delay=60)
+        try:
+            writer.write(log_file, 'first\n')
+            writer.write(log_file, 'second\n')
+            assert not log_file.exists(), "Entries should stay buffered"
+            writer.flush()
+            assert log_file.read_text() == 'first\nsecond\n'
+        finally:
+            writer.close()
+        writer.write(log_file, 'after close\n')
+        assert log_file.read_text().endswith('after close\n'), "Closed writer should append directly"
+
+
+def test_log_writer_flushes_on_size_and_time():
+    """Buffers flush when reaching max_bytes or after max_delay."""
+    with tempfile.TemporaryDirectory() as tmp:
+        size_file = Path(tmp) / 'size.log'
+        writer = module.LogWriter(max_bytes=20, max_delay=60)
+        try:
+            writer.write(size_file, 'x' * 10 + '\n')
+            assert not size_file.exists()
+            writer.write(size_file, 'y' * 10 + '\n')
+            assert size_file.read_text() == 'x' * 10 + '\n' + 'y' * 10 + '\n'
+        finally:
+            writer.close()
+
+        time_file = Path(tmp) / 'time.log'
+        writer = module.LogWriter(max_bytes=1_000_000, max_delay=0.05)
+        try:
+            writer.write(time_file, 'delayed\n')
+            deadline = time.time() + 5
+            while not time_file.exists() and time.time() < deadline:
+                time.sleep(0.02)
+            assert time_file.read_text() == 'delayed\n', "Timer should flush the entry"
+        finally:
+            writer.close()
+
+
+def test_buffered_logging_routes_log_calls():
+    """Log calls are buffered while active; work logs and readers stay consistent."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_base = Path(tmp)
+        plan_dir = plan_base / 'plans' / 'test-plan'
+        plan_dir.mkdir(parents=True)
+
+        os.environ['PLAN_BASE_DIR'] = str(plan_base)
+        module.start_buffered_logging(max_bytes=1_000_000, max_delay=60)
+        try:
+            for i in range(3):
+                module.log_script_execution(
+                    notation='test:skill:script', subcommand=f'cmd{i}',
+                    args=['--plan-id', 'test-plan'], exit_code=0, duration=0.1
+                )
+                module.record_script_stats('test:skill:script', f'cmd{i}', 0, 0.1)
+            script_log = plan_dir / 'script-execution.log'
+            assert not script_log.exists(), "Script entries should be buffered"
+
+            # Readers see buffered records
+            assert len(module.read_script_stats()) == 3
+
+            # Work log entries are synchronous and counted immediately
+            result = module.log_work('test-plan', 'PROGRESS', 'Synchronous', 'init')
+            assert result['total_entries'] == 1
+        finally:
+            module.stop_buffered_logging()
+            del os.environ['PLAN_BASE_DIR']
+
+        content = script_log.read_text()
+        assert [line.split('] ')[-1].split()[1] for line in content.splitlines()] == ['cmd0', 'cmd1', 'cmd2']
+
+
+def test_write_log_entry_concurrent_processes():
+    """Concurrent processes never interleave partial entries."""
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / 'shared.log'
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_append_entries, args=(str(log_file), w, 25)) for w in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0, f"Writer process failed: {process.exitcode}"
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 4 * 25 * 21, f"Expected {4 * 25 * 21} lines, got {len(lines)}"
+        for start in range(0, len(lines), 21):
+            writer_id = lines[start].split()[3]
+            assert lines[start].startswith('[2025-01-01T00:00:00Z]'), f"Entry split at line {start}"
+            for line in lines[start + 1:start + 21]:
+                assert line.endswith(writer_id * 400), f"Interleaved entry at line {start}"
+
+
 # =============================================================================
 # Test Runner
 # =============================================================================
@@ -441,6 +1322,17 @@ if __name__ == '__main__':
         # cleanup
         test_cleanup_deletes_old_logs,
         test_cleanup_preserves_recent_logs,
+        # script stats
+        test_record_script_stats_appends_records,
+        test_summarize_script_stats_percentiles_and_errors,
+        test_summarize_script_stats_since_filter,
+        test_parse_since_formats,
+        test_cleanup_compacts_script_stats,
+        test_compact_script_stats_with_concurrent_appends,
+        # import-time profiling
+        test_parse_import_time_splits_stderr,
+        test_log_import_profile_writes_entry,
+        test_summarize_import_profiles_filters_notation,
         # log_work
         test_log_work_default_category,
         test_log_work_all_categories,
@@ -451,5 +1343,33 @@ if __name__ == '__main__':
         test_read_work_log_filtered_by_phase,
         # list_recent_work
         test_list_recent_work_with_limit,
+        # work log index
+        test_log_work_maintains_index,
+        test_index_queries_match_full_parse,
+        test_index_rebuilt_when_stale,
+        # tail reader
+        test_read_log_tail_matches_full_parse,
+        test_text_log_lines_starting_with_brace_are_not_entries,
+        test_read_log_tail_reads_only_the_end,
+        test_tail_log_work_and_script,
+        # JSONL backend and query
+        test_jsonl_backend_round_trip,
+        test_query_log_filters_and_aggregates,
+        test_convert_logs_to_jsonl,
+        test_jsonl_format_keeps_text_history,
+        # log rotation
+        test_rotation_compresses_segments_and_reads_across,
+        test_compression_thread_does_not_delay_exit,
+        test_rotation_with_concurrent_writers,
+        test_cleanup_handles_segments,
+        # output blobs
+        test_store_output_deduplicates,
+        test_script_execution_references_output,
+        test_gc_output_blobs,
+        # LogWriter
+        test_log_writer_buffers_until_flush,
+        test_log_writer_flushes_on_size_and_time,
+        test_buffered_logging_routes_log_calls,
+        test_write_log_entry_concurrent_processes,
     ])
     sys.exit(runner.run())
@@ -195,6 +195,40 @@ def test_read_script_log():
         assert 'log_type: script' in result.stdout
 
 
+def test_read_tail():
+    """Test read subcommand with --tail returns the last entries of either log."""
+    with PlanTestContext(plan_id='log-read-tail') as ctx:
+        for i in range(1, 5):
+            run_script(SCRIPT_PATH, 'work', 'log-read-tail', 'INFO', f'Entry {i}')
+            run_script(SCRIPT_PATH, 'script', 'log-read-tail', 'INFO', f'test:skill:script run{i} (0.1s)')
+
+        result = run_script(SCRIPT_PATH, 'read', '--plan-id', 'log-read-tail', '--type', 'work', '--tail', '2')
+        assert result.success, f"Read failed: {result.stderr}"
+        assert 'showing: 2' in result.stdout
+        assert 'Entry 2' not in result.stdout
+        assert 'Entry 3' in result.stdout and 'Entry 4' in result.stdout
+
+        result = run_script(SCRIPT_PATH, 'read', '--plan-id', 'log-read-tail', '--type', 'script', '--tail=1')
+        assert result.success, f"Read failed: {result.stderr}"
+        assert 'log_type: script' in result.stdout
+        assert 'showing: 1' in result.stdout
+        assert 'run4' in result.stdout and 'run3' not in result.stdout
+
+
+def test_read_tail_global_script_log():
+    """Test read --type script --tail without --plan-id tails today's global script log."""
+    with PlanTestContext(plan_id='log-read-global'):
+        for i in range(1, 3):
+            # No plan directory for this id: entries go to the global log
+            run_script(SCRIPT_PATH, 'script', 'unknown-plan', 'INFO', f'test:skill:script global{i} (0.1s)')
+
+        result = run_script(SCRIPT_PATH, 'read', '--type', 'script', '--tail', '1')
+        assert result.success, f"Read failed: {result.stderr}"
+        assert 'showing: 1' in result.stdout
+        assert 'global2' in result.stdout and 'global1' not in result.stdout
+        assert 'plan_id' not in result.stdout
+
+
 def test_read_missing_plan_id():
     """Test read subcommand fails without --plan-id."""
     result = run_script(SCRIPT_PATH, 'read', '--type', 'work')
@@ -218,6 +252,105 @@ def test_read_invalid_type():
     assert 'invalid_type' in result.stderr
 
 
+# =============================================================================
+# Test: Query and Convert Subcommands
+# =============================================================================
+
+def test_query_aggregates_script_log():
+    """Test query filters script executions and groups them."""
+    with PlanTestContext(plan_id='log-query') as ctx:
+        for duration in ('0.10', '0.30', '2.50'):
+            run_script(SCRIPT_PATH, 'script', 'log-query', 'INFO', f'test:skill:script run ({duration}s)')
+        run_script(SCRIPT_PATH, 'script', 'log-query', 'ERROR', 'test:skill:other check (1.00s)')
+
+        result = run_script(SCRIPT_PATH, 'query', '--plan-id', 'log-query', '--group-by', 'notation')
+        assert result.success, f"query failed: {result.stderr}"
+        assert 'count: 4' in result.stdout, result.stdout
+        assert 'errors: 1' in result.stdout
+        assert 'groups[2]{notation,count,errors,total,p50,p95,p99,max}:' in result.stdout
+        assert '"test:skill:script",3,0,2.9,0.3,2.5,2.5,2.5' in result.stdout, result.stdout
+
+        result = run_script(SCRIPT_PATH, 'query', '--min-duration', '1', '--level', 'info', '--limit', '5')
+        assert result.success, f"query failed: {result.stderr}"
+        assert 'count: 1' in result.stdout, result.stdout
+        assert 'entries[1]{' in result.stdout and ',2.5,' in result.stdout
+
+
+def test_query_invalid_arguments():
+    """Test query rejects bad values with an error result."""
+    result = run_script(SCRIPT_PATH, 'query', '--since', 'yesterday')
+    assert not result.success
+    assert 'invalid_argument' in result.stderr
+
+    result = run_script(SCRIPT_PATH, 'query', '--group-by', 'color')
+    assert not result.success
+    assert 'invalid_group_by' in result.stderr
+
+
+def test_show_output():
+    """Test show-output prints a stored output by full or abbreviated reference."""
+    import plan_logging
+
+    with PlanTestContext(plan_id='log-show-output') as ctx:
+        output = 'line one\nline two, with details\n'
+        ref = plan_logging.store_output(output)
+
+        result = run_script(SCRIPT_PATH, 'show-output', ref[:10])
+        assert result.success, f"show-output failed: {result.stderr}"
+        assert result.stdout == output
+
+        result = run_script(SCRIPT_PATH, 'show-output', 'f' * 64)
+        assert not result.success
+        assert 'not_found' in result.stderr
+
+
+def test_convert_text_logs():
+    """Test convert rewrites text logs as JSONL."""
+    with PlanTestContext(plan_id='log-convert') as ctx:
+        run_script(SCRIPT_PATH, 'work', 'log-convert', 'INFO', '[ARTIFACT] Created file')
+
+        result = run_script(SCRIPT_PATH, 'convert', '--plan-id', 'log-convert')
+        assert result.success, f"convert failed: {result.stderr}"
+        assert 'files: 1' in result.stdout and 'entries: 1' in result.stdout
+
+        plan_dir = ctx.fixture_dir / 'plans' / 'log-convert'
+        assert not (plan_dir / 'work.log').exists()
+        assert '"category":"ARTIFACT"' in (plan_dir / 'work.jsonl').read_text()
+
+
+# =============================================================================
+# Test: Profile Summary Subcommand
+# =============================================================================
+
+def test_profile_summary_aggregates_runs():
+    """Test profile-summary aggregates [PROFILE] entries across runs."""
+    import plan_logging
+
+    with PlanTestContext(plan_id='log-profile') as ctx:
+        for total in (10000, 30000):
+            modules = [
+                {'module': 'json', 'self_us': 500, 'cumulative_us': total, 'depth': 0},
+                {'module': 'json.decoder', 'self_us': 200, 'cumulative_us': total // 2, 'depth': 1},
+            ]
+            plan_logging.log_import_profile('test:skill:script', 'run', ['--plan-id', 'log-profile'], modules)
+
+        result = run_script(SCRIPT_PATH, 'profile-summary', '--plan-id', 'log-profile')
+        assert result.success, f"profile-summary failed: {result.stderr}"
+        assert 'profiles: 2' in result.stdout, result.stdout
+        assert 'test:skill:script,2,20.0,30.0' in result.stdout, result.stdout
+        assert 'json,2,20.0,30.0' in result.stdout, result.stdout
+        assert 'json.decoder,2,10.0,15.0' in result.stdout, result.stdout
+
+
+def test_profile_summary_empty():
+    """Test profile-summary without profiles reports zero runs."""
+    with PlanTestContext(plan_id='log-profile-empty') as ctx:
+        result = run_script(SCRIPT_PATH, 'profile-summary', '--plan-id', 'log-profile-empty')
+        assert result.success, f"profile-summary failed: {result.stderr}"
+        assert 'profiles: 0' in result.stdout
+        assert 'modules[0]' in result.stdout
+
+
 # =============================================================================
 # Test Runner
 # =============================================================================
@@ -241,8 +374,18 @@ if __name__ == '__main__':
         test_read_work_log_with_limit,
         test_read_empty_log,
         test_read_script_log,
+        test_read_tail,
+        test_read_tail_global_script_log,
+        # Query and convert
+        test_query_aggregates_script_log,
+        test_query_invalid_arguments,
+        test_show_output,
+        test_convert_text_logs,
         test_read_missing_plan_id,
         test_read_missing_type,
         test_read_invalid_type,
+        # profile-summary subcommand
+        test_profile_summary_aggregates_runs,
+        test_profile_summary_empty,
     ])
     sys.exit(runner.run())
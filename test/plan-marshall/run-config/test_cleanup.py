@@ -78,6 +78,8 @@ def test_clean_logs():
         # Create log files - one old, one recent
         old_log = logs_dir / 'old.log'
         old_log.write_text('old log content')
+        old_index = logs_dir / 'old.log.idx'
+        old_index.write_text('0\t15\tINFO\tinit\n')
         # Make it old (2 days ago)
         old_time = time.time() - (2 * 86400)
         os.utime(old_log, (old_time, old_time))
@@ -92,9 +94,59 @@ def test_clean_logs():
 
         # Verify old log deleted, recent kept
         assert not old_log.exists(), "Old log should be deleted"
+        assert not old_index.exists(), "Index of old log should be deleted"
         assert recent_log.exists(), "Recent log should be kept"
 
 
+def test_clean_logs_jsonl():
+    """Clean old daily JSONL logs and rotated segments but never the script stats sidecar."""
+    with PlanTestContext(plan_id='test-clean-logs-jsonl') as ctx:
+        setup_marshal_json(ctx.fixture_dir)
+
+        logs_dir = ctx.fixture_dir / 'logs'
+        logs_dir.mkdir(parents=True, exist_ok=True)
+
+        old_time = time.time() - (2 * 86400)
+        old_log = logs_dir / 'script-execution-2020-01-01.jsonl'
+        old_segment = logs_dir / 'script-execution-2020-01-01.1.log.gz'
+        stats = logs_dir / 'script-stats.jsonl'
+        for path in (old_log, old_segment, stats):
+            path.write_text('{"level":"INFO"}\n')
+            os.utime(path, (old_time, old_time))
+
+        result = run_script(SCRIPT_PATH, 'clean', '--target', 'logs')
+        assert result.success, f"Script failed: {result.stderr}"
+        assert 'logs_deleted: 2' in result.stdout
+
+        assert not old_log.exists(), "Old JSONL log should be deleted"
+        assert not old_segment.exists(), "Old rotated segment should be deleted"
+        assert stats.exists(), "Stats sidecar is compacted by plan_logging, not deleted"
+
+
+def test_clean_logs_output_blobs():
+    """Clean output blobs that no remaining log references."""
+    with PlanTestContext(plan_id='test-clean-logs-blobs') as ctx:
+        setup_marshal_json(ctx.fixture_dir)
+
+        blobs_dir = ctx.fixture_dir / 'logs' / 'blobs'
+        old_time = time.time() - (2 * 86400)
+        referenced = blobs_dir / 'aa' / ('aa' + '1' * 62 + '.gz')
+        orphan = blobs_dir / 'bb' / ('bb' + '2' * 62 + '.gz')
+        for blob in (referenced, orphan):
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            blob.write_bytes(b'output')
+            os.utime(blob, (old_time, old_time))
+        recent_log = blobs_dir.parent / 'script-execution-2099-01-01.log'
+        recent_log.write_text(f'[2099-01-01T00:00:00Z] [ERROR] [abc] a:b:c (0.10s)\n  stderr_ref: {referenced.name[:-3]}\n')
+
+        result = run_script(SCRIPT_PATH, 'clean', '--target', 'logs')
+        assert result.success, f"Script failed: {result.stderr}"
+        assert 'logs_deleted: 1' in result.stdout
+
+        assert referenced.exists(), "Referenced blob should be kept"
+        assert not orphan.exists(), "Unreferenced blob should be deleted"
+
+
 def test_clean_archived_plans():
     """Clean old archived plans."""
     with PlanTestContext(plan_id='test-clean-archived') as ctx:
@@ -274,6 +326,8 @@ if __name__ == '__main__':
     runner.add_tests([
         test_clean_temp,
         test_clean_logs,
+        test_clean_logs_jsonl,
+        test_clean_logs_output_blobs,
         test_clean_archived_plans,
         test_clean_memory,
         test_clean_all,
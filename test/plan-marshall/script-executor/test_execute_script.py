@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit tests for execute-script.py executor (template)."""
 
+import os
 import subprocess
 import sys
 import tempfile
@@ -17,22 +18,48 @@ SCRIPTS_DIR = SKILL_DIR / "scripts"
 LOGGING_DIR = Path(__file__).parent.parent.parent.parent / "marketplace/bundles/plan-marshall/skills/logging/scripts"
 
 
-def load_executor_module():
+TEST_MAPPINGS = {
+    "pm-workflow:manage-files": "/test/path/manage-files.py",
+    "pm-dev-builder:builder-maven-rules": "/test/path/maven.py",
+    "test:skill": "/test/path/test-skill.py",
+}
+
+
+def load_generator_module():
+    """Load generate-executor.py (provides the index builders)."""
+    import types
+    module = types.ModuleType('generate_executor')
+    module.__dict__['__file__'] = str(SCRIPTS_DIR / "generate-executor.py")
+    exec((SCRIPTS_DIR / "generate-executor.py").read_text(), module.__dict__)
+    return module
+
+
+TEST_CACHE_POLICIES = {
+    'pm-workflow:manage-files': {
+        'read': {'reads': ['{plan_dir}/plans/{--plan-id}/*.md'], 'max_age': 60},
+        'list': {'reads': ['{--root}/files/*'], 'defaults': {'--root': '.'}, 'bypass': ['--no-cache']},
+    },
+    'plan-marshall:scan': {'*': {'reads': ['bundles/**']}},
+}
+
+
+def load_executor_module(mappings: dict | None = None):
     """Load the execute-script module from template for testing."""
+    mappings = TEST_MAPPINGS if mappings is None else mappings
     template_path = TEMPLATE_DIR / "execute-script.py.template"
     with open(template_path) as f:
         code = f.read()
 
     # Replace the placeholders with test values
-    code = code.replace(
-        '{{SCRIPT_MAPPINGS}}',
-        '''
-    "pm-workflow:manage-files": "/test/path/manage-files.py",
-    "pm-dev-builder:builder-maven-rules": "/test/path/maven.py",
-    "test:skill": "/test/path/test-skill.py",
-'''
-    )
+    generator = load_generator_module()
+    prefix_index, trigram_index = generator.generate_index_code(mappings)
+    code = code.replace('{{SCRIPT_MAPPINGS}}', generator.generate_mappings_code(mappings))
     code = code.replace('{{LOGGING_DIR}}', str(LOGGING_DIR))
+    code = code.replace('{{IN_PROCESS_SCRIPTS}}', "    'pm-workflow:manage-files',")
+    code = code.replace('{{NOTATION_PREFIXES}}', prefix_index)
+    code = code.replace('{{NOTATION_TRIGRAMS}}', trigram_index)
+    code = code.replace('{{CACHE_POLICIES}}', repr(TEST_CACHE_POLICIES))
+    code = code.replace('{{CACHE_SOURCES}}', repr({notation: [] for notation in TEST_CACHE_POLICIES}))
 
     # Add logging dir to path so plan_logging can be imported
     sys.path.insert(0, str(LOGGING_DIR))
@@ -81,6 +108,67 @@ def test_resolve_all_mappings():
     assert 'test:skill' in executor.SCRIPTS
 
 
+AMBIGUOUS_MAPPINGS = {
+    "pm-workflow:manage-tasks:manage-tasks": "/test/path/manage-tasks.py",
+    "pm-workflow:manage-tasks-extra:helper": "/test/path/helper.py",
+    "pm-workflow:manage-files:manage-files": "/test/path/manage-files.py",
+    "plan-marshall:logging:manage-log": "/test/path/manage-log.py",
+    "plan-marshall:toon-usage:toon_parser": "/test/path/toon_parser.py",
+}
+
+
+def test_resolve_whole_segment_beats_longer_segment():
+    """A whole-segment match wins over a segment that only starts with the fragment."""
+    executor = load_executor_module(AMBIGUOUS_MAPPINGS)
+    assert executor.resolve_notation('manage-tasks') == '/test/path/manage-tasks.py'
+    assert executor.resolve_notation('pm-workflow:manage-tasks') == '/test/path/manage-tasks.py'
+
+
+def test_resolve_ambiguous_is_deterministic():
+    """Ambiguous fragments resolve to the lexicographically first best-ranked notation."""
+    executor = load_executor_module(AMBIGUOUS_MAPPINGS)
+    # Leading segment matches three notations equally - lexicographic order decides
+    assert executor.resolve_notation('pm-workflow') == '/test/path/manage-files.py'
+    # Prefix match beats substring match in an earlier notation
+    assert executor.resolve_notation('plan-mar') == '/test/path/manage-log.py'
+    assert executor.find_notation_matches('manage') == [
+        'plan-marshall:logging:manage-log',
+        'pm-workflow:manage-files:manage-files',
+        'pm-workflow:manage-tasks-extra:helper',
+        'pm-workflow:manage-tasks:manage-tasks',
+    ]
+
+
+def test_resolve_arbitrary_substring():
+    """Fragments not aligned to segments resolve via the trigram index."""
+    executor = load_executor_module(AMBIGUOUS_MAPPINGS)
+    assert executor.resolve_notation('n_pars') == '/test/path/toon_parser.py'
+    assert executor.resolve_notation('ging:man') == '/test/path/manage-log.py'
+    assert executor.resolve_notation('zzz') is None
+
+
+def test_suggestions_ranked_by_similarity():
+    """Unknown notations get similarity-ranked "did you mean" suggestions."""
+    executor = load_executor_module(AMBIGUOUS_MAPPINGS)
+    suggestions = executor.suggest_notations('pm-workflow:manage-task')
+    assert suggestions[:2] == [
+        'pm-workflow:manage-tasks-extra:helper',
+        'pm-workflow:manage-tasks:manage-tasks',
+    ], f"Unexpected ranking: {suggestions}"
+
+    suggestions = executor.suggest_notations('plan-marshal:loging:manage-log')
+    assert suggestions[0] == 'plan-marshall:logging:manage-log', f"Unexpected ranking: {suggestions}"
+    assert len(suggestions) <= executor.MAX_SUGGESTIONS
+
+
+def test_subcommand_used_as_script_name():
+    """A subcommand in the script position is detected via the prefix index."""
+    executor = load_executor_module(AMBIGUOUS_MAPPINGS)
+    error_msg, _ = executor.build_notation_error('pm-workflow:manage-files:add')
+    assert 'appears to be a subcommand' in error_msg, error_msg
+    assert 'pm-workflow:manage-files:manage-files add' in error_msg, error_msg
+
+
 # =============================================================================
 # TESTS: extract_trace_plan_id
 # =============================================================================
@@ -235,6 +323,366 @@ def test_log_normal_scripts_failure():
     assert result is False, "Should log normal script calls on failure"
 
 
+# =============================================================================
+# TESTS: In-process execution (used by the warm worker)
+# =============================================================================
+
+def test_in_process_captures_output_and_argv():
+    """In-process run captures stdout and passes arguments as sys.argv."""
+    executor = load_executor_module()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('''import sys
+import json
+print(json.dumps(sys.argv[1:]))
+print("warn", file=sys.stderr)
+''')
+
+        exit_code, stdout, stderr = executor.run_script_in_process(str(test_script), ['verb', '--flag'])
+
+        assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
+        assert stdout.strip() == '["verb", "--flag"]', f"Unexpected stdout: {stdout}"
+        assert stderr.strip() == 'warn', f"Unexpected stderr: {stderr}"
+
+
+def test_in_process_maps_system_exit():
+    """sys.exit(main()) in a script maps to the exit code without ending the caller."""
+    executor = load_executor_module()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('''import sys
+
+def main():
+    print("Error occurred", file=sys.stderr)
+    return 42
+
+if __name__ == '__main__':
+    sys.exit(main())
+''')
+
+        exit_code, _, stderr = executor.run_script_in_process(str(test_script), [])
+
+        assert exit_code == 42, f"Expected exit code 42, got {exit_code}"
+        assert 'Error occurred' in stderr
+
+
+def test_in_process_uncaught_exception_is_exit_1():
+    """Uncaught exceptions print a traceback and map to exit code 1."""
+    executor = load_executor_module()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('raise ValueError("boom")\n')
+
+        exit_code, _, stderr = executor.run_script_in_process(str(test_script), [])
+
+        assert exit_code == 1, f"Expected exit code 1, got {exit_code}"
+        assert 'ValueError: boom' in stderr, f"Missing traceback: {stderr}"
+
+
+def test_in_process_restores_interpreter_state():
+    """argv, stdio and sys.path are restored after an in-process run."""
+    executor = load_executor_module()
+    argv_before = list(sys.argv)
+    path_before = list(sys.path)
+    stdout_before = sys.stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('import sys\nsys.exit(3)\n')
+
+        executor.run_script_in_process(str(test_script), ['a'], stdin_text='')
+
+    assert sys.argv == argv_before, "sys.argv not restored"
+    assert sys.path == path_before, "sys.path not restored"
+    assert sys.stdout is stdout_before, "sys.stdout not restored"
+
+
+def test_in_process_env_restored_between_runs():
+    """In-process runs see the script env; the executor's os.environ is restored afterwards."""
+    executor = load_executor_module()
+    executor.should_run_in_process = lambda script_path: True
+    pythonpath_before = os.environ.get('PYTHONPATH')
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('import os\nos.environ["LEAKED"] = "1"\nprint(os.environ["PYTHONPATH"])\n')
+        try:
+            outputs = [executor._run_script_captured(str(test_script), [], executor.build_script_env(), '')[1]
+                       for _ in range(3)]
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+    assert outputs[0] == outputs[2], f"PYTHONPATH grew between runs: {outputs}"
+    assert outputs[0].startswith(executor._PYTHONPATH), outputs[0]
+    assert os.environ.get('PYTHONPATH') == pythonpath_before, "PYTHONPATH of the executor changed"
+    assert 'LEAKED' not in os.environ, "Script env leaked into the executor"
+
+
+def test_pycache_prefix_scoped_to_script_interpreter():
+    """The pycache prefix reaches the script's interpreter but not its environment."""
+    executor = load_executor_module()
+    with tempfile.TemporaryDirectory() as tmp:
+        executor._PYCACHE_OPTIONS = ['-X', f'pycache_prefix={tmp}']
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text(
+            'import os, sys\n'
+            'print(sys.pycache_prefix)\n'
+            'print(os.environ.get("PYTHONPYCACHEPREFIX"))\n'
+        )
+        env = executor.build_script_env()
+        env.pop('PYTHONPYCACHEPREFIX', None)
+        code, stdout, _ = executor.run_script_subprocess(str(test_script), [], env, stdin_text='')
+
+    assert code == 0
+    prefix, exported = stdout.splitlines()
+    assert prefix == tmp, f"Expected prefix {tmp}, got {prefix}"
+    assert exported == 'None', f"Prefix leaked into the environment: {exported}"
+
+
+def test_exit_code_from_system_exit():
+    """SystemExit payloads map like the interpreter maps them."""
+    executor = load_executor_module()
+    assert executor.exit_code_from_system_exit(SystemExit()) == 0
+    assert executor.exit_code_from_system_exit(SystemExit(5)) == 5
+    assert executor.exit_code_from_system_exit(SystemExit('fatal')) == 1
+
+
+def test_output_tail_keeps_last_bytes():
+    """OutputTail keeps only the configured number of trailing bytes."""
+    executor = load_executor_module()
+    tail = executor.OutputTail(10)
+    for i in range(1000):
+        tail.append(f"line-{i}\n".encode())
+
+    assert len(tail.data) == 10, f"Expected 10 bytes, got {len(tail.data)}"
+    assert tail.truncated is True
+    assert tail.text() == '...\nline-999\n', f"Unexpected tail: {tail.text()!r}"
+
+
+def test_output_tail_untruncated():
+    """Short output is kept completely without truncation marker."""
+    executor = load_executor_module()
+    tail = executor.OutputTail(100)
+    tail.append(b'short')
+
+    assert tail.truncated is False
+    assert tail.text() == 'short'
+
+
+def test_streaming_forwards_all_output_and_keeps_tail():
+    """Streaming forwards every chunk to the console and returns bounded tails."""
+    import contextlib
+    import io
+    import os
+    executor = load_executor_module()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_script = Path(tmp) / 'test-script.py'
+        test_script.write_text('''import sys
+for i in range(20000):
+    print(f"out-{i}")
+print("boom", file=sys.stderr)
+sys.exit(3)
+''')
+
+        console_out = io.StringIO()
+        console_err = io.StringIO()
+        with contextlib.redirect_stdout(console_out), contextlib.redirect_stderr(console_err):
+            exit_code, stdout_tail, stderr_tail = executor.run_script_streaming(
+                str(test_script), [], dict(os.environ), max_output=50
+            )
+
+        assert exit_code == 3, f"Expected exit code 3, got {exit_code}"
+        assert console_out.getvalue().count('\n') == 20000, "Console did not receive all output"
+        assert console_err.getvalue() == 'boom\n'
+        assert len(stdout_tail) <= 53, f"Tail not bounded: {len(stdout_tail)}"
+        assert stdout_tail.endswith('out-19999\n'), f"Unexpected tail: {stdout_tail!r}"
+        assert stderr_tail == 'boom\n'
+
+
+def test_should_run_in_process_whitelist():
+    """Only notations recorded as in-process safe run in the executor's interpreter."""
+    executor = load_executor_module()
+    assert executor.should_run_in_process('/test/path/manage-files.py') is True
+    assert executor.should_run_in_process('/test/path/maven.py') is False
+
+
+def test_should_run_in_process_disabled_by_env():
+    """EXECUTOR_IN_PROCESS=0 forces subprocess execution."""
+    executor = load_executor_module()
+    import os
+    os.environ['EXECUTOR_IN_PROCESS'] = '0'
+    try:
+        assert executor.should_run_in_process('/test/path/manage-files.py') is False
+    finally:
+        del os.environ['EXECUTOR_IN_PROCESS']
+
+
+def test_worker_call_without_socket_returns_none():
+    """Without a running worker the client reports unavailability (subprocess fallback)."""
+    executor = load_executor_module()
+    import os
+    original = os.environ.get('PLAN_BASE_DIR')
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            assert executor.worker_call({'command': 'ping'}) is None
+        finally:
+            if original is None:
+                del os.environ['PLAN_BASE_DIR']
+            else:
+                os.environ['PLAN_BASE_DIR'] = original
+
+
+# =============================================================================
+# TESTS: Result cache
+# =============================================================================
+
+def test_find_cache_policy_by_subcommand():
+    """Rules are selected by declared subcommand, '*' or not at all."""
+    executor = load_executor_module()
+
+    assert executor.find_cache_policy('pm-workflow:manage-files', ['read', '--plan-id', 'p'])['max_age'] == 60
+    assert executor.find_cache_policy('pm-workflow:manage-files', ['add', '--plan-id', 'p']) is None
+    assert executor.find_cache_policy('pm-workflow:manage-files', ['list', '--no-cache']) is None
+    assert executor.find_cache_policy('plan-marshall:scan', ['--scope', 'auto']) is not None
+    assert executor.find_cache_policy('pm-dev-java:maven', ['run']) is None
+
+
+def test_expand_read_patterns_placeholders():
+    """Option placeholders use call values, then defaults; missing values disable caching."""
+    executor = load_executor_module()
+    read_rule = executor.CACHE_POLICIES['pm-workflow:manage-files']['read']
+    list_rule = executor.CACHE_POLICIES['pm-workflow:manage-files']['list']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            assert executor.expand_read_patterns(read_rule, ['read', '--plan-id=my-plan']) == [f'{tmp}/plans/my-plan/*.md']
+            assert executor.expand_read_patterns(read_rule, ['read']) is None
+            assert executor.expand_read_patterns(list_rule, ['list']) == ['./files/*']
+            assert executor.expand_read_patterns(list_rule, ['list', '--root', '/r']) == ['/r/files/*']
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_cache_key_tracks_declared_reads():
+    """The cache key changes when a declared input file changes, and only then."""
+    executor = load_executor_module()
+    rule = executor.CACHE_POLICIES['pm-workflow:manage-files']['read']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            plan_dir = Path(tmp) / 'plans' / 'p'
+            plan_dir.mkdir(parents=True)
+            (plan_dir / 'a.md').write_text('one')
+            script = str(Path(tmp) / 'script.py')
+            args = ['read', '--plan-id', 'p']
+
+            first = executor.compute_cache_key('pm-workflow:manage-files', script, args, rule)
+            assert first == executor.compute_cache_key('pm-workflow:manage-files', script, args, rule)
+            assert first != executor.compute_cache_key('pm-workflow:manage-files', script, args + ['--x'], rule)
+
+            (plan_dir / 'a.md').write_text('one plus')
+            assert first != executor.compute_cache_key('pm-workflow:manage-files', script, args, rule)
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_cache_key_tracks_imported_modules():
+    """Editing a marketplace module the script imports from another directory misses the cache."""
+    executor = load_executor_module()
+    rule = {'reads': ['{--root}/*']}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / 'manage-files' / 'manage-files.py'
+        module = Path(tmp) / 'toon-usage' / 'toon_parser.py'
+        for path in (script, module):
+            path.parent.mkdir()
+            path.write_text('# v1\n')
+        executor.CACHE_SOURCES['pm-workflow:manage-files'] = [str(module)]
+        args = ['list', '--root', tmp]
+
+        first = executor.compute_cache_key('pm-workflow:manage-files', str(script), args, rule)
+        module.write_text('# v2, edited\n')
+
+        assert first != executor.compute_cache_key('pm-workflow:manage-files', str(script), args, rule)
+
+
+def test_cache_store_lookup_and_max_age():
+    """Stored results are replayed until older than the rule's max_age."""
+    executor = load_executor_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            executor.cache_store('k1', 'a:b', ['list'], 'out\n', '')
+
+            entry = executor.cache_lookup('k1', max_age=60)
+            assert entry and entry['stdout'] == 'out\n', entry
+            assert executor.cache_lookup('k1', max_age=-1) is None, "Expired entry replayed"
+            assert not (executor.get_cache_dir() / 'k1.json').exists(), "Expired entry not removed"
+            assert executor.cache_lookup('missing', max_age=60) is None
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+def test_evict_cache_removes_least_recently_used():
+    """Eviction removes the least recently used entries until the size limit holds."""
+    import time
+    executor = load_executor_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PLAN_BASE_DIR'] = tmp
+        try:
+            for index, key in enumerate(('old', 'mid', 'new')):
+                executor.cache_store(key, 'a:b', [], 'x' * 1000, '')
+                os.utime(executor.get_cache_dir() / f'{key}.json', (time.time() - 100 + index, time.time() - 100 + index))
+            executor.cache_lookup('old', max_age=3600)  # touch: now most recently used
+
+            removed = executor.evict_cache(max_bytes=2500, max_age=3600)
+
+            remaining = sorted(p.stem for p in executor.get_cache_dir().glob('*.json'))
+            assert removed == 1 and remaining == ['new', 'old'], remaining
+        finally:
+            del os.environ['PLAN_BASE_DIR']
+
+
+
+# =============================================================================
+
+def test_format_stats_toon_orders_tables():
+    """Slowest table is ordered by p95, most_frequent by call count."""
+    executor = load_executor_module()
+
+    def row(notation, count, p95):
+        return {'notation': notation, 'subcommand': 'run', 'count': count, 'errors': 0, 'error_rate': 0.0,
+                'p50': p95 / 2, 'p95': p95, 'p99': p95, 'max': p95, 'total': count * p95}
+
+    summary = [row('a:b:fast', 50, 0.1), row('a:b:slow', 2, 3.0), row('a:b:mid', 10, 1.0)]
+    output = executor.format_stats_toon(summary, '7d', limit=2)
+
+    slowest = output.split('slowest[2]')[1].split('\n\n')[0]
+    frequent = output.split('most_frequent[2]')[1]
+    assert slowest.index('a:b:slow') < slowest.index('a:b:mid') and 'a:b:fast' not in slowest, output
+    assert frequent.index('a:b:fast') < frequent.index('a:b:mid') and 'a:b:slow' not in frequent, output
+    assert 'since: 7d' in output and 'calls: 62' in output, output
+
+
+def test_format_import_profile_sorts_by_cumulative():
+    """Console profile lists the most expensive imports first with a top-level total."""
+    executor = load_executor_module()
+    modules = [
+        {'module': 'json', 'self_us': 1200, 'cumulative_us': 5000, 'depth': 0},
+        {'module': 'json.decoder', 'self_us': 800, 'cumulative_us': 3000, 'depth': 1},
+        {'module': 're', 'self_us': 9000, 'cumulative_us': 9000, 'depth': 0},
+    ]
+
+    output = executor.format_import_profile(modules, limit=2)
+
+    assert output.startswith('import_total_ms: 14.0\n'), output
+    assert 'import_profile[2]{module,self_ms,cumulative_ms}:\n  re,9.0,9.0\n  json,1.2,5.0\n' in output, output
+
+
 # =============================================================================
 # TESTS: generate-executor.py script
 # =============================================================================
@@ -276,6 +724,11 @@ if __name__ == '__main__':
         test_resolve_partial_match,
         test_resolve_unknown_notation,
         test_resolve_all_mappings,
+        test_resolve_whole_segment_beats_longer_segment,
+        test_resolve_ambiguous_is_deterministic,
+        test_resolve_arbitrary_substring,
+        test_suggestions_ranked_by_similarity,
+        test_subcommand_used_as_script_name,
         test_extract_trace_plan_id_space_separated,
         test_extract_trace_plan_id_equals_format,
         test_extract_trace_plan_id_not_present,
@@ -288,6 +741,29 @@ if __name__ == '__main__':
         test_successful_script_execution,
         test_failed_script_returns_exit_code,
         test_argument_forwarding,
+        test_in_process_captures_output_and_argv,
+        test_in_process_maps_system_exit,
+        test_in_process_uncaught_exception_is_exit_1,
+        test_in_process_restores_interpreter_state,
+        test_in_process_env_restored_between_runs,
+        test_pycache_prefix_scoped_to_script_interpreter,
+        test_exit_code_from_system_exit,
+        test_output_tail_keeps_last_bytes,
+        test_output_tail_untruncated,
+        test_streaming_forwards_all_output_and_keeps_tail,
+        test_should_run_in_process_whitelist,
+        test_should_run_in_process_disabled_by_env,
+        test_worker_call_without_socket_returns_none,
+        # Result cache
+        test_find_cache_policy_by_subcommand,
+        test_expand_read_patterns_placeholders,
+        test_cache_key_tracks_declared_reads,
+        test_cache_key_tracks_imported_modules,
+        test_cache_store_lookup_and_max_age,
+        test_evict_cache_removes_least_recently_used,
+        # Stats report
+        test_format_stats_toon_orders_tables,
+        test_format_import_profile_sorts_by_cumulative,
         test_generate_script_help,
         test_verify_script_help,
     ])
@@ -98,6 +98,26 @@ class ExecutorTestEnvironment:
             '{{LOGGING_DIR}}',
             str(LOGGING_DIR)  # Real marketplace location for plan_logging module
         )
+        generator = self._load_generator()
+        prefix_index, trigram_index = generator.generate_index_code(mappings)
+        executor_content = executor_content.replace('{{NOTATION_PREFIXES}}', prefix_index)
+        executor_content = executor_content.replace('{{NOTATION_TRIGRAMS}}', trigram_index)
+        # Cache policies as declared by the real scripts
+        cache_policies = generator.find_cache_policies(mappings)
+        executor_content = executor_content.replace(
+            '{{CACHE_POLICIES}}',
+            generator.generate_cache_policy_code(cache_policies)
+        )
+        executor_content = executor_content.replace(
+            '{{CACHE_SOURCES}}',
+            generator.generate_cache_sources_code(generator.find_cache_sources(mappings, cache_policies))
+        )
+        # In-process set as decided by the real generator's import check
+        self.in_process_scripts = generator.find_in_process_scripts(mappings)
+        executor_content = executor_content.replace(
+            '{{IN_PROCESS_SCRIPTS}}',
+            generator.generate_in_process_code(self.in_process_scripts)
+        )
 
         self.executor_path = self.plan_dir / 'execute-script.py'
         self.executor_path.write_text(executor_content)
@@ -114,6 +134,10 @@ class ExecutorTestEnvironment:
             ('pm-workflow', 'manage-config', 'manage-config.py'),
             ('pm-workflow', 'manage-lifecycle', 'manage-lifecycle.py'),
             ('plan-marshall', 'toon-usage', 'toon_parser.py'),
+            # Shared modules imported by the manage-* scripts
+            ('plan-marshall', 'file-operations-base', 'file_ops.py'),
+            ('plan-marshall', 'logging', 'plan_logging.py'),
+            ('plan-marshall', 'plan-marshall-config', '_config_core.py'),
         ]
 
         for bundle, skill, script in test_scripts:
@@ -127,6 +151,15 @@ class ExecutorTestEnvironment:
 
         return mappings
 
+    def _load_generator(self):
+        """Load the real generator (index and cache policy code)."""
+        import types
+        generator_path = SCRIPTS_DIR / 'generate-executor.py'
+        generator = types.ModuleType('generate_executor')
+        generator.__dict__['__file__'] = str(generator_path)
+        exec(generator_path.read_text(), generator.__dict__)
+        return generator
+
     def _format_mappings(self, mappings: dict) -> str:
         """Format mappings as Python dict entries."""
         lines = []
@@ -157,6 +190,36 @@ class ExecutorTestEnvironment:
             [sys.executable, str(self.executor_path)] + list(args),
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
+            cwd=self.temp_dir,
+            timeout=timeout,
+            env=env
+        )
+
+    def run_executor_input(self, input_text: str, *args, timeout: int = 60) -> subprocess.CompletedProcess:
+        """Run the generated executor feeding input_text on stdin."""
+        env = os.environ.copy()
+        env['PLAN_BASE_DIR'] = str(self.plan_dir)
+        return subprocess.run(
+            [sys.executable, str(self.executor_path)] + list(args),
+            input=input_text,
+            capture_output=True,
+            text=True,
+            cwd=self.temp_dir,
+            timeout=timeout,
+            env=env
+        )
+
+    def run_executor_with_env(self, extra_env: dict, *args, timeout: int = 30) -> subprocess.CompletedProcess:
+        """Run the generated executor with additional environment variables."""
+        env = os.environ.copy()
+        env['PLAN_BASE_DIR'] = str(self.plan_dir)
+        env.update(extra_env)
+        return subprocess.run(
+            [sys.executable, str(self.executor_path)] + list(args),
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
             cwd=self.temp_dir,
             timeout=timeout,
             env=env
@@ -171,8 +234,8 @@ class ExecutorTestEnvironment:
         return ''
 
     def clear_logs(self):
-        """Clear all log files."""
-        for log_file in self.logs_dir.glob('*.log'):
+        """Clear all log files (including the stats sidecar)."""
+        for log_file in [*self.logs_dir.glob('*.log'), *self.logs_dir.glob('*.jsonl')]:
             log_file.unlink()
 
 
@@ -240,6 +303,36 @@ def test_executor_list_command():
     assert 'pm-workflow:manage-config' in output, f"Missing pm-workflow:manage-config in list: {output}"
 
 
+# Imported lazily by the executor; a plain --list must not pay for any of them
+LAZY_EXECUTOR_MODULES = (
+    'ast', 'concurrent', 'glob', 'hashlib', 'select', 'selectors', 'signal',
+    'socket', 'subprocess', 'tempfile', 'threading', 'traceback',
+)
+
+
+def test_executor_list_skips_lazy_imports():
+    """Executor --list under -X importtime imports none of the lazily loaded modules."""
+    env = get_test_env()
+    run_env = os.environ.copy()
+    run_env['PLAN_BASE_DIR'] = str(env.plan_dir)
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(env.executor_path), '--list'],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        cwd=env.temp_dir,
+        timeout=30,
+        env=run_env
+    )
+
+    assert result.returncode == 0, f"--list failed: {result.stderr}"
+    imported = {line.rsplit('|', 1)[-1].strip().split('.')[0]
+                for line in result.stderr.splitlines() if line.startswith('import time:')}
+    eager = sorted(imported.intersection(LAZY_EXECUTOR_MODULES))
+    assert not eager, f"Imported at startup: {eager}"
+
+
 # ============================================================================
 # TESTS: Successful Execution
 # ============================================================================
@@ -559,6 +652,300 @@ def test_plan_scoped_log_when_plan_exists():
         shutil.rmtree(plan_dir, ignore_errors=True)
 
 
+# ============================================================================
+# TESTS: Streaming Execution
+# ============================================================================
+
+def test_stream_option_forwards_output():
+    """--stream produces the same console output as captured execution."""
+    env = get_test_env()
+
+    streamed = env.run_executor('--stream', 'pm-workflow:manage-lifecycle', '--help')
+    captured = env.run_executor('pm-workflow:manage-lifecycle', '--help')
+
+    assert streamed.returncode == 0, f"Streaming failed: {streamed.stderr}"
+    assert streamed.stdout == captured.stdout, "Streamed output differs from captured output"
+
+
+def test_stream_failure_logged_with_tail():
+    """Streamed failures are logged with the stderr tail."""
+    env = get_test_env()
+    env.clear_logs()
+
+    result = env.run_executor_with_env(
+        {'EXECUTOR_STREAM': '1'}, 'pm-workflow:manage-lifecycle', 'invalid-subcommand-xyz'
+    )
+
+    assert result.returncode == 2, f"Expected exit code 2, got {result.returncode}"
+    assert 'invalid choice' in result.stderr, f"stderr not forwarded: {result.stderr}"
+    log_content = env.get_log_content()
+    assert 'exit_code: 2' in log_content, f"Missing exit code: {log_content}"
+    assert 'invalid choice' in log_content, f"Missing stderr tail: {log_content}"
+
+
+# ============================================================================
+# TESTS: In-Process Execution
+# ============================================================================
+
+def test_in_process_scripts_generated():
+    """Scripts importing only stdlib and shared marketplace modules (plan_logging included) run in-process."""
+    env = get_test_env()
+
+    assert env.in_process_scripts == ['pm-workflow:manage-config', 'pm-workflow:manage-lifecycle'], \
+        env.in_process_scripts
+
+
+def test_in_process_matches_subprocess():
+    """In-process execution produces the same output and exit code as a subprocess."""
+    env = get_test_env()
+
+    in_process = env.run_executor('pm-workflow:manage-lifecycle', '--help')
+    subprocess_run = env.run_executor_with_env(
+        {'EXECUTOR_IN_PROCESS': '0'}, 'pm-workflow:manage-lifecycle', '--help'
+    )
+
+    assert in_process.returncode == subprocess_run.returncode == 0, in_process.stderr
+    assert in_process.stdout == subprocess_run.stdout, \
+        f"Output differs:\n{in_process.stdout}\n---\n{subprocess_run.stdout}"
+
+
+def test_in_process_failure_logged():
+    """In-process failures map SystemExit to the exit code and are logged with stderr."""
+    env = get_test_env()
+    env.clear_logs()
+
+    result = env.run_executor('pm-workflow:manage-lifecycle', 'invalid-subcommand-xyz')
+
+    assert result.returncode == 2, f"Expected argparse exit code 2, got {result.returncode}"
+    log_content = env.get_log_content()
+    assert '[ERROR]' in log_content, f"Expected ERROR entry: {log_content}"
+    assert 'exit_code: 2' in log_content, f"Missing exit code: {log_content}"
+    assert 'invalid choice' in log_content, f"Missing captured stderr: {log_content}"
+
+
+# ============================================================================
+# TESTS: Batch Execution
+# ============================================================================
+
+BATCH_INPUT = '\n'.join([
+    '{"notation": "pm-workflow:manage-lifecycle", "args": ["--help"]}',
+    '{"notation": "test:unknown-script", "args": []}',
+    'not json',
+    '{"notation": "pm-workflow:manage-lifecycle", "args": ["invalid-subcommand-xyz"]}',
+]) + '\n'
+
+
+def test_batch_jsonl_results_in_order():
+    """--batch --format jsonl returns one result line per entry in input order."""
+    import json
+    env = get_test_env()
+
+    result = env.run_executor_input(BATCH_INPUT, '--batch', '--format', 'jsonl')
+
+    assert result.returncode == 1, "Batch with failures should exit 1"
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r['index'] for r in results] == [0, 1, 2, 3], result.stdout
+    assert results[0]['exit_code'] == 0 and 'usage' in results[0]['stdout'].lower()
+    assert results[1]['exit_code'] == 1 and 'Unknown notation' in results[1]['stderr']
+    assert results[2]['exit_code'] == 1 and 'Invalid JSON' in results[2]['stderr']
+    assert results[3]['exit_code'] == 2 and 'invalid choice' in results[3]['stderr']
+
+
+def test_batch_parallel_matches_sequential():
+    """--parallel produces the same results as sequential execution."""
+    import json
+    env = get_test_env()
+
+    sequential = env.run_executor_input(BATCH_INPUT, '--batch', '--format', 'jsonl')
+    parallel = env.run_executor_input(BATCH_INPUT, '--batch', '--format', 'jsonl', '--parallel', '4')
+
+    def strip_duration(output):
+        return [{k: v for k, v in json.loads(line).items() if k != 'duration'} for line in output.splitlines()]
+
+    assert strip_duration(parallel.stdout) == strip_duration(sequential.stdout)
+
+
+def test_batch_toon_output():
+    """Default TOON output has a summary table and per-result output blocks."""
+    from toon_parser import parse_toon  # type: ignore[import-not-found]
+    env = get_test_env()
+
+    result = env.run_executor_input(BATCH_INPUT, '--batch')
+
+    data = parse_toon(result.stdout)
+    assert data['status'] == 'error', result.stdout
+    assert data['total'] == 4 and data['failed'] == 3, result.stdout
+    assert [r['exit_code'] for r in data['results']] == [0, 1, 1, 2], result.stdout
+    assert data['results'][0]['notation'] == 'pm-workflow:manage-lifecycle'
+    assert 'usage' in data['result_0']['stdout'].lower(), result.stdout
+
+
+def test_batch_logs_each_entry():
+    """Every batch entry gets its own execution log entry."""
+    env = get_test_env()
+    env.clear_logs()
+
+    env.run_executor_input(BATCH_INPUT, '--batch')
+
+    log_content = env.get_log_content()
+    assert log_content.count('pm-workflow:manage-lifecycle') == 2, log_content
+    assert 'test:unknown-script' in log_content, log_content
+
+
+# ============================================================================
+# TESTS: Result Cache
+# ============================================================================
+
+def _write_status(env, plan_id: str, title: str) -> None:
+    """Write a minimal status.toon for manage-lifecycle read."""
+    plan_dir = env.plan_dir / 'plans' / plan_id
+    plan_dir.mkdir(parents=True, exist_ok=True)
+    (plan_dir / 'status.toon').write_text(f"title: {title}\ncurrent_phase: init\n")
+
+
+def test_cache_replays_read_only_calls():
+    """Declared read-only calls are replayed, logged as hits and invalidated on input change."""
+    env = get_test_env()
+    env.clear_logs()
+    env.run_executor('--cache', 'clear')
+    _write_status(env, 'cache-plan', 'First')
+
+    first = env.run_executor('pm-workflow:manage-lifecycle', 'read', '--plan-id', 'cache-plan')
+    second = env.run_executor('pm-workflow:manage-lifecycle', 'read', '--plan-id', 'cache-plan')
+
+    assert first.returncode == 0 and 'First' in first.stdout, f"{first.stdout}{first.stderr}"
+    assert second.stdout == first.stdout, "Replayed output differs"
+    log_content = env.get_log_content() + (env.plan_dir / 'plans' / 'cache-plan' / 'script-execution.log').read_text()
+    assert log_content.count('[cache hit]') == 1, log_content
+
+    _write_status(env, 'cache-plan', 'Second title')
+    third = env.run_executor('pm-workflow:manage-lifecycle', 'read', '--plan-id', 'cache-plan')
+    assert 'Second title' in third.stdout, f"Stale result replayed: {third.stdout}"
+
+
+def test_cache_replays_manage_config_get():
+    """manage-config get is replayed from the cache until set rewrites config.toon."""
+    env = get_test_env()
+    env.clear_logs()
+    env.run_executor('--cache', 'clear')
+    created = env.run_executor('pm-workflow:manage-config', 'create', '--plan-id', 'config-plan', '--domains', 'java')
+    assert created.returncode == 0, f"{created.stdout}{created.stderr}"
+
+    get_args = ('pm-workflow:manage-config', 'get', '--plan-id', 'config-plan', '--field', 'commit_strategy')
+    first = env.run_executor(*get_args)
+    second = env.run_executor(*get_args)
+
+    assert first.returncode == 0 and 'value: per_task' in first.stdout, f"{first.stdout}{first.stderr}"
+    assert second.stdout == first.stdout, "Replayed output differs"
+    log_content = env.get_log_content() + (env.plan_dir / 'plans' / 'config-plan' / 'script-execution.log').read_text()
+    assert log_content.count('[cache hit]') == 1, log_content
+
+    env.run_executor('pm-workflow:manage-config', 'set', '--plan-id', 'config-plan',
+                     '--field', 'commit_strategy', '--value', 'none')
+    third = env.run_executor(*get_args)
+    assert 'value: none' in third.stdout, f"Stale result replayed: {third.stdout}"
+
+
+def test_cache_disabled_by_env():
+    """EXECUTOR_CACHE=0 never replays results."""
+    env = get_test_env()
+    env.run_executor('--cache', 'clear')
+    _write_status(env, 'cache-off', 'Off')
+
+    env.run_executor_with_env({'EXECUTOR_CACHE': '0'}, 'pm-workflow:manage-lifecycle', 'read', '--plan-id', 'cache-off')
+    status = env.run_executor('--cache', 'status')
+
+    assert 'entries: 0' in status.stdout, status.stdout
+
+
+
+# ============================================================================
+
+def test_stats_report_aggregates_executions():
+    """--stats reports count and error rate per notation and subcommand."""
+    from toon_parser import parse_toon  # type: ignore[import-not-found]
+    env = get_test_env()
+    env.clear_logs()
+
+    env.run_executor('pm-workflow:manage-lifecycle', '--help')
+    env.run_executor('pm-workflow:manage-lifecycle', '--help')
+    env.run_executor('pm-workflow:manage-lifecycle', 'invalid-subcommand')
+
+    result = env.run_executor('--stats', '--since', '1h')
+
+    assert result.returncode == 0, f"--stats failed: {result.stderr}"
+    data = parse_toon(result.stdout)
+    assert data['calls'] == 3 and data['errors'] == 1, result.stdout
+    rows = {r['subcommand']: r for r in data['most_frequent']}
+    assert rows['--help']['count'] == 2 and rows['--help']['error_rate'] == 0.0, result.stdout
+    assert rows['invalid-subcommand']['error_rate'] == 1.0, result.stdout
+
+
+def test_stats_rejects_invalid_since():
+    """--stats with an unparseable --since exits 1."""
+    env = get_test_env()
+
+    result = env.run_executor('--stats', '--since', 'yesterday')
+
+    assert result.returncode == 1, result.stdout
+    assert 'invalid --since' in result.stderr, result.stderr
+
+
+# ============================================================================
+# TESTS: Startup Profiling
+# ============================================================================
+
+def test_profile_startup_logs_import_profile():
+    """--profile-startup keeps script output clean and logs a [PROFILE] entry."""
+    env = get_test_env()
+    env.clear_logs()
+
+    result = env.run_executor('--profile-startup', 'pm-workflow:manage-lifecycle', '--help')
+
+    assert result.returncode == 0, f"Profiled execution failed: {result.stderr}"
+    assert 'usage' in result.stdout.lower(), result.stdout
+    assert 'import time:' not in result.stdout + result.stderr, "Raw importtime lines leaked"
+    assert 'import_profile[' in result.stderr, result.stderr
+
+    log_content = env.get_log_content()
+    assert '[PROFILE] pm-workflow:manage-lifecycle --help (imports ' in log_content, log_content
+    assert '  imports: ' in log_content, log_content
+
+
+# ============================================================================
+# TESTS: Warm Worker
+# ============================================================================
+
+def test_worker_serves_executions():
+    """Executions go through a started worker and fall back once it is stopped."""
+    env = get_test_env()
+    env.clear_logs()
+
+    result = env.run_executor('--worker', 'start')
+    assert result.returncode == 0, f"Worker start failed: {result.stderr}"
+    assert 'status: started' in result.stdout or 'status: running' in result.stdout, result.stdout
+
+    try:
+        result = env.run_executor('pm-workflow:manage-lifecycle', '--help')
+        assert result.returncode == 0, f"Worker execution failed: {result.stderr}"
+        assert 'usage' in result.stdout.lower(), f"Expected help output, got: {result.stdout}"
+
+        status = env.run_executor('--worker', 'status')
+        assert 'requests: 1' in status.stdout, f"Request not served by worker: {status.stdout}"
+
+        # Exit codes and logging behave as with subprocess execution
+        result = env.run_executor('pm-workflow:manage-lifecycle', 'invalid-subcommand-xyz')
+        assert result.returncode != 0, "Invalid subcommand should fail via worker"
+        assert 'pm-workflow:manage-lifecycle' in env.get_log_content()
+    finally:
+        result = env.run_executor('--worker', 'stop')
+
+    assert 'status: stopped' in result.stdout, f"Worker stop failed: {result.stdout}"
+
+    result = env.run_executor('pm-workflow:manage-lifecycle', '--help')
+    assert result.returncode == 0, f"Fallback execution failed: {result.stderr}"
+
+
 # ============================================================================
 # TEST RUNNER
 # ============================================================================
@@ -570,6 +957,7 @@ if __name__ == '__main__':
         test_executor_generated_successfully,
         test_executor_contains_mappings,
         test_executor_list_command,
+        test_executor_list_skips_lazy_imports,
         # Success execution tests
         test_execute_script_help,
         test_execute_script_with_subcommand,
@@ -593,6 +981,29 @@ if __name__ == '__main__':
         # Log location tests
         test_global_log_used_without_plan_id,
         test_plan_scoped_log_when_plan_exists,
+        # Streaming execution tests
+        test_stream_option_forwards_output,
+        test_stream_failure_logged_with_tail,
+        # In-process execution tests
+        test_in_process_scripts_generated,
+        test_in_process_matches_subprocess,
+        test_in_process_failure_logged,
+        # Batch execution tests
+        test_batch_jsonl_results_in_order,
+        test_batch_parallel_matches_sequential,
+        test_batch_toon_output,
+        test_batch_logs_each_entry,
+        # Result cache tests
+        test_cache_replays_read_only_calls,
+        test_cache_replays_manage_config_get,
+        test_cache_disabled_by_env,
+        # Stats report tests
+        test_stats_report_aggregates_executions,
+        test_stats_rejects_invalid_since,
+        # Startup profiling tests
+        test_profile_startup_logs_import_profile,
+        # Warm worker tests
+        test_worker_serves_executions,
     ])
 
     try:
@@ -11,7 +11,7 @@ from datetime import date
 from pathlib import Path
 
 # Import shared infrastructure (conftest.py sets up PYTHONPATH)
-from conftest import TestRunner
+from conftest import MARKETPLACE_ROOT, TestRunner
 
 # Path to the script
 SCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "marketplace/bundles/plan-marshall/skills/script-executor/scripts"
@@ -108,6 +108,147 @@ def test_checksum_is_8_chars():
     assert len(checksum) == 8, f"Expected 8 chars, got {len(checksum)}"
 
 
+# =============================================================================
+# TESTS: notation index
+# =============================================================================
+
+def test_prefix_index_covers_segment_runs():
+    """Prefix index maps every whole-segment run to its best notation."""
+    module = load_module()
+
+    index = module.build_prefix_index({
+        "pm-workflow:manage-tasks:manage-tasks": "/p/a.py",
+        "pm-workflow:manage-tasks-extra:helper": "/p/b.py",
+    })
+
+    assert index['pm-workflow'] == 'pm-workflow:manage-tasks-extra:helper', index
+    assert index['manage-tasks'] == 'pm-workflow:manage-tasks:manage-tasks', index
+    assert index['manage-tasks:manage-tasks'] == 'pm-workflow:manage-tasks:manage-tasks', index
+    assert 'pm-workflow:manage-tasks:manage-tasks' not in index, "Full notations use exact lookup"
+
+
+def test_trigram_index_positions():
+    """Trigram postings reference positions in sorted notation order."""
+    module = load_module()
+
+    index = module.build_trigram_index({"b:xyz": "/p/b.py", "a:xyz": "/p/a.py"})
+
+    assert index['xyz'] == [0, 1], index
+    assert index['a:x'] == [0], index
+
+
+def test_index_code_is_string_literal_json():
+    """Generated index code is a Python string literal holding JSON."""
+    module = load_module()
+
+    prefix_code, trigram_code = module.generate_index_code({"a:b": "/p/a.py"})
+
+    assert json.loads(eval(prefix_code)) == {'a': 'a:b', 'b': 'a:b'}
+    assert 'a:b' in json.loads(eval(trigram_code))
+
+
+# =============================================================================
+# TESTS: find_in_process_scripts
+# =============================================================================
+
+def _write_skill_script(bundles_dir: Path, bundle: str, skill: str, name: str, content: str) -> Path:
+    """Create a script under {bundle}/skills/{skill}/scripts/."""
+    scripts_dir = bundles_dir / bundle / 'skills' / skill / 'scripts'
+    scripts_dir.mkdir(parents=True, exist_ok=True)
+    script = scripts_dir / name
+    script.write_text(content)
+    return script
+
+
+def test_in_process_accepts_stdlib_and_safe_local_imports():
+    """Candidates importing only stdlib and safe marketplace modules are in-process safe."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundles = Path(tmp)
+        _write_skill_script(bundles, 'shared', 'helpers', 'helper_lib.py', 'import json\n')
+        script = _write_skill_script(
+            bundles, 'pm-workflow', 'manage-things', 'manage-things.py',
+            'import argparse\nfrom pathlib import Path\nfrom helper_lib import x\n'
+        )
+        mappings = {
+            'pm-workflow:manage-things:manage-things': str(script),
+            'shared:helpers:helper_lib': str(bundles / 'shared/skills/helpers/scripts/helper_lib.py'),
+        }
+
+        result = module.find_in_process_scripts(mappings)
+
+        assert result == ['pm-workflow:manage-things:manage-things'], f"Got {result}"
+
+
+def test_in_process_rejects_blocked_and_third_party_imports():
+    """Blocked stdlib modules, unknown modules and unsafe local modules disqualify a script."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundles = Path(tmp)
+        _write_skill_script(bundles, 'shared', 'helpers', 'runner_lib.py', 'import subprocess\n')
+        mappings = {
+            'pm-workflow:manage-a:manage-a': str(_write_skill_script(
+                bundles, 'pm-workflow', 'manage-a', 'manage-a.py', 'def f():\n    import subprocess\n')),
+            'pm-workflow:manage-b:manage-b': str(_write_skill_script(
+                bundles, 'pm-workflow', 'manage-b', 'manage-b.py', 'import yaml\n')),
+            'pm-workflow:manage-c:manage-c': str(_write_skill_script(
+                bundles, 'pm-workflow', 'manage-c', 'manage-c.py', 'import runner_lib\n')),
+            'shared:helpers:runner_lib': str(bundles / 'shared/skills/helpers/scripts/runner_lib.py'),
+        }
+
+        result = module.find_in_process_scripts(mappings)
+
+        assert result == [], f"Expected no safe scripts, got {result}"
+
+
+def test_in_process_only_considers_candidates():
+    """Safe scripts outside the candidate notations stay subprocess-only."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = _write_skill_script(Path(tmp), 'pm-dev-java', 'maven', 'maven.py', 'import json\n')
+
+        result = module.find_in_process_scripts({'pm-dev-java:maven:maven': str(script)})
+
+        assert result == [], f"Expected no candidates, got {result}"
+
+
+def test_in_process_allows_reviewed_module_imports():
+    """Modules in IN_PROCESS_ALLOWED_IMPORTS may import their allowed blocked modules."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundles = Path(tmp)
+        _write_skill_script(bundles, 'shared', 'logging', 'plan_logging.py', 'import atexit\nimport threading\n')
+        _write_skill_script(bundles, 'shared', 'helpers', 'other_lib.py', 'import threading\n')
+        mappings = {
+            'pm-workflow:manage-a:manage-a': str(_write_skill_script(
+                bundles, 'pm-workflow', 'manage-a', 'manage-a.py', 'import plan_logging\n')),
+            'pm-workflow:manage-b:manage-b': str(_write_skill_script(
+                bundles, 'pm-workflow', 'manage-b', 'manage-b.py', 'import other_lib\n')),
+            'shared:logging:plan_logging': str(bundles / 'shared/skills/logging/scripts/plan_logging.py'),
+            'shared:helpers:other_lib': str(bundles / 'shared/skills/helpers/scripts/other_lib.py'),
+        }
+
+        result = module.find_in_process_scripts(mappings)
+
+        assert result == ['pm-workflow:manage-a:manage-a'], f"Got {result}"
+
+
+def test_in_process_marketplace_manage_scripts():
+    """The real manage-* scripts that use plan_logging stay in-process safe."""
+    module = load_module()
+    mappings = module.discover_scripts_fallback(MARKETPLACE_ROOT)
+
+    result = module.find_in_process_scripts(mappings)
+
+    for notation in ('pm-workflow:manage-tasks', 'pm-workflow:manage-files', 'pm-workflow:manage-lifecycle',
+                     'pm-workflow:manage-config', 'pm-workflow:manage-references'):
+        assert notation in result, f"{notation} not in-process: {result}"
+
+
 # =============================================================================
 # TESTS: cleanup_old_logs
 # =============================================================================
@@ -162,6 +303,258 @@ def test_cleanup_preserves_recent_logs():
             module.LOGS_DIR = original
 
 
+# =============================================================================
+# TESTS: fingerprints and state (incremental regeneration)
+# =============================================================================
+
+def _make_bundle(base: Path, bundle: str = 'bundle', skill: str = 'skill') -> Path:
+    """Create {base}/{bundle}/skills/{skill}/scripts with one script."""
+    scripts_dir = base / bundle / 'skills' / skill / 'scripts'
+    scripts_dir.mkdir(parents=True)
+    (scripts_dir / 'script.py').write_text('print("x")\n')
+    return scripts_dir
+
+
+def test_bundle_fingerprint_stable_when_unchanged():
+    """Fingerprint is identical for an unchanged bundle."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _make_bundle(Path(tmp))
+        first = module.compute_bundle_fingerprint(Path(tmp) / 'bundle')
+        second = module.compute_bundle_fingerprint(Path(tmp) / 'bundle')
+
+        assert first and first == second, f"Fingerprints differ: {first} != {second}"
+
+
+def test_bundle_fingerprint_detects_script_changes():
+    """Adding or modifying a script changes the bundle fingerprint."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scripts_dir = _make_bundle(Path(tmp))
+        bundle_dir = Path(tmp) / 'bundle'
+        original = module.compute_bundle_fingerprint(bundle_dir)
+
+        (scripts_dir / 'other.py').write_text('')
+        added = module.compute_bundle_fingerprint(bundle_dir)
+        assert added != original, "Added script not detected"
+
+        (scripts_dir / 'script.py').write_text('import subprocess\n')
+        modified = module.compute_bundle_fingerprint(bundle_dir)
+        assert modified != added, "Modified script not detected"
+
+
+def test_bundle_without_skills_has_no_fingerprint():
+    """Directories without skills/ are not fingerprinted."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / 'empty').mkdir()
+        assert module.compute_bundle_fingerprint(Path(tmp) / 'empty') is None
+
+
+def test_update_state_preserves_bootstrap_keys():
+    """update_state merges into marshall-state.toon and drops the legacy row format."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / 'marshall-state.toon'
+        state_path.write_text(
+            'plugin_root\t/plugins/plan-marshall\n'
+            'status\tgenerated\tscript_count\tchecksum\tlogs_cleaned\n'
+            'success\t2025-01-01\t3\tabc\t0\n'
+        )
+        original = module.STATE_PATH
+        module.STATE_PATH = state_path
+        try:
+            fingerprint = {'bundles': {'b': '123'}, 'combined': 'fp', 'base_path': tmp}
+            module.update_state(5, 'cafe', 0, fingerprint)
+            state = module.read_state()
+        finally:
+            module.STATE_PATH = original
+
+        assert state['plugin_root'] == '/plugins/plan-marshall', state
+        assert state['script_count'] == '5', state
+        assert state['executor_fingerprint'] == 'fp', state
+        assert state['bundle_fingerprint.b'] == '123', state
+        assert 'success' not in state, f"Legacy row not dropped: {state}"
+
+
+def test_is_executor_current():
+    """Executor is current only with matching fingerprint, base path and executor file."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        executor = Path(tmp) / 'execute-script.py'
+        executor.write_text('SCRIPTS = {}\n')
+        original = module.EXECUTOR_PATH
+        module.EXECUTOR_PATH = executor
+        try:
+            fingerprint = {'bundles': {}, 'combined': 'fp', 'base_path': tmp}
+            state = {'executor_fingerprint': 'fp', 'executor_base_path': tmp,
+                     'executor_stat': module.executor_stat()}
+            assert module.is_executor_current(state, fingerprint) is True
+
+            assert module.is_executor_current(state, dict(fingerprint, combined='other')) is False
+
+            executor.write_text('SCRIPTS = {"edited": "x"}\n')
+            assert module.is_executor_current(state, fingerprint) is False, "Edited executor not detected"
+        finally:
+            module.EXECUTOR_PATH = original
+
+
+def test_changed_bundles():
+    """changed_bundles reports added, removed and modified bundles."""
+    module = load_module()
+
+    state = {'bundle_fingerprint.a': '1', 'bundle_fingerprint.b': '2'}
+    fingerprint = {'bundles': {'a': '1', 'b': '3', 'c': '4'}}
+
+    assert module.changed_bundles(state, fingerprint) == ['b', 'c']
+
+
+# =============================================================================
+# TESTS: result cache policies
+# =============================================================================
+
+def test_read_cache_policy_literal():
+    """A module-level EXECUTOR_CACHE_POLICY literal is read without importing the script."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / 'script.py'
+        script.write_text(
+            "import sys\n"
+            "EXECUTOR_CACHE_POLICY = {'list': {'reads': ['{plan_dir}/x/*'], 'max_age': 60}}\n"
+            "sys.exit(1)\n"
+        )
+
+        policy = module.read_cache_policy(script)
+
+        assert policy == {'list': {'reads': ['{plan_dir}/x/*'], 'max_age': 60}}, policy
+
+
+def test_read_cache_policy_rejects_invalid():
+    """Non-literal or malformed policies are ignored."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / 'script.py'
+        for source in (
+            "EXECUTOR_CACHE_POLICY = {s: {'reads': ['a']} for s in ('list',)}\n",
+            "EXECUTOR_CACHE_POLICY = {'list': {'reads': []}}\n",
+            "EXECUTOR_CACHE_POLICY = {'list': {'reads': ['a'], 'ttl': 5}}\n",
+            "EXECUTOR_CACHE_POLICY = {'list': {'reads': ['a'], 'max_age': 0}}\n",
+        ):
+            script.write_text(source)
+            assert module.read_cache_policy(script) is None, f"Accepted invalid policy: {source}"
+
+
+def test_find_cache_policies_for_marketplace_scripts():
+    """Declared policies of the real read-only scripts are collected and render as a literal."""
+    module = load_module()
+    mappings = {
+        'pm-workflow:manage-tasks': str(MARKETPLACE_ROOT / 'pm-workflow' / 'skills' / 'manage-tasks' / 'scripts' / 'manage-tasks.py'),
+        'pm-workflow:manage-files': str(MARKETPLACE_ROOT / 'pm-workflow' / 'skills' / 'manage-files' / 'scripts' / 'manage-files.py'),
+    }
+
+    policies = module.find_cache_policies(mappings)
+
+    assert list(policies) == ['pm-workflow:manage-tasks'], policies
+    assert 'list' in policies['pm-workflow:manage-tasks'] and 'add' not in policies['pm-workflow:manage-tasks']
+    assert eval(module.generate_cache_policy_code(policies)) == policies
+
+
+def test_find_cache_sources_follows_imports():
+    """Cached scripts list the marketplace modules they import from other directories, transitively."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundles = Path(tmp)
+        _write_skill_script(bundles, 'shared', 'toon', 'toon_lib.py', 'import json\n')
+        _write_skill_script(bundles, 'shared', 'config', 'config_lib.py', 'import toon_lib\n')
+        _write_skill_script(bundles, 'pm-workflow', 'manage-a', '_a_helper.py', 'import config_lib\n')
+        script = _write_skill_script(
+            bundles, 'pm-workflow', 'manage-a', 'manage-a.py',
+            "import _a_helper\nEXECUTOR_CACHE_POLICY = {'list': {'reads': ['x']}}\n"
+        )
+        mappings = {
+            'pm-workflow:manage-a:manage-a': str(script),
+            'shared:toon:toon_lib': str(bundles / 'shared/skills/toon/scripts/toon_lib.py'),
+            'shared:config:config_lib': str(bundles / 'shared/skills/config/scripts/config_lib.py'),
+        }
+
+        sources = module.find_cache_sources(mappings, module.find_cache_policies(mappings))
+
+        assert sources == {'pm-workflow:manage-a:manage-a': [
+            mappings['shared:config:config_lib'], mappings['shared:toon:toon_lib']]}, sources
+        assert eval(module.generate_cache_sources_code(sources)) == sources
+
+
+
+# =============================================================================
+
+def test_precompile_writes_to_prefix_and_verifies():
+    """Precompile writes bytecode under the prefix (not __pycache__) and verifies it."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scripts_dir = _make_bundle(Path(tmp) / 'bundles')
+        (scripts_dir / '_helper.py').write_text('VALUE = 1\n')
+        prefix = Path(tmp) / 'pycache'
+
+        result = module.precompile_script_dirs([scripts_dir], prefix)
+
+        assert result['compiled'] == 2, result
+        assert result['verified'] == 2 and not result['stale'] and not result['failed'], result
+        assert not (scripts_dir / '__pycache__').exists(), "Bytecode written next to sources"
+        assert list(prefix.rglob('*.pyc')), "No bytecode under prefix"
+
+
+def test_precompile_check_detects_stale_bytecode():
+    """--check reports sources changed after precompilation."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scripts_dir = _make_bundle(Path(tmp) / 'bundles')
+        prefix = Path(tmp) / 'pycache'
+        module.precompile_script_dirs([scripts_dir], prefix)
+
+        (scripts_dir / 'script.py').write_text('print("changed")\n')
+        result = module.precompile_script_dirs([scripts_dir], prefix, check_only=True)
+
+        assert result['compiled'] == 0, result
+        assert result['stale'] == [str(scripts_dir / 'script.py')], result
+
+
+def test_precompile_reports_syntax_errors():
+    """Sources that do not compile are reported as failed."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scripts_dir = _make_bundle(Path(tmp) / 'bundles')
+        (scripts_dir / 'broken.py').write_text('def broken(:\n')
+
+        result = module.precompile_script_dirs([scripts_dir], Path(tmp) / 'pycache')
+
+        assert [path for path, _ in result['failed']] == [str(scripts_dir / 'broken.py')], result
+        assert result['verified'] == 1, result
+
+
+def test_measure_import_time_returns_milliseconds():
+    """Import timing runs in a fresh interpreter and returns milliseconds."""
+    module = load_module()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scripts_dir = _make_bundle(Path(tmp) / 'bundles')
+        (scripts_dir / 'script.py').write_text('import json\n')
+
+        elapsed = module.measure_import_time(str(scripts_dir / 'script.py'), [scripts_dir], Path(tmp) / 'pycache')
+
+        assert elapsed is not None and elapsed >= 0, f"Unexpected timing: {elapsed}"
+
+
 # =============================================================================
 # TESTS: Script execution
 # =============================================================================
@@ -180,6 +573,7 @@ def test_help_output():
     assert 'drift' in result.stdout, "Missing 'drift' in help"
     assert 'paths' in result.stdout, "Missing 'paths' in help"
     assert 'cleanup' in result.stdout, "Missing 'cleanup' in help"
+    assert 'precompile' in result.stdout, "Missing 'precompile' in help"
 
 
 def test_generate_help():
@@ -353,6 +747,28 @@ if __name__ == '__main__':
         test_same_mappings_same_checksum,
         test_different_mappings_different_checksum,
         test_checksum_is_8_chars,
+        test_prefix_index_covers_segment_runs,
+        test_trigram_index_positions,
+        test_index_code_is_string_literal_json,
+        test_in_process_accepts_stdlib_and_safe_local_imports,
+        test_in_process_rejects_blocked_and_third_party_imports,
+        test_in_process_only_considers_candidates,
+        test_in_process_allows_reviewed_module_imports,
+        test_in_process_marketplace_manage_scripts,
+        test_bundle_fingerprint_stable_when_unchanged,
+        test_bundle_fingerprint_detects_script_changes,
+        test_bundle_without_skills_has_no_fingerprint,
+        test_update_state_preserves_bootstrap_keys,
+        test_is_executor_current,
+        test_changed_bundles,
+        test_read_cache_policy_literal,
+        test_read_cache_policy_rejects_invalid,
+        test_find_cache_policies_for_marketplace_scripts,
+        test_find_cache_sources_follows_imports,
+        test_precompile_writes_to_prefix_and_verifies,
+        test_precompile_check_detects_stale_bytecode,
+        test_precompile_reports_syntax_errors,
+        test_measure_import_time_returns_milliseconds,
         test_cleanup_deletes_old_logs,
         test_cleanup_preserves_recent_logs,
         test_help_output,
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Benchmark and fuzz tests for toon_parser on synthetic documents.
+
+Documents come from toon_corpus.py (nested, wide_array, multiline and
+quoted_csv shapes). For each shape the benchmark measures parse and
+serialize throughput and peak memory. It fails when the result regresses
+beyond the stored baseline in toon_benchmark_baseline.toon.
+
+Throughput is compared as a speedup over the frozen legacy implementation
+(legacy_toon_parser.py) measured in the same run, so the baseline holds on
+any machine. Peak memory is compared in KiB.
+
+Environment:
+    TOON_BENCHMARK_SIZE: small (default), medium or large
+    TOON_BENCHMARK_UPDATE=1: write the measured values as the new baseline
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Import shared infrastructure (conftest.py sets up PYTHONPATH)
+from conftest import TestRunner
+
+# Import the module under test (PYTHONPATH set by conftest)
+from toon_parser import parse_toon, serialize_toon
+
+sys.path.insert(0, str(Path(__file__).parent))
+import legacy_toon_parser  # noqa: E402
+import toon_corpus  # noqa: E402
+
+BASELINE_FILE = Path(__file__).parent / 'toon_benchmark_baseline.toon'
+BENCHMARK_SIZE = os.environ.get('TOON_BENCHMARK_SIZE', 'small')
+UPDATE_BASELINE = os.environ.get('TOON_BENCHMARK_UPDATE') == '1'
+
+# Allowed regression against the baseline before the benchmark fails
+SPEEDUP_TOLERANCE = 0.30
+MEMORY_TOLERANCE = 0.25
+# Serialize must keep up with legacy on every shape, whatever the baseline
+# says (0.85 leaves room for timing noise)
+SERIALIZE_MIN_SPEEDUP = 0.85
+# Shapes exempt from SERIALIZE_MIN_SPEEDUP, with the reason
+SERIALIZE_EXCEPTIONS = {
+    'multiline': "multi-line strings are written as '|' blocks, one line per text line; "
+                 "legacy writes a quoted raw newline that does not parse back",
+}
+BENCHMARK_RUNS = 5
+BENCHMARK_ATTEMPTS = 3
+FUZZ_SEEDS = range(12)
+
+
+def _best_time(function, argument) -> float:
+    """Best wall-clock time of function(argument) over BENCHMARK_RUNS runs."""
+    best = float('inf')
+    for _ in range(BENCHMARK_RUNS):
+        gc.collect()
+        start = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_kib(function, argument) -> int:
+    """Peak traced memory of function(argument) in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(argument)
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(document: str) -> dict:
+    """Parse/serialize rates (MB/s), speedups over legacy and parse peak memory."""
+    data = parse_toon(document)
+    megabytes = len(document.encode('utf-8')) / 1_000_000
+    parse_time = _best_time(parse_toon, document)
+    legacy_parse_time = _best_time(legacy_toon_parser.parse_toon, document)
+    serialize_time = _best_time(serialize_toon, data)
+    legacy_serialize_time = _best_time(legacy_toon_parser.serialize_toon, data)
+    return {
+        'parse_mb_s': round(megabytes / parse_time, 2),
+        'serialize_mb_s': round(megabytes / serialize_time, 2),
+        'parse_speedup': round(legacy_parse_time / parse_time, 2),
+        'serialize_speedup': round(legacy_serialize_time / serialize_time, 2),
+        'peak_kib': _peak_kib(parse_toon, document),
+    }
+
+
+def _serialize_floor(shape: str, result: dict) -> list[str]:
+    """Describe a serialize speedup below SERIALIZE_MIN_SPEEDUP (exempt shapes pass)."""
+    if shape in SERIALIZE_EXCEPTIONS or result['serialize_speedup'] >= SERIALIZE_MIN_SPEEDUP:
+        return []
+    return [f"serialize_speedup {result['serialize_speedup']} < {SERIALIZE_MIN_SPEEDUP} (slower than legacy)"]
+
+
+def _regressions(result: dict, baseline: dict) -> list[str]:
+    """Describe every value of result that is worse than baseline allows."""
+    problems = []
+    for metric in ('parse_speedup', 'serialize_speedup'):
+        minimum = baseline[metric] * (1 - SPEEDUP_TOLERANCE)
+        if result[metric] < minimum:
+            problems.append(f"{metric} {result[metric]} < {minimum:.2f} (baseline {baseline[metric]})")
+    maximum = baseline['peak_kib'] * (1 + MEMORY_TOLERANCE)
+    if result['peak_kib'] > maximum:
+        problems.append(f"peak_kib {result['peak_kib']} > {maximum:.0f} (baseline {baseline['peak_kib']})")
+    return problems
+
+
+def _load_baseline() -> dict[tuple[str, str], dict]:
+    """Baseline rows keyed by (shape, size)."""
+    if not BASELINE_FILE.exists():
+        return {}
+    rows = parse_toon(BASELINE_FILE.read_text(encoding='utf-8')).get('results', [])
+    return {(row['shape'], row['size']): row for row in rows}
+
+
+def _save_baseline(baseline: dict[tuple[str, str], dict]) -> None:
+    results = [baseline[key] for key in sorted(baseline)]
+    content = (
+        "# toon_parser benchmark baseline (speedups over legacy_toon_parser, parse peak memory)\n"
+        "# Regenerate: TOON_BENCHMARK_UPDATE=1 python3 test/run-tests.py test/plan-marshall/toon-usage\n"
+        + ''.join(f"# Known serialize slowdown, {shape}: {reason}\n" for shape, reason in SERIALIZE_EXCEPTIONS.items())
+        + "\n"
+        + serialize_toon({'results': results}) + '\n'
+    )
+    BASELINE_FILE.write_text(content, encoding='utf-8')
+
+
+# =============================================================================
+# Test: Corpus Generator
+# =============================================================================
+
+def test_corpus_is_deterministic():
+    """The same shape, size and seed always produce the same document."""
+    for shape in toon_corpus.SHAPES:
+        assert toon_corpus.generate(shape, 'small', 3) == toon_corpus.generate(shape, 'small', 3)
+        assert toon_corpus.generate(shape, 'small', 3) != toon_corpus.generate(shape, 'small', 4)
+
+
+def test_corpus_shapes():
+    """Generated documents contain the structures their shape promises."""
+    nested = parse_toon(toon_corpus.generate('nested'))
+    depth, level = 0, nested
+    while any(isinstance(value, dict) for value in level.values()):
+        level = next(value for value in level.values() if isinstance(value, dict))
+        depth += 1
+    assert depth >= 3, f"Expected deep nesting, got depth {depth}"
+
+    wide = parse_toon(toon_corpus.generate('wide_array'))
+    assert len(wide['table_0']) == 400 and len(wide['table_0'][0]) >= 12
+
+    multiline = toon_corpus.generate('multiline')
+    values = parse_toon(multiline)
+    assert multiline.count(": |") >= 100
+    assert any(isinstance(value, str) and '\n' in value for value in values.values())
+
+    findings = parse_toon(toon_corpus.generate('quoted_csv'))['findings']
+    assert any(',' in row['message'] for row in findings), "Expected quoted commas in cells"
+    assert any(':' in row['hint'] for row in findings if row['hint']), "Expected quoted colons in cells"
+
+
+# =============================================================================
+# Test: Fuzz
+# =============================================================================
+
+def test_fuzz_round_trip():
+    """parse(serialize(parse(doc))) equals parse(doc) for every generated document."""
+    for name, document in toon_corpus.generate_corpus('small', FUZZ_SEEDS):
+        data = parse_toon(document)
+        assert parse_toon(serialize_toon(data)) == data, f"Round trip differs for {name}"
+
+
+def test_fuzz_legacy_equivalence():
+    """The current parser agrees with the legacy parser on generated documents."""
+    for name, document in toon_corpus.generate_corpus('small', FUZZ_SEEDS):
+        expected = legacy_toon_parser.parse_toon(document)
+        assert repr(parse_toon(document)) == repr(expected), f"Output differs for {name}"
+
+
+# =============================================================================
+# Test: Benchmark
+# =============================================================================
+
+def test_benchmark_against_baseline():
+    """Throughput and peak memory per shape stay within the stored baseline.
+
+    Serialize must also reach SERIALIZE_MIN_SPEEDUP on every shape outside
+    SERIALIZE_EXCEPTIONS, so a baseline cannot hide a slowdown.
+
+    A noisy machine can spoil a measurement, so a regressing shape is
+    measured again up to BENCHMARK_ATTEMPTS times before failing. Updating
+    the baseline records the worst of BENCHMARK_ATTEMPTS measurements.
+    """
+    baseline = _load_baseline()
+    failures = []
+    for shape in toon_corpus.SHAPES:
+        document = toon_corpus.generate(shape, BENCHMARK_SIZE)
+        expected = baseline.get((shape, BENCHMARK_SIZE))
+        results = []
+        for _ in range(BENCHMARK_ATTEMPTS):
+            result = _measure(document)
+            results.append(result)
+            problems = _serialize_floor(shape, result)
+            if expected and not UPDATE_BASELINE:
+                problems += _regressions(result, expected)
+            if not problems and not UPDATE_BASELINE:
+                break
+        print(f"    {shape} ({BENCHMARK_SIZE}, {len(document) // 1024}KiB): "
+              f"parse {result['parse_mb_s']}MB/s ({result['parse_speedup']}x), "
+              f"serialize {result['serialize_mb_s']}MB/s ({result['serialize_speedup']}x), "
+              f"peak {result['peak_kib']}KiB")
+        if shape in SERIALIZE_EXCEPTIONS:
+            print(f"    {shape}: known serialize slowdown ({SERIALIZE_EXCEPTIONS[shape]})")
+        if UPDATE_BASELINE:
+            baseline[(shape, BENCHMARK_SIZE)] = {
+                'shape': shape,
+                'size': BENCHMARK_SIZE,
+                'parse_speedup': min(r['parse_speedup'] for r in results),
+                'serialize_speedup': min(r['serialize_speedup'] for r in results),
+                'peak_kib': max(r['peak_kib'] for r in results),
+            }
+        elif expected is None:
+            print(f"    {shape}: no baseline for size {BENCHMARK_SIZE}")
+        failures.extend(f"{shape}: {problem}" for problem in problems)
+
+    if UPDATE_BASELINE:
+        _save_baseline(baseline)
+    assert not failures, "Benchmark regressions:\n  " + "\n  ".join(failures)
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == '__main__':
+    runner = TestRunner()
+    runner.add_tests([
+        # Corpus generator
+        test_corpus_is_deterministic,
+        test_corpus_shapes,
+        # Fuzz
+        test_fuzz_round_trip,
+        test_fuzz_legacy_equivalence,
+        # Benchmark
+        test_benchmark_against_baseline,
+    ])
+    sys.exit(runner.run())
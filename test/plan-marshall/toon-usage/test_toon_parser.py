@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """Tests for toon_parser.py module."""
 
+import io
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Import shared infrastructure (conftest.py sets up PYTHONPATH)
-from conftest import TestRunner
+from conftest import PROJECT_ROOT, TestRunner, create_temp_file
 
 # Import the module under test (PYTHONPATH set by conftest)
-from toon_parser import parse_toon, serialize_toon, ToonParseError
+import toon_parser
+from toon_parser import parse_toon, serialize_toon, ToonParseError, iter_toon, ToonEvent, ToonWriter, ToonTable
+from toon_parser import clear_load_cache, load_cached, save_toon
 
 
 # =============================================================================
@@ -410,6 +415,14 @@ roles[2]{id,name}:
     assert reparsed['roles'] == parsed['roles']
 
 
+def test_serialize_multiline_value():
+    """Multi-line strings are written as | blocks and parse back unchanged."""
+    original = {'summary': 'First line\n\n  indented: line\nlast', 'nested': {'notes': 'a, b\nc'}}
+    serialized = serialize_toon(original)
+    assert 'summary: |\n  First line\n\n    indented: line\n  last' in serialized
+    assert parse_toon(serialized) == original
+
+
 # =============================================================================
 # Test: Edge Cases
 # =============================================================================
@@ -452,6 +465,396 @@ url: https://example.com
     assert result['url'] == 'https://example.com'
 
 
+# =============================================================================
+# Test: Streaming Events
+# =============================================================================
+
+STREAMING_DOCUMENT = """
+status: success
+summary:
+  total: 2
+  note: |
+    first line
+    second line
+issues[2]{file,line,severity}:
+  src/A.java,10,ERROR
+  "src/B, C.java",20
+tags[2]:
+  - urgent
+  - 3
+done: true
+"""
+
+
+def _rebuild(events) -> dict:
+    """Rebuild the parse_toon() result from iter_toon() events."""
+    root: dict = {}
+    stack = [root]
+    array: list = []
+    fields: tuple = ()
+    for event in events:
+        key = event.path[-1]
+        if event.kind == 'key':
+            stack[-1][key] = event.value
+        elif event.kind == 'begin_object':
+            stack[-1][key] = {}
+            stack.append(stack[-1][key])
+        elif event.kind == 'end_object':
+            stack.pop()
+        elif event.kind == 'begin_array':
+            array = stack[-1][key] = []
+            fields = event.fields or ()
+        elif event.kind == 'row':
+            array.append(dict(zip(fields, event.value)))
+        elif event.kind == 'item':
+            array.append(event.value)
+    return root
+
+
+def test_iter_toon_events():
+    """Test the event sequence for a mixed document."""
+    events = list(iter_toon(STREAMING_DOCUMENT))
+    assert events == [
+        ToonEvent('key', ('status',), 'success'),
+        ToonEvent('begin_object', ('summary',)),
+        ToonEvent('key', ('summary', 'total'), 2),
+        ToonEvent('key', ('summary', 'note'), 'first line\nsecond line'),
+        ToonEvent('end_object', ('summary',)),
+        ToonEvent('begin_array', ('issues',), fields=('file', 'line', 'severity'), count=2),
+        ToonEvent('row', ('issues',), ('src/A.java', 10, 'ERROR')),
+        ToonEvent('row', ('issues',), ('src/B, C.java', 20, None)),
+        ToonEvent('end_array', ('issues',)),
+        ToonEvent('begin_array', ('tags',), count=2),
+        ToonEvent('item', ('tags',), 'urgent'),
+        ToonEvent('item', ('tags',), 3),
+        ToonEvent('end_array', ('tags',)),
+        ToonEvent('key', ('done',), True),
+    ], f"Unexpected events: {events}"
+
+
+def test_iter_toon_matches_parse_toon():
+    """Test that events describe exactly what parse_toon returns."""
+    documents = [STREAMING_DOCUMENT]
+    documents += [path.read_text(encoding='utf-8') for path in sorted((PROJECT_ROOT / 'test').rglob('*.toon'))]
+    documents += [path.read_text(encoding='utf-8') for path in sorted((PROJECT_ROOT / 'marketplace').rglob('*.toon'))]
+    for content in documents:
+        assert _rebuild(iter_toon(content)) == parse_toon(content), f"Mismatch for:\n{content[:200]}"
+
+
+def test_iter_toon_is_lazy():
+    """Test that rows are yielded before the source is exhausted."""
+    def endless_rows():
+        yield 'items[1000000]{id,name}:\n'
+        number = 0
+        while True:
+            number += 1
+            yield f'  {number},item-{number}\n'
+
+    events = iter_toon(endless_rows())
+    assert next(events).kind == 'begin_array'
+    assert next(events).value == (1, 'item-1')
+    assert next(events).value == (2, 'item-2')
+
+
+def test_iter_toon_file_object():
+    """Test reading events from an open text file."""
+    path = create_temp_file(STREAMING_DOCUMENT, suffix='.toon')
+    with open(path, encoding='utf-8') as f:
+        rows = [event.value for event in iter_toon(f) if event.kind == 'row']
+    assert rows == [('src/A.java', 10, 'ERROR'), ('src/B, C.java', 20, None)]
+
+
+def test_iter_toon_row_width():
+    """Test that rows always have one value per field."""
+    toon = """
+items[3]{a,b}:
+  1
+  1,2
+  1,2,3
+"""
+    rows = [event.value for event in iter_toon(toon) if event.kind == 'row']
+    assert rows == [(1, None), (1, 2), (1, 2)]
+
+
+# =============================================================================
+# Test: Incremental Writer
+# =============================================================================
+
+WRITER_DATA = {
+    'status': 'success',
+    'metadata': {'created': '2025-12-02', 'count': 3, 'note': 'a, b'},
+    'issues': [
+        {'file': 'Main.java', 'line': 15, 'message': 'cannot find symbol'},
+        {'file': 'Test.java', 'line': 42, 'message': 'expected: 1'},
+    ],
+    'tags': ['python', 'toon'],
+    'active': True,
+    'missing': None,
+}
+
+
+class _PipeStream(io.StringIO):
+    """Text stream that cannot seek, like stdout on a pipe."""
+
+    def seekable(self):
+        return False
+
+
+def _issue_rows(count):
+    for i in range(count):
+        yield {'id': i, 'file': f'src/Component{i}.java', 'message': f'issue {i}, severity {i % 3}'}
+
+
+def test_writer_matches_serialize_toon():
+    """Writing a whole dict produces serialize_toon output line by line."""
+    stream = io.StringIO()
+    ToonWriter(stream).write_all(WRITER_DATA)
+    assert stream.getvalue() == serialize_toon(WRITER_DATA) + '\n'
+
+
+def test_writer_seekable_iterator():
+    """Seekable streams get the row count patched into the header."""
+    stream = io.StringIO()
+    writer = ToonWriter(stream)
+    writer.write('status', 'success')
+    assert writer.write_table('issues', _issue_rows(250)) == 250
+    writer.write_items('tags', iter(['a', 'b', 'c']))
+    writer.write('total', 250)
+
+    result = parse_toon(stream.getvalue())
+    assert result['issues'] == list(_issue_rows(250))
+    assert result['tags'] == ['a', 'b', 'c']
+    assert result['total'] == 250
+    assert list(iter_toon(stream.getvalue()))[1].count == 250
+
+
+def test_writer_non_seekable_iterator():
+    """Non-seekable streams count rows in a spool and write them after the header."""
+    stream = _PipeStream()
+    writer = ToonWriter(stream)
+    writer.begin_object('report')
+    writer.write_table('issues', _issue_rows(40), ['id', 'message'])
+    writer.end_object()
+    writer.write('after', 'done')
+
+    content = stream.getvalue()
+    assert '  issues[40]{id,message}:\n' in content, "Expected exact count in header"
+    result = parse_toon(content)
+    assert result['report']['issues'] == [{'id': r['id'], 'message': r['message']} for r in _issue_rows(40)]
+    assert result['after'] == 'done'
+
+
+def test_writer_file_streams():
+    """Regular files are patched in place; append-mode files fall back to spooling."""
+    path = create_temp_file('prefix: kept\n', suffix='.toon')
+    try:
+        with open(path, 'a', encoding='utf-8') as f:
+            ToonWriter(f).write_items('items', (f'item-{i}' for i in range(5)))
+        with open(path, encoding='utf-8') as f:
+            assert parse_toon(f.read()) == {'prefix': 'kept', 'items': [f'item-{i}' for i in range(5)]}
+
+        with open(path, 'w', encoding='utf-8') as f:
+            ToonWriter(f).write_table('rows', ({'n': i} for i in range(1000)))
+        with open(path, encoding='utf-8') as f:
+            assert parse_toon(f.read())['rows'] == [{'n': i} for i in range(1000)]
+    finally:
+        path.unlink()
+
+
+def test_writer_is_incremental():
+    """Rows reach the stream while the iterator is still producing them."""
+    stream = io.StringIO()
+
+    def rows():
+        for i in range(3):
+            yield {'id': i}
+            assert f'  {i}\n' in stream.getvalue(), f"Row {i} not written before the next was produced"
+
+    ToonWriter(stream).write_table('rows', rows())
+    assert parse_toon(stream.getvalue())['rows'] == [{'id': 0}, {'id': 1}, {'id': 2}]
+
+
+def test_writer_empty_and_unbalanced():
+    """Empty iterators write an empty array; end_object needs begin_object."""
+    for stream in (io.StringIO(), _PipeStream()):
+        writer = ToonWriter(stream)
+        assert writer.write_table('rows', iter([])) == 0
+        assert parse_toon(stream.getvalue()) == {'rows': []}
+        try:
+            writer.end_object()
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+
+
+# =============================================================================
+# Test: Columnar Tables
+# =============================================================================
+
+TABLE_DOCUMENT = """
+status: success
+modules[3]{name,path,tests,coverage}:
+  core,modules/core,120,85%
+  api,"modules/api, v2",,0.5
+  web,modules/web,7
+nested:
+  findings[2]{file,line}:
+    Main.java,15
+    Test.java,42
+tags[2]:
+  - a
+  - b
+"""
+
+
+def test_tables_option():
+    """tables=True returns ToonTable objects with shared headers and tuple rows."""
+    result = parse_toon(TABLE_DOCUMENT, tables=True)
+    modules = result['modules']
+    assert isinstance(modules, ToonTable), f"Expected ToonTable, got {type(modules)}"
+    assert modules.fields == ('name', 'path', 'tests', 'coverage')
+    assert modules.rows[1] == ('api', 'modules/api, v2', '', 0.5)
+    assert modules.rows[2] == ('web', 'modules/web', 7, None)
+    assert isinstance(result['nested']['findings'], ToonTable)
+    assert result['tags'] == ['a', 'b']
+    assert not hasattr(modules, '__dict__'), "ToonTable should use __slots__"
+
+
+def test_table_row_views():
+    """Rows are read-only dict-like views created on demand."""
+    modules = parse_toon(TABLE_DOCUMENT, tables=True)['modules']
+    row = modules[0]
+    assert row['name'] == 'core'
+    assert row.get('missing', 'default') == 'default'
+    assert 'coverage' in row
+    assert list(row.items()) == [('name', 'core'), ('path', 'modules/core'), ('tests', 120), ('coverage', 85)]
+    assert row == {'name': 'core', 'path': 'modules/core', 'tests': 120, 'coverage': 85}
+    assert [r['name'] for r in modules] == ['core', 'api', 'web']
+    assert modules.column('tests') == [120, '', 7]
+    assert len(modules[1:]) == 2 and modules[-1]['name'] == 'web'
+
+
+def test_table_compatibility():
+    """ToonTable converts to and compares with the default list-of-dicts form."""
+    default = parse_toon(TABLE_DOCUMENT)
+    tables = parse_toon(TABLE_DOCUMENT, tables=True)
+    assert tables['modules'] == default['modules']
+    assert tables['modules'].to_list() == default['modules']
+    assert type(tables['modules'].to_list()[0]) is dict
+    assert tables == default
+    assert serialize_toon(tables) == serialize_toon(default)
+
+    stream = io.StringIO()
+    ToonWriter(stream).write_all(tables)
+    assert parse_toon(stream.getvalue()) == default
+
+
+def test_table_irregular_rows():
+    """Short, long and empty tables match the list-of-dicts parse."""
+    content = "rows[3]{a,b}:\n  1\n  2,x,extra\n  3,y\nempty[2]{a}:\nnext: 1\n"
+    tables = parse_toon(content, tables=True)
+    assert tables['rows'].rows == [(1, None), (2, 'x'), (3, 'y')]
+    assert tables['rows'] == parse_toon(content)['rows']
+    assert isinstance(tables['empty'], ToonTable) and len(tables['empty']) == 0
+
+
+# =============================================================================
+# Test: Cached Loading
+# =============================================================================
+
+class _CountingParser:
+    """parse_toon wrapper counting its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, content):
+        self.calls += 1
+        return parse_toon(content)
+
+
+def test_load_cached_reuses_parse():
+    """Unchanged files are parsed once; copies are independent."""
+    clear_load_cache()
+    parser = _CountingParser()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'status.toon'
+        path.write_text('current_phase: plan\nphases[2]:\n  - init\n  - plan\n', encoding='utf-8')
+
+        first = load_cached(path, parser)
+        first['phases'].append('modified')
+        second = load_cached(str(path), parser)
+        assert parser.calls == 1, f"Expected 1 parse, got {parser.calls}"
+        assert second == {'current_phase': 'plan', 'phases': ['init', 'plan']}
+        assert load_cached(path, parser, copy=False) is load_cached(path, parser, copy=False)
+
+
+def test_load_cached_detects_changes():
+    """Size, mtime or inode changes cause a re-parse."""
+    clear_load_cache()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'config.toon'
+        path.write_text('value: 1\n', encoding='utf-8')
+        assert load_cached(path) == {'value': 1}
+
+        path.write_text('value: 22\n', encoding='utf-8')
+        assert load_cached(path) == {'value': 22}
+
+        # Same size and mtime, replaced by a new file (new inode)
+        stat = path.stat()
+        replacement = Path(temp_dir) / 'replacement.toon'
+        replacement.write_text('value: 33\n', encoding='utf-8')
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, path)
+        assert load_cached(path) == {'value': 33}
+
+        path.unlink()
+        try:
+            load_cached(path)
+            raise AssertionError("Expected FileNotFoundError")
+        except FileNotFoundError:
+            pass
+
+
+def test_save_toon_refreshes_cache():
+    """save_toon writes atomically and the next load needs no parse."""
+    clear_load_cache()
+    parser = _CountingParser()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'plans' / 'my-plan' / 'references.toon'
+        save_toon(path, {'branch': 'feature/x', 'files': ['a.py']}, header='# Plan References\n\n', parser=parser)
+        assert path.read_text(encoding='utf-8') == '# Plan References\n\nbranch: feature/x\nfiles[1]:\n  - a.py\n'
+        assert parser.calls == 1
+        assert load_cached(path, parser) == {'branch': 'feature/x', 'files': ['a.py']}
+        assert parser.calls == 1, "Expected the saved document to be served from cache"
+        assert [p.name for p in path.parent.iterdir()] == ['references.toon'], "Temp file left behind"
+
+
+def test_load_cached_lru_eviction():
+    """The least recently used entry is evicted first."""
+    clear_load_cache()
+    parser = _CountingParser()
+    original_size = toon_parser._LOAD_CACHE_SIZE
+    toon_parser._LOAD_CACHE_SIZE = 2
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / f'TASK-00{i}.toon' for i in range(3)]
+            for i, path in enumerate(paths):
+                path.write_text(f'number: {i}\n', encoding='utf-8')
+            load_cached(paths[0], parser)
+            load_cached(paths[1], parser)
+            load_cached(paths[0], parser)  # paths[1] is now least recently used
+            load_cached(paths[2], parser)
+            assert parser.calls == 3
+            load_cached(paths[0], parser)
+            assert parser.calls == 3, "Recently used entry should still be cached"
+            assert load_cached(paths[1], parser) == {'number': 1}
+            assert parser.calls == 4, "Evicted entry should be parsed again"
+    finally:
+        toon_parser._LOAD_CACHE_SIZE = original_size
+        clear_load_cache()
+
+
 # =============================================================================
 # Test Runner
 # =============================================================================
@@ -491,10 +894,34 @@ if __name__ == '__main__':
         test_serialize_uniform_array,
         test_serialize_simple_array,
         test_roundtrip,
+        test_serialize_multiline_value,
         # Edge cases
         test_empty_input,
         test_only_comments,
         test_whitespace_handling,
         test_colon_in_value,
+        # Streaming events
+        test_iter_toon_events,
+        test_iter_toon_matches_parse_toon,
+        test_iter_toon_is_lazy,
+        test_iter_toon_file_object,
+        test_iter_toon_row_width,
+        # Incremental writer
+        test_writer_matches_serialize_toon,
+        test_writer_seekable_iterator,
+        test_writer_non_seekable_iterator,
+        test_writer_file_streams,
+        test_writer_is_incremental,
+        test_writer_empty_and_unbalanced,
+        # Columnar tables
+        test_tables_option,
+        test_table_row_views,
+        test_table_compatibility,
+        test_table_irregular_rows,
+        # Cached loading
+        test_load_cached_reuses_parse,
+        test_load_cached_detects_changes,
+        test_save_toon_refreshes_cache,
+        test_load_cached_lru_eviction,
     ])
     sys.exit(runner.run())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Equivalence and performance tests for the single-pass toon_parser tokenizer.
+
+The rewritten parser must produce output identical to the original
+line-by-line implementation (kept as legacy_toon_parser.py) and parse large
+uniform arrays at least 5x faster.
+"""
+
+import gc
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Import shared infrastructure (conftest.py sets up PYTHONPATH)
+from conftest import PROJECT_ROOT, TestRunner
+
+# Import the module under test (PYTHONPATH set by conftest)
+from toon_parser import ToonTable, parse_toon
+
+sys.path.insert(0, str(Path(__file__).parent))
+import legacy_toon_parser  # noqa: E402
+
+# Minimum speedup over the legacy parser on large uniform arrays
+MIN_SPEEDUP = 5.0
+BENCHMARK_ROWS = 20000
+BENCHMARK_RUNS = 7
+BENCHMARK_ATTEMPTS = 3
+
+SEVERITIES = ['BLOCKER', 'CRITICAL', 'MAJOR', 'MINOR', 'INFO']
+ISSUE_KINDS = [
+    ('java:S2095', 'BUG', '"Use try-with-resources or close this \'InputStream\' in a \'finally\' clause."'),
+    ('java:S1192', 'CODE_SMELL', '"Define a constant instead of duplicating this literal \'application/json\' 4 times."'),
+    ('java:S3649', 'VULNERABILITY', 'Make sure that string concatenation is required here and is done safely.'),
+    ('java:S1068', 'CODE_SMELL', 'Remove this unused \'logger\' private field.'),
+    ('java:S1135', 'CODE_SMELL', '"Complete the task associated to this \'TODO\' comment, or remove it."'),
+]
+
+TOON_BLOCK = re.compile(r'```toon\n(.*?)```', re.DOTALL)
+
+EDGE_CASES = [
+    '',
+    '# only a comment\n\n',
+    'name: Alice\nage: 30\nratio: -0.75\ncoverage: 85%\nneg: -3\n',
+    'a: true\nb: false\nc: null\nd: "quoted"\ne: "\nf: "a, b"\ng: 1.\nh: .5\ni: -\nj: 12abc\n',
+    'unicode: ١٢٣\nsuper: ²\nfull: １２%\n',
+    'url: http://example.com:8080/path\ntime: 10:30:00\n',
+    'outer:\n  inner:\n    deep: 1\n  sibling: x\nafter: y\n',
+    'parent:\n    over_indented: 1\nnext: 2\n',
+    'empty:\n# comment\nnext: value\n',
+    'empty:\n\n  # comment\n  child: 1\n',
+    'items[3]{id,name,score}:\n  1,Alice,9.5\n  2,"Smith, Bob",80%\n  3,,\n',
+    'items[2]{id,name}:\n  1,"a ""quoted"" name",extra,values\n  2\n',
+    'items[5]{id,note}:\n  1,ok\n  note: breaks here\n  2,still parsed\n',
+    'items[4]{id,desc}:\n  1,ratio:2\n\n  # comment inside\n  2,"x: y"\n3,outdented\n',
+    'items[1]{a, b ,c}:\n  x,y,z\n  overflow,row\nnext: 1\n',
+    'my-list[3]:\n  - one\n  - 2\n  -\n  -x\n  - "three, four"\nafter: done\n',
+    'tags[2]:\n- top\n- level\nnext: 1\n',
+    'tags[2]:\n  - a\n  plain line\n  - b\n',
+    'text: |\n  line one\n\n  line two\n    indented\n  # not a comment\nnext: 1\n',
+    'text: |\n x\n  y\n',
+    'nested:\n  rows[2]{k,v}:\n    a,1\n    b,2\n  tail: z\ntop: 1\n',
+    'no colon line\nkey: value\n  stray: skipped\n',
+    '\tkey: tabbed\nkey2:\tvalue\t\nkey3: trailing   \r\n',
+    'k[2]{a}: \n  1\n  2\nk2[x]: not an array\n',
+]
+
+
+def _corpus_files() -> list[Path]:
+    """All .toon files and markdown files with toon code blocks in the repo."""
+    roots = [PROJECT_ROOT / 'marketplace', PROJECT_ROOT / 'test']
+    return sorted(
+        path for root in roots for pattern in ('*.toon', '*.md') for path in root.rglob(pattern)
+    )
+
+
+def _corpus_documents() -> list[tuple[str, str]]:
+    """Collect (source, content) pairs from repo files and edge cases."""
+    documents = [(f'edge case {i}', text) for i, text in enumerate(EDGE_CASES)]
+    for path in _corpus_files():
+        text = path.read_text(encoding='utf-8', errors='replace')
+        if path.suffix == '.toon':
+            documents.append((str(path), text))
+        else:
+            for i, block in enumerate(TOON_BLOCK.findall(text)):
+                documents.append((f'{path}#{i}', block))
+    return documents
+
+
+def _large_uniform_array(rows: int) -> str:
+    """Build a document with one large uniform array shaped like Sonar issue lists."""
+    lines = ['project_key: benchmark', f'issues[{rows}]{{key,type,severity,file,line,rule,message,effort}}:']
+    for i in range(rows):
+        rule, issue_type, message = ISSUE_KINDS[i % len(ISSUE_KINDS)]
+        lines.append(
+            f'  AX-{i:05d},{issue_type},{SEVERITIES[i % len(SEVERITIES)]},'
+            f'src/main/java/de/cuioss/module{i % 40}/Component{i % 700}.java,{i % 900 + 1},'
+            f'{rule},{message},{i % 6 * 5 + 2}min'
+        )
+    lines.append('total_issues: done')
+    return '\n'.join(lines) + '\n'
+
+
+def _best_times(content: str) -> tuple[float, float]:
+    """Best wall-clock times of the legacy and current parser, runs interleaved."""
+    legacy = current = float('inf')
+    for _ in range(BENCHMARK_RUNS):
+        gc.collect()
+        start = time.perf_counter()
+        legacy_toon_parser.parse_toon(content)
+        legacy = min(legacy, time.perf_counter() - start)
+        gc.collect()
+        start = time.perf_counter()
+        parse_toon(content)
+        current = min(current, time.perf_counter() - start)
+    return legacy, current
+
+
+def _tables_to_lists(value):
+    """Replace ToonTable values with their list-of-dicts form, recursively."""
+    if isinstance(value, ToonTable):
+        return value.to_list()
+    if isinstance(value, dict):
+        return {key: _tables_to_lists(item) for key, item in value.items()}
+    return value
+
+
+def _traced_size(build) -> int:
+    """Bytes still allocated for the result of build()."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()  # noqa: F841 - kept alive while measuring
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+# =============================================================================
+# Test: Equivalence with the legacy parser
+# =============================================================================
+
+def test_corpus_equivalence():
+    """Parser output matches the legacy parser for every corpus document."""
+    documents = _corpus_documents()
+    assert len(documents) > len(EDGE_CASES), "Expected repo TOON documents in corpus"
+    for source, content in documents:
+        expected = legacy_toon_parser.parse_toon(content)
+        actual = parse_toon(content)
+        assert actual == expected, f"Output differs for {source}"
+        assert list(actual) == list(expected), f"Key order differs for {source}"
+
+
+def test_value_types_equivalence():
+    """Parsed scalar types match exactly (1 vs 1.0 vs True)."""
+    for source, content in _corpus_documents():
+        expected = repr(legacy_toon_parser.parse_toon(content))
+        assert repr(parse_toon(content)) == expected, f"Value types differ for {source}"
+
+
+def test_large_array_equivalence():
+    """Large generated uniform array parses identically."""
+    content = _large_uniform_array(500)
+    assert parse_toon(content) == legacy_toon_parser.parse_toon(content)
+
+
+def test_column_typing_equivalence():
+    """Whole-column typing matches per-value parsing for every column shape."""
+    row_sets = [
+        # ints, floats, booleans, plain strings, repetitive mixed values
+        [f'{i},{i}.25,{"true" if i % 3 else "false"},name-{i},{["null", "x", "5%", ""][i % 4]}' for i in range(40)],
+        # padding around separators, empty and unicode digit values
+        [f' {i} , a{i} ,, ١{i} ,-{i}' for i in range(40)],
+        # quoted commas, quoted numbers and escaped quotes
+        [f'{i},"a, {i}","{i}",x""y,"-{i}.5"' for i in range(40)],
+        # an unbalanced quote, a short row and an extra value
+        [f'{i},b{i},c,d,e' for i in range(10)] + ['1,"open,x,y,z', '2,short', '3,a,b,c,d,extra'],
+        # the internal quoted-comma mask character in the data
+        [f'{i},"a,\x1fb",c,d,e' for i in range(10)],
+    ]
+    for rows in row_sets:
+        content = 'items[{}]{{a,b,c,d,e}}:\n'.format(len(rows)) + ''.join(f'  {row}\n' for row in rows)
+        expected = legacy_toon_parser.parse_toon(content)
+        assert repr(parse_toon(content)) == repr(expected), f"Output differs for rows like {rows[0]!r}"
+
+
+def test_tables_corpus_equivalence():
+    """tables=True holds the same values for every corpus document."""
+    for source, content in _corpus_documents():
+        converted = _tables_to_lists(parse_toon(content, tables=True))
+        assert repr(converted) == repr(parse_toon(content)), f"Table output differs for {source}"
+
+
+def test_tables_memory():
+    """Large uniform arrays take much less memory as a ToonTable."""
+    content = _large_uniform_array(5000)
+    dicts = _traced_size(lambda: parse_toon(content))
+    tables = _traced_size(lambda: parse_toon(content, tables=True))
+    print(f"    5000 rows: list of dicts {dicts // 1024}KiB, table {tables // 1024}KiB")
+    assert tables < dicts * 0.7, f"Expected ToonTable below 70% of dict memory, got {tables / dicts:.0%}"
+
+
+# =============================================================================
+# Test: Benchmark
+# =============================================================================
+
+def test_large_uniform_array_speedup():
+    """Single-pass parser is at least MIN_SPEEDUP times faster on large arrays.
+
+    A noisy machine can spoil a whole measurement, so it is repeated up to
+    BENCHMARK_ATTEMPTS times before failing.
+    """
+    content = _large_uniform_array(BENCHMARK_ROWS)
+    speedup = 0.0
+    for _ in range(BENCHMARK_ATTEMPTS):
+        legacy, current = _best_times(content)
+        speedup = legacy / current
+        print(f"    {BENCHMARK_ROWS} rows: legacy {legacy * 1000:.1f}ms, "
+              f"current {current * 1000:.1f}ms, speedup {speedup:.1f}x")
+        if speedup >= MIN_SPEEDUP:
+            break
+    assert speedup >= MIN_SPEEDUP, f"Expected >= {MIN_SPEEDUP}x speedup, got {speedup:.1f}x"
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == '__main__':
+    runner = TestRunner()
+    runner.add_tests([
+        # Equivalence
+        test_corpus_equivalence,
+        test_value_types_equivalence,
+        test_large_array_equivalence,
+        test_column_typing_equivalence,
+        test_tables_corpus_equivalence,
+        test_tables_memory,
+        # Benchmark
+        test_large_uniform_array_speedup,
+    ])
+    sys.exit(runner.run())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Synthetic TOON document generator for benchmarks and fuzzing.
+
+Generates documents in four shapes at configurable sizes from a seed:
+
+- nested: sections of deep object nesting with scalar leaves and small arrays
+- wide_array: uniform arrays with many columns of mixed types
+- multiline: many multi-line (|) values with blank and indented lines
+- quoted_csv: uniform arrays whose cells need quoting (commas, colons)
+
+Every generated document stays within what serialize_toon can write back,
+so parse_toon(serialize_toon(parse_toon(doc))) == parse_toon(doc) holds.
+
+Usage:
+    python3 toon_corpus.py --output /tmp/corpus [--size medium] [--seed 1] [--count 5]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+SHAPES = ('nested', 'wide_array', 'multiline', 'quoted_csv')
+
+# Scale factor per size name (rows, values or nesting breadth grow with it)
+SIZES = {'small': 1, 'medium': 5, 'large': 25}
+
+WORDS = [
+    'build', 'module', 'task', 'plan', 'phase', 'finding', 'issue', 'sonar', 'maven', 'gradle',
+    'deliverable', 'review', 'commit', 'branch', 'status', 'config', 'domain', 'profile',
+    'java', 'python', 'frontend', 'coverage', 'lint', 'security', 'verify', 'outline',
+]
+PUNCTUATION = [', ', ': ', ' - ', ' / ', '; ']
+
+
+def _word(rng: random.Random) -> str:
+    return rng.choice(WORDS)
+
+
+def _key(rng: random.Random, used: set[str]) -> str:
+    """Unique key in snake_case or kebab-case."""
+    while True:
+        key = f"{_word(rng)}{rng.choice(['_', '-'])}{_word(rng)}{rng.randrange(100)}"
+        if key not in used:
+            used.add(key)
+            return key
+
+
+def _scalar(rng: random.Random) -> str:
+    """A scalar in TOON source form: number, percentage, boolean, null or text."""
+    kind = rng.randrange(8)
+    if kind == 0:
+        return str(rng.randrange(-1000, 100000))
+    if kind == 1:
+        return f"{rng.randrange(-500, 500)}.{rng.randrange(1, 100):02d}"
+    if kind == 2:
+        return f"{rng.randrange(101)}%"
+    if kind == 3:
+        return rng.choice(['true', 'false'])
+    if kind == 4:
+        return 'null'
+    if kind == 5:
+        return f"src/main/java/de/cuioss/{_word(rng)}/{_word(rng).title()}{rng.randrange(500)}.java"
+    return ' '.join(_word(rng) for _ in range(rng.randrange(1, 6)))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    """Prose with punctuation that needs quoting in CSV cells."""
+    parts = [_word(rng)]
+    for _ in range(words - 1):
+        parts.append(rng.choice(PUNCTUATION) if rng.random() < 0.2 else ' ')
+        parts.append(_word(rng))
+    return ''.join(parts)
+
+
+def _nested_object(rng: random.Random, lines: list[str], depth: int, breadth: int, indent: int) -> None:
+    prefix = '  ' * indent
+    used: set[str] = set()
+    for _ in range(breadth):
+        key = _key(rng, used)
+        roll = rng.random()
+        if depth > 0 and roll < 0.35:
+            lines.append(f"{prefix}{key}:")
+            _nested_object(rng, lines, depth - 1, breadth, indent + 1)
+        elif roll < 0.45:
+            items = [_word(rng) for _ in range(rng.randrange(1, 5))]
+            lines.append(f"{prefix}{key}[{len(items)}]:")
+            lines.extend(f"{prefix}  - {item}" for item in items)
+        else:
+            lines.append(f"{prefix}{key}: {_scalar(rng)}")
+
+
+def nested_document(rng: random.Random, scale: int) -> str:
+    """Sections of deeply nested objects (up to depth 6), 20 per scale step."""
+    lines = ['# nested document']
+    for section in range(20 * scale):
+        lines.append(f"section_{section}:")
+        _nested_object(rng, lines, depth=5, breadth=4, indent=1)
+    return '\n'.join(lines) + '\n'
+
+
+def wide_array_document(rng: random.Random, scale: int) -> str:
+    """Uniform arrays with 12-24 columns of per-column types."""
+    lines = ['project: benchmark']
+    for table in range(2):
+        width = rng.randrange(12, 25)
+        fields = [f"col_{table}_{column}" for column in range(width)]
+        kinds = [rng.randrange(6) for _ in fields]
+        rows = 400 * scale
+        lines.append(f"table_{table}[{rows}]{{{','.join(fields)}}}:")
+        for row in range(rows):
+            cells = []
+            for kind in kinds:
+                if kind == 0:
+                    cells.append(str(rng.randrange(100000)))
+                elif kind == 1:
+                    cells.append(f"{rng.randrange(100)}.{rng.randrange(10)}{rng.randrange(1, 10)}")
+                elif kind == 2:
+                    cells.append(rng.choice(['true', 'false']))
+                elif kind == 3:
+                    cells.append(rng.choice(['OPEN', 'DONE', 'BLOCKED', '']))
+                elif kind == 4:
+                    cells.append(f"{_word(rng)}-{row}")
+                else:
+                    cells.append(_scalar(rng))
+            lines.append('  ' + ','.join(cells))
+    lines.append('total: done')
+    return '\n'.join(lines) + '\n'
+
+
+def multiline_document(rng: random.Random, scale: int) -> str:
+    """Many | values with blank lines, deeper indentation and key-like lines."""
+    lines = ['# multi-line values']
+    used: set[str] = set()
+    for value in range(100 * scale):
+        nested = value % 3 == 0
+        prefix = '  ' if nested else ''
+        if nested:
+            lines.append(f"section_{value}:")
+        lines.append(f"{prefix}{_key(rng, used)}: |")
+        for line in range(rng.randrange(2, 12)):
+            roll = rng.random()
+            if 0 < line and roll < 0.1:
+                lines.append('')
+            elif roll < 0.2:
+                lines.append(f"{prefix}    {_text(rng, 4)}")
+            elif roll < 0.3:
+                lines.append(f"{prefix}  {_word(rng)}: {_scalar(rng)}")
+            else:
+                lines.append(f"{prefix}  {_text(rng, rng.randrange(3, 15))}")
+        lines.append(f"{prefix}{_key(rng, used)}: {_scalar(rng)}")
+    return '\n'.join(lines) + '\n'
+
+
+def quoted_csv_document(rng: random.Random, scale: int) -> str:
+    """Finding tables where many cells contain commas and colons."""
+    lines = ['status: success']
+    rows = 300 * scale
+    lines.append(f"findings[{rows}]{{id,file,line,message,rule,hint}}:")
+    for row in range(rows):
+        message = _text(rng, rng.randrange(4, 16))
+        hint = f"{_word(rng)}: {_text(rng, 3)}" if rng.random() < 0.5 else ''
+        cells = [
+            f"F-{row:05d}",
+            f"src/{_word(rng)}/{_word(rng)}.py",
+            str(rng.randrange(1, 2000)),
+            f'"{message}"' if (',' in message or ':' in message) else message,
+            f"{_word(rng)}:{rng.randrange(1000, 9999)}",
+            f'"{hint}"' if hint else '',
+        ]
+        lines.append('  ' + ','.join(cells))
+    return '\n'.join(lines) + '\n'
+
+
+GENERATORS = {
+    'nested': nested_document,
+    'wide_array': wide_array_document,
+    'multiline': multiline_document,
+    'quoted_csv': quoted_csv_document,
+}
+
+
+def generate(shape: str, size: str = 'small', seed: int = 0) -> str:
+    """Generate one document of the given shape and size."""
+    if shape not in GENERATORS:
+        raise ValueError(f"Unknown shape: {shape} (expected one of {', '.join(SHAPES)})")
+    if size not in SIZES:
+        raise ValueError(f"Unknown size: {size} (expected one of {', '.join(SIZES)})")
+    return GENERATORS[shape](random.Random(f"{shape}:{seed}"), SIZES[size])
+
+
+def generate_corpus(size: str = 'small', seeds: range = range(1)) -> list[tuple[str, str]]:
+    """Generate (name, document) pairs for every shape and seed."""
+    return [(f"{shape}-{size}-{seed}", generate(shape, size, seed)) for seed in seeds for shape in SHAPES]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate a synthetic TOON corpus')
+    parser.add_argument('--output', required=True, help='Directory for the generated .toon files')
+    parser.add_argument('--size', choices=list(SIZES), default='small', help='Document size')
+    parser.add_argument('--seed', type=int, default=0, help='First seed')
+    parser.add_argument('--count', type=int, default=1, help='Documents per shape')
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    corpus = generate_corpus(args.size, range(args.seed, args.seed + args.count))
+    for name, document in corpus:
+        (output / f"{name}.toon").write_text(document, encoding='utf-8')
+    print(f"status: success\noutput: {output}\ndocuments: {len(corpus)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
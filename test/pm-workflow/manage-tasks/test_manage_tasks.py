@@ -800,6 +800,246 @@ def test_next_include_context():
         cleanup(temp_dir)
 
 
+# =============================================================================
+# Tests: schedule and dependency cycles
+# =============================================================================
+
+def add_dependent_task(title, depends_on, steps=None):
+    toon = build_task_toon(title=title, deliverables=[1], depends_on=depends_on,
+                           steps=steps or ['src/main/java/File.java'])
+    return run_script(SCRIPT_PATH, 'add', '--plan-id', 'test-plan', input_data=toon)
+
+
+def test_schedule_waves_and_critical_path():
+    """Schedule groups tasks into waves and reports the critical path."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Short', deliverables=[1], steps=['src/main/java/File.java'])
+        add_basic_task(title='Base', deliverables=[1], steps=['src/main/java/File.java'])
+        add_dependent_task('Long', 'TASK-2', steps=['src/a/A.java', 'src/a/B.java', 'src/a/C.java'])
+
+        result = run_script(SCRIPT_PATH, 'schedule', '--plan-id', 'test-plan')
+
+        assert result.returncode == 0, result.stderr
+        assert 'wave_count: 2' in result.stdout
+        assert 'critical_path_steps: 4' in result.stdout
+        assert 'critical_path: [TASK-2, TASK-3]' in result.stdout
+        assert 'order: [TASK-1, TASK-2, TASK-3]' in result.stdout
+        assert 'waves[3]{wave,number,title,status,progress,path_steps}:' in result.stdout
+        assert '0,2,Base,pending,0/1,4\n0,1,Short,pending,0/1,1\n1,3,Long,pending,0/3,3' in result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+def test_next_prefers_critical_path():
+    """Next and next-tasks offer the ready task with the longest remaining path first."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Short', deliverables=[1], steps=['src/main/java/File.java'])
+        add_basic_task(title='Base', deliverables=[1], steps=['src/main/java/File.java'])
+        add_dependent_task('Long', 'TASK-2', steps=['src/a/A.java', 'src/a/B.java'])
+
+        result = run_script(SCRIPT_PATH, 'next', '--plan-id', 'test-plan')
+        assert 'task_number: 2' in result.stdout
+
+        result = run_script(SCRIPT_PATH, 'next-tasks', '--plan-id', 'test-plan')
+        ready = result.stdout.split('ready_tasks[2]')[1]
+        assert ready.index('2,Base') < ready.index('1,Short')
+    finally:
+        cleanup(temp_dir)
+
+
+def test_dependency_cycle_rejected():
+    """Add and update reject dependencies that would form a cycle."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='First', deliverables=[1], steps=['src/main/java/File.java'])
+        add_dependent_task('Second', 'TASK-1')
+
+        result = add_dependent_task('Self', 'TASK-3')
+        assert result.returncode == 1
+        assert 'Dependency cycle: TASK-3 -> TASK-3' in result.stderr
+
+        result = run_script(SCRIPT_PATH, 'update', '--plan-id', 'test-plan',
+                            '--number', '1', '--depends-on', 'TASK-2')
+        assert result.returncode == 1
+        assert 'Dependency cycle: TASK-1 -> TASK-2 -> TASK-1' in result.stderr
+
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '1')
+        assert 'depends_on: none' in get_result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+def test_existing_cycle_does_not_block_plan():
+    """A cycle stored before cycle checks existed blocks only its own tasks."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Looping', deliverables=[1])
+        add_basic_task(title='Free', deliverables=[1])
+        looping = get_task_dir() / 'TASK-001-IMPL.toon'
+        looping.write_text(looping.read_text().replace('depends_on: none', 'depends_on: TASK-1'))
+
+        result = run_script(SCRIPT_PATH, 'update', '--plan-id', 'test-plan', '--number', '2', '--status', 'blocked')
+        assert result.returncode == 0, result.stderr
+        result = run_script(SCRIPT_PATH, 'update', '--plan-id', 'test-plan', '--number', '1', '--title', 'Renamed')
+        assert result.returncode == 0, result.stderr
+
+        result = run_script(SCRIPT_PATH, 'next', '--plan-id', 'test-plan', '--ignore-deps')
+        assert result.returncode == 0, result.stderr
+        assert 'task_number: 1' in result.stdout
+
+        result = run_script(SCRIPT_PATH, 'next', '--plan-id', 'test-plan')
+        assert result.returncode == 0, result.stderr
+        assert '1,Renamed,TASK-1' in result.stdout
+
+        result = run_script(SCRIPT_PATH, 'schedule', '--plan-id', 'test-plan')
+        assert result.returncode == 0, result.stderr
+        assert 'cyclic: [TASK-1]' in result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+# =============================================================================
+# Tests: batch
+# =============================================================================
+
+def run_batch(content, *extra):
+    return run_script(SCRIPT_PATH, 'batch', '--plan-id', 'test-plan', *extra, input_data=content)
+
+
+def test_batch_toon_creates_tasks():
+    """A TOON batch creates all tasks; dependencies may name tasks of the same batch."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+        content = '\n---\n'.join([
+            build_task_toon(title='Model', deliverables=[2]),
+            build_task_toon(title='Service, part 1', deliverables=[2, 3], depends_on='TASK-1, TASK-2'),
+        ])
+
+        result = run_batch(content)
+
+        assert result.returncode == 0, result.stderr
+        assert 'total_tasks: 3' in result.stdout
+        assert 'created_count: 2' in result.stdout
+        assert 'updated_count: 0' in result.stdout
+        assert 'batch[2]{action,number,file,title}:' in result.stdout
+        assert 'add,3,TASK-003-IMPL.toon,Service, part 1' in result.stdout
+
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '3')
+        assert 'depends_on: [TASK-1, TASK-2]' in get_result.stdout
+        list_result = run_script(SCRIPT_PATH, 'list', '--plan-id', 'test-plan')
+        assert 'tasks[3]' in list_result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+def test_batch_jsonl_create_and_update():
+    """A JSONL batch mixes new tasks and updates of existing tasks."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+        content = '\n'.join([
+            '{"title": "From JSON", "deliverables": [4], "domain": "java", "steps": ["src/A.java", "src/B.java"]}',
+            '{"number": 1, "status": "blocked", "depends_on": "TASK-2"}',
+        ])
+
+        result = run_batch(content)
+
+        assert result.returncode == 0, result.stderr
+        assert 'created_count: 1' in result.stdout
+        assert 'updated_count: 1' in result.stdout
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '1')
+        assert 'status: blocked' in get_result.stdout
+        assert 'depends_on: [TASK-2]' in get_result.stdout
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '2')
+        assert 'steps[2]' in get_result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+def test_batch_toon_update_block():
+    """A TOON block with a number updates that task."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+
+        result = run_batch('number: 1\ntitle: Renamed\ndeliverables: 1, 5\n')
+
+        assert result.returncode == 0, result.stderr
+        assert 'update,1,TASK-001-IMPL.toon,Renamed' in result.stdout
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '1')
+        assert 'deliverables: [1, 5]' in get_result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
+def test_batch_rejected_writes_nothing():
+    """An invalid entry rejects the whole batch and reports every problem."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+        task_dir = get_task_dir()
+        before = {path.name: path.read_text() for path in task_dir.iterdir()}
+        content = '\n---\n'.join([
+            build_task_toon(title='Valid', deliverables=[2]),
+            build_task_toon(title='Dangling', deliverables=[2], depends_on='TASK-9'),
+            build_task_toon(title='No deliverables', deliverables=[]),
+            'number: 7\nstatus: done',
+        ])
+
+        result = run_batch(content)
+
+        assert result.returncode == 1
+        assert 'Batch rejected, no task written' in result.stderr
+        assert 'Entry 2: depends_on target TASK-9 does not exist' in result.stderr
+        assert 'Entry 3:' in result.stderr
+        assert 'Entry 4: Task TASK-7 not found' in result.stderr
+        assert {path.name: path.read_text() for path in task_dir.iterdir()} == before
+    finally:
+        cleanup(temp_dir)
+
+
+def test_batch_rejects_cycle():
+    """Dependencies within a batch must not form a cycle."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+        content = '\n'.join([
+            '{"title": "A", "deliverables": [1], "domain": "java", "steps": ["src/A.java"], "depends_on": "TASK-1"}',
+            '{"number": 1, "depends_on": ["TASK-2"]}',
+        ])
+
+        result = run_batch(content, '--format', 'jsonl')
+
+        assert result.returncode == 1
+        assert 'Entry 1: Dependency cycle: TASK-2 -> TASK-1 -> TASK-2' in result.stderr
+        assert not (get_task_dir() / 'TASK-002-IMPL.toon').exists()
+    finally:
+        cleanup(temp_dir)
+
+
+def test_batch_journal_completed_after_crash():
+    """Staged files of an interrupted batch are moved into place by the next command."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='Existing', deliverables=[1])
+        task_dir = get_task_dir()
+        staged = (task_dir / 'TASK-001-IMPL.toon').read_text().replace('Existing', 'Recovered')
+        (task_dir / '.tmp_crash.toon').write_text(staged)
+        (task_dir / '.batch-journal').write_text('.tmp_crash.toon\tTASK-001-IMPL.toon')
+
+        add_basic_task(title='Next', deliverables=[1])
+
+        assert not (task_dir / '.batch-journal').exists()
+        assert not (task_dir / '.tmp_crash.toon').exists()
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '1')
+        assert 'title: Recovered' in get_result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
 # =============================================================================
 # Tests: step-start
 # =============================================================================
@@ -1043,6 +1283,7 @@ def test_update_clear_depends_on():
     """Update depends_on to none clears dependencies."""
     temp_dir = setup_plan_dir()
     try:
+        add_basic_task(title='First', deliverables=[1], steps=['src/main/java/File.java'])
         toon = build_task_toon(
             title='Task', deliverables=[1], domain='java',
             description='D', steps=['src/main/java/File.java'], depends_on='TASK-1'
@@ -1050,12 +1291,12 @@ def test_update_clear_depends_on():
         run_script(SCRIPT_PATH, 'add', '--plan-id', 'test-plan', input_data=toon)
 
         result = run_script(SCRIPT_PATH, 'update', '--plan-id', 'test-plan',
-                            '--number', '1', '--depends-on', 'none')
+                            '--number', '2', '--depends-on', 'none')
 
         assert result.returncode == 0
 
         # Verify
-        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '1')
+        get_result = run_script(SCRIPT_PATH, 'get', '--plan-id', 'test-plan', '--number', '2')
         assert 'depends_on: none' in get_result.stdout
     finally:
         cleanup(temp_dir)
@@ -1104,6 +1345,88 @@ def test_remove_preserves_gaps():
         cleanup(temp_dir)
 
 
+# =============================================================================
+# Tests: task index
+# =============================================================================
+
+def get_task_dir() -> Path:
+    return Path(os.environ['PLAN_BASE_DIR']) / 'plans' / 'test-plan' / 'tasks'
+
+
+def test_index_updated_on_write():
+    """Every write updates tasks/index.toon; titles may contain commas."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='First, with comma', deliverables=[1, 2], steps=['src/main/java/File.java'])
+        add_basic_task(title='Second', deliverables=[2],
+                       steps=['src/main/java/FileA.java', 'src/main/java/FileB.java'])
+        index_path = get_task_dir() / 'index.toon'
+        index = index_path.read_text()
+        assert 'tasks[2]{' in index
+        assert index.rstrip().endswith('TASK-002-IMPL.toon,Second')
+
+        run_script(SCRIPT_PATH, 'step-done', '--plan-id', 'test-plan', '--task', '2', '--step', '1')
+        assert ',1,2,' in index_path.read_text(), "Step progress should be updated"
+
+        result = run_script(SCRIPT_PATH, 'list', '--plan-id', 'test-plan')
+        assert '1,First, with comma,java,implementation,execute,[1, 2],pending,0/1' in result.stdout
+        assert '2,Second,java,implementation,execute,[2],pending,1/2' in result.stdout
+
+        run_script(SCRIPT_PATH, 'remove', '--plan-id', 'test-plan', '--number', '1')
+        assert 'tasks[1]{' in index_path.read_text()
+    finally:
+        cleanup(temp_dir)
+
+
+def test_index_rebuilt_when_stale():
+    """A missing, corrupt or outdated index is rebuilt from the task files."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='First', deliverables=[1], steps=['src/main/java/File.java'])
+        index_path = get_task_dir() / 'index.toon'
+
+        # Task file edited by hand
+        task_file = get_task_dir() / 'TASK-001-IMPL.toon'
+        task_file.write_text(task_file.read_text().replace('status: pending', 'status: done'))
+        result = run_script(SCRIPT_PATH, 'list', '--plan-id', 'test-plan')
+        assert '1,First,java,implementation,execute,[1],done,0/1' in result.stdout
+        assert ',done,' in index_path.read_text()
+
+        # Task file copied in by hand
+        (get_task_dir() / 'TASK-002-IMPL.toon').write_text(task_file.read_text().replace('number: 1', 'number: 2'))
+        result = run_script(SCRIPT_PATH, 'list', '--plan-id', 'test-plan')
+        assert 'total: 2' in result.stdout
+
+        index_path.write_text('garbage\n')
+        result = run_script(SCRIPT_PATH, 'list', '--plan-id', 'test-plan')
+        assert 'total: 2' in result.stdout
+
+        index_path.unlink()
+        result = add_basic_task(title='Third', deliverables=[3], steps=['src/main/java/File.java'])
+        assert 'TASK-003' in result.stdout
+        assert 'total_tasks: 3' in result.stdout
+        assert 'tasks[3]{' in index_path.read_text()
+    finally:
+        cleanup(temp_dir)
+
+
+def test_queries_read_only_index():
+    """Query commands use the indexed values while the index is current."""
+    temp_dir = setup_plan_dir()
+    try:
+        add_basic_task(title='First', deliverables=[1], steps=['src/main/java/File.java'])
+        index_path = get_task_dir() / 'index.toon'
+        index_path.write_text(index_path.read_text().replace(',First', ',Indexed title'))
+
+        for command in ('list', 'next-tasks'):
+            result = run_script(SCRIPT_PATH, command, '--plan-id', 'test-plan')
+            assert 'Indexed title' in result.stdout, f"{command} should read the index"
+        result = run_script(SCRIPT_PATH, 'tasks-by-domain', '--plan-id', 'test-plan', '--domain', 'java')
+        assert 'Indexed title' in result.stdout
+    finally:
+        cleanup(temp_dir)
+
+
 # =============================================================================
 # Tests: progress tracking
 # =============================================================================
@@ -1274,6 +1597,18 @@ if __name__ == '__main__':
         test_next_ignore_deps,
         test_next_filter_by_phase,
         test_next_include_context,
+        # schedule and dependency cycles
+        test_schedule_waves_and_critical_path,
+        test_next_prefers_critical_path,
+        test_dependency_cycle_rejected,
+        test_existing_cycle_does_not_block_plan,
+        # batch
+        test_batch_toon_creates_tasks,
+        test_batch_jsonl_create_and_update,
+        test_batch_toon_update_block,
+        test_batch_rejected_writes_nothing,
+        test_batch_rejects_cycle,
+        test_batch_journal_completed_after_crash,
         # step-start
         test_step_start_marks_in_progress,
         test_step_start_invalid_step,
@@ -1296,6 +1631,10 @@ if __name__ == '__main__':
         # remove
         test_remove_deletes_file,
         test_remove_preserves_gaps,
+        # task index
+        test_index_updated_on_write,
+        test_index_rebuilt_when_stale,
+        test_queries_read_only_index,
         # progress
         test_progress_calculation,
         # file content
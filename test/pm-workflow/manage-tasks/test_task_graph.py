@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for _task_graph.py (dependency graph, waves and critical path)."""
+
+import sys
+from pathlib import Path
+
+# Import shared infrastructure (conftest.py sets up PYTHONPATH)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from conftest import TestRunner
+
+from _task_graph import (  # type: ignore[import-not-found]
+    build_graph, check_dependencies, find_cycle, find_cycle_through, schedule, topological_order
+)
+
+
+def entry(number, depends_on=(), status='pending', steps_total=1, steps_done=0):
+    """Minimal task index entry."""
+    return {
+        'number': number,
+        'title': f'Task {number}',
+        'status': status,
+        'depends_on': [f'TASK-{dep}' for dep in depends_on],
+        'steps_total': steps_total,
+        'steps_done': steps_done,
+    }
+
+
+# =============================================================================
+# Tests: graph and cycles
+# =============================================================================
+
+def test_build_graph():
+    """Dependencies map to task numbers; duplicates are dropped."""
+    entries = [entry(1), {'number': 2, 'depends_on': ['TASK-1', 'TASK-1', 'TASK-x', 'TASK-7']}]
+    assert build_graph(entries) == {1: [], 2: [1, 7]}
+
+
+def test_find_cycle():
+    """Cycles are reported with their path; unknown tasks are ignored."""
+    assert find_cycle({1: [], 2: [1], 3: [1, 2, 9]}) is None
+    assert find_cycle({1: [1]}) == [1, 1]
+    assert find_cycle({1: [3], 2: [1], 3: [2], 4: [1]}) == [1, 3, 2, 1]
+
+
+def test_check_dependencies():
+    """A new or updated task must not close a cycle."""
+    entries = [entry(1), entry(2, [1]), entry(3, [2])]
+    check_dependencies(entries, 4, ['TASK-3'])
+    check_dependencies(entries, 1, ['TASK-9'])
+    for number, deps, cycle in ((1, ['TASK-3'], 'TASK-1 -> TASK-3 -> TASK-2 -> TASK-1'),
+                                (4, ['TASK-4'], 'TASK-4 -> TASK-4')):
+        try:
+            check_dependencies(entries, number, deps)
+            assert False, f"Expected cycle for TASK-{number}"
+        except ValueError as e:
+            assert str(e) == f'Dependency cycle: {cycle}'
+
+
+def test_find_cycle_through():
+    """Only cycles containing the given task are found, shortest first."""
+    graph = {1: [1], 2: [3], 3: [2, 4], 4: [2], 5: [1]}
+    assert find_cycle_through(graph, 1) == [1, 1]
+    assert find_cycle_through(graph, 2) == [2, 3, 2]
+    assert find_cycle_through(graph, 4) == [4, 2, 3, 4]
+    assert find_cycle_through(graph, 5) is None
+
+
+def test_check_dependencies_ignores_other_cycles():
+    """A cycle elsewhere in the plan does not block changing another task."""
+    entries = [entry(1, [1]), entry(2, [3]), entry(3, [2])]
+    check_dependencies(entries, 4, ['TASK-1', 'TASK-2'])
+    check_dependencies(entries, 1, ['TASK-2'])
+
+
+def test_topological_order():
+    """Dependencies come first; independent tasks keep number order."""
+    assert topological_order({1: [3], 2: [], 3: [], 4: [1, 2]}) == [2, 3, 1, 4]
+    try:
+        topological_order({1: [2], 2: [1]})
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert 'TASK-1 -> TASK-2 -> TASK-1' in str(e)
+
+
+# =============================================================================
+# Tests: schedule
+# =============================================================================
+
+def test_schedule_waves():
+    """Remaining tasks are grouped into waves; done tasks satisfy dependencies."""
+    entries = [
+        entry(1, status='done'),
+        entry(2, [1]),
+        entry(3, [1]),
+        entry(4, [2, 3]),
+        entry(5, [4]),
+        entry(6),
+    ]
+    plan = schedule(entries)
+    assert plan['order'] == [1, 2, 3, 4, 5, 6]
+    assert plan['waves'] == [[2, 3, 6], [4], [5]]
+    assert plan['blocked'] == {4: ['TASK-2', 'TASK-3'], 5: ['TASK-4']}
+
+
+def test_schedule_critical_path():
+    """Ready tasks are ordered by the remaining steps on their longest path."""
+    entries = [
+        entry(1, steps_total=1),
+        entry(2, steps_total=4, steps_done=1),
+        entry(3, [1], steps_total=5),
+        entry(4, [2], steps_total=1),
+    ]
+    plan = schedule(entries)
+    assert plan['priority'] == {1: 6, 2: 4, 3: 5, 4: 1}
+    assert plan['ready'] == [1, 2]
+    assert plan['critical_path'] == [1, 3]
+    assert plan['critical_path_steps'] == 6
+
+
+def test_schedule_unresolved():
+    """Tasks depending on missing tasks, directly or not, are never ready."""
+    plan = schedule([entry(1, [9]), entry(2, [1]), entry(3)])
+    assert plan['unresolved'] == {1: ['TASK-9'], 2: []}
+    assert plan['waves'] == [[3]]
+    assert plan['ready'] == [3]
+    assert plan['blocked'] == {1: ['TASK-9'], 2: ['TASK-1']}
+
+
+def test_schedule_in_progress():
+    """In-progress tasks are scheduled but not offered as ready."""
+    plan = schedule([entry(1, status='in_progress'), entry(2, [1]), entry(3, status='done')])
+    assert plan['waves'] == [[1], [2]]
+    assert plan['ready'] == []
+    assert plan['critical_path'] == [1, 2]
+
+
+def test_schedule_cycle_blocks_only_its_tasks():
+    """Tasks in or behind a cycle are reported as cyclic and blocked; others are scheduled."""
+    entries = [entry(1, [1]), entry(2, [1]), entry(3), entry(4, [5], status='done'), entry(5, [4], status='done'),
+               entry(6, [4])]
+    plan = schedule(entries)
+    assert plan['cyclic'] == [1, 2]
+    assert plan['order'] == [3, 4, 5, 6]
+    assert plan['waves'] == [[3, 6]]
+    assert plan['ready'] == [3, 6]
+    assert plan['blocked'] == {1: ['TASK-1'], 2: ['TASK-1']}
+
+
+def test_schedule_empty():
+    """An empty plan has no waves and no critical path."""
+    plan = schedule([])
+    assert plan['waves'] == [] and plan['critical_path'] == [] and plan['critical_path_steps'] == 0
+
+
+def test_schedule_large_chain():
+    """Long dependency chains are handled without recursion limits."""
+    entries = [entry(1)] + [entry(n, [n - 1]) for n in range(2, 3001)]
+    plan = schedule(entries)
+    assert len(plan['waves']) == 3000
+    assert plan['critical_path_steps'] == 3000
+    assert find_cycle(build_graph(entries)) is None
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+if __name__ == '__main__':
+    runner = TestRunner()
+    runner.add_tests([
+        # graph and cycles
+        test_build_graph,
+        test_find_cycle,
+        test_check_dependencies,
+        test_find_cycle_through,
+        test_check_dependencies_ignores_other_cycles,
+        test_topological_order,
+        # schedule
+        test_schedule_waves,
+        test_schedule_critical_path,
+        test_schedule_unresolved,
+        test_schedule_in_progress,
+        test_schedule_cycle_blocks_only_its_tasks,
+        test_schedule_empty,
+        test_schedule_large_chain,
+    ])
+    sys.exit(runner.run())